@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📊 Benchmark Package for Mushroom Cultivation Quiz 📊
+
+Standard-library performance benchmarks for the quiz application.
+
+File: benchmarks/__init__.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This package measures the hot paths of the quiz with timeit and
+    perf_counter only, and writes the results as JSON so runs from
+    different releases can be compared.
+
+Benchmark Modules:
+    - harness: Timing helpers, synthetic banks and JSON result files
+    - bench_selection: Question selection (in memory, streamed and memory-mapped), option shuffling
+      and answer checking
+    - bench_render: Full-screen rendering of questions and results
+    - bench_timer: Scheduler and timed-input wake-up latency
+    - bench_session: Headless end-to-end quizzes per second
+    - bench_text: Near-duplicate index and keyword search over varied text
+    - bench_memory: Resident bytes per question of a loaded bank
+    - run_benchmarks: Command-line runner
+
+Usage:
+    python -m benchmarks.run_benchmarks --output results.json
+    python -m benchmarks.run_benchmarks --quick --compare old.json
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import os
+import sys
+
+# Benchmark the in-tree package without installing it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+💾 Memory Benchmarks Module
+
+Resident memory per question of a loaded bank.
+
+File: bench_memory.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    Loads the largest configured synthetic bank (10^6 questions by
+    default) from JSON text, the way banks reach memory in practice, and
+    measures with tracemalloc how many bytes stay allocated per question:
+    once as the plain dictionaries json.loads() produces, and once as a
+    QuestionBank of compact Question records (including its difficulty
+    and topic indexes). Temporary objects are freed before measuring, so
+    only what a resident bank keeps is counted.
+
+Functions:
+    resident_bytes(): Bytes kept alive by what a callable builds
+    run(): Run the memory benchmarks
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import gc
+import json
+import tracemalloc
+
+from mushroom_quiz.data.question_bank import QuestionBank
+
+from .harness import make_questions, memory_result
+
+def resident_bytes(build):
+    """
+    Measure the memory kept alive by the result of a callable.
+
+    Args:
+        build (callable): Zero-argument callable returning the object to keep
+
+    Returns:
+        int: Bytes still allocated after build() returned, temporaries freed
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = build()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size
+
+def run(config):
+    """
+    Run the memory benchmarks.
+
+    Args:
+        config (BenchConfig): Shared benchmark settings
+
+    Returns:
+        list: Result dictionaries
+    """
+    size = max(config.bank_sizes)
+    lines = [json.dumps(question) for question in make_questions(size)]
+    results = []
+    for representation, build in (
+        ("dict", lambda: [json.loads(line) for line in lines]),
+        ("question", lambda: QuestionBank(json.loads(line) for line in lines)),
+    ):
+        results.append(memory_result(
+            "bank_memory", resident_bytes(build), size,
+            {"bank_size": size, "representation": representation}
+        ))
+    return results
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🖥️ Rendering Benchmarks Module
+
+Full-screen render cost of questions and answer results.
+
+File: bench_render.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    Times the terminal screens players see on every question: the full
+    question frame (clear, header, question and options), the plain
+    display_question() and display_result() calls, and the countdown line
+    repaint. Output goes to os.devnull, so each write still costs a real
+    system call but nothing is printed.
+
+Functions:
+    run(): Run the rendering benchmarks
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+from mushroom_quiz.ui.terminal_ui import (display_question, display_result,
+                                          render_question, show_screen)
+from mushroom_quiz.ui.renderer import get_renderer
+
+from .harness import make_questions, measure, null_output
+
+def run(config):
+    """
+    Run the rendering benchmarks.
+
+    Args:
+        config (BenchConfig): Shared benchmark settings
+
+    Returns:
+        list: Result dictionaries
+    """
+    question = make_questions(1)[0]
+    options = question['options']
+    renderer = get_renderer()
+    results = []
+
+    with null_output():
+        results.append(measure(
+            "question_frame",
+            lambda: show_screen(render_question(3, 10, question, options)),
+            {}, config.repeat, config.min_time
+        ))
+        results.append(measure(
+            "display_question",
+            lambda: display_question(3, 10, question, options),
+            {}, config.repeat, config.min_time
+        ))
+        results.append(measure(
+            "display_result",
+            lambda: display_result(False, options[1], question['answer'], question['explanation']),
+            {}, config.repeat, config.min_time
+        ))
+        results.append(measure(
+            "countdown_repaint",
+            lambda: renderer.update_line("⏰ Time remaining: 12 seconds"),
+            {}, config.repeat, config.min_time
+        ))
+    return results
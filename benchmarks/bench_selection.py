@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🎲 Selection Benchmarks Module
+
+Question selection, option shuffling and answer checking.
+
+File: bench_selection.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    Times QuizGame.prepare_questions() against synthetic banks whose size
+    grows by powers of ten, for a single difficulty and for mixed quizzes,
+    so any selection cost that grows with the bank shows up directly.
+    Shuffling the options of a question (QuizSession.next_question) and
+    checking an answer (QuizSession.submit_answer) are timed together as
+    one ask/answer cycle. The adaptive mode's next-item pick (an argmax of
+    item information over the whole bank) is timed at the same sizes.
+
+    The same banks are also written to JSON Lines files and sampled by a
+    streaming JsonlQuestionSource (stream_sample), which reads the whole
+    file once per quiz; its cost is linear in the bank by design, so those
+    sizes stop at 10^5 questions.
+
+    Each bank is also packed into a memory-mapped binary bank. bank_open
+    times opening a bank and reading one question from the middle, for
+    the binary file at every size and for the JSON file (parsed and
+    indexed in full) up to the same 10^5 cap; mapped_sample times quiz
+    selection from the binary bank, which decodes only the questions it
+    returns.
+
+Functions:
+    run(): Run the selection benchmarks
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import json
+import os
+import tempfile
+
+from mushroom_quiz.core.adaptive import ItemModel, np
+from mushroom_quiz.core.quiz_engine import QuizGame
+from mushroom_quiz.core.quiz_session import QuizSession
+from mushroom_quiz.data.binary_bank import MappedQuestionBank, write_binary_bank
+from mushroom_quiz.data.question_bank import QuestionBank
+from mushroom_quiz.data.question_loader import load_questions
+from mushroom_quiz.data.question_source import JsonlQuestionSource
+
+from .harness import make_bank, make_questions, measure
+
+QUIZ_LENGTH = 10
+MAX_STREAM_BANK = 10 ** 5
+
+def stream_results(bank, config):
+    """Time streamed quiz selection from a JSON Lines copy of a bank"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bank.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            for question in bank:
+                f.write(json.dumps(dict(question)) + "\n")
+        for difficulty in ("beginner", "mixed"):
+            game = QuizGame(difficulty, QUIZ_LENGTH, bank=JsonlQuestionSource(path))
+            results.append(measure(
+                "stream_sample", game.prepare_questions,
+                {"bank_size": len(bank), "difficulty": difficulty, "num_questions": QUIZ_LENGTH},
+                config.repeat, config.min_time
+            ))
+    return results
+
+def mapped_results(bank, config):
+    """Time opening JSON and binary copies of a bank, and sampling the binary one"""
+    results = []
+    size = len(bank)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bank.mqb")
+        write_binary_bank(bank, path, version=bank.version)
+        opens = [("mqb", lambda: MappedQuestionBank(path)[size // 2])]
+        if size <= MAX_STREAM_BANK:
+            json_path = os.path.join(tmp, "bank.json")
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump([dict(question) for question in bank], f)
+            opens.append(("json", lambda: QuestionBank(*load_questions(json_path, use_cache=False))[size // 2]))
+        for file_format, open_bank in opens:
+            results.append(measure(
+                "bank_open", open_bank, {"bank_size": size, "format": file_format},
+                config.repeat, config.min_time
+            ))
+        mapped = MappedQuestionBank(path)
+        for difficulty in ("beginner", "mixed"):
+            game = QuizGame(difficulty, QUIZ_LENGTH, bank=mapped)
+            results.append(measure(
+                "mapped_sample", game.prepare_questions,
+                {"bank_size": size, "difficulty": difficulty, "num_questions": QUIZ_LENGTH},
+                config.repeat, config.min_time
+            ))
+        mapped.close()
+    return results
+
+def run(config):
+    """
+    Run the selection benchmarks.
+
+    Args:
+        config (BenchConfig): Shared benchmark settings
+
+    Returns:
+        list: Result dictionaries
+    """
+    results = []
+    for size in config.bank_sizes:
+        bank = make_bank(size)
+        for difficulty in ("beginner", "mixed"):
+            game = QuizGame(difficulty, QUIZ_LENGTH, bank=bank)
+            results.append(measure(
+                "prepare_questions", game.prepare_questions,
+                {"bank_size": size, "difficulty": difficulty, "num_questions": QUIZ_LENGTH},
+                config.repeat, config.min_time
+            ))
+        model = ItemModel(bank)
+        available = model.new_mask()
+        results.append(measure(
+            "adaptive_pick", lambda: model.pick(0.3, list(available) if np is None else available.copy()),
+            {"bank_size": size, "numpy": np is not None},
+            config.repeat, config.min_time
+        ))
+        if size <= MAX_STREAM_BANK:
+            results.extend(stream_results(bank, config))
+        results.extend(mapped_results(bank, config))
+        del bank, model, available
+
+    question = make_questions(1)
+    session = QuizSession(question)
+
+    def ask_and_answer():
+        session.answered = 0
+        session.next_question()
+        session.submit_answer(1)
+
+    results.append(measure(
+        "shuffle_and_check_answer", ask_and_answer, {"options": 4},
+        config.repeat, config.min_time
+    ))
+    return results
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏁 Session Benchmarks Module
+
+Headless end-to-end quizzes per second.
+
+File: bench_session.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    Plays complete quizzes without a terminal: select the questions from
+    the packaged bank, ask each one, answer it and build the summary. The
+    ops_per_sec figure of each result is the number of whole quizzes one
+    process can run per second.
+
+    Also measures one phase-timing mark of the terminal quiz, timing on
+    and off, to keep the instrumentation's cost in view, and one append
+    to the answer event log (with its share of the group commits).
+
+Functions:
+    play_quiz(): Play one headless quiz
+    run(): Run the session benchmarks
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import random
+import tempfile
+
+from mushroom_quiz.core.instrumentation import PhaseTimer
+from mushroom_quiz.core.quiz_engine import QuizGame
+from mushroom_quiz.data.question_loader import get_question_bank
+from mushroom_quiz.stats.event_log import EventLog
+
+from .harness import measure
+
+def play_quiz(difficulty, num_questions, rng):
+    """
+    Play one headless quiz with random answers.
+
+    Returns:
+        QuizSummary: Final results of the quiz
+    """
+    session = QuizGame(difficulty, num_questions).new_session()
+    while not session.finished:
+        asked = session.next_question()
+        session.submit_answer(rng.randint(1, len(asked.options)))
+    return session.summary()
+
+def run(config):
+    """
+    Run the session benchmarks.
+
+    Args:
+        config (BenchConfig): Shared benchmark settings
+
+    Returns:
+        list: Result dictionaries
+    """
+    # Load the bank up front so the first timed quiz does not pay for it
+    get_question_bank()
+    rng = random.Random(0)
+    results = []
+    for difficulty, num_questions in (("mixed", 10), ("beginner", 5), ("mixed", 20)):
+        results.append(measure(
+            "headless_quiz",
+            lambda: play_quiz(difficulty, num_questions, rng),
+            {"difficulty": difficulty, "num_questions": num_questions},
+            config.repeat, config.min_time
+        ))
+    
+    # The guard QuizGame runs before each mark, with timing off and on
+    for timing in (None, PhaseTimer()):
+        def mark(timing=timing):
+            if timing is not None:
+                timing.mark("render")
+        results.append(measure("phase_mark", mark, {"enabled": timing is not None},
+                               config.repeat, config.min_time))
+    
+    # Appends include every batch_size-th call writing the batch
+    with tempfile.TemporaryDirectory() as directory:
+        with EventLog(directory, flush_interval=None) as log:
+            results.append(measure(
+                "event_append",
+                lambda: log.append(1, 2, 0, True, False, 0.5, 1700000000.0),
+                {"batch_size": log.batch_size}, config.repeat, config.min_time
+            ))
+    return results
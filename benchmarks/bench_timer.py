@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏱️ Timer Benchmarks Module
+
+Wake-up latency of the deadline scheduler and of timed input.
+
+File: bench_timer.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    Measures how late scheduler callbacks run after their deadline, with
+    one deadline at a time and with many deadlines pending at once, and
+    how long a timed question takes to return after its answer line is
+    written. Answers are fed through a pipe standing in for stdin, so the
+    timed-input path is the same one players use.
+
+Functions:
+    run(): Run the timer benchmarks
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import os
+import threading
+import time
+
+from mushroom_quiz.core.scheduler import DeadlineScheduler
+from mushroom_quiz.core.stdin_reader import StdinReader
+from mushroom_quiz.core.timer import TimedInput
+
+from .harness import latency_result, null_output
+
+# Delay before each deadline, long enough to always be in the future
+DEADLINE_DELAY = 0.002
+PENDING_DEADLINES = 1000
+
+def scheduler_latency(scheduler, samples):
+    """Lateness of single deadlines, one at a time"""
+    latencies = []
+    for _ in range(samples):
+        fired = threading.Event()
+        lateness = []
+
+        def callback(deadline):
+            lateness.append(scheduler.clock() - deadline)
+            fired.set()
+
+        deadline = scheduler.clock() + DEADLINE_DELAY
+        scheduler.call_at(deadline, callback, deadline)
+        fired.wait()
+        latencies.append(lateness[0])
+    return latencies
+
+def loaded_scheduler_latency(scheduler, samples):
+    """Lateness of single deadlines while many far-off deadlines are pending"""
+    handles = [scheduler.call_later(3600, lambda: None) for _ in range(PENDING_DEADLINES)]
+    try:
+        return scheduler_latency(scheduler, samples)
+    finally:
+        for handle in handles:
+            handle.cancel()
+
+def answer_latency(scheduler, samples):
+    """Time from writing an answer line to get_timed_input() returning"""
+    read_fd, write_fd = os.pipe()
+    stream = os.fdopen(read_fd, 'rb', buffering=0)
+    reader = StdinReader(stream)
+    latencies = []
+    try:
+        for _ in range(samples):
+            timer = TimedInput(30, scheduler, reader)
+            sent_at = []
+
+            def answer():
+                time.sleep(DEADLINE_DELAY)
+                sent_at.append(time.perf_counter())
+                os.write(write_fd, b"1\n")
+
+            thread = threading.Thread(target=answer)
+            thread.start()
+            with null_output():
+                timer.get_timed_input("Answer: ", 4)
+            latencies.append(time.perf_counter() - sent_at[0])
+            thread.join()
+    finally:
+        reader.close()
+        stream.close()
+        os.close(write_fd)
+    return latencies
+
+def run(config):
+    """
+    Run the timer benchmarks.
+
+    Args:
+        config (BenchConfig): Shared benchmark settings
+
+    Returns:
+        list: Result dictionaries
+    """
+    scheduler = DeadlineScheduler(name="bench-deadlines")
+    try:
+        results = [
+            latency_result("scheduler_wakeup", scheduler_latency(scheduler, config.samples),
+                           {"pending": 1}),
+            latency_result("scheduler_wakeup", loaded_scheduler_latency(scheduler, config.samples),
+                           {"pending": PENDING_DEADLINES + 1}),
+            latency_result("timed_answer_wakeup", answer_latency(scheduler, config.samples)),
+        ]
+    finally:
+        scheduler.stop()
+    return results
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧰 Benchmark Harness Module
+
+Timing helpers, synthetic question banks and JSON result files.
+
+File: harness.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module holds everything the benchmark modules share. Throughput
+    benchmarks are timed with timeit: the loop count is grown until one
+    run takes at least min_time, then the run is repeated and the best,
+    median and mean time per operation are reported. Latency benchmarks
+    report the distribution of individual samples measured with
+    perf_counter. Both produce plain dictionaries with the same core keys
+    (best, median, mean, in seconds), so a results file can be compared
+    with one from an earlier release. Memory results use the same keys,
+    in bytes per item.
+
+Classes:
+    BenchConfig: Settings shared by every benchmark module
+
+Functions:
+    measure(): Time a callable and build a throughput result
+    latency_result(): Build a latency result from raw samples
+    memory_result(): Build a memory result from a measured size
+    make_questions(): Build synthetic questions for large banks
+    make_text_questions(): Build synthetic questions with varied wording
+    make_bank(): Build a synthetic QuestionBank
+    null_output(): Context manager sending stdout to os.devnull
+    build_report(): Wrap results with environment metadata
+    write_report(): Write a report as JSON
+    compare_reports(): Median ratios between two reports
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import json
+import os
+import platform
+import random
+import statistics
+import time
+import timeit
+from collections import namedtuple
+from contextlib import contextmanager, redirect_stdout
+
+from mushroom_quiz import __version__
+from mushroom_quiz.data.question_bank import QuestionBank
+
+# Bump when the layout of the results file changes
+REPORT_FORMAT = 1
+
+BenchConfig = namedtuple('BenchConfig', ['repeat', 'min_time', 'bank_sizes', 'samples'])
+
+DIFFICULTIES = ("beginner", "intermediate", "advanced")
+TOPICS = (
+    "growing_conditions", "mushroom_varieties", "substrates", "biology_basics",
+    "sterilization", "medicinal_mushrooms", "cultivation_process",
+    "beginner_varieties", "growing_methods", "timing",
+)
+
+def measure(name, func, params=None, repeat=5, min_time=0.2):
+    """
+    Time a callable and summarise the time per call.
+
+    Args:
+        name (str): Benchmark name
+        func (callable): Zero-argument callable to time
+        params (dict): Parameters recorded with the result
+        repeat (int): Number of timed runs
+        min_time (float): Minimum seconds per run, used to pick the loop count
+
+    Returns:
+        dict: Throughput result
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 10
+    per_op = [total / number for total in timer.repeat(repeat, number)]
+    best = min(per_op)
+    return {
+        "name": name,
+        "params": params or {},
+        "kind": "throughput",
+        "number": number,
+        "repeat": repeat,
+        "best": best,
+        "median": statistics.median(per_op),
+        "mean": statistics.mean(per_op),
+        "ops_per_sec": 1.0 / best if best else None,
+    }
+
+def latency_result(name, samples, params=None):
+    """
+    Summarise individually measured latencies.
+
+    Args:
+        name (str): Benchmark name
+        samples (list): Latencies in seconds
+        params (dict): Parameters recorded with the result
+
+    Returns:
+        dict: Latency result
+    """
+    ordered = sorted(samples)
+    return {
+        "name": name,
+        "params": params or {},
+        "kind": "latency",
+        "samples": len(ordered),
+        "best": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.mean(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+def memory_result(name, total_bytes, count, params=None):
+    """
+    Summarise a memory measurement.
+
+    Args:
+        name (str): Benchmark name
+        total_bytes (int): Bytes measured for all items
+        count (int): Number of items measured
+        params (dict): Parameters recorded with the result
+
+    Returns:
+        dict: Memory result, with best/median/mean in bytes per item
+    """
+    per_item = total_bytes / count
+    return {
+        "name": name,
+        "params": params or {},
+        "kind": "memory",
+        "total_bytes": total_bytes,
+        "count": count,
+        "best": per_item,
+        "median": per_item,
+        "mean": per_item,
+    }
+
+def make_questions(size):
+    """
+    Build synthetic questions shaped like the packaged ones.
+
+    Args:
+        size (int): Number of questions
+
+    Returns:
+        list: Question dictionaries spread across difficulties and topics
+    """
+    questions = []
+    for i in range(size):
+        options = [f"Option {i}-{j}" for j in range(4)]
+        questions.append({
+            'question': f"Synthetic question {i}?",
+            'options': options,
+            'answer': options[i % 4],
+            'difficulty': DIFFICULTIES[i % len(DIFFICULTIES)],
+            'explanation': f"Explanation for question {i}.",
+            'topic': TOPICS[i % len(TOPICS)],
+        })
+    return questions
+
+# Syllables for the made-up words of make_text_questions()
+SYLLABLES = (
+    "my", "co", "spo", "re", "ga", "ri", "cus", "ple", "ro", "tus", "len", "ti",
+    "nu", "la", "her", "ci", "um", "sub", "stra", "te", "ste", "ril", "fru", "it",
+)
+
+def make_text_questions(size, vocabulary=5000, words=12, seed=0):
+    """
+    Build synthetic questions whose wording varies like real text.
+
+    Words are drawn from a made-up vocabulary with Zipf-like frequencies,
+    so a few words are common and most are rare, and no two questions are
+    near-duplicates of each other by accident.
+
+    Args:
+        size (int): Number of questions
+        vocabulary (int): Number of distinct words
+        words (int): Words per question
+        seed (int): Seed of the generator, so runs are comparable
+
+    Returns:
+        list: Question dictionaries spread across difficulties and topics
+    """
+    rng = random.Random(seed)
+    lexicon = sorted({
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        for _ in range(vocabulary * 2)
+    })[:vocabulary]
+    rng.shuffle(lexicon)
+    weights = [1.0 / rank for rank in range(1, len(lexicon) + 1)]
+    questions = []
+    for i in range(size):
+        text = rng.choices(lexicon, weights, k=words + 16)
+        options = [" ".join(text[words + 4 * j:words + 4 * j + 4]) for j in range(4)]
+        questions.append({
+            'question': " ".join(text[:words]) + "?",
+            'options': options,
+            'answer': options[i % 4],
+            'difficulty': DIFFICULTIES[i % len(DIFFICULTIES)],
+            'explanation': " ".join(rng.choices(lexicon, weights, k=words)) + ".",
+            'topic': TOPICS[i % len(TOPICS)],
+        })
+    return questions
+
+def make_bank(size):
+    """
+    Build a synthetic QuestionBank.
+
+    Args:
+        size (int): Number of questions
+
+    Returns:
+        QuestionBank: Bank with version 'synthetic-<size>'
+    """
+    return QuestionBank(make_questions(size), version=f"synthetic-{size}")
+
+@contextmanager
+def null_output():
+    """Send stdout to os.devnull, so writes still cost a real system call"""
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        with redirect_stdout(devnull):
+            yield devnull
+
+def build_report(results, config):
+    """
+    Wrap benchmark results with the environment they were measured in.
+
+    Args:
+        results (list): Result dictionaries
+        config (BenchConfig): Settings used for the run
+
+    Returns:
+        dict: Report ready to be written as JSON
+    """
+    return {
+        "format": REPORT_FORMAT,
+        "package_version": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "config": config._asdict(),
+        "results": results,
+    }
+
+def write_report(report, path):
+    """
+    Write a report as indented JSON.
+
+    Args:
+        report (dict): Report from build_report()
+        path (str): Destination file, or '-' for standard output
+    """
+    text = json.dumps(report, indent=2)
+    if path == '-':
+        print(text)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+
+def result_key(result):
+    """Identify a result by name and parameters, for comparisons"""
+    return result["name"], json.dumps(result["params"], sort_keys=True)
+
+def compare_reports(old, new):
+    """
+    Compare the median of every benchmark present in both reports.
+
+    Args:
+        old (dict): Baseline report
+        new (dict): Report to compare against the baseline
+
+    Returns:
+        list: (name, params, old_median, new_median, ratio) tuples, where a
+            ratio below 1.0 means the new run is faster
+    """
+    baseline = {result_key(result): result for result in old["results"]}
+    rows = []
+    for result in new["results"]:
+        before = baseline.get(result_key(result))
+        if before is None:
+            continue
+        ratio = result["median"] / before["median"] if before["median"] else None
+        rows.append((result["name"], result["params"], before["median"], result["median"], ratio))
+    return rows
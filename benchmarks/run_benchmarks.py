@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏃 Benchmark Runner Module
+
+Command-line entry point for the benchmark suite.
+
+File: run_benchmarks.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    Runs the selected benchmark groups, prints a one-line summary per
+    result, and writes the full results as JSON. With --compare, each
+    median is also shown next to the same benchmark from an earlier
+    results file (a ratio below 1.00 means the current run is faster, or
+    uses less memory for memory results).
+
+Functions:
+    build_parser(): Build the command-line parser
+    main(): Run the benchmarks
+
+Usage:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --quick --only selection render
+    python -m benchmarks.run_benchmarks --output v2.0.1.json --compare v2.0.0.json
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import argparse
+import json
+import sys
+
+from . import bench_memory, bench_render, bench_selection, bench_session, bench_text, bench_timer
+from .harness import BenchConfig, build_report, compare_reports, result_key, write_report
+
+GROUPS = {
+    "selection": bench_selection,
+    "render": bench_render,
+    "timer": bench_timer,
+    "session": bench_session,
+    "text": bench_text,
+    "memory": bench_memory,
+}
+
+def build_parser():
+    """Build the command-line parser for the benchmark runner"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run_benchmarks",
+        description="Measure quiz performance and write the results as JSON."
+    )
+    parser.add_argument("--output", "-o", default="benchmark-results.json",
+                        help="results file to write, or '-' for stdout (default: %(default)s)")
+    parser.add_argument("--only", nargs="+", choices=sorted(GROUPS), metavar="GROUP",
+                        help=f"benchmark groups to run (default: all of {', '.join(GROUPS)})")
+    parser.add_argument("--quick", action="store_true",
+                        help="fewer repeats and banks up to 10^4 questions, for a fast check")
+    parser.add_argument("--max-bank-size", type=int, default=None,
+                        help="largest synthetic bank for selection benchmarks (default: 10^6, 10^4 with --quick)")
+    parser.add_argument("--compare", metavar="RESULTS",
+                        help="earlier results file to compare medians against")
+    return parser
+
+def make_config(args):
+    """Build the shared benchmark settings from parsed arguments"""
+    max_size = args.max_bank_size or (10 ** 4 if args.quick else 10 ** 6)
+    bank_sizes = []
+    size = 100
+    while size <= max_size:
+        bank_sizes.append(size)
+        size *= 10
+    if args.quick:
+        return BenchConfig(repeat=3, min_time=0.02, bank_sizes=bank_sizes, samples=50)
+    return BenchConfig(repeat=5, min_time=0.2, bank_sizes=bank_sizes, samples=500)
+
+def format_value(value, kind):
+    """Format a median in the unit of its result kind"""
+    if kind == "memory":
+        return f"{value:10.1f} B"
+    return f"{value * 1e6:10.2f} µs"
+
+def describe(result):
+    """Format one result as a summary line"""
+    params = " ".join(f"{key}={value}" for key, value in result["params"].items())
+    if result["kind"] == "memory":
+        return (f"{result['name']:<26} {params:<48} {result['median']:12.1f} B/question"
+                f"  ({result['total_bytes'] / 2 ** 20:,.1f} MiB)")
+    line = f"{result['name']:<26} {params:<48} median {result['median'] * 1e6:12.2f} µs"
+    if result["kind"] == "throughput":
+        line += f"  ({result['ops_per_sec']:,.0f}/s)"
+    else:
+        line += f"  (p95 {result['p95'] * 1e6:.0f} µs)"
+    return line
+
+def main(argv=None):
+    """
+    Run the benchmarks.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        int: Process exit status
+    """
+    args = build_parser().parse_args(argv)
+    config = make_config(args)
+    # Progress goes to stderr so '--output -' stays valid JSON
+    log = sys.stderr
+
+    results = []
+    for name in args.only or GROUPS:
+        print(f"Running {name} benchmarks...", file=log)
+        for result in GROUPS[name].run(config):
+            print("  " + describe(result), file=log)
+            results.append(result)
+
+    report = build_report(results, config)
+    write_report(report, args.output)
+    if args.output != '-':
+        print(f"Results written to {args.output}", file=log)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {args.compare} (version {baseline.get('package_version')}):", file=log)
+        kinds = {result_key(result): result["kind"] for result in report["results"]}
+        for name, params, before, after, ratio in compare_reports(baseline, report):
+            kind = kinds[result_key({"name": name, "params": params})]
+            params = " ".join(f"{key}={value}" for key, value in params.items())
+            shown = f"{ratio:.2f}x" if ratio is not None else "n/a"
+            print(f"  {name:<26} {params:<48} {format_value(before, kind)} -> "
+                  f"{format_value(after, kind)}  {shown}", file=log)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
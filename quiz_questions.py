@@ -8,15 +8,19 @@ difficulty levels and topic categories for educational assessment.
 
 File: quiz_questions.py
 Author: Aaron J
-Version: 2.0.0
+Version: 2.0.1
 Created: 2025-06-21
-Last Modified: 2025-06-21
+Last Modified: 2026-10-18
 
 Description:
     This module contains the complete question database for the mushroom
-    cultivation quiz application. It includes 111+ carefully crafted questions
-    covering all aspects of mushroom cultivation, from basic biology to
-    advanced growing techniques and medicinal properties.
+    cultivation quiz application. It covers all aspects of mushroom
+    cultivation, from basic biology to advanced growing techniques and
+    medicinal properties.
+
+    Generated by `mushroom-quiz compile` from
+    src/mushroom_quiz/data/questions.json. Do not edit: change
+    questions.json and compile again.
 
 Database Structure:
     Each question is a dictionary containing:
@@ -27,14 +31,14 @@ Database Structure:
     - explanation: Educational explanation of the correct answer
     - topic: Category for study recommendations
 
-Statistics (as of v2.0.0):
+Statistics:
     Total Questions: 111
-    
+
     Difficulty Distribution:
     - Beginner: 38 questions (34.2%)
     - Intermediate: 46 questions (41.4%)
     - Advanced: 27 questions (24.3%)
-    
+
     Topic Distribution:
     - Cultivation Process: 22 questions (19.8%)
     - Medicinal Mushrooms: 19 questions (17.1%)
@@ -77,12 +81,6 @@ Data Quality:
     - Progressive difficulty appropriate for skill levels
     - Real-world applicable knowledge
 
-Maintenance:
-    - Questions can be easily added to the QUESTIONS list
-    - Follow existing format for consistency
-    - Ensure all topics and difficulties are represented
-    - Verify answer accuracy and explanation quality
-
 License:
     MIT License - See LICENSE file for details
 """
@@ -1004,4 +1002,3 @@ def get_topic_distribution():
         topic = question["topic"]
         topics[topic] = topics.get(topic, 0) + 1
     return topics
-
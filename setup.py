@@ -27,6 +27,7 @@ setup(
     url="https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    package_data={"mushroom_quiz": ["data/*.json"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Education",
@@ -42,6 +43,10 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=read_requirements(),
+    extras_require={
+        # Vectorized item selection for the adaptive mode
+        "fast": ["numpy>=1.17"],
+    },
     entry_points={
         "console_scripts": [
             "mushroom-quiz=mushroom_quiz:main",
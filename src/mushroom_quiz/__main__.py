@@ -26,7 +26,9 @@ Repository:
     https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
 """
 
+import sys
+
 from .app import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
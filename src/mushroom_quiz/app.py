@@ -11,7 +11,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-21
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 
 Description:
     This is the main entry point for the modular mushroom cultivation quiz
@@ -24,12 +24,20 @@ Description:
 Features:
     - Interactive main menu system
     - Multiple difficulty levels (Beginner, Intermediate, Advanced, Mixed)
+    - Adaptive mode that picks questions from a running ability estimate
     - Flexible quiz lengths (5, 10, or 20 questions)
     - Optional timer modes (Relaxed, Timed 30s, Speed 15s)
     - Comprehensive question database with 111+ questions
     - Personalized study recommendations
     - Colorful terminal interface with emojis
     - Session management and replay functionality
+    - Command-line subcommands for non-interactive modes
+    - Statistics across sessions and a spaced-repetition review mode
+    - Keyword search and study quizzes on the questions matching a query
+    - Quizzes from other question files, streaming JSON Lines banks too large for memory
+    - Memory-mapped binary banks that open instantly at any size
+    - Live quiz metrics in the Prometheus format for kiosks and servers
+    - Append-only binary answer event log for analytics
 
 Usage:
     python -m mushroom_quiz
@@ -37,6 +45,18 @@ Usage:
     from mushroom_quiz import main
     main()
 
+Commands:
+    mushroom-quiz                 Interactive terminal quiz (default)
+    mushroom-quiz serve           Multi-session asyncio quiz server over TCP
+    mushroom-quiz api             HTTP JSON quiz API (and web app) for browsers
+    mushroom-quiz loadtest        Simulated players measuring a running quiz server
+    mushroom-quiz generate        Bulk quiz papers and answer keys (jsonl, txt, html)
+    mushroom-quiz stats           Accuracy by topic and recent sessions for a player
+    mushroom-quiz duplicates      Near-duplicate question clusters, or check new submissions
+    mushroom-quiz search          Ranked keyword and phrase search over the questions
+    mushroom-quiz pack            Compile a question file into a memory-mapped binary bank
+    mushroom-quiz compile         Build the web shards and Python module from questions.json
+
 License:
     MIT License - See LICENSE file for details
     
@@ -44,48 +64,470 @@ Repository:
     https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
 """
 
-from .ui import (clear_screen, print_header, display_main_menu, display_about,
+import argparse
+import getpass
+import os
+import sqlite3
+import sys
+import time
+
+from .ui import (show_screen, display_main_menu, display_about,
                  get_difficulty_level, get_number_of_questions, get_timer_mode, Colors)
 from .core import create_quiz
 
-def main():
+def default_user():
+    """Get the player name used when --user is not given"""
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        return "player"
+
+def add_stats_arguments(parser):
+    """Add the options selecting the player and the statistics database"""
+    parser.add_argument("--user", "-u", default=default_user(),
+                        help="player name for statistics (default: login name)")
+    parser.add_argument("--stats-db", metavar="PATH",
+                        help="statistics database (default: ~/.local/share/mushroom_quiz/stats.db)")
+
+def build_parser():
+    """Build the command-line parser for the application and its subcommands"""
+    parser = argparse.ArgumentParser(
+        prog="mushroom-quiz",
+        description="🍄 Mushroom Cultivation Quiz - run with no command for the interactive quiz."
+    )
+    add_stats_arguments(parser)
+    parser.add_argument("--no-stats", action="store_true", help="do not record this session's statistics")
+    parser.add_argument("--bank", metavar="PATH",
+                        help="question file for Start Quiz: JSON, or JSON Lines (.jsonl[.gz]) streamed from disk")
+    parser.add_argument("--timing", nargs="?", const="-", metavar="PATH",
+                        help="time each phase of every question and report at exit (or on SIGUSR1) "
+                             "to PATH (.json for JSON) or stderr")
+    parser.add_argument("--metrics", metavar="[HOST:]PORT",
+                        help="serve live quiz metrics for Prometheus at /metrics (host default: 127.0.0.1)")
+    parser.add_argument("--events", metavar="DIR",
+                        help="append every scored answer to a rotating binary event log in DIR")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    
+    serve = commands.add_parser("serve", help="host many quiz sessions over a line-based TCP protocol")
+    serve.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=7777, help="TCP port to listen on (default: 7777)")
+    # SUPPRESS keeps values given before the command (mushroom-quiz --metrics 9100 serve)
+    serve.add_argument("--metrics", metavar="[HOST:]PORT", default=argparse.SUPPRESS,
+                       help="serve live quiz metrics for Prometheus at /metrics (host default: 127.0.0.1)")
+    serve.add_argument("--events", metavar="DIR", default=argparse.SUPPRESS,
+                       help="append every scored answer to a rotating binary event log in DIR")
+    serve.set_defaults(handler=run_serve)
+    
+    api = commands.add_parser("api", help="serve quizzes to browsers over an HTTP JSON API")
+    api.add_argument("--host", default="127.0.0.1", help="interface to listen on (default: 127.0.0.1)")
+    api.add_argument("--port", type=int, default=8080, help="TCP port to listen on (default: 8080)")
+    api.add_argument("--web-dir", metavar="DIR", help="also serve the web app from this directory at /")
+    api.add_argument("--events", metavar="DIR", default=argparse.SUPPRESS,
+                     help="append every scored answer to a rotating binary event log in DIR")
+    api.set_defaults(handler=run_api)
+    
+    loadtest = commands.add_parser("loadtest", help="play quizzes against a running server with many bots")
+    loadtest.add_argument("--mode", choices=["tcp", "http"], default="tcp",
+                          help="server to test: 'serve' (tcp) or 'api' (http) (default: tcp)")
+    loadtest.add_argument("--host", default="127.0.0.1", help="server address (default: 127.0.0.1)")
+    loadtest.add_argument("--port", type=int, help="server port (default: 7777 for tcp, 8080 for http)")
+    loadtest.add_argument("--bots", "-b", type=int, default=100, help="concurrent simulated players (default: 100)")
+    loadtest.add_argument("--quizzes", "-q", type=int,
+                          help="quizzes per bot (default: 1, or unlimited with --duration)")
+    loadtest.add_argument("--duration", "-d", type=float, metavar="SECONDS",
+                          help="stop starting new quizzes after this many seconds")
+    loadtest.add_argument("--ramp", type=float, default=0.0, metavar="SECONDS",
+                          help="spread bot start times over this many seconds (default: 0)")
+    loadtest.add_argument("--scenario", "-s", action="append", metavar="NAME",
+                          help="preset scenario DIFFICULTY-LENGTH-MODE, e.g. 'beginner-quick-timed'; "
+                               "wildcards allowed, repeatable (default: all)")
+    loadtest.add_argument("--think", default="lognormal:4:0.5", metavar="DIST",
+                          help="seconds before each answer: a number, uniform:LOW:HIGH, exponential:MEAN, "
+                               "normal:MEAN:SD or lognormal:MEDIAN:SIGMA (default: lognormal:4:0.5)")
+    loadtest.add_argument("--accuracy", default="beta:7:3", metavar="DIST",
+                          help="each bot's chance of a correct answer, e.g. 0.8 or beta:ALPHA:BETA "
+                               "(default: beta:7:3)")
+    loadtest.add_argument("--timeout", type=float, default=10.0, metavar="SECONDS",
+                          help="seconds to wait for any one reply (default: 10)")
+    loadtest.add_argument("--seed", type=int, help="seed for the bots' choices, for repeatable runs")
+    loadtest.add_argument("--json", action="store_true", help="print the report as JSON")
+    loadtest.add_argument("--list", action="store_true", help="list the preset scenarios and exit")
+    loadtest.set_defaults(handler=run_loadtest)
+    
+    generate = commands.add_parser("generate", help="write many distinct quiz papers and their answer keys")
+    generate.add_argument("--count", "-n", type=int, default=1, help="number of papers (default: 1)")
+    generate.add_argument("--difficulty", default="mixed",
+                          choices=["beginner", "intermediate", "advanced", "mixed"],
+                          help="difficulty level (default: mixed)")
+    generate.add_argument("--questions", "-q", type=int, default=10, help="questions per paper (default: 10)")
+    generate.add_argument("--format", "-f", dest="format_name", default="jsonl",
+                          choices=["jsonl", "txt", "html"], help="output format (default: jsonl)")
+    generate.add_argument("--output", "-o", default="-", help="papers file, or '-' for stdout (default: -)")
+    generate.add_argument("--answer-key", "-k", help="also write answer keys to this file")
+    generate.add_argument("--seed", type=int, help="base seed of the run (default: random); reuse it to regenerate")
+    generate.add_argument("--workers", "-j", type=int, default=os.cpu_count() or 1,
+                          help="worker processes (default: number of CPUs)")
+    generate.set_defaults(handler=run_generate)
+    
+    stats = commands.add_parser("stats", help="show a player's accuracy by topic and recent sessions")
+    add_stats_arguments(stats)
+    stats.set_defaults(handler=run_stats)
+    
+    duplicates = commands.add_parser("duplicates", help="report near-duplicate questions in a bank")
+    duplicates.add_argument("--bank", metavar="PATH", help="question file to scan (default: bundled questions)")
+    duplicates.add_argument("--check", metavar="PATH",
+                            help="only check the questions in this file against the bank (exit 1 if any match)")
+    duplicates.add_argument("--threshold", type=float, default=0.8,
+                            help="estimated similarity that counts as a duplicate, above 0 and at most 1; "
+                                 "the LSH banding is tuned to it (default: 0.8)")
+    duplicates.set_defaults(handler=run_duplicates)
+    
+    search = commands.add_parser("search", help="find questions by keyword or \"quoted phrase\"")
+    search.add_argument("query", nargs="+", help="words and quoted phrases, any of which may match")
+    search.add_argument("--limit", "-n", type=int, default=10, help="most hits to show (default: 10)")
+    search.add_argument("--all", action="store_true", help="show every matching question")
+    search.add_argument("--bank", metavar="PATH", help="question file to search (default: bundled questions)")
+    search.set_defaults(handler=run_search)
+    
+    pack = commands.add_parser("pack", help="compile a question file into a memory-mapped binary bank")
+    pack.add_argument("output", help="binary bank to write (.mqb)")
+    pack.add_argument("--bank", metavar="PATH", help="JSON, JSON Lines or binary question file "
+                      "(default: bundled questions)")
+    pack.set_defaults(handler=run_pack)
+    
+    compiler = commands.add_parser("compile", help="build the web question shards and legacy Python "
+                                   "module from questions.json (run from the repository root)")
+    compiler.add_argument("--source", metavar="PATH", help="JSON question file (default: bundled questions)")
+    compiler.add_argument("--web-dir", default="web", help="web app directory (default: web)")
+    compiler.add_argument("--python", metavar="PATH", default="quiz_questions.py",
+                          help="legacy Python module to write, or '' for none (default: quiz_questions.py)")
+    compiler.add_argument("--binary", metavar="PATH", help="also write a binary bank (.mqb)")
+    compiler.add_argument("--check", action="store_true",
+                          help="write nothing; exit with status 1 if any output is out of date")
+    compiler.set_defaults(handler=run_compile)
+    
+    return parser
+
+def main(argv=None):
     """Main application entry point"""
-    clear_screen()
-    print_header()
+    args = build_parser().parse_args(argv)
+    handler = getattr(args, "handler", None)
+    if handler is not None:
+        return handler(args)
+    bank = None
+    if args.bank:
+        from .data import open_question_source
+        try:
+            bank = open_question_source(args.bank)
+            # Reading the version opens the file, so a bad path fails here
+            bank.version
+        except (OSError, ValueError) as e:
+            print(f"{Colors.FAIL}Cannot read questions: {e}{Colors.ENDC}", file=sys.stderr)
+            return 2
+    if args.timing:
+        from .core.instrumentation import enable_phase_timing
+        enable_phase_timing(args.timing)
+    if args.metrics and not serve_metrics(args.metrics):
+        return 2
+    if args.events and not open_events(args.events):
+        return 2
+    stats = None if args.no_stats else open_stats(args.stats_db)
+    try:
+        run_interactive(stats, args.user, bank)
+    finally:
+        if stats is not None:
+            stats.close()
+
+def open_stats(path=None):
+    """Open the statistics store, or warn and return None if it is unavailable"""
+    from .stats import StatsStore
+    try:
+        return StatsStore(path)
+    except (sqlite3.Error, OSError) as e:
+        print(f"{Colors.WARNING}Statistics are disabled: {e}{Colors.ENDC}", file=sys.stderr)
+        return None
+
+def serve_metrics(address):
+    """Serve /metrics from a background thread; report failure and return False"""
+    from .stats.metrics import parse_address, start_metrics_server
+    try:
+        host, port = parse_address(address)
+        start_metrics_server(host, port)
+    except (OSError, ValueError) as e:
+        print(f"{Colors.FAIL}Cannot serve metrics on {address}: {e}{Colors.ENDC}", file=sys.stderr)
+        return False
+    return True
+
+def open_events(directory):
+    """Open the process's answer event log; report failure and return False"""
+    from .stats.event_log import open_event_log
+    try:
+        open_event_log(directory)
+    except OSError as e:
+        print(f"{Colors.FAIL}Cannot open the event log in {directory}: {e}{Colors.ENDC}", file=sys.stderr)
+        return False
+    return True
+
+def run_serve(args):
+    """Run the multi-session quiz server"""
+    from .server import run_server
+    if args.metrics and not serve_metrics(args.metrics):
+        return 2
+    if args.events and not open_events(args.events):
+        return 2
+    run_server(args.host, args.port)
+
+def run_api(args):
+    """Serve the HTTP quiz API until interrupted"""
+    from .server import run_api as serve_api
+    if args.web_dir is not None and not os.path.isdir(args.web_dir):
+        print(f"{Colors.FAIL}No web app directory at {args.web_dir}.{Colors.ENDC}", file=sys.stderr)
+        return 2
+    # The API serves /metrics itself; a top-level --metrics adds its own port
+    if args.metrics and not serve_metrics(args.metrics):
+        return 2
+    if args.events and not open_events(args.events):
+        return 2
+    serve_api(args.host, args.port, args.web_dir)
+    return 0
+
+def run_loadtest(args):
+    """Play quizzes against a running server with simulated players and report latencies"""
+    from .server.loadtest import (parse_distribution, preset_scenarios, run_loadtest as load,
+                                  select_scenarios)
+    if args.list:
+        for scenario in preset_scenarios():
+            timer = f"{scenario.timer_seconds}s" if scenario.timer_seconds else "untimed"
+            print(f"{scenario.name:<28} {scenario.num_questions:>3} questions, {timer}")
+        return 0
+    if args.bots < 1 or (args.quizzes is not None and args.quizzes < 1):
+        print(f"{Colors.FAIL}--bots and --quizzes must be at least 1.{Colors.ENDC}", file=sys.stderr)
+        return 2
+    try:
+        scenarios = select_scenarios(args.scenario or ["all"])
+        think = parse_distribution(args.think)
+        accuracy = parse_distribution(args.accuracy)
+    except ValueError as e:
+        print(f"{Colors.FAIL}{e}{Colors.ENDC}", file=sys.stderr)
+        return 2
+    
+    try:
+        report = load(mode=args.mode, host=args.host, port=args.port, bots=args.bots,
+                      quizzes=args.quizzes, duration=args.duration, ramp=args.ramp,
+                      scenarios=scenarios, think=think, accuracy=accuracy, seed=args.seed,
+                      timeout=args.timeout, json=args.json)
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}Load test interrupted.{Colors.ENDC}", file=sys.stderr)
+        return 1
+    if report.quizzes == 0 and report.errors:
+        command = "serve" if args.mode == "tcp" else "api"
+        print(f"{Colors.FAIL}No quiz completed; is 'mushroom-quiz {command}' running?{Colors.ENDC}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+def run_generate(args):
+    """Generate quiz papers (and answer keys) to files or stdout"""
+    from .papers import write_papers
+    if args.count < 1 or args.questions < 1:
+        print(f"{Colors.FAIL}--count and --questions must be at least 1.{Colors.ENDC}", file=sys.stderr)
+        return 2
+    
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    key_out = open(args.answer_key, "w", encoding="utf-8") if args.answer_key else None
+    try:
+        seed = write_papers(out, args.difficulty, args.questions, args.count, args.format_name,
+                            args.seed, key_out, max(1, args.workers))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if key_out is not None:
+            key_out.close()
+    papers = "paper" if args.count == 1 else "papers"
+    print(f"{Colors.GREEN}🍄 Generated {args.count} {papers} (seed {seed}).{Colors.ENDC}", file=sys.stderr)
+    return 0
+
+def run_stats(args):
+    """Print a player's accuracy by topic and recent sessions"""
+    stats = open_stats(args.stats_db)
+    if stats is None:
+        return 1
+    with stats:
+        topics = stats.accuracy_by_topic(args.user)
+        sessions = stats.recent_sessions(args.user)
+    
+    if not topics:
+        print(f"{Colors.YELLOW}No answers recorded for {args.user} yet. 🍄{Colors.ENDC}")
+        return 0
+    print(f"\n{Colors.BOLD}{Colors.CYAN}📈 Accuracy by topic for {args.user}:{Colors.ENDC}")
+    for row in topics:
+        color = Colors.GREEN if row.accuracy >= 0.7 else Colors.YELLOW if row.accuracy >= 0.5 else Colors.RED
+        print(f"{color}{row.topic:<22} {row.correct:>5}/{row.answered:<5} {row.accuracy:6.1%}{Colors.ENDC}")
+    if sessions:
+        print(f"\n{Colors.BOLD}Recent sessions:{Colors.ENDC}")
+        for session in sessions:
+            played = time.strftime("%Y-%m-%d %H:%M", time.localtime(session.started_at))
+            print(f"{played}  {session.difficulty:<12} {session.score}/{session.total}")
+    return 0
+
+def run_duplicates(args):
+    """Report near-duplicate clusters in a bank, or flag new questions that duplicate it"""
+    from .data.dedup import DuplicateIndex, find_duplicate_clusters
+    from .data.question_loader import QUESTIONS_FILE, load_questions
+    if not 0 < args.threshold <= 1:
+        print(f"{Colors.FAIL}--threshold must be between 0 and 1.{Colors.ENDC}", file=sys.stderr)
+        return 2
+    try:
+        bank, _ = load_questions(args.bank or QUESTIONS_FILE)
+        submitted = load_questions(args.check, use_cache=False)[0] if args.check else None
+    except (OSError, ValueError) as e:
+        print(f"{Colors.FAIL}Cannot read questions: {e}{Colors.ENDC}", file=sys.stderr)
+        return 2
+    
+    if submitted is not None:
+        index = DuplicateIndex(bank, threshold=args.threshold)
+        flagged = 0
+        for number, question in enumerate(submitted, 1):
+            matches = index.query(question)
+            if matches:
+                flagged += 1
+                print(f"{Colors.YELLOW}#{number}: {question['question']}{Colors.ENDC}")
+                for match in matches:
+                    print(f"    {match.similarity:4.0%}  {bank[match.index]['question']}")
+        print(f"\n{flagged} of {len(submitted)} submitted questions look like duplicates.")
+        return 1 if flagged else 0
+    
+    clusters = find_duplicate_clusters(bank, args.threshold)
+    for number, cluster in enumerate(clusters, 1):
+        print(f"{Colors.BOLD}Cluster {number} ({len(cluster)} questions):{Colors.ENDC}")
+        for i in cluster:
+            print(f"    [{i}] {bank[i]['question']}")
+    print(f"\n{len(clusters)} near-duplicate clusters in {len(bank)} questions.")
+    return 0
+
+def run_search(args):
+    """Print the questions that best match a keyword query"""
+    from .data.search import get_search_index
+    from .data.question_bank import QuestionBank
+    from .data.question_loader import get_question_bank, load_questions
+    if args.limit < 1:
+        print(f"{Colors.FAIL}--limit must be at least 1.{Colors.ENDC}", file=sys.stderr)
+        return 2
+    try:
+        bank = QuestionBank(*load_questions(args.bank)) if args.bank else get_question_bank()
+    except (OSError, ValueError) as e:
+        print(f"{Colors.FAIL}Cannot read questions: {e}{Colors.ENDC}", file=sys.stderr)
+        return 2
+    
+    query = " ".join(args.query)
+    hits = get_search_index(bank).search(query, limit=None if args.all else args.limit)
+    for rank, hit in enumerate(hits, 1):
+        question = bank[hit.index]
+        print(f"{rank:>3}. {hit.score:6.2f}  {Colors.CYAN}{question['difficulty']:<12}{Colors.ENDC} "
+              f"{question['question']}")
+    if not hits:
+        print(f"{Colors.YELLOW}No questions match {query!r}. 🍄{Colors.ENDC}")
+        return 1
+    return 0
+
+def run_pack(args):
+    """Write a question file as a binary bank, keeping its version where it has one"""
+    from .data.binary_bank import BINARY_SUFFIX, write_binary_bank
+    from .data.question_bank import QuestionBank
+    from .data.question_loader import QUESTIONS_FILE, open_question_source
+    if not args.output.endswith(BINARY_SUFFIX):
+        print(f"{Colors.FAIL}The output file must end in {BINARY_SUFFIX}.{Colors.ENDC}", file=sys.stderr)
+        return 2
+    try:
+        source = open_question_source(args.bank or QUESTIONS_FILE)
+        # A streamed file's version only fingerprints its ends, so the
+        # binary bank gets a digest of its own records instead
+        version = source.version if isinstance(source, QuestionBank) else None
+        count = write_binary_bank(source, args.output, version=version)
+    except (OSError, ValueError) as e:
+        print(f"{Colors.FAIL}Cannot pack questions: {e}{Colors.ENDC}", file=sys.stderr)
+        return 2
+    print(f"Packed {count} questions into {args.output}.")
+    return 0
+
+def run_compile(args):
+    """Build (or check) every generated copy of the question bank"""
+    from .data.compiler import compile_bank
+    from .data.question_loader import QUESTIONS_FILE
+    if not os.path.isdir(args.web_dir):
+        print(f"{Colors.FAIL}No web app directory at {args.web_dir}.{Colors.ENDC}", file=sys.stderr)
+        return 2
+    try:
+        result = compile_bank(args.source or QUESTIONS_FILE, args.web_dir, args.python or None,
+                              args.binary, check=args.check)
+    except (OSError, ValueError) as e:
+        print(f"{Colors.FAIL}Cannot compile questions: {e}{Colors.ENDC}", file=sys.stderr)
+        return 2
+    
+    if args.check:
+        for path in result.written:
+            print(f"{Colors.YELLOW}out of date: {path}{Colors.ENDC}")
+        for path in result.removed:
+            print(f"{Colors.YELLOW}stale: {path}{Colors.ENDC}")
+        if result.written or result.removed:
+            print("Run 'mushroom-quiz compile' to rebuild.")
+            return 1
+        print(f"All {len(result.unchanged)} compiled outputs are up to date.")
+        return 0
+    for path in result.written:
+        print(f"wrote   {path} ({os.path.getsize(path):,} bytes)")
+    for path in result.removed:
+        print(f"removed {path}")
+    print(f"{Colors.GREEN}🍄 {len(result.written)} written, {len(result.unchanged)} unchanged, "
+          f"{len(result.removed)} removed.{Colors.ENDC}")
+    return 0
+
+def run_interactive(stats=None, user=None, bank=None):
+    """Run the interactive terminal quiz menu (recording to stats, if given)"""
+    show_screen()
     
     try:
         while True:
             display_main_menu()
             
             try:
-                choice = int(input(f"\n{Colors.BOLD}Enter your choice (1-3): {Colors.ENDC}"))
+                choice = int(input(f"\n{Colors.BOLD}Enter your choice (1-5): {Colors.ENDC}"))
                 
-                if choice == 1:
-                    # Start Quiz
-                    run_quiz_session()
+                if choice in (1, 2):
+                    # Start Quiz, or a review quiz of due questions
+                    if choice == 1:
+                        run_quiz_session(stats, user, bank)
+                    else:
+                        run_review_session(stats, user)
                     
                     # Ask if they want to play again
                     play_again = input(f"\n{Colors.BOLD}Would you like to play again? (y/n): {Colors.ENDC}").lower()
                     if play_again != 'y':
                         break
                     else:
-                        clear_screen()
-                        print_header()
+                        show_screen()
                         
-                elif choice == 2:
+                elif choice == 3:
+                    # Study quiz on the questions matching a keyword query
+                    if run_keyword_session(stats, user) is not None:
+                        play_again = input(f"\n{Colors.BOLD}Would you like to play again? (y/n): {Colors.ENDC}").lower()
+                        if play_again != 'y':
+                            break
+                    show_screen()
+                    
+                elif choice == 4:
                     # Show About information
                     display_about()
                     input(f"{Colors.BOLD}Press Enter to return to menu...{Colors.ENDC}")
-                    clear_screen()
-                    print_header()
+                    show_screen()
                     
-                elif choice == 3:
+                elif choice == 5:
                     # Exit application
                     print(f"\n{Colors.GREEN}Thanks for playing! Happy mushroom growing! 🍄🌟{Colors.ENDC}")
                     break
                     
                 else:
-                    print(f"{Colors.FAIL}Please enter a number between 1 and 3.{Colors.ENDC}")
+                    print(f"{Colors.FAIL}Please enter a number between 1 and 5.{Colors.ENDC}")
                     
             except ValueError:
                 print(f"{Colors.FAIL}Please enter a valid number.{Colors.ENDC}")
@@ -93,18 +535,58 @@ def main():
     except KeyboardInterrupt:
         print(f"\n\n{Colors.YELLOW}Thanks for playing! 🍄{Colors.ENDC}")
 
-def run_quiz_session():
-    """Handle a complete quiz session"""
-    # Get quiz parameters from user
-    difficulty = get_difficulty_level()
+def run_quiz_session(stats=None, user=None, bank=None):
+    """Handle a complete quiz session (from bank, or the bundled questions)"""
+    from .data import QuestionBank
+    # Get quiz parameters from user; streamed banks cannot run adaptive quizzes
+    difficulty = get_difficulty_level(adaptive=bank is None or isinstance(bank, QuestionBank))
     num_questions = get_number_of_questions()
     timer_seconds = get_timer_mode()
     
     # Run the quiz
-    score, total = create_quiz(difficulty, num_questions, timer_seconds)
+    score, total = create_quiz(difficulty, num_questions, timer_seconds, stats=stats, user=user, bank=bank)
     
-    # Return results (could be used for statistics tracking)
+    # Return results (answers were already recorded in stats, if enabled)
     return score, total
 
+def run_review_session(stats=None, user=None):
+    """Handle a spaced-repetition review quiz of the player's due questions"""
+    from .core.review import ReviewDeck
+    if stats is None:
+        print(f"{Colors.WARNING}Review mode keeps its schedule in the statistics database; "
+              f"run without --no-stats to use it.{Colors.ENDC}")
+        return None
+    
+    deck = ReviewDeck.load(stats, user)
+    print(f"\n{Colors.CYAN}🔁 {deck.due_count()} of {len(deck)} reviewed questions are due; "
+          f"new questions fill any remaining places.{Colors.ENDC}")
+    difficulty = get_difficulty_level()
+    num_questions = get_number_of_questions()
+    timer_seconds = get_timer_mode()
+    
+    try:
+        return create_quiz(difficulty, num_questions, timer_seconds, stats=stats, user=user, selector=deck)
+    finally:
+        # Keep the schedule of everything answered, even if the quiz was interrupted
+        deck.save(stats)
+        stats.flush()
+
+def run_keyword_session(stats=None, user=None):
+    """Handle a study quiz on the questions matching the player's keywords"""
+    from .data import get_question_bank
+    from .data.search import SearchSelector
+    query = input(f"\n{Colors.BOLD}Keywords or \"phrases\" to study: {Colors.ENDC}").strip()
+    selector = SearchSelector(query)
+    matches = len(selector.matches(get_question_bank()))
+    if not matches:
+        print(f"{Colors.YELLOW}No questions match {query!r}.{Colors.ENDC}")
+        input(f"{Colors.BOLD}Press Enter to return to menu...{Colors.ENDC}")
+        return None
+    
+    print(f"\n{Colors.CYAN}🔎 {matches} questions match; the quiz draws from the best matches.{Colors.ENDC}")
+    num_questions = get_number_of_questions()
+    timer_seconds = get_timer_mode()
+    return create_quiz("mixed", num_questions, timer_seconds, stats=stats, user=user, selector=selector)
+
 if __name__ == "__main__":
     main()
@@ -10,7 +10,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-23
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 License: MIT
 
 Description:
@@ -20,6 +20,12 @@ Description:
     
 Exports:
     - create_quiz: Main quiz creation and execution function
+    - QuizGame: Terminal quiz adapter with question selection
+    - QuizSession: Headless quiz state machine
+    - QuizSpec: Bank version, settings and seed that regenerate a quiz
+    - AdaptiveSession: Session that picks questions from an ability estimate
+    - PhaseTimer: Per-phase timing histograms of terminal quizzes
+    - enable_phase_timing: Turn phase timing on for the process
     - get_user_input: Timer-aware user input function
     - TimerColors: Color constants for timer display
     
@@ -27,7 +33,12 @@ Repository:
     https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
 """
 
-from .quiz_engine import create_quiz
+from .quiz_engine import create_quiz, QuizGame
+from .quiz_session import QuizSession
+from .quiz_spec import QuizSpec
+from .adaptive import AdaptiveSession
+from .instrumentation import PhaseTimer, enable_phase_timing
 from .timer import get_user_input, Colors as TimerColors
 
-__all__ = ["create_quiz", "get_user_input", "TimerColors"]
+__all__ = ["create_quiz", "QuizGame", "QuizSession", "QuizSpec", "AdaptiveSession", "PhaseTimer",
+           "enable_phase_timing", "get_user_input", "TimerColors"]
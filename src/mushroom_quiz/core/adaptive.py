@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧠 Adaptive Quiz Module
+
+Item response theory quizzes that follow the player's ability.
+
+File: adaptive.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module provides the 'adaptive' quiz mode. Every question carries
+    three-parameter logistic (3PL) item parameters: discrimination a,
+    difficulty b and guessing floor c. Questions may be calibrated with
+    'irt_a', 'irt_b' and 'irt_c' keys; otherwise a defaults to 1, b to a
+    location for the question's difficulty label (beginner -1, intermediate
+    0, advanced +1) and c to one over the number of options, kept below 1.
+
+    The player's ability is estimated as the posterior mean (EAP) over a
+    fixed grid of ability values with a standard normal prior. Each answer
+    multiplies the whole posterior by the item's likelihood in one array
+    operation, and the next question is the unused item with the largest
+    Fisher information at the current estimate: one pass over the
+    parameter arrays and an argmax. Items with equal information (as all
+    uncalibrated items of one difficulty are) are chosen between at random,
+    so players do not all see the same sequence.
+
+    Parameters and the posterior are NumPy arrays when NumPy is installed;
+    otherwise the same computations run over plain lists, so the mode has
+    no hard dependency beyond the standard library.
+
+Classes:
+    ItemModel: 3PL parameters of every question in a bank
+    AbilityEstimate: Posterior over the player's ability
+    AdaptiveSession: QuizSession that picks each question as it is asked
+
+Functions:
+    get_item_model(): Get the (cached) item model of a question bank
+    ability_level(): Difficulty label matching an ability estimate
+
+Constants:
+    ADAPTIVE: Difficulty name that selects the adaptive mode
+
+Usage:
+    from mushroom_quiz.core import QuizGame
+    QuizGame("adaptive", 10).run_quiz()
+
+    from mushroom_quiz.core.adaptive import AdaptiveSession, get_item_model
+    session = AdaptiveSession(get_item_model(bank), 10, target_se=0.4)
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import math
+import random
+import weakref
+
+try:
+    import numpy as np
+except ImportError:  # optional; the pure-Python paths below are used instead
+    np = None
+
+from ..data.binary_bank import MappedQuestionBank
+from .quiz_session import QuizSession
+
+ADAPTIVE = 'adaptive'
+
+# Item difficulty (b) of uncalibrated questions, by difficulty label
+DIFFICULTY_LOCATIONS = {'beginner': -1.0, 'intermediate': 0.0, 'advanced': 1.0}
+DEFAULT_DISCRIMINATION = 1.0
+# Highest guessing floor c; at c = 1 the 3PL terms divide by (1 - c) = 0
+MAX_GUESSING = 0.99
+
+# Ability grid for the posterior: -4 to +4 in steps of 0.1
+GRID_MIN = -4.0
+GRID_MAX = 4.0
+GRID_POINTS = 81
+
+# Items whose information is this close to the best count as tied
+TIE_TOLERANCE = 1e-9
+
+def ability_level(theta):
+    """
+    Get the difficulty label closest to an ability estimate.
+
+    Args:
+        theta (float): Ability on the item difficulty scale
+
+    Returns:
+        str: 'beginner', 'intermediate' or 'advanced'
+    """
+    if theta < -0.5:
+        return 'beginner'
+    if theta < 0.5:
+        return 'intermediate'
+    return 'advanced'
+
+def _parameters(calibration, difficulty, option_count):
+    """Get (a, b, c) from a mapping of calibration keys, or defaults"""
+    a = calibration.get('irt_a', DEFAULT_DISCRIMINATION)
+    b = calibration.get('irt_b', DIFFICULTY_LOCATIONS.get(difficulty, 0.0))
+    c = calibration.get('irt_c', 1.0 / max(1, option_count))
+    return float(a), float(b), min(float(c), MAX_GUESSING)
+
+def _item_parameters(question):
+    """Get (a, b, c) for a question, from calibration keys or defaults"""
+    return _parameters(question, question['difficulty'], len(question['options']))
+
+class ItemModel:
+    """3PL item parameters of every question in a bank, as parallel arrays"""
+
+    def __init__(self, questions, parameters=None):
+        """
+        Build the parameter arrays.
+
+        Args:
+            questions (iterable): Question dictionaries (see _item_parameters
+                for the optional calibration keys)
+            parameters (iterable): (a, b, c) of each question, in order; when
+                given, questions must be a sequence and is kept as it is
+        """
+        if parameters is None:
+            self.questions = tuple(questions)
+            params = [_item_parameters(q) for q in self.questions]
+        else:
+            self.questions = questions
+            params = list(parameters)
+        a = [p[0] for p in params]
+        b = [p[1] for p in params]
+        c = [p[2] for p in params]
+        if np is not None:
+            self.a, self.b, self.c = np.array(a), np.array(b), np.array(c)
+        else:
+            self.a, self.b, self.c = a, b, c
+
+    def __len__(self):
+        return len(self.questions)
+
+    def parameters(self, index):
+        """tuple: (a, b, c) of one item"""
+        return float(self.a[index]), float(self.b[index]), float(self.c[index])
+
+    def new_mask(self):
+        """Get an availability mask with every item available"""
+        if np is not None:
+            return np.ones(len(self), dtype=bool)
+        return [True] * len(self)
+
+    def information(self, theta):
+        """
+        Get the Fisher information of every item at one ability.
+
+        Args:
+            theta (float): Ability
+
+        Returns:
+            Array (or list) of information values, one per item
+        """
+        if np is not None:
+            p = self.c + (1.0 - self.c) / (1.0 + np.exp(-self.a * (theta - self.b)))
+            return self.a ** 2 * ((1.0 - p) / p) * ((p - self.c) / (1.0 - self.c)) ** 2
+        info = []
+        for a, b, c in zip(self.a, self.b, self.c):
+            p = c + (1.0 - c) / (1.0 + math.exp(-a * (theta - b)))
+            info.append(a * a * ((1.0 - p) / p) * ((p - c) / (1.0 - c)) ** 2)
+        return info
+
+    def pick(self, theta, available, rng=random):
+        """
+        Take the most informative available item.
+
+        Args:
+            theta (float): Current ability estimate
+            available: Mask from new_mask(); the picked item is cleared in it
+            rng: Random source for breaking ties
+
+        Returns:
+            int or None: Index of the item, or None when none are left
+        """
+        info = self.information(theta)
+        if np is not None:
+            info[~available] = -1.0
+            best = info.max() if len(info) else -1.0
+            if best < 0:
+                return None
+            ties = np.flatnonzero(info >= best - TIE_TOLERANCE)
+        else:
+            candidates = [value for value, ok in zip(info, available) if ok]
+            if not candidates:
+                return None
+            best = max(candidates)
+            ties = [i for i, (value, ok) in enumerate(zip(info, available))
+                    if ok and value >= best - TIE_TOLERANCE]
+        index = int(ties[rng.randrange(len(ties))])
+        available[index] = False
+        return index
+
+class AbilityEstimate:
+    """Posterior over a player's ability on a fixed grid"""
+
+    def __init__(self, points=GRID_POINTS, low=GRID_MIN, high=GRID_MAX):
+        """
+        Start from a standard normal prior.
+
+        Args:
+            points (int): Number of grid points
+            low (float): Lowest ability on the grid
+            high (float): Highest ability on the grid
+        """
+        step = (high - low) / (points - 1)
+        grid = [low + i * step for i in range(points)]
+        # Log-posterior, so long quizzes cannot underflow
+        log_post = [-0.5 * x * x for x in grid]
+        if np is not None:
+            self._grid, self._log_post = np.array(grid), np.array(log_post)
+        else:
+            self._grid, self._log_post = grid, log_post
+        self._summarise()
+
+    def update(self, a, b, c, correct):
+        """
+        Apply one answer to the posterior.
+
+        Args:
+            a (float): Item discrimination
+            b (float): Item difficulty
+            c (float): Item guessing floor
+            correct (bool): Whether the answer was correct (timeouts are not)
+        """
+        if np is not None:
+            p = c + (1.0 - c) / (1.0 + np.exp(-a * (self._grid - b)))
+            self._log_post += np.log(p if correct else 1.0 - p)
+        else:
+            for i, x in enumerate(self._grid):
+                p = c + (1.0 - c) / (1.0 + math.exp(-a * (x - b)))
+                self._log_post[i] += math.log(p if correct else 1.0 - p)
+        self._summarise()
+
+    def _summarise(self):
+        """Recompute the posterior mean and standard deviation"""
+        if np is not None:
+            weights = np.exp(self._log_post - self._log_post.max())
+            total = weights.sum()
+            mean = float((weights * self._grid).sum() / total)
+            variance = float((weights * (self._grid - mean) ** 2).sum() / total)
+        else:
+            top = max(self._log_post)
+            weights = [math.exp(v - top) for v in self._log_post]
+            total = sum(weights)
+            mean = sum(w * x for w, x in zip(weights, self._grid)) / total
+            variance = sum(w * (x - mean) ** 2 for w, x in zip(weights, self._grid)) / total
+        self.theta = mean
+        self.standard_error = math.sqrt(variance)
+
+class AdaptiveSession(QuizSession):
+    """Quiz session that picks each question by information at the current ability"""
+
+    def __init__(self, model, num_questions, rng=random, target_se=None):
+        """
+        Create an adaptive session.
+
+        Args:
+            model (ItemModel): Item parameters of the bank to draw from
+            num_questions (int): Maximum number of questions
+            rng: Random source for tie-breaking and option shuffles
+            target_se (float): Stop early once the ability's standard error
+                is at or below this (None asks every question)
+        """
+        super().__init__([], rng)
+        self.model = model
+        self.total = min(num_questions, len(model))
+        self.target_se = target_se
+        self.estimate = AbilityEstimate()
+        self._available = model.new_mask()
+        self._items = []
+
+    @property
+    def ability(self):
+        """float: Current ability estimate"""
+        return self.estimate.theta
+
+    @property
+    def standard_error(self):
+        """float: Standard error of the ability estimate"""
+        return self.estimate.standard_error
+
+    def next_question(self):
+        """Pick the most informative remaining question and ask it"""
+        if self.current is None and not self.finished and len(self._items) == self.answered:
+            index = self.model.pick(self.ability, self._available, self.rng)
+            if index is None:
+                self.total = self.answered
+            else:
+                self._items.append(index)
+                self.questions.append(self.model.questions[index])
+        return super().next_question()
+
+    def submit_answer(self, answer_num):
+        """Score the answer and update the ability estimate"""
+        result = super().submit_answer(answer_num)
+        self.estimate.update(*self.model.parameters(self._items[-1]), result.is_correct)
+        if self.target_se is not None and self.standard_error <= self.target_se:
+            self.total = self.answered
+        return result
+
+_MODELS = weakref.WeakKeyDictionary()
+
+def get_item_model(bank):
+    """
+    Get the item model of a question bank, building it on first use.
+
+    A memory-mapped bank's parameters are read from its records and its
+    questions stay lazy, so building the model decodes none of them.
+
+    Args:
+        bank (QuestionBank): Bank whose questions are modelled
+
+    Returns:
+        ItemModel: Model cached for as long as the bank is alive
+    """
+    model = _MODELS.get(bank)
+    if model is None:
+        if isinstance(bank, MappedQuestionBank):
+            # Parameters come from the record headers; questions are decoded when asked
+            parameters = (_parameters(extra or {}, difficulty, options)
+                          for difficulty, options, extra in bank.item_fields())
+            model = ItemModel(bank.questions, parameters)
+        else:
+            model = ItemModel(bank)
+        model = _MODELS[bank] = model
+    return model
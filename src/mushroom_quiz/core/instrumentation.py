@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏱️ Phase Timing Module
+
+Optional per-phase timings of terminal quiz sessions.
+
+File: instrumentation.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module measures where a terminal quiz's time goes. QuizGame marks
+    the end of each phase of a question (selecting it, drawing it, waiting
+    for the answer, scoring it, showing the result, recording it, waiting
+    to continue) on a PhaseTimer, which adds the time since the previous
+    mark to that phase's histogram. Waiting for the learner is kept apart
+    from the application's own work, so a report tells our slowness from
+    the learner's thinking.
+
+    Histograms have a fixed number of buckets (8 per doubling, from 1 ns
+    to over an hour), so memory does not grow with the number of samples
+    and percentiles are within 12.5% of the true value; count, total,
+    minimum and maximum are exact.
+
+    Timing is off unless enabled (`mushroom-quiz --timing` or the
+    MUSHROOM_QUIZ_TIMING environment variable). When off, QuizGame holds
+    no timer and each mark is a skipped `is not None` test, so the hooks
+    stay in production code at no measurable cost. When on, the report is
+    written at exit and, on Unix, whenever the process receives SIGUSR1.
+
+Phases:
+    prepare   Build the session and select its questions (once per quiz)
+    select    Pick the next question
+    render    Draw the question
+    input     Wait for the learner's answer (learner time)
+    evaluate  Score the answer
+    result    Show the result
+    record    Record the answer in statistics or the review deck
+    continue  Wait for Enter before the next question (learner time)
+
+Classes:
+    Histogram: Fixed-size log-linear histogram of durations
+    PhaseTimer: Per-phase histograms filled from successive marks
+
+Functions:
+    enable_phase_timing(): Turn timing on for the process
+    get_phase_timer(): The process's PhaseTimer, or None when timing is off
+
+Usage:
+    mushroom-quiz --timing                 # report to stderr at exit
+    mushroom-quiz --timing timings.json    # JSON report to a file
+    kill -USR1 <pid>                       # report now
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import atexit
+import json
+import math
+import os
+import signal
+import sys
+import time
+
+PHASES = ("prepare", "select", "render", "input", "evaluate", "result", "record", "continue")
+# Phases spent waiting for the learner rather than working
+LEARNER_PHASES = frozenset(("input", "continue"))
+
+# Buckets per doubling; percentiles are within 1/SUB_BUCKETS of the truth
+SUB_BUCKETS = 8
+# Doublings of a nanosecond covered; 2**42 ns is about 73 minutes
+OCTAVES = 42
+_LAST_BUCKET = OCTAVES * SUB_BUCKETS - 1
+
+class Histogram:
+    """Fixed-size log-linear histogram of durations in seconds"""
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (OCTAVES * SUB_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def bucket(seconds):
+        """
+        Get the bucket index of a duration.
+
+        Args:
+            seconds (float): Duration
+
+        Returns:
+            int: Index into counts; durations beyond the range share the last bucket
+        """
+        nanoseconds = seconds * 1e9
+        if nanoseconds < 1:
+            return 0
+        # nanoseconds = mantissa * 2**exponent with 0.5 <= mantissa < 1
+        mantissa, exponent = math.frexp(nanoseconds)
+        index = (exponent - 2) * SUB_BUCKETS + int(mantissa * 2 * SUB_BUCKETS)
+        return index if index < _LAST_BUCKET else _LAST_BUCKET
+
+    @staticmethod
+    def upper_bound(index):
+        """Largest duration (seconds) counted in a bucket"""
+        octave, step = divmod(index + 1, SUB_BUCKETS)
+        return 2.0 ** octave * (1 + step / SUB_BUCKETS) / 1e9
+
+    def add(self, seconds):
+        """Count one duration"""
+        self.counts[self.bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """
+        Estimate a percentile.
+
+        Args:
+            percent (float): Percentile wanted, 0-100
+
+        Returns:
+            float or None: Upper bound of the bucket holding it (clamped to
+                the exact minimum and maximum), or None if empty
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.max, max(self.min, self.upper_bound(index)))
+        return self.max
+
+    @property
+    def mean(self):
+        """float or None: Mean duration"""
+        return self.total / self.count if self.count else None
+
+class PhaseTimer:
+    """Per-phase duration histograms, filled from successive marks"""
+
+    def __init__(self, clock=time.perf_counter):
+        """
+        Args:
+            clock (callable): Monotonic clock returning seconds
+        """
+        self.clock = clock
+        self.histograms = {phase: Histogram() for phase in PHASES}
+        self._last = clock()
+
+    def start(self):
+        """Start timing the next phase from now"""
+        self._last = self.clock()
+
+    def mark(self, phase):
+        """
+        End a phase: count the time since the previous mark (or start) against it.
+
+        Args:
+            phase (str): One of PHASES
+        """
+        now = self.clock()
+        self.histograms[phase].add(now - self._last)
+        self._last = now
+
+    @property
+    def questions(self):
+        """int: Questions timed (answers scored)"""
+        return self.histograms["evaluate"].count
+
+    def snapshot(self):
+        """
+        Summarise every phase with samples.
+
+        Returns:
+            dict: Phase name to count, total, mean, p50, p90, p99 and max
+                (seconds), plus application and learner totals
+        """
+        phases = {}
+        for phase, histogram in self.histograms.items():
+            if histogram.count:
+                phases[phase] = {
+                    "count": histogram.count,
+                    "total": histogram.total,
+                    "mean": histogram.mean,
+                    "p50": histogram.percentile(50),
+                    "p90": histogram.percentile(90),
+                    "p99": histogram.percentile(99),
+                    "max": histogram.max,
+                }
+        learner = sum(phases[phase]["total"] for phase in phases if phase in LEARNER_PHASES)
+        application = sum(phases[phase]["total"] for phase in phases if phase not in LEARNER_PHASES)
+        return {"questions": self.questions, "application": application, "learner": learner,
+                "phases": phases}
+
+    def format(self):
+        """
+        Format the timings as a text table (milliseconds).
+
+        Returns:
+            str: Multi-line report
+        """
+        snapshot = self.snapshot()
+        lines = [f"⏱️ Quiz phase timings ({snapshot['questions']} questions, ms)",
+                 f"{'phase':<9} {'count':>6} {'mean':>9} {'p50':>9} {'p90':>9} {'p99':>9} "
+                 f"{'max':>9} {'total':>10}"]
+        for phase, row in snapshot["phases"].items():
+            lines.append(f"{phase:<9} {row['count']:>6} " + " ".join(
+                f"{row[key] * 1000:>9.3f}" for key in ("mean", "p50", "p90", "p99", "max")
+            ) + f" {row['total'] * 1000:>10.1f}")
+        overall = snapshot["application"] + snapshot["learner"]
+        if overall:
+            lines.append(f"Application {snapshot['application']:.3f}s "
+                         f"({snapshot['application'] / overall:.1%}), "
+                         f"learner {snapshot['learner']:.3f}s ({snapshot['learner'] / overall:.1%})")
+        return "\n".join(lines)
+
+    def dump(self, path=None):
+        """
+        Write the report.
+
+        Args:
+            path (str): File to write (JSON if it ends in .json, else text);
+                None or '-' for standard error
+        """
+        if path in (None, "-"):
+            print(self.format(), file=sys.stderr)
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith(".json"):
+                json.dump(self.snapshot(), f, indent=2)
+                f.write("\n")
+            else:
+                f.write(self.format() + "\n")
+
+_PHASE_TIMER = None
+
+def get_phase_timer():
+    """
+    Get the process's phase timer.
+
+    Returns:
+        PhaseTimer or None: The timer if timing is enabled (by
+            enable_phase_timing() or MUSHROOM_QUIZ_TIMING), else None
+    """
+    if _PHASE_TIMER is None and os.environ.get('MUSHROOM_QUIZ_TIMING'):
+        enable_phase_timing(os.environ['MUSHROOM_QUIZ_TIMING'])
+    return _PHASE_TIMER
+
+def enable_phase_timing(path=None):
+    """
+    Turn phase timing on for the process.
+
+    The report is written at exit, if anything was timed, and on Unix
+    whenever the process receives SIGUSR1.
+
+    Args:
+        path (str): Where reports go (see PhaseTimer.dump); None or '-' for standard error
+
+    Returns:
+        PhaseTimer: The process's timer
+    """
+    global _PHASE_TIMER
+    if _PHASE_TIMER is not None:
+        return _PHASE_TIMER
+    timer = _PHASE_TIMER = PhaseTimer()
+
+    def dump_at_exit():
+        if timer.questions:
+            try:
+                timer.dump(path)
+            except OSError as e:
+                print(f"Cannot write phase timings: {e}", file=sys.stderr)
+
+    atexit.register(dump_at_exit)
+    if hasattr(signal, 'SIGUSR1'):
+        try:
+            signal.signal(signal.SIGUSR1, lambda signum, frame: timer.dump(path))
+        except ValueError:
+            pass  # Not the main thread
+    return timer
@@ -10,7 +10,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-21
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 
 Description:
     This module contains the QuizGame class and related functions that handle
@@ -18,11 +18,38 @@ Description:
     scoring, and result analysis. It serves as the central coordinator between
     the UI, timer, and question database modules.
 
+    Scoring itself lives in the headless QuizSession state machine;
+    QuizGame is the terminal adapter that renders each step, collects
+    input and keeps the interactive pacing on top of it.
+
+    Each quiz draws its questions and shuffles its options with its own
+    random.Random, seeded from QuizGame.seed, so a quiz is fully described
+    by its QuizSpec (bank version, settings and seed) and can be
+    regenerated on demand with QuizGame.from_spec().
+
+    The 'adaptive' difficulty runs an AdaptiveSession instead, which picks
+    each question as it is asked from the player's running ability
+    estimate (see core/adaptive.py).
+
+    The bank can be any question source with a version and
+    sample(difficulty, k, rng): the in-memory QuestionBank, or a
+    JsonlQuestionSource that reservoir-samples a file too large to load.
+    Adaptive quizzes need every item's parameters, so they require a
+    QuestionBank.
+
+    When phase timing is enabled (see core/instrumentation.py), run_quiz()
+    marks the end of each phase of a question on a PhaseTimer; when it is
+    disabled the marks are skipped.
+
+    When an answer event log is open (see stats/event_log.py), every
+    scored answer is also appended to it as one binary record.
+
 Classes:
     QuizGame: Main quiz game class that manages quiz flow and scoring
         - Handles question preparation and randomization
-        - Processes user answers and maintains score
-        - Tracks wrong topics for study recommendations
+        - Owns a seeded generator, so a quiz can be regenerated from its spec
+        - Drives a QuizSession from terminal input
+        - Exposes score and wrong topics for study recommendations
         - Coordinates with UI and timer modules
 
 Functions:
@@ -34,14 +61,24 @@ Features:
     - Answer validation and timeout handling
     - Topic-based performance tracking
     - Integration with timed and untimed input modes
+    - Optional recording of sessions and answers in a StatsStore
+    - Pluggable question selection (random sampling or a spaced-repetition ReviewDeck)
+    - Adaptive mode that follows the player's ability with item response theory
+    - Optional per-phase timing that separates application time from learner time
+    - Optional binary answer event log for analytics
     - Comprehensive result reporting
 
 Dependencies:
-    - random: For question and option shuffling
     - time: For timing delays and user experience
-    - ..data.question_loader: Question database and filtering functions
+    - ..data.question_loader: Indexed question bank
     - ..ui.terminal_ui: Display functions and color constants
     - .timer: Timed input functionality
+    - .quiz_session: Headless scoring state machine
+    - .quiz_spec: Per-quiz seeded random generator
+    - .adaptive: Item response theory session for the adaptive mode
+    - .instrumentation: Optional per-phase timing
+    - ..stats.metrics: Live counters and latency histograms
+    - ..stats.event_log: Optional append-only answer event log
 
 Usage:
     from mushroom_quiz.core import create_quiz
@@ -51,107 +88,241 @@ License:
     MIT License - See LICENSE file for details
 """
 
-import random
 import time
-from ..data.question_loader import get_questions_by_difficulty, get_all_questions
-from ..ui.terminal_ui import (clear_screen, print_header, display_question, 
-                     display_result, display_final_score, display_study_recommendations, Colors)
-from .timer import get_user_input
+from ..data.question_bank import QuestionBank
+from ..data.question_loader import get_question_bank
+from ..stats import metrics
+from ..stats.event_log import get_event_log, new_session_id
+from ..ui.terminal_ui import (show_screen, render_question, display_result,
+                     display_final_score, display_study_recommendations,
+                     display_ability_estimate, Colors)
+from .timer import get_user_input, DEFAULT_TICK_INTERVAL
+from .quiz_session import QuizSession
+from .quiz_spec import QuizSpec, make_rng, new_seed
+from .adaptive import ADAPTIVE, AdaptiveSession, ability_level, get_item_model
+from .instrumentation import get_phase_timer
+
+# Live metrics series of the terminal quiz, looked up once
+_ACTIVE_SESSIONS = metrics.ACTIVE_SESSIONS.labels("terminal")
+_SELECTION_SECONDS = metrics.SELECTION_SECONDS.labels("terminal")
+_RENDER_SECONDS = metrics.RENDER_SECONDS.labels("terminal")
+_TIMER_EXPIRATIONS = metrics.TIMER_EXPIRATIONS.labels("terminal")
+_ANSWERS = {outcome: metrics.ANSWERS.labels("terminal", outcome)
+            for outcome in ("correct", "incorrect", "timeout")}
 
 class QuizGame:
     """Main quiz game class that handles quiz flow and scoring"""
     
-    def __init__(self, difficulty="mixed", num_questions=10, timer_seconds=None):
+    def __init__(self, difficulty="mixed", num_questions=10, timer_seconds=None,
+                 tick_interval=DEFAULT_TICK_INTERVAL, bank=None, seed=None, selector=None,
+                 timing=None, events=None):
         self.difficulty = difficulty
         self.num_questions = num_questions
         self.timer_seconds = timer_seconds
-        self.score = 0
-        self.wrong_topics = []
+        self.tick_interval = tick_interval
+        # Question source (QuestionBank or streamed JsonlQuestionSource);
+        # None means the packaged question bank, loaded on first use
+        self.bank = bank
+        # The seed alone decides question selection and option order
+        self.seed = new_seed() if seed is None else seed
+        # Optional question-selection strategy (e.g. a ReviewDeck) with
+        # select(bank, difficulty, k, rng) and record_answer(result, elapsed);
+        # quizzes it selects depend on its state, not only on the spec
+        self.selector = selector
+        # PhaseTimer for run_quiz(); None (timing disabled) skips every mark
+        self.timing = timing if timing is not None else get_phase_timer()
+        # EventLog that receives every scored answer; None logs nothing
+        self.events = events if events is not None else get_event_log()
+        self.session_id = None
+        self.session = None
+    
+    @classmethod
+    def from_spec(cls, spec, bank=None, tick_interval=DEFAULT_TICK_INTERVAL):
+        """
+        Recreate the quiz described by a spec.
         
-    def prepare_questions(self):
-        """Prepare and select questions for the quiz"""
-        questions = get_questions_by_difficulty(self.difficulty)
+        Args:
+            spec (QuizSpec): Spec of the quiz to regenerate
+            bank (QuestionBank): Bank to draw from (defaults to the packaged bank)
+            tick_interval (float): Seconds between countdown redraws
         
-        # Fallback to all questions if not enough in the selected difficulty
-        if len(questions) < self.num_questions:
-            questions = get_all_questions()
+        Returns:
+            QuizGame: Game whose sessions repeat the original quiz exactly
         
-        # Select random questions
-        return random.sample(questions, min(self.num_questions, len(questions)))
+        Raises:
+            ValueError: If the bank is not the version the spec was made from
+        """
+        game = cls(spec.difficulty, spec.num_questions, spec.timer_seconds,
+                   tick_interval, bank, spec.seed)
+        if game.get_bank().version != spec.bank_version:
+            raise ValueError(
+                f"Quiz was generated from bank {spec.bank_version}, "
+                f"not {game.get_bank().version}"
+            )
+        return game
+    
+    def get_bank(self):
+        """Get the question bank this quiz draws from"""
+        return self.bank if self.bank is not None else get_question_bank()
     
-    def run_quiz(self):
-        """Main quiz execution method"""
-        selected_questions = self.prepare_questions()
-        total_questions = len(selected_questions)
+    @property
+    def spec(self):
+        """QuizSpec: Everything needed to regenerate this quiz"""
+        return QuizSpec(self.get_bank().version, self.difficulty, self.num_questions,
+                        self.timer_seconds, self.seed)
+    
+    @property
+    def score(self):
+        """int: Correct answers so far in the current session"""
+        return self.session.score if self.session else 0
+    
+    @property
+    def wrong_topics(self):
+        """list: Topics of wrongly answered questions in the current session"""
+        return self.session.wrong_topics if self.session else []
+        
+    def prepare_questions(self, rng=None):
+        """Prepare and select questions for the quiz (from the seed unless rng is given)"""
+        if rng is None:
+            rng = make_rng(self.seed)
+        if self.selector is not None:
+            return self.selector.select(self.get_bank(), self.difficulty, self.num_questions, rng)
+        # The bank falls back to all questions if the difficulty is too small
+        return self.get_bank().sample(self.difficulty, self.num_questions, rng)
+    
+    def new_session(self):
+        """Select questions and start a headless session for them"""
+        # Selection and option shuffles share one generator, so the whole
+        # quiz (questions and option order) follows from the seed
+        rng = make_rng(self.seed)
+        if self.difficulty == ADAPTIVE:
+            if not isinstance(self.get_bank(), QuestionBank):
+                raise ValueError("Adaptive quizzes need an in-memory question bank")
+            # Questions are picked one at a time from the answers so far
+            self.session = AdaptiveSession(get_item_model(self.get_bank()), self.num_questions, rng)
+        else:
+            self.session = QuizSession(self.prepare_questions(rng), rng)
+        return self.session
+    
+    def run_quiz(self, stats=None, user=None):
+        """
+        Main quiz execution method.
         
-        # Initialize quiz
-        clear_screen()
-        print_header()
-        print(f"\n{Colors.BOLD}{Colors.CYAN}🎯 Quiz Starting! You'll answer {total_questions} questions.{Colors.ENDC}\n")
-        time.sleep(2)
+        Args:
+            stats (StatsStore): Store that records the session and its answers, if any
+            user (str): Player name recorded with the statistics
+        """
+        timing = self.timing
+        if timing is not None:
+            timing.start()
+        session = self.new_session()
+        if timing is not None:
+            timing.mark("prepare")
+        total_questions = session.total
+        session_id = stats.start_session(user, self.spec) if stats is not None else None
+        # Logged answers share the stats session id, so the two can be joined
+        self.session_id = session_id if session_id is not None else new_session_id()
         
-        # Process each question
-        for i, question_data in enumerate(selected_questions, 1):
-            self._process_question(i, total_questions, question_data)
+        metrics.QUIZZES_STARTED.labels("terminal", self.difficulty).inc()
+        _ACTIVE_SESSIONS.inc()
+        try:
+            # Initialize quiz
+            show_screen(f"\n{Colors.BOLD}{Colors.CYAN}🎯 Quiz Starting! You'll answer {total_questions} questions.{Colors.ENDC}\n\n")
+            time.sleep(2)
             
-            # Show continuation prompt except for last question
-            if i < total_questions:
-                input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
-                clear_screen()
-                print_header()
+            # Process each question
+            if timing is not None:
+                timing.start()
+            while not session.finished:
+                selecting_at = time.perf_counter()
+                asked = session.next_question()
+                _SELECTION_SECONDS.observe(time.perf_counter() - selecting_at)
+                if timing is not None:
+                    timing.mark("select")
+                result, elapsed = self._process_question(asked)
+                if stats is not None:
+                    stats.record_answer(session_id, user, result, elapsed)
+                if self.selector is not None:
+                    self.selector.record_answer(result, elapsed)
+                if timing is not None:
+                    timing.mark("record")
+                
+                # Show continuation prompt except for last question
+                if not session.finished:
+                    input(f"\n{Colors.BOLD}Press Enter to continue...{Colors.ENDC}")
+                    if timing is not None:
+                        timing.mark("continue")
+        finally:
+            _ACTIVE_SESSIONS.dec()
+        metrics.QUIZZES_COMPLETED.labels("terminal", self.difficulty).inc()
         
         # Display final results
         self._show_final_results(total_questions)
+        if stats is not None:
+            stats.finish_session(session_id, session.summary())
+            stats.flush()
         
         return self.score, total_questions
     
-    def _process_question(self, question_num, total_questions, question_data):
-        """Process a single question"""
-        # Shuffle options for variety
-        options = question_data['options'].copy()
-        random.shuffle(options)
+    def _process_question(self, asked):
+        """
+        Present one asked question, collect the answer and show the result.
         
-        # Display question
-        display_question(question_num, total_questions, question_data, options)
+        Returns:
+            tuple: (AnswerResult, seconds taken to answer)
+        """
+        timing = self.timing
+        # Draw header and question as one frame (options were shuffled by the session)
+        rendering_at = time.perf_counter()
+        show_screen(render_question(asked.number, asked.total, asked.question, asked.options))
+        _RENDER_SECONDS.observe(time.perf_counter() - rendering_at)
+        if timing is not None:
+            timing.mark("render")
         
         # Get user answer
+        asked_at = time.monotonic()
         answer_num = get_user_input(
-            f"\n{Colors.BOLD}Your answer (1-{len(options)}): {Colors.ENDC}",
-            len(options),
-            self.timer_seconds
+            f"\n{Colors.BOLD}Your answer (1-{len(asked.options)}): {Colors.ENDC}",
+            len(asked.options),
+            self.timer_seconds,
+            self.tick_interval
         )
+        elapsed = time.monotonic() - asked_at
+        if timing is not None:
+            timing.mark("input")
         
-        # Process answer
-        if answer_num is not None:
-            user_answer = options[answer_num - 1]
-            is_correct = user_answer == question_data['answer']
-            is_timeout = False
-        else:
-            user_answer = None
-            is_correct = False
-            is_timeout = True
-        
-        # Update score and track wrong topics
-        if is_correct:
-            self.score += 1
-        elif not is_timeout:
-            self.wrong_topics.append(question_data['topic'])
+        # Score answer (None means the timer ran out)
+        result = self.session.submit_answer(answer_num)
+        _ANSWERS[metrics.answer_outcome(result)].inc()
+        if result.is_timeout:
+            _TIMER_EXPIRATIONS.inc()
+        if self.events is not None:
+            self.events.record_answer(self.session_id, result, elapsed)
+        if timing is not None:
+            timing.mark("evaluate")
         
         # Display result
         display_result(
-            is_correct, 
-            user_answer, 
-            question_data['answer'], 
-            question_data['explanation'],
-            is_timeout
+            result.is_correct, 
+            result.user_answer, 
+            result.correct_answer, 
+            result.explanation,
+            result.is_timeout
         )
+        if timing is not None:
+            timing.mark("result")
+        return result, elapsed
     
     def _show_final_results(self, total_questions):
         """Display final quiz results and recommendations"""
         display_final_score(self.score, total_questions)
+        if isinstance(self.session, AdaptiveSession):
+            display_ability_estimate(self.session.ability, self.session.standard_error,
+                                     ability_level(self.session.ability))
         display_study_recommendations(self.wrong_topics)
 
-def create_quiz(difficulty, num_questions, timer_seconds):
-    """Factory function to create and run a quiz"""
-    quiz = QuizGame(difficulty, num_questions, timer_seconds)
-    return quiz.run_quiz()
+def create_quiz(difficulty, num_questions, timer_seconds, seed=None, stats=None, user=None,
+                selector=None, bank=None):
+    """Factory function to create and run a quiz (recorded in stats, if given)"""
+    quiz = QuizGame(difficulty, num_questions, timer_seconds, bank=bank, seed=seed, selector=selector)
+    return quiz.run_quiz(stats, user)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧩 Headless Quiz Session Module
+
+Pure quiz state machine with no terminal I/O, sleeps or timers.
+
+File: quiz_session.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module contains the QuizSession class, which holds the scoring
+    logic for a single quiz independently of how it is presented. A session
+    moves through three steps per question (next question -> submit answer
+    -> result) and finishes with a summary. It never prints, reads input or
+    sleeps, so the same logic can drive the terminal app, servers, batch
+    jobs and simulations.
+
+Classes:
+    QuizSession: Headless quiz state machine
+        - Shuffles options as each question is asked
+        - Scores answers and timeouts
+        - Tracks wrong topics for study recommendations
+
+Records:
+    AskedQuestion: A question as presented (number, total, question, options)
+    AnswerResult: The outcome of one submitted answer
+    QuizSummary: Final score, total and wrong topics
+
+Usage:
+    from mushroom_quiz.core import QuizSession
+    session = QuizSession(questions)
+    while not session.finished:
+        asked = session.next_question()
+        result = session.submit_answer(1)
+    summary = session.summary()
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import random
+from collections import namedtuple
+
+AskedQuestion = namedtuple('AskedQuestion', ['number', 'total', 'question', 'options'])
+AnswerResult = namedtuple('AnswerResult', [
+    'question', 'user_answer', 'correct_answer', 'explanation', 'is_correct', 'is_timeout'
+])
+QuizSummary = namedtuple('QuizSummary', ['score', 'total', 'wrong_topics'])
+
+class QuizSession:
+    """Headless quiz state machine: ask, answer, score, summarise"""
+
+    def __init__(self, questions, rng=random):
+        """
+        Create a session over an already selected list of questions.
+
+        Args:
+            questions (list): Question dictionaries, in the order to ask them
+            rng: Random source providing shuffle() (defaults to the random module)
+        """
+        self.questions = list(questions)
+        self.total = len(self.questions)
+        self.rng = rng
+        self.score = 0
+        self.wrong_topics = []
+        self.answered = 0
+        self.current = None
+
+    @property
+    def finished(self):
+        """bool: True once every question has been answered"""
+        return self.answered >= self.total
+
+    def next_question(self):
+        """
+        Ask the next question, shuffling its options.
+
+        Returns:
+            AskedQuestion or None: The question to present, or None when finished
+
+        Raises:
+            RuntimeError: If the current question has not been answered yet
+        """
+        if self.current is not None:
+            raise RuntimeError("The current question has not been answered yet")
+        if self.finished:
+            return None
+
+        question = self.questions[self.answered]
+        options = list(question['options'])
+        self.rng.shuffle(options)
+        self.current = AskedQuestion(self.answered + 1, self.total, question, options)
+        return self.current
+
+    def submit_answer(self, answer_num):
+        """
+        Score an answer to the current question.
+
+        Args:
+            answer_num (int or None): 1-based option number, or None on timeout
+
+        Returns:
+            AnswerResult: Outcome of the answer
+
+        Raises:
+            RuntimeError: If no question is waiting for an answer
+            ValueError: If answer_num is outside the option range
+        """
+        asked = self.current
+        if asked is None:
+            raise RuntimeError("No question is waiting for an answer")
+
+        question = asked.question
+        if answer_num is None:
+            user_answer = None
+            is_correct = False
+            is_timeout = True
+        else:
+            if not 1 <= answer_num <= len(asked.options):
+                raise ValueError(f"Answer must be between 1 and {len(asked.options)}")
+            user_answer = asked.options[answer_num - 1]
+            is_correct = user_answer == question['answer']
+            is_timeout = False
+
+        # Update score and track wrong topics
+        if is_correct:
+            self.score += 1
+        elif not is_timeout:
+            self.wrong_topics.append(question['topic'])
+
+        self.current = None
+        self.answered += 1
+        return AnswerResult(
+            question, user_answer, question['answer'], question['explanation'],
+            is_correct, is_timeout
+        )
+
+    def summary(self):
+        """
+        Get the final results of the session.
+
+        Returns:
+            QuizSummary: Score, total and wrong topics
+        """
+        return QuizSummary(self.score, self.total, list(self.wrong_topics))
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🌱 Quiz Spec Module
+
+Seeded, reproducible description of a generated quiz.
+
+File: quiz_spec.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    A quiz is fully determined by the question bank it was drawn from, its
+    settings and a seed. This module defines the QuizSpec record holding
+    exactly that, and the helpers that turn a seed into the quiz's own
+    random.Random. Every quiz draws its questions and shuffles its options
+    from its own generator, so concurrent sessions never share random
+    state, and any quiz can be regenerated from its spec instead of
+    storing the questions and option order it used.
+
+Classes:
+    QuizSpec: (bank_version, difficulty, num_questions, timer_seconds, seed)
+
+Functions:
+    new_seed(): Draw a fresh seed from the operating system
+    make_rng(): Create the random generator for a seed
+
+Usage:
+    from mushroom_quiz.core.quiz_engine import QuizGame
+    spec = QuizGame("beginner", 10).spec
+    same_quiz = QuizGame.from_spec(spec).new_session()
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import random
+from collections import namedtuple
+
+# Seeds are non-negative 63-bit integers, so they fit a signed SQLite INTEGER
+SEED_BITS = 63
+
+QuizSpec = namedtuple('QuizSpec', [
+    'bank_version', 'difficulty', 'num_questions', 'timer_seconds', 'seed'
+])
+
+_SEED_SOURCE = random.SystemRandom()
+
+def new_seed():
+    """
+    Draw a fresh seed from the operating system's entropy source.
+
+    Returns:
+        int: Seed in the range [0, 2**63)
+    """
+    return _SEED_SOURCE.getrandbits(SEED_BITS)
+
+def make_rng(seed):
+    """
+    Create the random generator for a quiz seed.
+
+    Args:
+        seed (int): Quiz seed
+
+    Returns:
+        random.Random: Generator owned by one quiz
+    """
+    return random.Random(seed)
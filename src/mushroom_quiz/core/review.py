@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔁 Spaced Repetition Review Module
+
+SM-2 review scheduling with a heap of due questions per player.
+
+File: review.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module provides the ReviewDeck, a question-selection strategy for
+    QuizGame that brings back each question on an SM-2 schedule: a correct
+    answer pushes the question further out (1 day, 6 days, then the last
+    interval times the question's ease factor), and a wrong answer or a
+    timeout brings it back the next day and lowers its ease.
+
+    A deck keeps one ReviewItem per question the player has seen, with
+    the question's difficulty, and heaps of (due time, question id)
+    entries: one over every item and one per difficulty, so quizzes of
+    one difficulty never walk past other difficulties' items.
+    Rescheduling pushes a new entry and leaves the old one to be skipped
+    when it surfaces, so picking the next k due questions costs
+    O(k log n) rather than a pass over the player's whole history; a heap
+    is rebuilt once its stale entries outnumber its live ones, so they
+    cannot pile up in a long-lived deck. Unseen questions are found by
+    sampling the difficulty at random and skipping seen ones, so only
+    about k question ids are computed per quiz. The chosen questions are
+    fetched with QuestionBank.get(), whose id index is built once per
+    bank and shared by every later quiz. Decks are loaded from and saved
+    to the statistics database, so the schedule carries over between
+    runs.
+
+Classes:
+    ReviewItem: Schedule of one question for one player
+    ReviewDeck: A player's review schedule and question selector
+
+Functions:
+    answer_quality(): SM-2 quality grade (0-5) for an answer
+
+Usage:
+    from mushroom_quiz.core.review import ReviewDeck
+    deck = ReviewDeck.load(stats, "alice")
+    create_quiz("mixed", 10, None, stats=stats, user="alice", selector=deck)
+    deck.save(stats)
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import heapq
+import time
+
+from ..data.question_bank import MIXED, question_id
+
+DAY = 24 * 60 * 60
+
+# SM-2 constants
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+PASSING_QUALITY = 3
+
+# Correct answers given faster than this are graded "perfect"
+FAST_ANSWER_SECONDS = 5.0
+
+# Random draws per unseen question wanted before falling back to a scan
+# of the difficulty (only reached once most of it has been seen)
+UNSEEN_DRAWS_PER_QUESTION = 4
+
+def answer_quality(result, elapsed=None):
+    """
+    Grade an answer on the SM-2 0-5 scale.
+
+    Args:
+        result (AnswerResult): Result from QuizSession.submit_answer()
+        elapsed (float): Seconds taken to answer, if known
+
+    Returns:
+        int: 5 fast and correct, 4 correct, 1 wrong, 0 timed out
+    """
+    if result.is_timeout:
+        return 0
+    if not result.is_correct:
+        return 1
+    if elapsed is not None and elapsed < FAST_ANSWER_SECONDS:
+        return 5
+    return 4
+
+class ReviewItem:
+    """Schedule of one question for one player"""
+
+    __slots__ = ('question_id', 'due', 'interval', 'ease', 'repetitions', 'difficulty')
+
+    def __init__(self, question_id, due, interval=0.0, ease=INITIAL_EASE, repetitions=0, difficulty=None):
+        self.question_id = question_id
+        self.due = due
+        self.interval = interval
+        self.ease = ease
+        self.repetitions = repetitions
+        # None for schedules saved before difficulties were recorded
+        self.difficulty = difficulty
+
+    def review(self, quality, now):
+        """
+        Apply one SM-2 review.
+
+        Args:
+            quality (int): Grade from answer_quality()
+            now (float): Unix time of the answer
+        """
+        if quality >= PASSING_QUALITY:
+            if self.repetitions == 0:
+                self.interval = 1 * DAY
+            elif self.repetitions == 1:
+                self.interval = 6 * DAY
+            else:
+                self.interval = self.interval * self.ease
+            self.repetitions += 1
+        else:
+            self.repetitions = 0
+            self.interval = 1 * DAY
+        self.ease = max(MIN_EASE, self.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+        self.due = now + self.interval
+
+    def as_row(self):
+        """tuple: (question_id, due, interval, ease, repetitions, difficulty)"""
+        return self.question_id, self.due, self.interval, self.ease, self.repetitions, self.difficulty
+
+class ReviewDeck:
+    """A player's review schedule, usable as a QuizGame question selector"""
+
+    def __init__(self, user, items=(), clock=time.time):
+        """
+        Build a deck from existing review items.
+
+        Args:
+            user (str): Player name
+            items (iterable): ReviewItem objects or (question_id, due,
+                interval, ease, repetitions[, difficulty]) rows
+            clock (callable): Source of the current Unix time
+        """
+        self.user = user
+        self.clock = clock
+        self.items = {}
+        for item in items:
+            if not isinstance(item, ReviewItem):
+                item = ReviewItem(*item)
+            self.items[item.question_id] = item
+        # Heap of every item under MIXED, and one per difficulty
+        self._heaps = {}
+        # Entries per heap left behind by reschedules
+        self._stale = {}
+        self._rebuild(MIXED)
+        for difficulty in {item.difficulty for item in self.items.values()} - {None}:
+            self._rebuild(difficulty)
+        # Items whose difficulty is looked up in the bank before their first difficulty quiz
+        self._unplaced = {qid for qid, item in self.items.items() if item.difficulty is None}
+        self._dirty = set()
+
+    @classmethod
+    def load(cls, store, user):
+        """
+        Load a player's deck from a statistics store.
+
+        Args:
+            store (StatsStore): Store holding review schedules
+            user (str): Player name
+
+        Returns:
+            ReviewDeck: The player's deck (empty for new players)
+        """
+        return cls(user, store.load_review_items(user))
+
+    def save(self, store):
+        """Queue every changed item for writing to a statistics store"""
+        if self._dirty:
+            store.save_review_items(self.user, [self.items[qid].as_row() for qid in self._dirty])
+            self._dirty.clear()
+
+    def __len__(self):
+        return len(self.items)
+
+    def due_count(self, now=None):
+        """
+        Count the items due for review.
+
+        Args:
+            now (float): Unix time (defaults to the deck's clock)
+
+        Returns:
+            int: Number of due items
+        """
+        now = self.clock() if now is None else now
+        return sum(1 for item in self.items.values() if item.due <= now)
+
+    def take(self, k, accept=None, until=None, difficulty=MIXED):
+        """
+        Get the k earliest-due question ids, without removing them.
+
+        Args:
+            k (int): Number of ids wanted
+            accept (callable): Predicate on question ids; others are passed over
+            until (float): Only return items due at or before this time
+            difficulty (str): Only take items of this difficulty ('mixed' for all)
+
+        Returns:
+            list: Question ids in due order
+        """
+        heap = self._heaps.get(difficulty)
+        if heap is None:
+            return []
+        taken = []
+        popped = []
+        seen = set()
+        while heap and len(taken) < k:
+            due, qid = heap[0]
+            if until is not None and due > until:
+                break
+            heapq.heappop(heap)
+            item = self.items.get(qid)
+            if item is None or item.due != due or qid in seen:
+                # Stale entry left behind by a reschedule
+                self._stale[difficulty] = max(0, self._stale[difficulty] - 1)
+                continue
+            seen.add(qid)
+            popped.append((due, qid))
+            if accept is None or accept(qid):
+                taken.append(qid)
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        return taken
+
+    def _rebuild(self, difficulty):
+        """Rebuild one heap from the items, dropping its stale entries"""
+        heap = [(item.due, qid) for qid, item in self.items.items()
+                if difficulty == MIXED or item.difficulty == difficulty]
+        heapq.heapify(heap)
+        self._heaps[difficulty] = heap
+        self._stale[difficulty] = 0
+
+    def _push(self, difficulty, item, rescheduled):
+        """Add an item's new entry to a heap, rebuilding it once stale entries dominate"""
+        heap = self._heaps.get(difficulty)
+        if heap is None:
+            heap = self._heaps[difficulty] = []
+            self._stale[difficulty] = 0
+        heapq.heappush(heap, (item.due, item.question_id))
+        if rescheduled:
+            self._stale[difficulty] += 1
+            if self._stale[difficulty] > len(heap) - self._stale[difficulty]:
+                self._rebuild(difficulty)
+
+    def _place(self, bank):
+        """Give items loaded without a difficulty the one their question has in the bank"""
+        for qid in list(self._unplaced):
+            question = bank.get(qid)
+            if question is not None:
+                item = self.items[qid]
+                item.difficulty = question['difficulty']
+                self._push(item.difficulty, item, False)
+                self._unplaced.discard(qid)
+                self._dirty.add(qid)
+
+    def _unseen(self, pool, k, rng):
+        """
+        Pick up to k ids of questions the player has never seen.
+
+        Candidates are drawn at random from the pool, so only about k ids
+        are computed while most of it is unseen; after too many misses the
+        rest of the pool is scanned.
+        """
+        items = self.items
+        chosen = []
+        picked = set()
+        tried = set()
+        draws = UNSEEN_DRAWS_PER_QUESTION * k
+        while len(chosen) < k and len(tried) < len(pool) and draws > 0:
+            draws -= 1
+            index = rng.randrange(len(pool))
+            if index in tried:
+                continue
+            tried.add(index)
+            qid = question_id(pool[index])
+            # Questions with the same text share an id
+            if qid not in items and qid not in picked:
+                chosen.append(qid)
+                picked.add(qid)
+        if len(chosen) < k and len(tried) < len(pool):
+            rest = dict.fromkeys(question_id(pool[index]) for index in range(len(pool)) if index not in tried)
+            rest = [qid for qid in rest if qid not in items and qid not in picked]
+            chosen.extend(rng.sample(rest, min(k - len(chosen), len(rest))))
+        return chosen
+
+    def select(self, bank, difficulty, k, rng):
+        """
+        Choose questions for a review quiz.
+
+        Due questions come first, earliest first. Remaining places go to
+        questions the player has never seen, then to the questions that
+        will fall due soonest.
+
+        Args:
+            bank (QuestionBank): Bank to draw from
+            difficulty (str): Difficulty level, or 'mixed'
+            k (int): Number of questions wanted
+            rng: Random source for picking unseen questions
+
+        Returns:
+            list: Selected question dictionaries
+        """
+        def accept(qid):
+            return bank.get(qid) is not None
+
+        if difficulty != MIXED and self._unplaced:
+            self._place(bank)
+        chosen = self.take(k, accept, until=self.clock(), difficulty=difficulty)
+        if len(chosen) < k:
+            chosen.extend(self._unseen(bank.by_difficulty(difficulty), k - len(chosen), rng))
+        if len(chosen) < k:
+            picked = set(chosen)
+            chosen.extend(self.take(k - len(chosen), lambda qid: qid not in picked and accept(qid),
+                                    difficulty=difficulty))
+        return [bank.get(qid) for qid in chosen]
+
+    def record_answer(self, result, elapsed=None):
+        """
+        Reschedule a question after it was answered.
+
+        Args:
+            result (AnswerResult): Result from QuizSession.submit_answer()
+            elapsed (float): Seconds taken to answer, if known
+        """
+        now = self.clock()
+        qid = question_id(result.question)
+        difficulty = result.question['difficulty']
+        item = self.items.get(qid)
+        rescheduled = item is not None
+        if item is None:
+            item = self.items[qid] = ReviewItem(qid, now, difficulty=difficulty)
+        item.review(answer_quality(result, elapsed), now)
+        self._push(MIXED, item, rescheduled)
+        if item.difficulty is None:
+            # Loaded without a difficulty, so it has no difficulty heap entry yet
+            item.difficulty = difficulty
+            self._unplaced.discard(qid)
+            self._push(difficulty, item, False)
+        else:
+            self._push(item.difficulty, item, rescheduled)
+        self._dirty.add(qid)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏱️ Deadline Scheduler Module
+
+Shared timer service that tracks many deadlines with a single thread.
+
+File: scheduler.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module provides a DeadlineScheduler that keeps pending callbacks
+    in a heap ordered by monotonic-clock deadline. One worker thread sleeps
+    until the earliest deadline (or until an earlier one is scheduled) and
+    runs whatever is due, so any number of timed questions can be tracked
+    without a thread or a polling loop per question.
+
+Classes:
+    TimerHandle: A scheduled callback that can be cancelled
+    DeadlineScheduler: Heap-based timer service with one worker thread
+
+Functions:
+    get_scheduler(): Get the process-wide shared scheduler
+
+Features:
+    - O(log n) scheduling; cancellation is O(1) with lazy removal
+    - Cancelled entries are compacted away once they dominate the heap
+    - Monotonic clock, so wall-clock changes never fire or delay timers
+    - Callbacks run on the worker thread and must return quickly
+
+Usage:
+    from mushroom_quiz.core.scheduler import get_scheduler
+    handle = get_scheduler().call_later(30, on_timeout)
+    handle.cancel()
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+import traceback
+
+class TimerHandle:
+    """A callback scheduled on a DeadlineScheduler"""
+
+    __slots__ = ('when', 'callback', 'args', 'cancelled', '_scheduler')
+
+    def __init__(self, scheduler, when, callback, args):
+        self._scheduler = scheduler
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancel the callback; has no effect once it has run"""
+        if not self.cancelled:
+            self._scheduler._cancel(self)
+
+class DeadlineScheduler:
+    """Monotonic-clock heap of deadlines served by a single worker thread"""
+
+    def __init__(self, clock=time.monotonic, name="quiz-deadlines"):
+        self.clock = clock
+        self.name = name
+        self._heap = []
+        self._counter = itertools.count()
+        self._cancelled_count = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopping = False
+
+    def call_at(self, when, callback, *args):
+        """
+        Run callback(*args) once the clock reaches `when`.
+
+        Args:
+            when (float): Deadline on this scheduler's clock
+            callback (callable): Function to run on the worker thread
+
+        Returns:
+            TimerHandle: Handle that can cancel the callback
+        """
+        handle = TimerHandle(self, when, callback, args)
+        with self._condition:
+            self._ensure_thread()
+            heapq.heappush(self._heap, (when, next(self._counter), handle))
+            # Only wake the worker if this is now the earliest deadline
+            if self._heap[0][2] is handle:
+                self._condition.notify()
+        return handle
+
+    def call_later(self, delay, callback, *args):
+        """
+        Run callback(*args) after `delay` seconds.
+
+        Returns:
+            TimerHandle: Handle that can cancel the callback
+        """
+        return self.call_at(self.clock() + delay, callback, *args)
+
+    def pending(self):
+        """
+        Get the number of live (not cancelled) scheduled callbacks.
+
+        Returns:
+            int: Pending callback count
+        """
+        with self._condition:
+            return len(self._heap) - self._cancelled_count
+
+    def stop(self):
+        """Stop the worker thread; pending callbacks are dropped"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._condition:
+            self._heap.clear()
+            self._cancelled_count = 0
+            self._thread = None
+            self._stopping = False
+
+    def _cancel(self, handle):
+        """Cancel a handle still in the heap and compact the heap if needed"""
+        with self._condition:
+            if handle.cancelled:
+                return
+            handle.cancelled = True
+            self._cancelled_count += 1
+            if self._cancelled_count > 64 and self._cancelled_count * 2 > len(self._heap):
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled_count = 0
+
+    def _ensure_thread(self):
+        """Start the worker thread on first use (caller holds the lock)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Worker loop: sleep until the earliest deadline, then run due callbacks"""
+        while True:
+            with self._condition:
+                due = []
+                while not due:
+                    if self._stopping:
+                        return
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    now = self.clock()
+                    while self._heap and self._heap[0][0] <= now:
+                        handle = heapq.heappop(self._heap)[2]
+                        if handle.cancelled:
+                            self._cancelled_count -= 1
+                        else:
+                            # Mark as finished so a late cancel() is a no-op
+                            handle.cancelled = True
+                            due.append(handle)
+                    if not due and self._heap:
+                        self._condition.wait(self._heap[0][0] - now)
+
+            for handle in due:
+                try:
+                    handle.callback(*handle.args)
+                except Exception:
+                    traceback.print_exc(file=sys.stderr)
+
+_SCHEDULER = None
+_SCHEDULER_LOCK = threading.Lock()
+
+def get_scheduler():
+    """
+    Get the process-wide shared scheduler, creating it on first use.
+
+    Returns:
+        DeadlineScheduler: Shared scheduler
+    """
+    global _SCHEDULER
+    with _SCHEDULER_LOCK:
+        if _SCHEDULER is None:
+            _SCHEDULER = DeadlineScheduler()
+        return _SCHEDULER
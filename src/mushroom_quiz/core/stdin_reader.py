@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⌨️ Shared Stdin Reader Module
+
+One persistent, selector-based reader that serves cancellable line reads.
+
+File: stdin_reader.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module provides the StdinReader used by timed questions. A single
+    long-lived thread waits on a selector over stdin and a wake-up pipe, and
+    only touches stdin while a line request is pending. Cancelling a request
+    (for example when a question times out) wakes the thread through the
+    pipe, so it stops reading immediately instead of staying blocked in
+    input() and stealing the next answer.
+
+    Bytes are read one at a time, so the reader never consumes input beyond
+    the end of the line it was asked for, and ordinary input() calls made
+    between timed questions see exactly what the user typed next. When
+    stdin cannot be used with a selector (Windows consoles, regular files,
+    streams without a file descriptor) or is a buffered stream over a pipe,
+    the same thread falls back to blocking readline() calls on the stream,
+    sharing its buffer with input(); lines that arrive with no pending
+    request are discarded.
+
+Classes:
+    LineRequest: A pending, cancellable request for one line
+    StdinReader: Persistent reader thread serving LineRequests
+
+Functions:
+    get_stdin_reader(): Get the process-wide reader for sys.stdin
+
+Usage:
+    from mushroom_quiz.core.stdin_reader import get_stdin_reader
+    request = get_stdin_reader().request_line(on_line)
+    request.cancel()
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import io
+import os
+import selectors
+import sys
+import threading
+
+try:
+    import termios
+except ImportError:  # Windows
+    termios = None
+
+class LineRequest:
+    """A pending request for one line of input"""
+
+    __slots__ = ('callback', '_reader')
+
+    def __init__(self, reader, callback):
+        self._reader = reader
+        self.callback = callback
+
+    def cancel(self):
+        """Withdraw the request; has no effect once the line was delivered"""
+        self._reader._cancel(self)
+
+class StdinReader:
+    """Persistent reader thread serving cancellable line requests"""
+
+    def __init__(self, stream=None):
+        """
+        Create a reader over a text or binary stream.
+
+        Args:
+            stream: Stream to read (defaults to sys.stdin)
+        """
+        self.stream = stream if stream is not None else sys.stdin
+        self.encoding = getattr(self.stream, 'encoding', None) or 'utf-8'
+        self._condition = threading.Condition()
+        self._request = None
+        self._partial = bytearray()
+        self._eof = False
+        self._closed = False
+        self._selector = None
+        self._fd = None
+        self._wake_r = self._wake_w = None
+        self._setup_selector()
+        self._thread = threading.Thread(target=self._run, name="quiz-stdin", daemon=True)
+        self._thread.start()
+
+    @property
+    def selectable(self):
+        """bool: True when reads are selector-based and cancellable"""
+        return self._selector is not None
+
+    def _setup_selector(self):
+        """Register the stream and a wake-up pipe, if the platform allows it"""
+        if os.name == 'nt':
+            return
+        try:
+            fd = self.stream.fileno()
+            # Bytes taken from the fd behind a buffered stream's back are only
+            # safe on a terminal, where its buffer fills one line at a time;
+            # from a pipe, input() would buffer the timed answers too
+            if not (os.isatty(fd) or isinstance(self.stream, io.RawIOBase)):
+                return
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+        except (AttributeError, OSError, ValueError):
+            return
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        self._fd = fd
+        self._selector = selector
+
+    def request_line(self, callback):
+        """
+        Ask for the next line of input.
+
+        The callback runs on the reader thread with the line (without its
+        line ending), or None at end of input. Any earlier pending request
+        is cancelled.
+
+        Args:
+            callback (callable): Function taking the line or None
+
+        Returns:
+            LineRequest: Handle that can cancel the request
+        """
+        request = LineRequest(self, callback)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Reader is closed")
+            eof = self._eof
+            if not eof:
+                self._request = request
+                self._partial.clear()
+                self._condition.notify()
+                self._wake()
+        if eof:
+            callback(None)
+        return request
+
+    def readline(self, timeout=None):
+        """
+        Block until a line arrives or the timeout passes.
+
+        Args:
+            timeout (float or None): Seconds to wait; None waits forever
+
+        Returns:
+            str or None: The line, or None on timeout or end of input
+        """
+        result = []
+        done = threading.Event()
+
+        def on_line(line):
+            result.append(line)
+            done.set()
+
+        request = self.request_line(on_line)
+        if not done.wait(timeout):
+            request.cancel()
+        return result[0] if result else None
+
+    def close(self):
+        """Stop the reader thread and release the wake-up pipe"""
+        with self._condition:
+            self._closed = True
+            self._request = None
+            self._condition.notify()
+            self._wake()
+        if self.selectable:
+            self._thread.join()
+            self._selector.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+    def _wake(self):
+        """Interrupt a pending select() (caller holds the lock)"""
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b'x')
+            except OSError:
+                pass
+
+    def _cancel(self, request):
+        """Withdraw a request and drop anything typed for it"""
+        with self._condition:
+            if self._request is not request:
+                return
+            self._request = None
+            self._partial.clear()
+            self._wake()
+        self._discard_typeahead()
+
+    def _discard_typeahead(self):
+        """Flush half-typed terminal input so it cannot answer the next prompt"""
+        if termios is None or self._fd is None:
+            return
+        try:
+            if os.isatty(self._fd):
+                termios.tcflush(self._fd, termios.TCIFLUSH)
+        except (OSError, termios.error):
+            pass
+
+    def _complete(self, request, line):
+        """Deliver a line to a request if it is still the pending one"""
+        with self._condition:
+            if self._request is not request:
+                return
+            self._request = None
+            if line is None:
+                self._eof = True
+        request.callback(line)
+
+    def _wait_for_request(self):
+        """Block until a request is pending; returns None once closed"""
+        with self._condition:
+            while self._request is None and not self._closed:
+                self._condition.wait()
+            return None if self._closed else self._request
+
+    def _run(self):
+        if self.selectable:
+            self._run_selector()
+        else:
+            self._run_blocking()
+
+    def _run_selector(self):
+        """Reader loop: select on stdin only while a request is pending"""
+        while True:
+            request = self._wait_for_request()
+            if request is None:
+                return
+            readable = False
+            for key, _ in self._selector.select():
+                if key.fd == self._wake_r:
+                    try:
+                        while os.read(self._wake_r, 512):
+                            pass
+                    except BlockingIOError:
+                        pass
+                else:
+                    readable = True
+            if not readable:
+                continue
+
+            with self._condition:
+                if self._request is not request:
+                    continue
+                try:
+                    byte = os.read(self._fd, 1)
+                except OSError:
+                    byte = b''
+                if byte and byte != b'\n':
+                    self._partial.extend(byte)
+                    continue
+                line = None
+                if byte:
+                    line = self._partial.decode(self.encoding, errors='replace').rstrip('\r')
+                    self._partial.clear()
+            self._complete(request, line)
+
+    def _run_blocking(self):
+        """Fallback loop: blocking readline(), delivered to whichever request is pending"""
+        while True:
+            if self._wait_for_request() is None:
+                return
+            try:
+                line = self.stream.readline()
+            except (OSError, ValueError):
+                line = ''
+            if isinstance(line, bytes):
+                line = line.decode(self.encoding, errors='replace')
+            with self._condition:
+                request = self._request
+                if not line:
+                    self._eof = True
+                    self._request = None
+            if not line:
+                if request is not None:
+                    request.callback(None)
+                return
+            if request is not None:
+                self._complete(request, line.rstrip('\r\n'))
+
+_READER = None
+_READER_LOCK = threading.Lock()
+
+def get_stdin_reader():
+    """
+    Get the process-wide reader for sys.stdin, creating it on first use.
+
+    Returns:
+        StdinReader: Shared reader
+    """
+    global _READER
+    with _READER_LOCK:
+        if _READER is None:
+            _READER = StdinReader()
+        return _READER
@@ -10,7 +10,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-21
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 
 Description:
     This module provides timed input functionality for the quiz application,
@@ -18,10 +18,23 @@ Description:
     It supports both timed and untimed input modes with proper timeout
     management and user feedback.
 
+    Deadlines and countdown ticks are tracked by the shared
+    DeadlineScheduler rather than by a sleep loop per question, and the
+    caller blocks on an event that is set by either the answer or the
+    timeout. Answers are read by the shared StdinReader; a timed-out read
+    is cancelled, so no thread is left blocked on stdin waiting to swallow
+    the next answer.
+
+    Because the waiter is woken by the answer itself, a typed answer is
+    acknowledged at once rather than on the next countdown tick. Ticks are
+    anchored to the question's start time (tick n fires at start + n *
+    tick_interval), so the countdown does not drift, and the redraw rate is
+    configurable down to sub-second intervals.
+
 Classes:
     TimedInput: Handles timed input with countdown display
-        - Thread-based input collection
-        - Visual countdown with color-coded time remaining
+        - Cancellable input collection through the shared stdin reader
+        - Scheduler-driven countdown with color-coded time remaining
         - Timeout detection and handling
         - Answer validation within time constraints
 
@@ -33,6 +46,8 @@ Features:
       * Green: >10 seconds remaining
       * Yellow: 5-10 seconds remaining  
       * Red: <5 seconds remaining
+    - Configurable, drift-free countdown redraw rate (tick_interval)
+    - Immediate wake-up when an answer arrives
     - Thread-safe input handling
     - Graceful timeout management
     - Answer validation (numeric range checking)
@@ -45,58 +60,114 @@ Timer Modes:
     - Speed Mode: 15 seconds per question
 
 Dependencies:
-    - threading: For non-blocking input collection
-    - time: For countdown timing and delays
+    - threading: For waiting on the answer or the deadline
+    - .scheduler: Shared monotonic deadline scheduler
+    - .stdin_reader: Shared, cancellable stdin reader
     - quiz_ui: Color constants for countdown display
 
 Usage:
     from quiz_timer import get_user_input
     answer = get_user_input("Your choice: ", 4, 30)  # 30 second timeout
     answer = get_user_input("Your choice: ", 4)      # No timeout
+    answer = get_user_input("Your choice: ", 4, 15, tick_interval=0.1)  # 10 redraws/second
 
 License:
     MIT License - See LICENSE file for details
 """
 
+import math
 import threading
-import time
 from ..ui.terminal_ui import Colors
+from ..ui.renderer import get_renderer
+from .scheduler import get_scheduler
+from .stdin_reader import get_stdin_reader
+
+# Seconds between countdown redraws
+DEFAULT_TICK_INTERVAL = 1.0
 
 class TimedInput:
     """Class to handle timed input with countdown display"""
-    def __init__(self, timeout):
+    def __init__(self, timeout, scheduler=None, reader=None, tick_interval=DEFAULT_TICK_INTERVAL):
+        if tick_interval <= 0:
+            raise ValueError("tick_interval must be positive")
         self.timeout = timeout
+        self.tick_interval = tick_interval
+        self.scheduler = scheduler or get_scheduler()
+        self.reader = reader or get_stdin_reader()
         self.answer = None
         self.timed_out = False
+        self.elapsed = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._start = None
+        self._tick_handle = None
     
-    def input_thread(self, prompt):
-        """Thread function to get input"""
-        try:
-            self.answer = input(prompt)
-        except:
-            pass
+    def _on_line(self, line):
+        """Reader callback: a line (or end of input) arrived"""
+        with self._lock:
+            if not self._done.is_set():
+                self.answer = line
+                self.elapsed = self.scheduler.clock() - self._start
+                self._done.set()
+    
+    def _expire(self):
+        """Scheduler callback: the deadline passed without an answer"""
+        with self._lock:
+            if not self._done.is_set():
+                self.timed_out = True
+                self.elapsed = self.timeout
+                self._done.set()
+    
+    def format_countdown(self, remaining):
+        """Format the countdown line for the given seconds remaining"""
+        countdown_color = Colors.GREEN if remaining > 10 else Colors.YELLOW if remaining > 5 else Colors.RED
+        if self.tick_interval < 1:
+            shown = f"{remaining:4.1f}"
+        else:
+            shown = f"{math.ceil(remaining):2d}"
+        return f"{countdown_color}⏰ Time remaining: {shown} seconds{Colors.ENDC}"
+    
+    def _tick(self, tick_number):
+        """Scheduler callback: redraw the countdown and arm the next tick"""
+        with self._lock:
+            if self._done.is_set():
+                return
+            now = self.scheduler.clock()
+            remaining = max(0.0, self._start + self.timeout - now)
+            # Repaint just the countdown line rather than the whole screen
+            get_renderer().update_line(self.format_countdown(remaining))
+            
+            # Anchor ticks to the start time so they never drift; if this
+            # tick ran late, skip straight to the next tick still ahead
+            next_number = max(tick_number + 1, int((now - self._start) / self.tick_interval) + 1)
+            next_tick = self._start + next_number * self.tick_interval
+            if next_tick < self._start + self.timeout:
+                self._tick_handle = self.scheduler.call_at(next_tick, self._tick, next_number)
     
     def get_timed_input(self, prompt, options_count):
         """Get input with timeout and countdown display"""
         print(f"\n{Colors.WARNING}⏰ You have {self.timeout} seconds to answer!{Colors.ENDC}")
         
-        # Start input thread
-        input_thread = threading.Thread(target=self.input_thread, args=(prompt,))
-        input_thread.daemon = True
-        input_thread.start()
+        # Arm the deadline and the first countdown tick before asking the
+        # shared reader for a line: after end of input, or with a line
+        # already typed ahead, the reader answers before request_line() returns
+        print(prompt, end="", flush=True)
+        self._start = self.scheduler.clock()
+        expire_handle = self.scheduler.call_at(self._start + self.timeout, self._expire)
+        self._tick_handle = self.scheduler.call_at(self._start, self._tick, 0)
+        request = self.reader.request_line(self._on_line)
+        self._done.wait()
         
-        # Countdown loop
-        for remaining in range(self.timeout, 0, -1):
-            if not input_thread.is_alive():
-                break
-            
-            # Display countdown
-            countdown_color = Colors.GREEN if remaining > 10 else Colors.YELLOW if remaining > 5 else Colors.RED
-            print(f"\r{countdown_color}⏰ Time remaining: {remaining:2d} seconds{Colors.ENDC}", end="", flush=True)
-            time.sleep(1)
+        # Withdraw whatever is still pending (the read on timeout, the timers
+        # on answer, including an answer that arrived during request_line())
+        request.cancel()
+        with self._lock:
+            expire_handle.cancel()
+            self._tick_handle.cancel()
+            # Drop the handle so no reference cycle outlives the question
+            self._tick_handle = None
         
-        if input_thread.is_alive():
-            self.timed_out = True
+        if self.timed_out:
             print(f"\n\n{Colors.FAIL}⏰ Time's up!{Colors.ENDC}")
             return None
         else:
@@ -110,10 +181,10 @@ class TimedInput:
             except (ValueError, TypeError):
                 return None
 
-def get_user_input(prompt, options_count, timer_seconds=None):
+def get_user_input(prompt, options_count, timer_seconds=None, tick_interval=DEFAULT_TICK_INTERVAL):
     """Get user input with optional timer"""
     if timer_seconds:
-        timer = TimedInput(timer_seconds)
+        timer = TimedInput(timer_seconds, tick_interval=tick_interval)
         return timer.get_timed_input(prompt, options_count)
     else:
         # Normal mode without timer
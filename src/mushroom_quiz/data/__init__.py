@@ -10,7 +10,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-23
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 License: MIT
 
 Description:
@@ -21,11 +21,31 @@ Description:
 Exports:
     - get_questions_by_difficulty: Get questions filtered by difficulty
     - get_all_questions: Get all available questions
+    - get_question_bank: Get the indexed default question bank
+    - QuestionBank: Immutable question collection with difficulty/topic indexes
+    - Question: Compact question record with a dict-compatible view
+    - question_id: Stable 64-bit identifier of a question
+    - open_question_source: Open a JSON, streamed JSON Lines or binary question file
+    - JsonlQuestionSource: Reservoir-sampling source over a JSON Lines file
+    - MappedQuestionBank: QuestionBank over a memory-mapped binary bank file
+    - write_binary_bank: Write questions as a binary bank file
+    - DuplicateIndex: MinHash/LSH index that flags near-duplicate questions
+    - SearchIndex: Inverted index with ranked keyword and phrase search
+    - get_search_index: Get the (cached) search index of a question bank
     
 Repository:
     https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
 """
 
-from .question_loader import get_questions_by_difficulty, get_all_questions
+from .question_loader import (get_questions_by_difficulty, get_all_questions, get_question_bank,
+                              open_question_source)
+from .question import Question
+from .question_bank import QuestionBank, question_id
+from .question_source import JsonlQuestionSource
+from .binary_bank import MappedQuestionBank, write_binary_bank
+from .dedup import DuplicateIndex
+from .search import SearchIndex, get_search_index
 
-__all__ = ["get_questions_by_difficulty", "get_all_questions"]
+__all__ = ["get_questions_by_difficulty", "get_all_questions", "get_question_bank", "QuestionBank",
+           "Question", "question_id", "open_question_source", "JsonlQuestionSource",
+           "MappedQuestionBank", "write_binary_bank", "DuplicateIndex", "SearchIndex", "get_search_index"]
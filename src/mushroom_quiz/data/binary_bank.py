@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗄️ Binary Question Bank Module 🗄️
+
+Memory-mapped question banks with O(1) access to any question.
+
+File: binary_bank.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    A JSON bank has to be parsed in full before its first question can be
+    asked, and every process pays for its own parsed copy. The binary bank
+    format (.mqb) is laid out so that it never needs parsing: the file is
+    opened with mmap and question i is decoded straight from its record
+    when it is asked for. Opening costs the same for ten questions or ten
+    million, and processes on one host share a single page-cached copy.
+
+    Layout (all integers little-endian):
+        header    magic, format, question count and the offsets of the
+                  sections below
+        records   one per question: topic and difficulty codes, answer
+                  index, option count, field lengths, then UTF-8 text of
+                  question, explanation, extra keys (as JSON) and options
+        offsets   count + 1 u64 record offsets, so record i spans
+                  offsets[i]:offsets[i + 1]
+        indexes   u32 question numbers per difficulty and per topic
+        ids       (question_id, number) pairs sorted by id, for lookups
+        metadata  JSON with the bank version, the difficulty and topic
+                  names behind the codes, and where each index lives
+
+    MappedQuestionBank is a QuestionBank whose question tuple and
+    difficulty/topic indexes are replaced by lazy IndexView sequences over
+    the map, so sampling, filtering and counting work unchanged and touch
+    only the questions they return. Lookups by question id binary-search
+    the ids section.
+
+Classes:
+    IndexView: Lazy, read-only sequence of a mapped bank's questions
+    MappedQuestionBank: QuestionBank backed by a memory-mapped .mqb file
+
+Functions:
+    write_binary_bank(): Write questions as a binary bank file
+
+Usage:
+    from mushroom_quiz.data.binary_bank import MappedQuestionBank, write_binary_bank
+    write_binary_bank(questions, "bank.mqb", version=digest)
+    bank = MappedQuestionBank("bank.mqb")
+    bank[123456]                        # decodes one record
+    bank.sample("advanced", 20, rng)
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+from .question import Question
+from .question_bank import QuestionBank, question_id
+
+BINARY_SUFFIX = '.mqb'
+
+_MAGIC = b'MQBANK\x00\x00'
+# Bump when the layout changes; older readers refuse newer files
+_FORMAT = 1
+
+# magic, format, reserved, count, offsets_at, ids_at, meta_at, meta_length
+_HEADER = struct.Struct('<8sIIQQQQQ')
+# topic code, difficulty code, answer index, option count
+_RECORD = struct.Struct('<HBBB')
+_SPAN = struct.Struct('<QQ')
+_NUMBER = struct.Struct('<I')
+_ID_ENTRY = struct.Struct('<qI')
+
+_LENGTHS = {}
+
+def _lengths_struct(fields):
+    """Struct for the u32 field lengths of a record with this many fields"""
+    lengths = _LENGTHS.get(fields)
+    if lengths is None:
+        lengths = _LENGTHS[fields] = struct.Struct(f'<{fields}I')
+    return lengths
+
+def _little_endian(values):
+    """Bytes of an array in little-endian order"""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def _code(codes, name, limit, what):
+    code = codes.get(name)
+    if code is None:
+        if len(codes) >= limit:
+            raise ValueError(f"A binary bank holds at most {limit} {what}")
+        code = codes[name] = len(codes)
+    return code
+
+def _encode(question, topic_code, difficulty_code):
+    """Encode one question as a record"""
+    if len(question.options) > 255:
+        raise ValueError(f"Too many options in {question.text!r} for a binary bank")
+    extra = json.dumps(question.extra, ensure_ascii=False, separators=(',', ':')) if question.extra else ''
+    fields = [question.text, question.explanation, extra, *question.options]
+    encoded = [field.encode('utf-8') for field in fields]
+    return b''.join([
+        _RECORD.pack(topic_code, difficulty_code, question.answer_index, len(question.options)),
+        _lengths_struct(len(encoded)).pack(*map(len, encoded)),
+        *encoded,
+    ])
+
+def write_binary_bank(questions, path, version=None):
+    """
+    Write questions as a binary bank file.
+
+    Questions are encoded as they are read, so a streamed source can be
+    packed without holding the bank in memory; only the offset, index and
+    id tables (about 28 bytes per question, in arrays) are kept until the
+    end. Sorting the ids briefly needs a list of question numbers as
+    well. The file is written to a temporary name and moved into place
+    when complete.
+
+    Args:
+        questions (iterable): Question dictionaries or Question records
+        path (str): Destination .mqb file
+        version (str): Bank version to record (defaults to a SHA-256 of
+            the encoded records)
+
+    Returns:
+        int: Number of questions written
+
+    Raises:
+        ValueError: If a question cannot be encoded
+    """
+    difficulties = {}
+    topics = {}
+    difficulty_groups = []
+    topic_groups = []
+    offsets = array('Q')
+    ids = array('q')
+    digest = hashlib.sha256()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(b'\0' * _HEADER.size)
+            position = _HEADER.size
+            for number, question in enumerate(questions):
+                if not isinstance(question, Question):
+                    question = Question.from_dict(question)
+                difficulty = _code(difficulties, question.difficulty, 256, "difficulties")
+                topic = _code(topics, question.topic, 65536, "topics")
+                if difficulty == len(difficulty_groups):
+                    difficulty_groups.append(array('I'))
+                if topic == len(topic_groups):
+                    topic_groups.append(array('I'))
+                difficulty_groups[difficulty].append(number)
+                topic_groups[topic].append(number)
+                ids.append(question_id(question))
+
+                record = _encode(question, topic, difficulty)
+                digest.update(record)
+                offsets.append(position)
+                f.write(record)
+                position += len(record)
+            offsets.append(position)
+            count = len(ids)
+
+            # Tables start on 8-byte boundaries
+            padding = -position % 8
+            f.write(b'\0' * padding)
+            offsets_at = position + padding
+            f.write(_little_endian(offsets))
+            position = offsets_at + 8 * len(offsets)
+
+            groups = {}
+            for kind, names, arrays in (("difficulty", difficulties, difficulty_groups),
+                                        ("topic", topics, topic_groups)):
+                groups[kind] = []
+                for name, numbers in zip(names, arrays):
+                    groups[kind].append([name, position, len(numbers)])
+                    f.write(_little_endian(numbers))
+                    position += 4 * len(numbers)
+
+            ids_at = position
+            for number in sorted(range(count), key=ids.__getitem__):
+                f.write(_ID_ENTRY.pack(ids[number], number))
+            position += _ID_ENTRY.size * count
+
+            meta = json.dumps({
+                "version": version or digest.hexdigest(),
+                "difficulties": groups["difficulty"],
+                "topics": groups["topic"],
+            }, ensure_ascii=False).encode('utf-8')
+            f.write(meta)
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, _FORMAT, 0, count, offsets_at, ids_at, position, len(meta)))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return count
+
+class IndexView(Sequence):
+    """Lazy, read-only sequence of a mapped bank's questions"""
+
+    __slots__ = ('_bank', '_at', '_length')
+
+    def __init__(self, bank, at, length):
+        """
+        Args:
+            bank (MappedQuestionBank): Bank the questions come from
+            at (int or None): Offset of a u32 question number array in the
+                map, or None for every question in order
+            length (int): Number of questions in the view
+        """
+        self._bank = bank
+        self._at = at
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("question index out of range")
+        if self._at is not None:
+            index = _NUMBER.unpack_from(self._bank._map, self._at + 4 * index)[0]
+        return self._bank._decode(index)
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self[index]
+
+    def __repr__(self):
+        return f"<IndexView of {self._length} questions>"
+
+class MappedQuestionBank(QuestionBank):
+    """QuestionBank backed by a memory-mapped binary bank file"""
+
+    def __init__(self, path):
+        """
+        Open a binary bank. Only the header and metadata are read.
+
+        Args:
+            path (str): .mqb file written by write_binary_bank()
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a binary bank this version reads
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError(f"{path} is not a binary question bank") from None
+        try:
+            magic, file_format, _, count, offsets_at, ids_at, meta_at, meta_length = \
+                _HEADER.unpack_from(self._map, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a binary question bank")
+            if file_format != _FORMAT:
+                raise ValueError(f"{path} uses binary bank format {file_format}, not {_FORMAT}")
+            meta = json.loads(self._map[meta_at:meta_at + meta_length].decode('utf-8'))
+        except (struct.error, UnicodeDecodeError) as e:
+            self._map.close()
+            raise ValueError(f"{path} is not a readable binary question bank: {e}") from None
+        except ValueError:
+            self._map.close()
+            raise
+
+        self.version = meta["version"]
+        self._count = count
+        self._offsets_at = offsets_at
+        self._ids_at = ids_at
+        self._difficulty_names = [sys.intern(name) for name, _, _ in meta["difficulties"]]
+        self._topic_names = [sys.intern(name) for name, _, _ in meta["topics"]]
+        # The views stand in for QuestionBank's tuples, so its lookups,
+        # counts and sampling work unchanged
+        self._questions = IndexView(self, None, count)
+        self._by_difficulty = {name: IndexView(self, at, length) for name, at, length in meta["difficulties"]}
+        self._by_topic = {name: IndexView(self, at, length) for name, at, length in meta["topics"]}
+        self._by_id = None
+
+    def _decode(self, number):
+        """Decode question number from its record"""
+        data = self._map
+        start, end = _SPAN.unpack_from(data, self._offsets_at + 8 * number)
+        topic, difficulty, answer_index, options = _RECORD.unpack_from(data, start)
+        lengths = _lengths_struct(3 + options)
+        position = start + _RECORD.size + lengths.size
+        fields = []
+        for length in lengths.unpack_from(data, start + _RECORD.size):
+            fields.append(data[position:position + length].decode('utf-8'))
+            position += length
+        text, explanation, extra = fields[:3]
+        return Question(text, fields[3:], answer_index, explanation, self._topic_names[topic],
+                        self._difficulty_names[difficulty], json.loads(extra) if extra else None)
+
+    def item_fields(self):
+        """
+        Read what item models need of each question, without decoding its text.
+
+        Yields:
+            tuple: (difficulty, option count, extra keys dict or None), in
+                question order
+        """
+        data = self._map
+        names = self._difficulty_names
+        for number in range(self._count):
+            start = _SPAN.unpack_from(data, self._offsets_at + 8 * number)[0]
+            _, difficulty, _, options = _RECORD.unpack_from(data, start)
+            lengths = _lengths_struct(3 + options)
+            text, explanation, extra = lengths.unpack_from(data, start + _RECORD.size)[:3]
+            extra_at = start + _RECORD.size + lengths.size + text + explanation
+            yield (names[difficulty], options,
+                   json.loads(data[extra_at:extra_at + extra].decode('utf-8')) if extra else None)
+
+    def get(self, qid):
+        """
+        Look up a question by its question_id() (binary search of the ids).
+
+        Args:
+            qid (int): Question id
+
+        Returns:
+            Question or None: The question, or None if it is not in this bank
+        """
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            found, number = _ID_ENTRY.unpack_from(self._map, self._ids_at + _ID_ENTRY.size * middle)
+            if found < qid:
+                low = middle + 1
+            elif found > qid:
+                high = middle
+            else:
+                return self._decode(number)
+        return None
+
+    def close(self):
+        """Unmap the file; questions already decoded stay usable"""
+        self._map.close()
+
+    def __reduce__(self):
+        # Other processes map the same file rather than receiving a copy
+        return (MappedQuestionBank, (self.path,))
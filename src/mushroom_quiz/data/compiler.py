@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏗️ Question Bank Compiler Module 🏗️
+
+Builds every shipped copy of the question bank from questions.json.
+
+File: compiler.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    questions.json is the one source of the question bank. The compiler
+    turns it into the copies other front ends load, so they can no longer
+    drift apart by hand:
+
+    - web/data/questions-<difficulty>.<hash>.json: minified JSON, one shard
+      per difficulty, named by a hash of its content so browsers and CDNs
+      can cache shards forever. Each shard is also written gzip-compressed
+      (.json.gz) and, when the optional brotli package is installed,
+      brotli-compressed (.json.br), ready for servers that serve
+      precompressed files. Shards that are no longer current are removed.
+    - web/questions.js: a small loader holding the shard names, so the web
+      app fetches only the shard of the chosen difficulty.
+    - quiz_questions.py: the legacy top-level module with QUESTIONS as a
+      Python literal.
+    - Optionally, a memory-mapped binary bank (.mqb).
+
+    Output is deterministic, so compiling an unchanged bank rewrites
+    nothing, and check mode reports outputs that are out of date (for CI).
+
+Classes:
+    CompileResult: Paths written, left unchanged and removed by a compile
+
+Functions:
+    build_outputs(): Render every output of a compile in memory
+    compile_bank(): Write (or check) the outputs of a compile
+
+Usage:
+    from mushroom_quiz.data.compiler import compile_bank
+    result = compile_bank(web_dir="web", python_path="quiz_questions.py")
+    # or: mushroom-quiz compile --check
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from collections import Counter, namedtuple
+
+try:
+    import brotli
+except ImportError:  # optional; shards are then only gzip-compressed
+    brotli = None
+
+from .binary_bank import write_binary_bank
+from .question_loader import QUESTIONS_FILE, load_questions
+
+CompileResult = namedtuple('CompileResult', ['written', 'unchanged', 'removed'])
+
+SHARD_DIR = 'data'
+SHARD_PREFIX = 'questions-'
+
+# Editorial notes on each topic, listed in the generated module's docstring
+TOPIC_NOTES = {
+    'biology_basics': "Fundamental fungal biology and terminology",
+    'beginner_varieties': "Entry-level mushroom species",
+    'cultivation_process': "Step-by-step growing procedures",
+    'growing_conditions': "Temperature, humidity, pH, CO2, lighting",
+    'growing_methods': "Different cultivation techniques and systems",
+    'medicinal_mushrooms': "Health benefits and active compounds",
+    'mushroom_varieties': "Species identification and characteristics",
+    'sterilization': "Contamination prevention and sterile techniques",
+    'substrates': "Growing media and nutrition",
+    'timing': "Schedules, harvest timing, and lifecycle stages",
+}
+
+_JS_LOADER = """\
+// Mushroom Cultivation Quiz Questions
+// Generated by `mushroom-quiz compile` from src/mushroom_quiz/data/questions.json.
+// Do not edit: change questions.json and compile again.
+//
+// Questions are split into one shard per difficulty and fetched on demand,
+// so the first paint does not wait for the whole bank.
+
+const QUESTION_SHARDS = {shards};
+
+const QUESTION_COUNTS = {counts};
+
+const questionShards = {{}};
+
+function loadShard(difficulty) {{
+    if (!questionShards[difficulty]) {{
+        const url = QUESTION_SHARDS[difficulty];
+        questionShards[difficulty] = fetch(url)
+            .then(response => {{
+                if (!response.ok) {{
+                    throw new Error(`${{url}}: HTTP ${{response.status}}`);
+                }}
+                return response.json();
+            }})
+            .catch(error => {{
+                // Let a later call try again
+                delete questionShards[difficulty];
+                throw error;
+            }});
+    }}
+    return questionShards[difficulty];
+}}
+
+function loadQuestions(difficulty) {{
+    if (difficulty === "mixed") {{
+        return Promise.all(Object.keys(QUESTION_SHARDS).map(loadShard))
+            .then(shards => shards.flat());
+    }}
+    if (!(difficulty in QUESTION_SHARDS)) {{
+        return Promise.reject(new Error(`Unknown difficulty: ${{difficulty}}`));
+    }}
+    return loadShard(difficulty);
+}}
+
+function getRandomQuestions(questions, count) {{
+    const shuffled = [...questions].sort(() => Math.random() - 0.5);
+    return shuffled.slice(0, count);
+}}
+
+function shuffleArray(array) {{
+    const shuffled = [...array];
+    for (let i = shuffled.length - 1; i > 0; i--) {{
+        const j = Math.floor(Math.random() * (i + 1));
+        [shuffled[i], shuffled[j]] = [shuffled[j], shuffled[i]];
+    }}
+    return shuffled;
+}}
+"""
+
+_PY_HEADER = '''\
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📚 Mushroom Cultivation Quiz Questions Database
+
+Comprehensive database of mushroom cultivation questions organized by
+difficulty levels and topic categories for educational assessment.
+
+File: quiz_questions.py
+Author: Aaron J
+Version: 2.0.1
+Created: 2025-06-21
+Last Modified: 2026-10-18
+
+Description:
+    This module contains the complete question database for the mushroom
+    cultivation quiz application. It covers all aspects of mushroom
+    cultivation, from basic biology to advanced growing techniques and
+    medicinal properties.
+
+    Generated by `mushroom-quiz compile` from
+    src/mushroom_quiz/data/questions.json. Do not edit: change
+    questions.json and compile again.
+
+Database Structure:
+    Each question is a dictionary containing:
+    - question: The question text
+    - options: List of 4 multiple choice options
+    - answer: The correct answer (must match one option exactly)
+    - difficulty: "beginner", "intermediate", or "advanced"
+    - explanation: Educational explanation of the correct answer
+    - topic: Category for study recommendations
+
+Statistics:
+    Total Questions: {total}
+
+    Difficulty Distribution:
+{difficulties}
+
+    Topic Distribution:
+{topics}
+
+Topics Covered:
+{notes}
+
+Functions:
+    get_questions_by_difficulty(difficulty): Filter questions by difficulty
+    get_questions_count(): Get total number of questions
+    get_difficulty_distribution(): Get question counts by difficulty
+    get_topic_distribution(): Get question counts by topic
+
+Usage:
+    from quiz_questions import get_questions_by_difficulty, QUESTIONS
+    beginner_questions = get_questions_by_difficulty("beginner")
+    all_questions = QUESTIONS
+
+Data Quality:
+    - All questions thoroughly researched and fact-checked
+    - Explanations provide educational value beyond just answers
+    - Balanced coverage across all cultivation aspects
+    - Progressive difficulty appropriate for skill levels
+    - Real-world applicable knowledge
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+# Comprehensive Questions Database
+QUESTIONS = [
+'''
+
+_PY_FOOTER = '''\
+]
+
+def get_questions_by_difficulty(difficulty):
+    """Filter questions based on chosen difficulty"""
+    if difficulty == "mixed":
+        return QUESTIONS
+    else:
+        return [q for q in QUESTIONS if q["difficulty"] == difficulty]
+
+def get_questions_count():
+    """Get total number of questions available"""
+    return len(QUESTIONS)
+
+def get_difficulty_distribution():
+    """Get distribution of questions by difficulty level"""
+    distribution = {difficulties}
+    for question in QUESTIONS:
+        distribution[question["difficulty"]] += 1
+    return distribution
+
+def get_topic_distribution():
+    """Get distribution of questions by topic"""
+    topics = {{}}
+    for question in QUESTIONS:
+        topic = question["topic"]
+        topics[topic] = topics.get(topic, 0) + 1
+    return topics
+'''
+
+def _minified(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _distribution(counts, total):
+    """Docstring lines of a count distribution, in the order given"""
+    return "\n".join(
+        f"    - {name.replace('_', ' ').title()}: {count} questions ({count / total:.1%})"
+        for name, count in counts
+    )
+
+def _python_module(questions):
+    """Render the legacy quiz_questions module"""
+    total = len(questions)
+    difficulties = Counter(question['difficulty'] for question in questions)
+    topics = Counter(question['topic'] for question in questions)
+    notes = "\n".join(
+        f"    - {topic.replace('_', ' ').title()}: {note}"
+        for topic, note in TOPIC_NOTES.items() if topic in topics
+    )
+    entries = []
+    for question in questions:
+        # JSON string and list literals are valid Python; anything else
+        # (such as calibration numbers) is written with repr()
+        fields = [
+            f'        "{key}": '
+            + (json.dumps(value, ensure_ascii=False) if isinstance(value, (str, list)) else repr(value))
+            for key, value in question.items()
+        ]
+        entries.append("    {\n" + ",\n".join(fields) + "\n    }")
+    return (
+        _PY_HEADER.format(total=total, difficulties=_distribution(difficulties.items(), total),
+                          topics=_distribution(topics.most_common(), total), notes=notes)
+        + ",\n".join(entries) + "\n"
+        + _PY_FOOTER.format(difficulties=json.dumps(dict.fromkeys(difficulties, 0)))
+    ).encode('utf-8')
+
+def build_outputs(questions, web_dir, python_path=None):
+    """
+    Render every output of a compile in memory.
+
+    Args:
+        questions (list): Question dictionaries, in bank order
+        web_dir (str): Web app directory (holding index.html)
+        python_path (str): Where the legacy Python module goes, or None
+
+    Returns:
+        dict: Output path -> file content (bytes)
+    """
+    shard_dir = os.path.join(web_dir, SHARD_DIR)
+    outputs = {}
+    shards = {}
+    counts = {}
+    for difficulty in dict.fromkeys(question['difficulty'] for question in questions):
+        shard = [question for question in questions if question['difficulty'] == difficulty]
+        content = _minified(shard)
+        name = f"{SHARD_PREFIX}{difficulty}.{hashlib.sha256(content).hexdigest()[:12]}.json"
+        path = os.path.join(shard_dir, name)
+        outputs[path] = content
+        # mtime=0 keeps the compressed bytes identical between compiles
+        outputs[path + '.gz'] = gzip.compress(content, 9, mtime=0)
+        if brotli is not None:
+            outputs[path + '.br'] = brotli.compress(content)
+        shards[difficulty] = f"{SHARD_DIR}/{name}"
+        counts[difficulty] = len(shard)
+
+    outputs[os.path.join(web_dir, 'questions.js')] = _JS_LOADER.format(
+        shards=json.dumps(shards, indent=4),
+        counts=json.dumps(counts, indent=4),
+    ).encode('utf-8')
+    if python_path:
+        outputs[python_path] = _python_module(questions)
+    return outputs
+
+def _stale_shards(web_dir, outputs):
+    """Shard files (compressed copies included) that are not current shards"""
+    shard_dir = os.path.join(web_dir, SHARD_DIR)
+    try:
+        names = os.listdir(shard_dir)
+    except FileNotFoundError:
+        return []
+    stale = []
+    for name in names:
+        # A .br copy of a current shard is kept even where brotli is missing
+        base = name[:-3] if name.endswith(('.gz', '.br')) else name
+        if name.startswith(SHARD_PREFIX) and os.path.join(shard_dir, base) not in outputs:
+            stale.append(os.path.join(shard_dir, name))
+    return sorted(stale)
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def compile_bank(source=QUESTIONS_FILE, web_dir='web', python_path='quiz_questions.py',
+                 binary_path=None, check=False):
+    """
+    Write (or check) the outputs of a compile.
+
+    Args:
+        source (str): JSON question file, the single source of the bank
+        web_dir (str): Web app directory (holding index.html)
+        python_path (str): Where the legacy Python module goes, or None
+        binary_path (str): Also write a binary bank here (never checked)
+        check (bool): Only report what is out of date; write nothing
+
+    Returns:
+        CompileResult: Paths written (or, when checking, that would be
+            written), unchanged, and removed (or that would be removed)
+
+    Raises:
+        OSError: If the source cannot be read or an output written
+        ValueError: If the source is not a valid question list
+    """
+    questions, digest = load_questions(source, use_cache=False)
+    outputs = build_outputs(questions, web_dir, python_path)
+    written = []
+    unchanged = []
+    for path, content in outputs.items():
+        if _read(path) == content:
+            unchanged.append(path)
+            continue
+        written.append(path)
+        if not check:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+    removed = _stale_shards(web_dir, outputs)
+    if not check:
+        for path in removed:
+            os.remove(path)
+        if binary_path:
+            write_binary_bank(questions, binary_path, version=digest)
+            written.append(binary_path)
+    return CompileResult(written, unchanged, removed)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧬 Near-Duplicate Detection Module 🧬
+
+MinHash/LSH index that flags near-duplicate questions without pairwise scans.
+
+File: dedup.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module finds questions that say nearly the same thing. A question
+    is reduced to the set of character 5-grams of its normalised text
+    (question plus options, with the options sorted so their order does not
+    matter), and the Jaccard similarity of two such sets is estimated from
+    MinHash signatures.
+
+    Signatures use one-permutation hashing: every shingle is hashed once,
+    the top bits of the hash pick one of num_perm bins and each bin keeps
+    its smallest value. Empty bins borrow the value of the next filled bin
+    to the right, tagged with the distance (rotation densification), so the
+    signature stays comparable position by position. This costs one hash
+    per shingle rather than one per shingle and permutation.
+
+    Signatures are split into bands; each band is a key into a hash table.
+    Two questions become candidates when any band matches, and candidates
+    are kept when their estimated similarity reaches the threshold. A new
+    question is therefore compared only with the few questions that share
+    a bucket with it, not with the whole bank.
+
+    A pair of similarity s shares a bucket with probability
+    1 - (1 - s**rows)**bands, an S-curve whose steep part has to sit at
+    the threshold. Unless bands are given, the index picks the bands and
+    rows (bands * rows <= num_perm) that minimise the area of missed pairs
+    above the threshold plus candidate pairs below it, so every threshold
+    in (0, 1] gets a curve centred on it.
+
+Classes:
+    DuplicateIndex: Incremental near-duplicate index over questions
+
+Records:
+    DuplicateMatch: (index, similarity) of an indexed near-duplicate
+
+Functions:
+    question_shingles(): Hashed shingles of a question
+    minhash_signature(): Densified one-permutation MinHash signature
+    find_duplicate_clusters(): Groups of near-duplicate questions in a list
+    optimal_bands(): LSH (bands, rows) for a similarity threshold
+
+Usage:
+    from mushroom_quiz.data.dedup import DuplicateIndex, find_duplicate_clusters
+    index = DuplicateIndex(bank)
+    index.query(new_question)            # [DuplicateMatch(index=17, similarity=0.84)]
+    find_duplicate_clusters(questions)   # [[3, 17], [40, 41, 90]]
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import operator
+import re
+import zlib
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+DuplicateMatch = namedtuple('DuplicateMatch', ['index', 'similarity'])
+
+SHINGLE_SIZE = 5
+NUM_PERM = 128
+DEFAULT_THRESHOLD = 0.8
+# Weights of missed duplicates and of candidates below the threshold when
+# choosing the banding. A needless candidate costs one signature comparison,
+# a miss a duplicate left in the bank; at 0.8 this gives 16 bands of 8 rows,
+# which catch a pair at the threshold 95% of the time
+FALSE_NEGATIVE_WEIGHT = 0.95
+FALSE_POSITIVE_WEIGHT = 0.05
+# Midpoint-rule steps when integrating the S-curve
+_INTEGRATION_STEPS = 100
+
+_MASK64 = (1 << 64) - 1
+# Odd 64-bit multiplier (2**64 / golden ratio) that spreads CRC-32 values
+_MIX = 0x9E3779B97F4A7C15
+_NON_WORD = re.compile(r'[\W_]+')
+
+def _normalise(question):
+    """Lowercase question and sorted options with punctuation collapsed to spaces"""
+    text = " ".join([question['question']] + sorted(question.get('options', ())))
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+def question_shingles(question, size=SHINGLE_SIZE):
+    """
+    Get the hashed character shingles of a question.
+
+    Args:
+        question (dict): Question dictionary
+        size (int): Characters per shingle
+
+    Returns:
+        set: 64-bit shingle hashes
+    """
+    data = _normalise(question).encode('utf-8')
+    if len(data) <= size:
+        return {(zlib.crc32(data) * _MIX) & _MASK64} if data else set()
+    crc32 = zlib.crc32
+    return {(crc32(data[i:i + size]) * _MIX) & _MASK64 for i in range(len(data) - size + 1)}
+
+def minhash_signature(hashes, num_perm=NUM_PERM):
+    """
+    Build a densified one-permutation MinHash signature.
+
+    Args:
+        hashes (iterable): 64-bit shingle hashes
+        num_perm (int): Signature length (a power of two)
+
+    Returns:
+        array: num_perm unsigned 64-bit values
+    """
+    bin_bits = num_perm.bit_length() - 1
+    value_bits = 64 - bin_bits
+    value_mask = (1 << value_bits) - 1
+    empty = _MASK64
+    bins = [empty] * num_perm
+    for h in hashes:
+        slot = h >> value_bits
+        value = h & value_mask
+        if value < bins[slot]:
+            bins[slot] = value
+
+    signature = array('Q', bins)
+    if empty in bins and len(set(bins)) > 1:
+        # Rotation: an empty bin takes the next filled bin's value, with
+        # the distance to it in the top bits
+        filled = None
+        for step in range(2 * num_perm - 1, -1, -1):
+            slot = step % num_perm
+            if bins[slot] != empty:
+                filled = step
+            elif step < num_perm and filled is not None:
+                signature[slot] = ((filled - step) << value_bits) | bins[filled % num_perm]
+    return signature
+
+def _area(bands, rows, low, high, missed):
+    """Integrate the chance of (missing, if missed) becoming a candidate over [low, high]"""
+    width = (high - low) / _INTEGRATION_STEPS
+    total = 0.0
+    for step in range(_INTEGRATION_STEPS):
+        s = low + (step + 0.5) * width
+        collide = 1.0 - (1.0 - s ** rows) ** bands
+        total += (1.0 - collide) if missed else collide
+    return total * width
+
+@lru_cache(maxsize=None)
+def optimal_bands(threshold, num_perm=NUM_PERM):
+    """
+    Choose LSH bands and rows for a similarity threshold.
+
+    Tries every split with bands * rows <= num_perm and keeps the one with
+    the least weighted area of false negatives (similarity above the
+    threshold, never a candidate) and false positives (below it, a
+    candidate).
+
+    Args:
+        threshold (float): Similarity that counts as a duplicate, in (0, 1]
+        num_perm (int): Signature length
+
+    Returns:
+        tuple: (bands, rows)
+    """
+    best = None
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            error = (FALSE_POSITIVE_WEIGHT * _area(bands, rows, 0.0, threshold, False)
+                     + FALSE_NEGATIVE_WEIGHT * _area(bands, rows, threshold, 1.0, True))
+            if best is None or error < best[0]:
+                best = (error, bands, rows)
+    return best[1], best[2]
+
+class DuplicateIndex:
+    """Incremental MinHash/LSH index of questions"""
+
+    def __init__(self, questions=(), threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM, bands=None):
+        """
+        Create an index, optionally filled with existing questions.
+
+        Args:
+            questions (iterable): Questions to index straight away
+            threshold (float): Estimated Jaccard similarity that counts as a
+                duplicate, in (0, 1]
+            num_perm (int): Signature length (a power of two)
+            bands (int): LSH bands, which must divide num_perm (default:
+                chosen for the threshold by optimal_bands())
+
+        Raises:
+            ValueError: If the threshold or signature settings are invalid
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be between 0 and 1")
+        if num_perm & (num_perm - 1) or (bands is not None and num_perm % bands):
+            raise ValueError("num_perm must be a power of two divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        if bands is None:
+            self.bands, self.rows = optimal_bands(threshold, num_perm)
+        else:
+            self.bands, self.rows = bands, num_perm // bands
+        self.questions = []
+        self._signatures = []
+        self._buckets = [{} for _ in range(self.bands)]
+        for question in questions:
+            self._insert(question, self.signature(question))
+
+    def __len__(self):
+        return len(self.questions)
+
+    def signature(self, question):
+        """Get the MinHash signature of a question"""
+        return minhash_signature(question_shingles(question), self.num_perm)
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [hash(tuple(signature[b * rows:(b + 1) * rows])) for b in range(self.bands)]
+
+    def _matches(self, signature, keys):
+        candidates = set()
+        for bucket, key in zip(self._buckets, keys):
+            found = bucket.get(key)
+            if found:
+                candidates.update(found)
+        matches = []
+        for index in candidates:
+            other = self._signatures[index]
+            similarity = sum(map(operator.eq, signature, other)) / self.num_perm
+            if similarity >= self.threshold:
+                matches.append(DuplicateMatch(index, similarity))
+        matches.sort(key=lambda m: (-m.similarity, m.index))
+        return matches
+
+    def _insert(self, question, signature, keys=None):
+        index = len(self.questions)
+        self.questions.append(question)
+        self._signatures.append(signature)
+        for bucket, key in zip(self._buckets, keys or self._band_keys(signature)):
+            bucket.setdefault(key, []).append(index)
+        return index
+
+    def query(self, question):
+        """
+        Find indexed near-duplicates of a question without adding it.
+
+        Args:
+            question (dict): Question dictionary
+
+        Returns:
+            list: DuplicateMatch records, most similar first
+        """
+        signature = self.signature(question)
+        return self._matches(signature, self._band_keys(signature))
+
+    def add(self, question):
+        """
+        Index a question and report the near-duplicates it already had.
+
+        Args:
+            question (dict): Question dictionary
+
+        Returns:
+            list: DuplicateMatch records of earlier questions, most similar first
+        """
+        signature = self.signature(question)
+        keys = self._band_keys(signature)
+        matches = self._matches(signature, keys)
+        self._insert(question, signature, keys)
+        return matches
+
+def find_duplicate_clusters(questions, threshold=DEFAULT_THRESHOLD):
+    """
+    Group a list of questions into clusters of near-duplicates.
+
+    Questions are linked when their estimated similarity reaches the
+    threshold, and clusters are the connected groups of links.
+
+    Args:
+        questions (iterable): Question dictionaries
+        threshold (float): Estimated Jaccard similarity that counts as a duplicate
+
+    Returns:
+        list: Clusters of two or more question indexes, largest first
+    """
+    parent = []
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    index = DuplicateIndex(threshold=threshold)
+    for i, question in enumerate(questions):
+        parent.append(i)
+        for match in index.add(question):
+            root, other = find(i), find(match.index)
+            if root != other:
+                parent[max(root, other)] = min(root, other)
+
+    clusters = {}
+    for i in range(len(parent)):
+        clusters.setdefault(find(i), []).append(i)
+    return sorted((c for c in clusters.values() if len(c) > 1), key=lambda c: (-len(c), c[0]))
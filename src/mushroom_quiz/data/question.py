@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧩 Compact Question Module 🧩
+
+Slotted, read-only question records that still read like dictionaries.
+
+File: question.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    A question parsed from JSON is a dict of six keys with its own options
+    list and its own copies of the difficulty and topic strings. Banks keep
+    every question resident, so that overhead is paid per question, per
+    bank. Question stores the same data in __slots__: options as a tuple,
+    the correct answer as an index into them, and difficulty and topic as
+    interned strings shared by every question with the same value. Keys
+    outside the standard six (such as item calibration 'irt_a') are kept in
+    a small dict only for the questions that have them.
+
+    Question is a read-only Mapping, so question['answer'],
+    question.get('options') and dict(question) work as they did for the
+    plain dictionaries, and a Question compares equal to the dict it was
+    built from. Code that knows it holds a Question can use the attributes
+    directly.
+
+Classes:
+    Question: Compact question with a dict-compatible read-only view
+
+Usage:
+    from mushroom_quiz.data.question import Question
+    question = Question.from_dict(data)
+    question['answer'] == question.options[question.answer_index]
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import sys
+from collections.abc import Mapping
+
+# Mapping keys of the standard fields, and the attribute holding each
+_FIELDS = {
+    'question': 'text',
+    'options': 'options',
+    'answer': 'answer',
+    'explanation': 'explanation',
+    'topic': 'topic',
+    'difficulty': 'difficulty',
+}
+
+class Question(Mapping):
+    """Compact, read-only quiz question that reads like a dict"""
+
+    __slots__ = ('text', 'options', 'answer_index', 'explanation', 'topic', 'difficulty', 'extra')
+
+    def __init__(self, text, options, answer_index, explanation='', topic='', difficulty='', extra=None):
+        """
+        Args:
+            text (str): Question text
+            options (iterable): Answer options
+            answer_index (int): Position of the correct answer in options
+            explanation (str): Explanation shown after answering
+            topic (str): Topic identifier
+            difficulty (str): Difficulty level
+            extra (dict): Any further keys, or None
+        """
+        self.text = text
+        self.options = tuple(options)
+        self.answer_index = answer_index
+        self.explanation = explanation
+        self.topic = sys.intern(topic)
+        self.difficulty = sys.intern(difficulty)
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build a question from its dictionary form.
+
+        Args:
+            data (dict): Question dictionary with at least 'question',
+                'options' and 'answer'
+
+        Returns:
+            Question: Compact copy of the question ('' for a null or
+                missing topic or difficulty)
+
+        Raises:
+            ValueError: If the answer is not one of the options
+        """
+        options = tuple(data['options'])
+        try:
+            answer_index = options.index(data['answer'])
+        except ValueError:
+            raise ValueError(f"Answer {data['answer']!r} is not an option of {data['question']!r}") from None
+        extra = {key: value for key, value in data.items() if key not in _FIELDS}
+        # A null or missing topic or difficulty is stored as '' so it can be interned
+        return cls(data['question'], options, answer_index, data.get('explanation', ''),
+                   data.get('topic') or '', data.get('difficulty') or '', extra)
+
+    @property
+    def answer(self):
+        """str: Text of the correct option"""
+        return self.options[self.answer_index]
+
+    def __getitem__(self, key):
+        attribute = _FIELDS.get(key)
+        if attribute is not None:
+            if attribute == 'answer':
+                # Skips the property call on the most frequently read key
+                return self.options[self.answer_index]
+            return getattr(self, attribute)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        """Like dict.get(), without Mapping's exception round trip"""
+        attribute = _FIELDS.get(key)
+        if attribute is not None:
+            return getattr(self, attribute)
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __iter__(self):
+        yield from _FIELDS
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return len(_FIELDS) + (len(self.extra) if self.extra is not None else 0)
+
+    def __contains__(self, key):
+        return key in _FIELDS or (self.extra is not None and key in self.extra)
+
+    def __eq__(self, other):
+        """Equal to any mapping with the same keys and values (options as any sequence)"""
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if len(other) != len(self):
+            return False
+        for key in self:
+            if key not in other:
+                return False
+            theirs = other[key]
+            if key == 'options':
+                theirs = tuple(theirs)
+            if theirs != self[key]:
+                return False
+        return True
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (Question, (self.text, self.options, self.answer_index, self.explanation,
+                           self.topic, self.difficulty, self.extra))
+
+    def __repr__(self):
+        return f"Question({self.text!r}, difficulty={self.difficulty!r}, topic={self.topic!r})"
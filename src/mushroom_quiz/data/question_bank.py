@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗃️ Indexed Question Bank Module 🗃️
+
+Immutable, pre-indexed question collection for fast quiz selection.
+
+File: question_bank.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module provides the QuestionBank class, which wraps a list of
+    question dictionaries and builds per-difficulty and per-topic indexes
+    once, at load time. Lookups return the prebuilt index tuples directly,
+    so selecting questions for a quiz never rescans the whole bank.
+    Questions are stored as compact Question records (see question.py),
+    which read like the dictionaries they were built from.
+
+Classes:
+    QuestionBank: Immutable question collection with difficulty/topic indexes
+        - O(1) lookups by difficulty, topic or question id
+        - O(k) random sampling for quiz preparation
+        - Fallback to the whole bank when a difficulty is too small
+
+Functions:
+    question_id(): Stable 64-bit identifier of a question
+
+Usage:
+    from mushroom_quiz.data import get_question_bank
+    bank = get_question_bank()
+    questions = bank.sample("intermediate", 10)
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import hashlib
+import random
+
+from .question import Question
+
+MIXED = 'mixed'
+
+def question_id(question):
+    """
+    Get a stable identifier for a question.
+
+    The id is derived from the question text, so it is the same in every
+    process and across bank versions that keep the question unchanged.
+
+    Args:
+        question (dict): Question dictionary
+
+    Returns:
+        int: Signed 64-bit integer (fits an SQLite INTEGER)
+    """
+    digest = hashlib.blake2b(question['question'].encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+class QuestionBank:
+    """Immutable question collection indexed by difficulty and topic"""
+
+    def __init__(self, questions, version=None):
+        """
+        Build the bank and its indexes.
+
+        Args:
+            questions (iterable): Question dictionaries (or Question
+                records) with at least 'difficulty' and 'topic' keys
+            version (str): Optional content identifier, such as the hash
+                of the file the questions were loaded from
+
+        Raises:
+            ValueError: If a question's answer is not one of its options
+        """
+        self._questions = tuple(
+            question if isinstance(question, Question) else Question.from_dict(question)
+            for question in questions
+        )
+        self.version = version
+
+        by_difficulty = {}
+        by_topic = {}
+        for question in self._questions:
+            by_difficulty.setdefault(question['difficulty'], []).append(question)
+            by_topic.setdefault(question['topic'], []).append(question)
+
+        self._by_difficulty = {key: tuple(value) for key, value in by_difficulty.items()}
+        self._by_topic = {key: tuple(value) for key, value in by_topic.items()}
+        # Built on first get(), since only review quizzes look questions up by id
+        self._by_id = None
+
+    def __len__(self):
+        return len(self._questions)
+
+    def __iter__(self):
+        return iter(self._questions)
+
+    def __getitem__(self, index):
+        return self._questions[index]
+
+    @property
+    def questions(self):
+        """tuple: Every question in the bank, in load order"""
+        return self._questions
+
+    def by_difficulty(self, difficulty):
+        """
+        Get the questions for a difficulty level.
+
+        Args:
+            difficulty (str): Difficulty level, or 'mixed' for the whole bank
+
+        Returns:
+            tuple: Matching questions (empty for unknown difficulties)
+        """
+        if difficulty == MIXED:
+            return self._questions
+        return self._by_difficulty.get(difficulty, ())
+
+    def by_topic(self, topic):
+        """
+        Get the questions for a topic.
+
+        Args:
+            topic (str): Topic identifier (e.g. 'sterilization')
+
+        Returns:
+            tuple: Matching questions (empty for unknown topics)
+        """
+        return self._by_topic.get(topic, ())
+
+    def get(self, qid):
+        """
+        Look up a question by its question_id().
+
+        Args:
+            qid (int): Question id
+
+        Returns:
+            dict or None: The question, or None if it is not in this bank
+        """
+        if self._by_id is None:
+            self._by_id = {question_id(question): question for question in self._questions}
+        return self._by_id.get(qid)
+
+    def difficulties(self):
+        """
+        Get the difficulty levels present in the bank.
+
+        Returns:
+            list: Difficulty level strings in first-seen order
+        """
+        return list(self._by_difficulty)
+
+    def topics(self):
+        """
+        Get the topics present in the bank.
+
+        Returns:
+            list: Topic strings in first-seen order
+        """
+        return list(self._by_topic)
+
+    def count(self, difficulty):
+        """
+        Get the number of questions for a difficulty level.
+
+        Args:
+            difficulty (str): Difficulty level, or 'mixed'
+
+        Returns:
+            int: Number of questions available
+        """
+        return len(self.by_difficulty(difficulty))
+
+    def sample(self, difficulty, k, rng=random):
+        """
+        Randomly select questions for a quiz.
+
+        Falls back to the whole bank when the requested difficulty does not
+        hold enough questions, and returns fewer than k questions only when
+        the whole bank is smaller than k.
+
+        Args:
+            difficulty (str): Difficulty level, or 'mixed'
+            k (int): Number of questions wanted
+            rng: Random source providing sample() (defaults to the random module)
+
+        Returns:
+            list: Selected question dictionaries
+        """
+        pool = self.by_difficulty(difficulty)
+        if len(pool) < k:
+            pool = self._questions
+        return rng.sample(pool, min(k, len(pool)))
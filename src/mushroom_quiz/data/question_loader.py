@@ -10,72 +10,232 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-23
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 License: MIT
 
 Description:
     This module provides an abstraction layer for loading and filtering
     quiz questions from the question database. It handles difficulty-based
     filtering and provides convenient functions for question management.
-    
+    Questions are indexed once into a QuestionBank on first use, so
+    difficulty lookups never rescan the database.
+
+    The bundled database lives in questions.json next to this module.
+    Parsed banks are cached in a marshal file keyed on the source file's
+    mtime and SHA-256 hash, so later starts skip JSON parsing entirely.
+
+    open_question_source() picks how a question file is read: JSON files
+    become an in-memory QuestionBank, while JSON Lines files (.jsonl,
+    .ndjson, optionally .gz) are streamed by a JsonlQuestionSource, so
+    banks larger than memory can still be quizzed from. Binary banks
+    (.mqb, written by 'mushroom-quiz pack') are memory-mapped by a
+    MappedQuestionBank and decode questions only when they are asked for.
+
 Functions:
+    - load_questions(): Load a question file, using the parse cache
+    - get_question_bank(): Get the indexed default QuestionBank
+    - open_question_source(): Open a question file as a quiz source
     - get_questions_by_difficulty(): Filter questions by difficulty level
     - get_all_questions(): Get all available questions
     - get_question_count_by_difficulty(): Count questions by difficulty
     - get_difficulty_levels(): Get list of available difficulty levels
-    
+
 Supported Difficulty Levels:
     - beginner: Easy questions for newcomers
     - intermediate: Moderate difficulty questions
     - advanced: Challenging questions for experts
     - mixed: Questions from all difficulty levels
-    
+
+Environment:
+    - MUSHROOM_QUIZ_CACHE_DIR: Override the parse cache directory
+      (defaults to $XDG_CACHE_HOME/mushroom_quiz or ~/.cache/mushroom_quiz)
+    - MUSHROOM_QUIZ_BANK: JSON or binary (.mqb) bank used in place of the
+      bundled database by get_question_bank() (and so by servers and
+      paper workers)
+
 Repository:
     https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
 """
 
-from .quiz_questions import get_questions_by_difficulty as _get_questions_by_difficulty, QUESTIONS
+import hashlib
+import json
+import marshal
+import os
+
+from .binary_bank import BINARY_SUFFIX, MappedQuestionBank
+from .question_bank import QuestionBank
+from .question_source import JsonlQuestionSource
+
+QUESTIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'questions.json')
+
+# Bump when the cached layout changes so stale caches are ignored
+_CACHE_FORMAT = 1
+
+_QUESTION_BANK = None
+
+STREAMED_SUFFIXES = ('.jsonl', '.ndjson', '.jsonl.gz', '.ndjson.gz')
+
+def _cache_dir():
+    """Get the directory used for parsed question caches"""
+    override = os.environ.get('MUSHROOM_QUIZ_CACHE_DIR')
+    if override:
+        return override
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'mushroom_quiz')
+
+def _cache_path(path):
+    """Get the cache file for a question file, unique per absolute path"""
+    key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(_cache_dir(), f"questions-{key}.marshal")
 
-def get_questions_by_difficulty(difficulty):
+def _read_cache(cache_path):
+    """Read a cache entry, returning None if it is missing or unusable"""
+    try:
+        with open(cache_path, 'rb') as f:
+            entry = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, tuple) or len(entry) != 5 or entry[0] != _CACHE_FORMAT:
+        return None
+    return entry
+
+def _write_cache(cache_path, entry):
+    """Atomically write a cache entry; caching is best effort"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            marshal.dump(entry, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def load_questions(path=QUESTIONS_FILE, use_cache=True):
+    """
+    Load questions from a JSON file, reusing the parsed cache when valid.
+
+    The cache is trusted outright when the file's mtime and size are
+    unchanged. Otherwise the file is hashed, and the cache is still reused
+    (and re-stamped) if the content hash matches.
+
+    Args:
+        path (str): Path to a JSON file holding a list of question dictionaries
+        use_cache (bool): Whether to read and write the parse cache
+
+    Returns:
+        tuple: (questions list, SHA-256 hex digest of the file content)
+    """
+    stat = os.stat(path)
+    cache_path = _cache_path(path) if use_cache else None
+    cached = _read_cache(cache_path) if use_cache else None
+
+    if cached and cached[1] == stat.st_mtime_ns and cached[2] == stat.st_size:
+        return cached[4], cached[3]
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if cached and cached[3] == digest:
+        questions = cached[4]
+    else:
+        questions = json.loads(raw.decode('utf-8'))
+
+    if use_cache:
+        _write_cache(cache_path, (_CACHE_FORMAT, stat.st_mtime_ns, stat.st_size, digest, questions))
+    return questions, digest
+
+def _open_bank(path):
+    """Open a JSON file as a QuestionBank, or map a binary bank"""
+    if path.endswith(BINARY_SUFFIX):
+        return MappedQuestionBank(path)
+    questions, digest = load_questions(path)
+    return QuestionBank(questions, version=digest)
+
+def get_question_bank():
+    """
+    Get the indexed bank built from the question database.
+
+    The database is the bundled one unless MUSHROOM_QUIZ_BANK names
+    another JSON or binary bank. It is loaded on first call and shared
+    afterwards.
+
+    Returns:
+        QuestionBank: Shared, immutable question bank
+    """
+    global _QUESTION_BANK
+    if _QUESTION_BANK is None:
+        _QUESTION_BANK = _open_bank(os.environ.get('MUSHROOM_QUIZ_BANK') or QUESTIONS_FILE)
+    return _QUESTION_BANK
+
+def open_question_source(path, topic=None):
+    """
+    Open a question file as a source QuizGame can draw quizzes from.
+
+    Args:
+        path (str): JSON file holding a list of questions, JSON Lines
+            file with one question per line (streamed, never fully loaded)
+            or binary bank (memory-mapped)
+        topic (str): Only use questions on this topic
+
+    Returns:
+        QuestionBank or JsonlQuestionSource: Source with version and sample()
+    """
+    if path.endswith(STREAMED_SUFFIXES):
+        return JsonlQuestionSource(path, topic=topic)
+    bank = _open_bank(path)
+    if topic is None:
+        return bank
+    return QuestionBank(bank.by_topic(topic), version=f"{bank.version}:{topic}")
+
+def get_questions_by_difficulty(difficulty, lazy=False):
     """
     Get questions filtered by difficulty level.
-    
+
     Args:
         difficulty (str): Difficulty level ('beginner', 'intermediate', 'advanced', 'mixed')
-        
+        lazy (bool): Return the bank's own read-only sequence instead of a
+            list copy (for binary banks, questions are decoded on access)
+
     Returns:
         list: List of question dictionaries for the specified difficulty
     """
-    if difficulty == 'mixed':
-        return get_all_questions()
-    else:
-        return _get_questions_by_difficulty(difficulty)
+    questions = get_question_bank().by_difficulty(difficulty)
+    return questions if lazy else list(questions)
 
-def get_all_questions():
+def get_all_questions(lazy=False):
     """
     Get all questions from all difficulty levels.
-    
+
+    Args:
+        lazy (bool): Return the bank's own read-only sequence instead of a
+            list copy (for binary banks, questions are decoded on access)
+
     Returns:
         list: Combined list of all questions
     """
-    return QUESTIONS
+    questions = get_question_bank().questions
+    return questions if lazy else list(questions)
 
 def get_question_count_by_difficulty(difficulty):
     """
     Get the number of questions available for a given difficulty.
-    
+
     Args:
         difficulty (str): Difficulty level
-        
+
     Returns:
         int: Number of questions available
     """
-    return len(get_questions_by_difficulty(difficulty))
+    return get_question_bank().count(difficulty)
 
 def get_difficulty_levels():
     """
     Get list of available difficulty levels.
-    
+
     Returns:
         list: Available difficulty level strings
     """
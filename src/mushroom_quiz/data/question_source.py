@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🌊 Streaming Question Source Module 🌊
+
+Quiz selection straight from JSON Lines files too large to load into memory.
+
+File: question_source.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    A question source is anything QuizGame can draw a quiz from: it has a
+    version (recorded in QuizSpec and the statistics) and a
+    sample(difficulty, k, rng) method with QuestionBank's semantics. The
+    in-memory QuestionBank is one source; JsonlQuestionSource is the
+    other, for banks kept on disk as one question object per line
+    (optionally gzip-compressed).
+
+    JsonlQuestionSource.sample() reads the file once and keeps only k
+    questions in memory, using reservoir sampling. Reservoirs follow Li's
+    Algorithm L, which draws how many questions to skip before the next
+    replacement, so lines that cannot be chosen are never parsed and only
+    O(k log(n/k)) random numbers are drawn. Difficulty, topic and custom
+    predicates are applied while streaming. Difficulty and topic are read
+    from the raw line with a regular expression whenever the field is
+    unambiguous (one unescaped occurrence), so non-matching lines are
+    ruled out without JSON parsing; custom predicates need the parsed
+    question and make every line be parsed. As with QuestionBank,
+    the whole (filtered) bank is sampled instead when the difficulty holds
+    fewer than k questions, from a second reservoir filled in the same pass.
+
+    Chosen questions are returned as compact Question records, like the
+    questions of a QuestionBank.
+
+    Reading a multi-gigabyte file just to name its version would cost as
+    much as a quiz, so the version is a SHA-256 fingerprint of the file
+    size and its first and last megabyte rather than of the full content.
+
+Classes:
+    JsonlQuestionSource: Question source that streams a JSON Lines file
+
+Usage:
+    from mushroom_quiz.data.question_source import JsonlQuestionSource
+    source = JsonlQuestionSource("aggregated.jsonl.gz", topic="sterilization")
+    QuizGame("advanced", 20, bank=source).new_session()
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import random
+import re
+
+from .question import Question
+from .question_bank import MIXED
+
+# Bytes read from each end of the file for its version fingerprint
+FINGERPRINT_BYTES = 1 << 20
+
+_READ_BUFFER = 1 << 20
+
+# A string value written without escapes, right after its key
+_RAW_VALUE = re.compile(rb'\s*:\s*"([^"\\]*)"')
+_DIFFICULTY_FIELD = b'"difficulty"'
+_TOPIC_FIELD = b'"topic"'
+
+def _raw_value(key, line):
+    """Field value read without parsing the line, or None if unsure"""
+    # Keys usually come last, so search from the end, then make sure
+    # there is no earlier (nested or ambiguous) occurrence
+    start = line.rfind(key)
+    if start < 0 or line.find(key, 0, start) >= 0:
+        return None
+    match = _RAW_VALUE.match(line, start + len(key))
+    return match.group(1) if match else None
+
+def _uniform(rng):
+    """Uniform random number in the open interval (0, 1)"""
+    u = rng.random()
+    while u == 0.0:
+        u = rng.random()
+    return u
+
+class _Reservoir:
+    """Uniform sample of up to k items from a stream (Algorithm L)"""
+
+    def __init__(self, k, rng):
+        self.k = k
+        self.items = []
+        self._rng = rng
+        self._skip = 0
+        self._w = 1.0
+
+    def wants(self):
+        """Check whether the next item of the stream goes into the sample"""
+        if len(self.items) < self.k:
+            return True
+        if self._skip:
+            self._skip -= 1
+            return False
+        return True
+
+    def keep(self, item):
+        """Store an item that wants() asked for"""
+        if len(self.items) < self.k:
+            self.items.append(item)
+            if len(self.items) < self.k:
+                return
+        else:
+            self.items[self._rng.randrange(self.k)] = item
+        # Distance to the next replacement is geometric in the running weight
+        self._w *= math.exp(math.log(_uniform(self._rng)) / self.k)
+        self._skip = 0 if self._w >= 1.0 else int(math.log(_uniform(self._rng)) / math.log1p(-self._w))
+
+class JsonlQuestionSource:
+    """Question source that streams questions from a JSON Lines file"""
+
+    def __init__(self, path, topic=None, predicate=None):
+        """
+        Args:
+            path (str): JSON Lines file, one question object per line
+                (read through gzip when it ends in .gz)
+            topic (str): Only use questions on this topic
+            predicate (callable): Only use questions for which
+                predicate(question) is true
+        """
+        self.path = path
+        self.topic = topic
+        self.predicate = predicate
+        self._version = None
+
+    @property
+    def version(self):
+        """str: Fingerprint of the file (size and first and last megabyte)"""
+        if self._version is None:
+            digest = hashlib.sha256()
+            with open(self.path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                digest.update(str(size).encode('ascii'))
+                digest.update(f.read(FINGERPRINT_BYTES))
+                if size > FINGERPRINT_BYTES:
+                    f.seek(max(FINGERPRINT_BYTES, size - FINGERPRINT_BYTES))
+                    digest.update(f.read(FINGERPRINT_BYTES))
+            self._version = digest.hexdigest()
+        return self._version
+
+    def _open(self):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, 'rb')
+        return open(self.path, 'rb', buffering=_READ_BUFFER)
+
+    def _lines(self):
+        """Yield (line number, raw line) for every non-blank line"""
+        with self._open() as f:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    yield number, line
+
+    def _parse(self, number, line):
+        try:
+            return Question.from_dict(json.loads(line))
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"{self.path}:{number}: invalid question: {e}") from None
+
+    def _filter(self, number, line):
+        """
+        Apply the source's topic and predicate filters to a line.
+
+        Returns:
+            tuple: (accepted, question dict if it had to be parsed, else None)
+        """
+        question = None
+        if self.topic is not None:
+            topic = _raw_value(_TOPIC_FIELD, line)
+            if topic is None:
+                question = self._parse(number, line)
+                if question.get('topic') != self.topic:
+                    return False, question
+            elif topic.decode('utf-8') != self.topic:
+                return False, None
+        if self.predicate is not None:
+            if question is None:
+                question = self._parse(number, line)
+            if not self.predicate(question):
+                return False, question
+        return True, question
+
+    def __iter__(self):
+        """Stream every question that passes the source's filters"""
+        for number, line in self._lines():
+            accepted, question = self._filter(number, line)
+            if accepted:
+                yield question if question is not None else self._parse(number, line)
+
+    def sample(self, difficulty, k, rng=random):
+        """
+        Randomly select questions for a quiz in one pass over the file.
+
+        Falls back to every question passing the source's filters when the
+        requested difficulty does not hold enough of them, and returns
+        fewer than k questions only when those are fewer than k.
+
+        Args:
+            difficulty (str): Difficulty level, or 'mixed'
+            k (int): Number of questions wanted
+            rng: Random source providing random(), randrange() and shuffle()
+
+        Returns:
+            list: Selected question dictionaries, in random order
+        """
+        if k <= 0:
+            return []
+        pool = _Reservoir(k, rng)
+        fallback = _Reservoir(k, rng) if difficulty != MIXED else None
+        filtered = self.topic is not None or self.predicate is not None
+        wanted = difficulty.encode('utf-8')
+
+        for number, line in self._lines():
+            question = None
+            if filtered:
+                accepted, question = self._filter(number, line)
+                if not accepted:
+                    continue
+            if fallback is not None:
+                if fallback.wants():
+                    if question is None:
+                        question = self._parse(number, line)
+                    fallback.keep(question)
+                value = _raw_value(_DIFFICULTY_FIELD, line) if question is None else None
+                if value is not None:
+                    matches = value == wanted
+                else:
+                    if question is None:
+                        question = self._parse(number, line)
+                    matches = question.get('difficulty') == difficulty
+                if not matches:
+                    continue
+            if pool.wants():
+                pool.keep(question if question is not None else self._parse(number, line))
+
+        chosen = pool.items if len(pool.items) == k or fallback is None else fallback.items
+        rng.shuffle(chosen)
+        return chosen
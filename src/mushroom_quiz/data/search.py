@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔎 Question Search Module 🔎
+
+Inverted full-text index with ranked keyword and phrase search.
+
+File: search.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module indexes the question, options and explanation of every
+    question and answers keyword queries ranked by BM25. A query is a list
+    of clauses, any of which may match: bare words, and "quoted phrases"
+    whose words must appear next to each other in one field. The word OR
+    between clauses is accepted and ignored.
+
+    Postings are stored impact-ordered: each term's list holds its
+    documents sorted by their BM25 contribution for that term, computed at
+    build time. A search walks the lists of the query's clauses in
+    parallel, scores each newly seen question exactly, and stops as soon
+    as the k-th best score reaches the most any unseen question could
+    still score (Fagin's threshold algorithm). Frequent words therefore
+    cost O(k) rather than a pass over their whole posting list.
+
+    Each question's token ids are also kept in order, which provides the
+    exact per-question term frequencies and the phrase check. Indexes of
+    versioned banks are cached as marshal files next to the question parse
+    cache, so they are built once per bank version.
+
+Classes:
+    SearchIndex: Inverted index over a list of questions
+    SearchSelector: QuizGame question selector for keyword study quizzes
+
+Records:
+    SearchHit: (index, score) of a matching question
+
+Functions:
+    tokenize(): Normalised search tokens of a text
+    parse_query(): Split a query into word and phrase clauses
+    get_search_index(): Get the (cached) index of a question bank
+
+Usage:
+    from mushroom_quiz.data.search import get_search_index
+    index = get_search_index(bank)
+    index.search('"pressure cooker" OR "PF Tek"', limit=10)
+    create_quiz("mixed", 10, None, selector=SearchSelector("sterilization"))
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import heapq
+import marshal
+import math
+import os
+import re
+import weakref
+from array import array
+from bisect import bisect_left
+from collections import Counter, namedtuple
+
+from .question_bank import MIXED
+from .question_loader import _cache_dir, _write_cache
+
+SearchHit = namedtuple('SearchHit', ['index', 'score'])
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Marks field boundaries in a question's token sequence, so phrases never
+# match across the end of one option and the start of the next
+_FIELD_BREAK = 0xFFFFFFFF
+
+# Bump when the cached index layout changes so stale caches are ignored
+_CACHE_FORMAT = 1
+
+# Sorted accesses per list between threshold checks
+_BATCH = 8
+
+# Posting lists up to this long are summed in full instead of walked
+SHORT_POSTINGS = 2048
+
+# Bare query words this common are ignored when the query has other
+# clauses: they match most questions and add almost nothing to the rank
+STOPWORDS = frozenset(
+    "a an and are as at be by can do does for from how in is it of on or "
+    "the their this to what when which who why with you your".split()
+)
+
+_TOKEN = re.compile(r'\w+')
+_QUERY = re.compile(r'"([^"]*)"|(\S+)')
+
+def tokenize(text):
+    """
+    Split text into normalised search tokens.
+
+    Tokens are lowercase runs of letters and digits; a trailing plural
+    's' is dropped from words longer than three letters (but not from
+    'ss'), so "spores" finds "spore".
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        list: Tokens in order
+    """
+    tokens = []
+    for word in _TOKEN.findall(text.lower()):
+        if len(word) > 3 and word[-1] == 's' and word[-2] != 's':
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+def parse_query(query):
+    """
+    Split a query into clauses.
+
+    Args:
+        query (str): Words and "quoted phrases"; a bare OR is ignored
+
+    Returns:
+        list: Clauses, each a tuple of tokens (one token for a bare word);
+            bare stopwords are left out unless nothing else is asked for
+    """
+    clauses = []
+    for phrase, word in _QUERY.findall(query):
+        if word == 'OR':
+            continue
+        tokens = tuple(tokenize(phrase if phrase else word))
+        if len(tokens) > 1 and not phrase:
+            # A bare word like "PF-Tek" splits into independent words
+            clauses.extend((token,) for token in tokens)
+        elif tokens and tokens not in clauses:
+            clauses.append(tokens)
+    content = [clause for clause in clauses if len(clause) > 1 or clause[0] not in STOPWORDS]
+    return content or clauses
+
+def _fields(question):
+    """Get the searchable fields of a question"""
+    return [question.get('question', '')] + list(question.get('options', ())) + [question.get('explanation', '')]
+
+def _idf(count, frequency):
+    """BM25 inverse document frequency (never negative)"""
+    return math.log(1.0 + (count - frequency + 0.5) / (frequency + 0.5))
+
+def _contains(sequence, phrase):
+    """Check whether a list of term ids contains a phrase (a list of term ids)"""
+    first, size = phrase[0], len(phrase)
+    start = 0
+    try:
+        while True:
+            start = sequence.index(first, start)
+            if sequence[start:start + size] == phrase:
+                return True
+            start += 1
+    except ValueError:
+        return False
+
+class SearchIndex:
+    """Inverted index with impact-ordered BM25 postings"""
+
+    def __init__(self, questions=()):
+        """
+        Build the index over a list of questions.
+
+        Args:
+            questions (iterable): Question dictionaries, searchable by position
+        """
+        terms = {}
+        doc_terms = array('I')
+        offsets = array('I', [0])
+        counted_terms = array('I')
+        counted_tfs = array('I')
+        counted_offsets = array('I', [0])
+        lengths = array('I')
+        postings = []
+        for doc, question in enumerate(questions):
+            length = 0
+            for field in _fields(question):
+                ids = [terms.setdefault(token, len(terms)) for token in tokenize(field)]
+                doc_terms.extend(ids)
+                doc_terms.append(_FIELD_BREAK)
+                length += len(ids)
+            counts = Counter(doc_terms[offsets[-1]:])
+            counts.pop(_FIELD_BREAK, None)
+            for term in sorted(counts):
+                tf = counts[term]
+                while len(postings) <= term:
+                    postings.append(([], []))
+                postings[term][0].append(doc)
+                postings[term][1].append(tf)
+                counted_terms.append(term)
+                counted_tfs.append(tf)
+            offsets.append(len(doc_terms))
+            counted_offsets.append(len(counted_terms))
+            lengths.append(length)
+
+        self.terms = terms
+        self._doc_terms = doc_terms
+        self._offsets = offsets
+        self._counted = (counted_terms, counted_tfs, counted_offsets)
+        self._set_lengths(lengths)
+        count = len(lengths)
+        self._idf = array('d', [
+            _idf(count, len(docs)) for docs, _ in postings
+        ])
+        self._docs = []
+        self._scores = []
+        norms = self._norms
+        for term, (docs, tfs) in enumerate(postings):
+            idf = self._idf[term]
+            impacts = [idf * tf * (K1 + 1.0) / (tf + norms[doc]) for doc, tf in zip(docs, tfs)]
+            order = sorted(range(len(docs)), key=impacts.__getitem__, reverse=True)
+            self._docs.append(array('I', [docs[i] for i in order]))
+            self._scores.append(array('d', [impacts[i] for i in order]))
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def _set_lengths(self, lengths):
+        """Store question lengths and their BM25 length normalisation"""
+        self._lengths = lengths
+        average = (sum(lengths) / len(lengths) if lengths else 0.0) or 1.0
+        self._norms = array('d', [K1 * (1.0 - B + B * length / average) for length in lengths])
+
+    def _clause_ids(self, clauses):
+        """Map token clauses to term id clauses, dropping ones that cannot match"""
+        resolved = []
+        for clause in clauses:
+            ids = tuple(self.terms.get(token) for token in clause)
+            if None not in ids:
+                resolved.append(ids)
+        return resolved
+
+    def _score(self, doc, clauses):
+        """Exact BM25 score of one question for a query"""
+        counted_terms, counted_tfs, counted_offsets = self._counted
+        low, high = counted_offsets[doc], counted_offsets[doc + 1]
+        norm = self._norms[doc]
+        idf = self._idf
+        total = 0.0
+        for clause in clauses:
+            part = 0.0
+            for term in clause:
+                # Binary search of the question's sorted (term, tf) pairs
+                i = bisect_left(counted_terms, term, low, high)
+                if i == high or counted_terms[i] != term:
+                    part = 0.0
+                    break
+                tf = counted_tfs[i]
+                part += idf[term] * tf * (K1 + 1.0) / (tf + norm)
+            if part and len(clause) > 1:
+                words = self._doc_terms[self._offsets[doc]:self._offsets[doc + 1]].tolist()
+                if not _contains(words, list(clause)):
+                    part = 0.0
+            total += part
+        return total
+
+    def search(self, query, limit=10):
+        """
+        Find the questions that best match a query.
+
+        Args:
+            query (str): Words and "quoted phrases", any of which may match
+            limit (int or None): Maximum number of hits; None returns every match
+
+        Returns:
+            list: SearchHit records, best first (equal scores in either order)
+        """
+        clauses = self._clause_ids(parse_query(query))
+        if not clauses:
+            return []
+        if limit is None:
+            matching = set()
+            for clause in clauses:
+                matching.update(self._docs[min(clause, key=lambda term: len(self._docs[term]))])
+            scored = [(self._score(doc, clauses), -doc) for doc in matching]
+            scored = sorted((hit for hit in scored if hit[0] > 0.0), reverse=True)
+            return [SearchHit(-doc, score) for score, doc in scored]
+
+        if len(clauses) == 1 and len(clauses[0]) == 1:
+            # One word: its impact-ordered list already is the ranking
+            term = clauses[0][0]
+            return [SearchHit(doc, score)
+                    for doc, score in zip(self._docs[term][:limit], self._scores[term][:limit])]
+
+        # Words with short posting lists are summed in full; their impacts
+        # are their exact contributions
+        accumulated = {}
+        walked = []
+        for clause in clauses:
+            lead = min(clause, key=lambda term: len(self._docs[term]))
+            docs, scores = self._docs[lead], self._scores[lead]
+            if len(clause) == 1 and len(docs) <= SHORT_POSTINGS:
+                get = accumulated.get
+                for doc, score in zip(docs, scores):
+                    accumulated[doc] = get(doc, 0.0) + score
+            else:
+                # Every question matching the clause is in the list of its
+                # rarest term; the other terms add at most their best impact
+                rest = sum(self._scores[term][0] for term in clause if term != lead)
+                walked.append((docs, scores, rest))
+        if not walked:
+            best = heapq.nlargest(limit, ((score, -doc) for doc, score in accumulated.items()))
+            return [SearchHit(-doc, score) for score, doc in best]
+
+        # Long lists are walked in impact order (threshold algorithm), and
+        # every question met is scored exactly
+        pending = sorted(accumulated.items(), key=lambda item: item[1], reverse=True)
+        pending_at = 0
+        scored = set()
+        best = []
+
+        def consider(doc, score):
+            if len(best) < limit:
+                heapq.heappush(best, (score, -doc))
+            elif (score, -doc) > best[0]:
+                heapq.heapreplace(best, (score, -doc))
+
+        positions = [0] * len(walked)
+        while True:
+            threshold = 0.0
+            for i, (docs, scores, rest) in enumerate(walked):
+                start = positions[i]
+                end = min(start + _BATCH, len(docs))
+                for doc in docs[start:end]:
+                    if doc not in scored:
+                        scored.add(doc)
+                        consider(doc, self._score(doc, clauses))
+                positions[i] = end
+                if end < len(docs):
+                    threshold += scores[end] + rest
+            # Impacts and exact scores may differ in the last bits, so an
+            # unseen question within rounding of the k-th score only ties it
+            kth = best[0][0] * (1.0 + 1e-6) if len(best) >= limit else 0.0
+            # Summed questions may still gain up to the threshold from the
+            # walked lists; resolve every one that could then reach the top k
+            while pending_at < len(pending) and pending[pending_at][1] + threshold >= kth:
+                doc, partial = pending[pending_at]
+                pending_at += 1
+                if doc not in scored:
+                    scored.add(doc)
+                    # Once the walked lists are exhausted the sum is exact
+                    consider(doc, self._score(doc, clauses) if threshold else partial)
+                    kth = best[0][0] * (1.0 + 1e-6) if len(best) >= limit else 0.0
+            if threshold == 0.0 or (len(best) >= limit and kth >= threshold):
+                break
+        best.sort(reverse=True)
+        return [SearchHit(-doc, score) for score, doc in best if score > 0.0]
+
+    def _state(self):
+        """Marshal-friendly form of the index"""
+        return (
+            sorted(self.terms, key=self.terms.__getitem__),
+            self._doc_terms.tobytes(), self._offsets.tobytes(),
+            tuple(part.tobytes() for part in self._counted), self._lengths.tobytes(),
+            self._idf.tobytes(), [d.tobytes() for d in self._docs], [s.tobytes() for s in self._scores],
+        )
+
+    @classmethod
+    def _from_state(cls, state):
+        """Rebuild an index from _state() without re-tokenising"""
+        self = cls.__new__(cls)
+        words, doc_terms, offsets, counted, lengths, idf, docs, scores = state
+        self.terms = {word: i for i, word in enumerate(words)}
+        self._doc_terms = array('I', doc_terms)
+        self._offsets = array('I', offsets)
+        self._counted = tuple(array('I', part) for part in counted)
+        self._set_lengths(array('I', lengths))
+        self._idf = array('d', idf)
+        self._docs = [array('I', d) for d in docs]
+        self._scores = [array('d', s) for s in scores]
+        return self
+
+def _index_cache_path(version):
+    return os.path.join(_cache_dir(), f"search-{version[:16]}.marshal")
+
+_INDEXES = weakref.WeakKeyDictionary()
+
+def get_search_index(bank, use_cache=True):
+    """
+    Get the search index of a question bank, building it on first use.
+
+    Banks with a version are cached on disk, keyed on that version.
+
+    Args:
+        bank (QuestionBank): Bank to search
+        use_cache (bool): Whether to read and write the on-disk cache
+
+    Returns:
+        SearchIndex: Index kept for as long as the bank is alive
+    """
+    index = _INDEXES.get(bank)
+    if index is not None:
+        return index
+    cache_path = _index_cache_path(bank.version) if use_cache and bank.version else None
+    if cache_path:
+        try:
+            with open(cache_path, 'rb') as f:
+                entry = marshal.load(f)
+            if entry[0] == _CACHE_FORMAT and entry[1] == bank.version:
+                index = SearchIndex._from_state(entry[2])
+        except (OSError, EOFError, ValueError, TypeError, IndexError):
+            index = None
+    if index is None:
+        index = SearchIndex(bank)
+        if cache_path:
+            _write_cache(cache_path, (_CACHE_FORMAT, bank.version, index._state()))
+    _INDEXES[bank] = index
+    return index
+
+class SearchSelector:
+    """Question selector for study quizzes on the questions matching a query"""
+
+    # Questions are drawn at random from this many of the best matches
+    POOL_PER_QUESTION = 3
+
+    def __init__(self, query):
+        """
+        Args:
+            query (str): Search query the quiz is about
+        """
+        self.query = query
+
+    def matches(self, bank, difficulty=MIXED):
+        """
+        Get the bank's questions matching the query, best first.
+
+        Args:
+            bank (QuestionBank): Bank to search
+            difficulty (str): Difficulty level, or 'mixed'
+
+        Returns:
+            list: Question dictionaries
+        """
+        hits = get_search_index(bank).search(self.query, limit=None)
+        questions = [bank[hit.index] for hit in hits]
+        if difficulty != MIXED:
+            questions = [q for q in questions if q['difficulty'] == difficulty]
+        return questions
+
+    def select(self, bank, difficulty, k, rng):
+        """
+        Choose questions for a study quiz.
+
+        Args:
+            bank (QuestionBank): Bank to draw from
+            difficulty (str): Difficulty level, or 'mixed'
+            k (int): Number of questions wanted
+            rng: Random source
+
+        Returns:
+            list: Up to k question dictionaries from the best matches
+        """
+        pool = self.matches(bank, difficulty)[:max(k, k * self.POOL_PER_QUESTION)]
+        return rng.sample(pool, min(k, len(pool)))
+
+    def record_answer(self, result, elapsed=None):
+        """Study quizzes keep no per-answer state"""
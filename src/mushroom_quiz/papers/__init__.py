@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📝 Papers Module 📝
+
+Bulk generation of printable quiz papers and answer keys.
+
+File: papers/__init__.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module turns the quiz engine into a paper generator for classroom
+    and certification use. Papers are produced lazily, one at a time, and
+    formatted as JSON Lines, plain text or HTML; large runs are sharded
+    across a process pool while the output stays in paper order.
+    
+Exports:
+    - Paper: One generated paper with its answer key
+    - generate_papers: Lazily generate papers from a base seed
+    - write_papers: Generate, format and write papers (optionally in parallel)
+    - FORMATS: Names of the supported output formats
+    
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+from .formats import FORMATS
+from .generator import Paper, generate_papers, write_papers
+
+__all__ = ["Paper", "generate_papers", "write_papers", "FORMATS"]
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🖨️ Paper Formats Module
+
+Text formats for generated quiz papers and their answer keys.
+
+File: formats.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    Each format is a PaperFormat record of plain functions: a document
+    header and footer, and one function each for formatting a paper and
+    its answer key. Papers are formatted one at a time, so a document of
+    any length can be streamed to a file without holding it in memory.
+    Papers never carry their answers, so they can be handed out while the
+    answer keys are kept back.
+
+    Options are lettered A to Z; a question with more options than that
+    numbers them instead, on the paper and in its answer key.
+
+Classes:
+    PaperFormat: Header, footer, paper and answer-key formatters
+
+Functions:
+    get_format(): Look up a format by name
+
+Formats:
+    - jsonl: One JSON object per paper; answers only in the key file
+    - txt: Plain text, one paper per form-feed separated page
+    - html: A single printable page, one paper per printed sheet
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import html
+import json
+import string
+from collections import namedtuple
+
+PaperFormat = namedtuple('PaperFormat', ['header', 'footer', 'paper', 'answer_key'])
+
+OPTION_LETTERS = string.ascii_uppercase
+
+def _lettered(options):
+    """True when a question's options can all be given letters"""
+    return len(options) <= len(OPTION_LETTERS)
+
+def _label(option_number, options):
+    """Label of a 1-based option number: its letter, or the number itself"""
+    return OPTION_LETTERS[option_number - 1] if _lettered(options) else str(option_number)
+
+def _key_entries(paper):
+    """(question number, answer) pairs of a paper, the answer as 'B' or '(12)' for numbered options"""
+    entries = []
+    for number, ((_, options), answer) in enumerate(zip(paper.questions, paper.answer_key), 1):
+        label = _label(answer, options)
+        entries.append((number, label if _lettered(options) else f"({label})"))
+    return entries
+
+def _paper_title(paper):
+    return f"Mushroom Cultivation Quiz - Paper {paper.number}"
+
+# JSON Lines
+
+def _jsonl_paper(paper):
+    record = {
+        "paper": paper.number,
+        "quiz": paper.spec._asdict(),
+        "questions": [
+            {
+                "question": question['question'],
+                "difficulty": question['difficulty'],
+                "topic": question['topic'],
+                "options": options,
+            }
+            for question, options in paper.questions
+        ],
+    }
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+
+def _jsonl_answer_key(paper):
+    record = {"paper": paper.number, "seed": paper.spec.seed, "answer_key": paper.answer_key}
+    return json.dumps(record, separators=(',', ':')) + "\n"
+
+# Plain text
+
+def _txt_paper(paper):
+    lines = [_paper_title(paper), f"Seed: {paper.spec.seed}", "Name: ____________________", ""]
+    for number, (question, options) in enumerate(paper.questions, 1):
+        lines.append(f"{number}. {question['question']}")
+        for option_number, option in enumerate(options, 1):
+            lines.append(f"   {_label(option_number, options)}) {option}")
+        lines.append("")
+    # Form feed starts each paper on a new printed page
+    return "\n".join(lines) + "\f\n"
+
+def _txt_answer_key(paper):
+    answers = " ".join(f"{number}{answer}" for number, answer in _key_entries(paper))
+    return f"Paper {paper.number} (seed {paper.spec.seed}): {answers}\n"
+
+# HTML
+
+_HTML_HEADER = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: Georgia, serif; margin: 2em; }}
+section {{ page-break-after: always; }}
+ol.options {{ list-style-type: upper-alpha; }}
+ol.numbered {{ list-style-type: decimal; }}
+.meta {{ color: #555; }}
+</style>
+</head>
+<body>
+"""
+
+_HTML_FOOTER = "</body>\n</html>\n"
+
+def _html_header(title):
+    return _HTML_HEADER.format(title=html.escape(title))
+
+def _html_paper(paper):
+    parts = [
+        "<section>\n",
+        f"<h1>{html.escape(_paper_title(paper))}</h1>\n",
+        f"<p class=\"meta\">Seed {paper.spec.seed} &middot; Name: ____________________</p>\n",
+        "<ol>\n",
+    ]
+    for question, options in paper.questions:
+        style = "options" if _lettered(options) else "numbered"
+        parts.append(f"<li><p>{html.escape(question['question'])}</p>\n<ol class=\"{style}\">\n")
+        parts.extend(f"<li>{html.escape(option)}</li>\n" for option in options)
+        parts.append("</ol></li>\n")
+    parts.append("</ol>\n</section>\n")
+    return "".join(parts)
+
+def _html_answer_key(paper):
+    answers = ", ".join(f"{number}&nbsp;{answer}" for number, answer in _key_entries(paper))
+    return f"<p><strong>Paper {paper.number}</strong> (seed {paper.spec.seed}): {answers}</p>\n"
+
+FORMATS = {
+    "jsonl": PaperFormat(lambda title: "", "", _jsonl_paper, _jsonl_answer_key),
+    "txt": PaperFormat(lambda title: "", "", _txt_paper, _txt_answer_key),
+    "html": PaperFormat(_html_header, _HTML_FOOTER, _html_paper, _html_answer_key),
+}
+
+def get_format(name):
+    """
+    Look up a paper format by name.
+
+    Args:
+        name (str): One of FORMATS
+
+    Returns:
+        PaperFormat: The format's formatters
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    try:
+        return FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unknown format '{name}' (choose from {', '.join(FORMATS)})") from None
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏭 Paper Generator Module
+
+Streams distinct quiz papers and answer keys, in parallel when asked.
+
+File: generator.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    Paper n of a run is the quiz described by the QuizSpec with seed
+    base_seed + n, built with the same question selection and option
+    shuffling as an interactive quiz (QuizGame and QuizSession). Papers
+    are produced by generators, so nothing but the paper being written is
+    kept in memory, and any single paper can be regenerated later from
+    the base seed and its number.
+
+    For large runs the papers are split into fixed-size shards that are
+    formatted by a process pool. Only a small window of shards is in
+    flight at a time and shards are written in order, so memory use stays
+    flat and the output is identical for any number of workers.
+
+Classes:
+    Paper: (number, spec, questions, answer_key) for one generated paper
+
+Functions:
+    paper_seed(): Seed of paper n in a run
+    build_paper(): Build the paper for a QuizSpec
+    generate_papers(): Lazily generate the papers of a run
+    format_shard(): Format one shard of papers (process pool worker)
+    write_papers(): Generate, format and write a whole run
+
+Usage:
+    from mushroom_quiz.papers import write_papers
+    with open("papers.html", "w", encoding="utf-8") as out, \\
+         open("keys.html", "w", encoding="utf-8") as keys:
+        write_papers(out, "mixed", 20, 50000, "html", key_out=keys, workers=8)
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from ..core.quiz_engine import QuizGame
+from ..core.quiz_spec import SEED_BITS, QuizSpec, new_seed
+from ..data.question_loader import get_question_bank
+from .formats import get_format
+
+# Papers formatted per worker task
+DEFAULT_CHUNK_SIZE = 250
+
+Paper = namedtuple('Paper', ['number', 'spec', 'questions', 'answer_key'])
+
+def paper_seed(base_seed, number):
+    """
+    Get the seed of paper `number` in a run.
+
+    Args:
+        base_seed (int): Seed of the whole run
+        number (int): 1-based paper number
+
+    Returns:
+        int: Seed of that paper's QuizSpec
+    """
+    return (base_seed + number) % (2 ** SEED_BITS)
+
+def build_paper(number, spec, bank=None):
+    """
+    Build the paper described by a quiz spec.
+
+    Args:
+        number (int): Paper number printed on the paper
+        spec (QuizSpec): Spec of the paper's quiz
+        bank (QuestionBank): Bank to draw from (defaults to the packaged bank)
+
+    Returns:
+        Paper: Questions with their shuffled options, and the answer key
+            as 1-based option numbers
+    """
+    session = QuizGame.from_spec(spec, bank).new_session()
+    questions = []
+    answer_key = []
+    while not session.finished:
+        asked = session.next_question()
+        answer = asked.options.index(asked.question['answer']) + 1
+        session.submit_answer(answer)
+        questions.append((asked.question, asked.options))
+        answer_key.append(answer)
+    return Paper(number, spec, questions, answer_key)
+
+def generate_papers(difficulty, num_questions, count, base_seed, start=1, bank=None):
+    """
+    Lazily generate consecutive papers of a run.
+
+    Args:
+        difficulty (str): Difficulty level, or 'mixed'
+        num_questions (int): Questions per paper
+        count (int): Number of papers
+        base_seed (int): Seed of the whole run
+        start (int): Number of the first paper
+        bank (QuestionBank): Bank to draw from (defaults to the packaged bank)
+
+    Yields:
+        Paper: Papers start .. start + count - 1, in order
+    """
+    if bank is None:
+        bank = get_question_bank()
+    for number in range(start, start + count):
+        spec = QuizSpec(bank.version, difficulty, num_questions, None,
+                        paper_seed(base_seed, number))
+        yield build_paper(number, spec, bank)
+
+def format_shard(shard):
+    """
+    Generate and format one shard of papers.
+
+    Runs in pool workers, so it takes a single picklable tuple and loads
+    the packaged bank itself.
+
+    Args:
+        shard (tuple): (bank_version, difficulty, num_questions, base_seed,
+            start, count, format_name, with_keys)
+
+    Returns:
+        tuple: (formatted papers, formatted answer keys or '')
+
+    Raises:
+        ValueError: If this process loaded a different bank version
+    """
+    bank_version, difficulty, num_questions, base_seed, start, count, format_name, with_keys = shard
+    bank = get_question_bank()
+    if bank.version != bank_version:
+        raise ValueError(f"Worker loaded bank {bank.version}, expected {bank_version}")
+    paper_format = get_format(format_name)
+    papers = []
+    keys = []
+    for paper in generate_papers(difficulty, num_questions, count, base_seed, start, bank):
+        papers.append(paper_format.paper(paper))
+        if with_keys:
+            keys.append(paper_format.answer_key(paper))
+    return "".join(papers), "".join(keys)
+
+def _ordered_results(executor, func, items, window):
+    """Map func over items on an executor, in order, with at most `window` tasks in flight"""
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def write_papers(out, difficulty, num_questions, count, format_name="jsonl",
+                 base_seed=None, key_out=None, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generate a run of papers and write them, and optionally their answer keys.
+
+    Args:
+        out: Text stream for the papers
+        difficulty (str): Difficulty level, or 'mixed'
+        num_questions (int): Questions per paper
+        count (int): Number of papers
+        format_name (str): Output format, one of FORMATS
+        base_seed (int): Seed of the run (a fresh one is drawn if None)
+        key_out: Text stream for the answer keys, or None to skip them
+        workers (int): Worker processes, at most one per shard; 1 (or a
+            run of one shard) generates in this process
+        chunk_size (int): Papers per worker task
+
+    Returns:
+        int: The run's base seed, which regenerates every paper
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    paper_format = get_format(format_name)
+    if base_seed is None:
+        base_seed = new_seed()
+    bank_version = get_question_bank().version
+    shards = (
+        (bank_version, difficulty, num_questions, base_seed,
+         start, min(chunk_size, count - start + 1), format_name, key_out is not None)
+        for start in range(1, count + 1, chunk_size)
+    )
+
+    out.write(paper_format.header("Mushroom Cultivation Quiz Papers"))
+    if key_out is not None:
+        key_out.write(paper_format.header("Mushroom Cultivation Quiz Answer Keys"))
+
+    def write_all(results):
+        for papers, keys in results:
+            out.write(papers)
+            if key_out is not None:
+                key_out.write(keys)
+
+    # More workers than shards would only add process start-up time
+    workers = min(workers, -(-count // chunk_size))
+    if workers <= 1:
+        write_all(map(format_shard, shards))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            write_all(_ordered_results(executor, format_shard, shards, workers * 2))
+
+    out.write(paper_format.footer)
+    if key_out is not None:
+        key_out.write(paper_format.footer)
+    return base_seed
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🌐 Server Module 🌐
+
+Networked quiz modes for the Mushroom Cultivation Quiz.
+
+File: server/__init__.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module provides network front ends for the headless quiz engine.
+    Every connection drives its own QuizSession, and all sessions share a
+    single asyncio event loop, so one process can host many players. The
+    HTTP API serves the same quizzes to browsers, one question at a time,
+    and the load tester measures either server under simulated players.
+    
+Exports:
+    - QuizServer: Line-based TCP server hosting concurrent quiz sessions
+    - run_server: Run a QuizServer until interrupted
+    - QuizApi: HTTP JSON quiz endpoints with an LRU payload cache
+    - make_api_server: Build a keep-alive HTTP server for a QuizApi
+    - run_api: Serve the HTTP quiz API until interrupted
+    - load_test: Play quizzes against a server with simulated players
+    - preset_scenarios: Load test scenarios built from the menu presets
+    
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+from .quiz_server import QuizServer, run_server
+from .http_api import QuizApi, make_api_server, run_api
+from .loadtest import load_test, preset_scenarios
+
+__all__ = ["QuizServer", "run_server", "QuizApi", "make_api_server", "run_api",
+           "load_test", "preset_scenarios"]
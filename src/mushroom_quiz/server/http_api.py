@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🌐 HTTP Quiz API Module
+
+JSON-over-HTTP quiz service for the web frontend, standard library only.
+
+File: http_api.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module serves quizzes over HTTP so a browser never holds the bank
+    or its answers: the server selects the questions with QuizGame, keeps
+    each player's QuizSession, and sends one question at a time. Payloads
+    are the ones protocol.py builds for the TCP server, encoded as JSON
+    response bodies.
+
+    Responses carry Content-Length and the server speaks HTTP/1.1, so
+    browsers keep one connection open for a whole quiz. Bank metadata
+    rarely changes and is served with an ETag (the bank version), so
+    clients revalidate it with a bodiless 304. Question payloads are
+    spliced from an LRU cache of encoded question text and options, so a
+    question shown to many players is encoded once.
+
+    Timers are enforced without threads: each question records its
+    deadline, and an answer arriving after it (plus a grace period for
+    network latency) is scored as a timeout.
+
+    When an answer event log is open, each scored answer is appended to it
+    with the time since the question was first served.
+
+    Given a web directory, the server also serves the static web app from
+    the same origin, and the app switches to the API when it finds it.
+
+Endpoints:
+    GET    /api/bank                    Bank version, counts and quiz limits (ETag)
+    POST   /api/quizzes                 Start a quiz from {"difficulty",
+                                        "num_questions", "timer_seconds", "seed"};
+                                        replies 201 with its "id" and "quiz" spec
+    GET    /api/quizzes/<id>/question   The open question, else the next one,
+                                        else the "summary" once finished
+    POST   /api/quizzes/<id>/answer     Answer the open question with
+                                        {"answer": <option number or null>}
+    DELETE /api/quizzes/<id>            Forget a quiz
+    GET    /metrics                     Live quiz metrics in the Prometheus text format
+
+Classes:
+    PayloadCache: Thread-safe LRU cache of encoded question payloads
+    QuizApi: Endpoint logic and quiz store, independent of the transport
+    ApiRequestHandler: HTTP/1.1 request handler routing to a QuizApi
+
+Functions:
+    make_api_server(): Build a threaded HTTP server for a QuizApi
+    run_api(): Serve the API until interrupted (used by `mushroom-quiz api`)
+
+Usage:
+    mushroom-quiz api --port 8080 --web-dir web
+    # then open http://localhost:8080/, or
+    curl -s -X POST localhost:8080/api/quizzes -d '{"difficulty": "beginner", "num_questions": 5}'
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import functools
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from .. import __version__
+from ..core.adaptive import ADAPTIVE, AdaptiveSession
+from ..core.quiz_engine import QuizGame
+from ..data.question_bank import question_id
+from ..data.question_loader import get_difficulty_levels, get_question_bank
+from ..stats import metrics
+from ..stats.event_log import new_session_id
+from ..ui.terminal_ui import Colors
+from . import protocol
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Quizzes kept at once; the least recently used is dropped beyond this
+MAX_QUIZZES = 10000
+# Quizzes untouched for this long are dropped
+QUIZ_IDLE_SECONDS = 3600
+# Allowance for network latency when enforcing question timers
+TIMER_GRACE_SECONDS = 2.0
+# Encoded questions kept by the payload cache
+DEFAULT_CACHE_SIZE = 4096
+# Largest request body accepted
+MAX_BODY_BYTES = 4096
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_SECONDS = 30
+# Pending connections the kernel queues before refusing (socketserver's default is 5)
+LISTEN_BACKLOG = 128
+
+JSON_TYPE = "application/json; charset=utf-8"
+
+_SELECTION_SECONDS = metrics.SELECTION_SECONDS.labels("http")
+_RENDER_SECONDS = metrics.RENDER_SECONDS.labels("http")
+_TIMER_EXPIRATIONS = metrics.TIMER_EXPIRATIONS.labels("http")
+_ANSWERS = {outcome: metrics.ANSWERS.labels("http", outcome)
+            for outcome in ("correct", "incorrect", "timeout")}
+
+def _json(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _error(status, message):
+    return status, {}, _json(protocol.error_payload(message))
+
+class PayloadCache:
+    """Thread-safe LRU cache of encoded question payloads"""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            maxsize (int): Most encoded questions kept
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def question(self, asked, time_limit=None):
+        """
+        Encode the payload of an asked question.
+
+        The question's difficulty, text and (shuffled) options are encoded
+        once per option order and cached; the per-quiz number, total and
+        time limit are spliced around them.
+
+        Args:
+            asked (AskedQuestion): Question from QuizSession.next_question()
+            time_limit (int or None): Seconds allowed to answer, if timed
+
+        Returns:
+            bytes: JSON of protocol.question_payload(asked, time_limit)
+        """
+        key = (question_id(asked.question), tuple(asked.options))
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if fragment is None:
+            payload = protocol.question_payload(asked, time_limit)
+            shared = {name: payload[name] for name in ("difficulty", "question", "options")}
+            # Drop the braces so the fragment can be spliced into an object
+            fragment = _json(shared)[1:-1]
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = fragment
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return b'{"type":"question","number":%d,"total":%d,"time_limit":%s,%s}' % (
+            asked.number, asked.total, b'null' if time_limit is None else b'%d' % time_limit, fragment
+        )
+
+class _Quiz:
+    """One player's quiz: the session, its spec and the open question's deadline"""
+
+    __slots__ = ('session', 'spec', 'timer_seconds', 'deadline', 'last_used', 'lock', 'completed',
+                 'events', 'session_id', 'asked_at')
+
+    def __init__(self, session, spec, timer_seconds, events=None):
+        self.session = session
+        self.spec = spec
+        self.timer_seconds = timer_seconds
+        self.deadline = None
+        # Answer event log, if one is open, and this quiz's id in it
+        self.events = events
+        self.session_id = new_session_id() if events is not None else None
+        self.asked_at = None
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+        self.completed = False
+
+class QuizApi:
+    """Endpoint logic and quiz store, independent of the transport"""
+
+    def __init__(self, bank=None, max_quizzes=MAX_QUIZZES, idle_seconds=QUIZ_IDLE_SECONDS,
+                 cache_size=DEFAULT_CACHE_SIZE, clock=time.monotonic):
+        """
+        Args:
+            bank (QuestionBank): Bank to quiz from (defaults to get_question_bank())
+            max_quizzes (int): Most quizzes kept at once
+            idle_seconds (float): Quizzes untouched this long are dropped
+            cache_size (int): Most encoded questions kept by the payload cache
+            clock (callable): Monotonic clock in seconds (replaceable in tests)
+        """
+        self.bank = bank if bank is not None else get_question_bank()
+        self.max_quizzes = max_quizzes
+        self.idle_seconds = idle_seconds
+        self.cache = PayloadCache(cache_size)
+        self.clock = clock
+        self._quizzes = OrderedDict()
+        self._lock = threading.Lock()
+        self._metadata = None
+        metrics.ACTIVE_SESSIONS.labels("http").set_function(lambda: self.active_quizzes)
+
+    @property
+    def active_quizzes(self):
+        """int: Number of quizzes currently kept"""
+        return len(self._quizzes)
+
+    def handle(self, method, path, body=b'', headers=None):
+        """
+        Handle one API request.
+
+        Args:
+            method (str): HTTP method
+            path (str): Request path below the server root (query ignored)
+            body (bytes): Request body
+            headers (Mapping): Request headers
+
+        Returns:
+            tuple: (HTTPStatus, dict of extra response headers, body bytes)
+        """
+        parts = path.split('?', 1)[0].strip('/').split('/')
+        if parts[:1] != ['api'] or len(parts) < 2:
+            return _error(HTTPStatus.NOT_FOUND, "Not found")
+        route = parts[1:]
+
+        if route == ['bank']:
+            if method not in ('GET', 'HEAD'):
+                return _error(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET")
+            return self.bank_metadata(headers or {})
+        if route == ['quizzes']:
+            if method != 'POST':
+                return _error(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+            return self.create_quiz(body)
+        if route[0] == 'quizzes' and len(route) in (2, 3):
+            quiz = self._get(route[1])
+            if quiz is None:
+                return _error(HTTPStatus.NOT_FOUND, "No such quiz; it may have expired")
+            action = route[2] if len(route) == 3 else None
+            if action is None and method == 'DELETE':
+                with self._lock:
+                    self._drop(route[1])
+                return HTTPStatus.NO_CONTENT, {}, b''
+            if action == 'question' and method == 'GET':
+                return self.next_question(quiz)
+            if action == 'answer' and method == 'POST':
+                return self.answer(quiz, body)
+            return _error(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed here")
+        return _error(HTTPStatus.NOT_FOUND, "Not found")
+
+    def bank_metadata(self, headers):
+        """GET /api/bank: bank version, counts and limits, revalidated by ETag"""
+        if self._metadata is None:
+            bank = self.bank
+            body = _json({
+                "type": "bank",
+                "version": bank.version,
+                "questions": len(bank),
+                "difficulties": {difficulty: bank.count(difficulty) for difficulty in bank.difficulties()},
+                "topics": bank.topics(),
+                "levels": get_difficulty_levels() + [ADAPTIVE],
+                "max_questions": protocol.MAX_QUESTIONS,
+            })
+            self._metadata = (f'"{bank.version}"', body)
+        etag, body = self._metadata
+        cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in (headers.get("If-None-Match") or ""):
+            return HTTPStatus.NOT_MODIFIED, cache_headers, b''
+        return HTTPStatus.OK, cache_headers, body
+
+    def create_quiz(self, body):
+        """POST /api/quizzes: select a quiz and store its session"""
+        try:
+            settings = json.loads(body or b'{}')
+            if not isinstance(settings, dict):
+                raise ValueError("Send a JSON object of quiz settings")
+            difficulty, num_questions, timer_seconds = protocol.validate_settings(
+                settings.get("difficulty", "mixed"), settings.get("num_questions", 10),
+                settings.get("timer_seconds")
+            )
+            seed = settings.get("seed")
+            seed = protocol.validate_seed(seed) if seed is not None else None
+        except (ValueError, TypeError) as e:
+            return _error(HTTPStatus.BAD_REQUEST, str(e) or "Invalid quiz settings")
+
+        game = QuizGame(difficulty, num_questions, timer_seconds, bank=self.bank, seed=seed)
+        quiz = _Quiz(game.new_session(), game.spec, timer_seconds, game.events)
+        quiz_id = secrets.token_urlsafe(12)
+        now = self.clock()
+        with self._lock:
+            self._expire(now)
+            quiz.last_used = now
+            self._quizzes[quiz_id] = quiz
+        metrics.QUIZZES_STARTED.labels("http", difficulty).inc()
+        return HTTPStatus.CREATED, {"Location": f"/api/quizzes/{quiz_id}"}, _json({
+            "type": "quiz",
+            "id": quiz_id,
+            "total": quiz.session.total,
+            "quiz": protocol.spec_payload(quiz.spec),
+        })
+
+    def next_question(self, quiz):
+        """GET /api/quizzes/<id>/question: open question, next question or summary"""
+        with quiz.lock:
+            session = quiz.session
+            if session.current is None:
+                if session.finished:
+                    ability = None
+                    if isinstance(session, AdaptiveSession):
+                        ability = (session.ability, session.standard_error)
+                    if not quiz.completed:
+                        quiz.completed = True
+                        metrics.QUIZZES_COMPLETED.labels("http", quiz.spec.difficulty).inc()
+                    return HTTPStatus.OK, {}, _json(protocol.summary_payload(session.summary(), quiz.spec, ability))
+                selecting_at = time.perf_counter()
+                session.next_question()
+                _SELECTION_SECONDS.observe(time.perf_counter() - selecting_at)
+                quiz.asked_at = self.clock()
+                if quiz.timer_seconds:
+                    quiz.deadline = self.clock() + quiz.timer_seconds + TIMER_GRACE_SECONDS
+            # Asking again returns the same question, so retries are safe
+            encoding_at = time.perf_counter()
+            body = self.cache.question(session.current, quiz.timer_seconds)
+            _RENDER_SECONDS.observe(time.perf_counter() - encoding_at)
+            return HTTPStatus.OK, {}, body
+
+    def answer(self, quiz, body):
+        """POST /api/quizzes/<id>/answer: score the open question"""
+        try:
+            answer = json.loads(body or b'{}')
+            answer = answer.get("answer") if isinstance(answer, dict) else None
+            if answer is not None and (isinstance(answer, bool) or not isinstance(answer, int)):
+                raise ValueError
+        except ValueError:
+            return _error(HTTPStatus.BAD_REQUEST, 'Send {"answer": <option number>}, or null on timeout')
+        with quiz.lock:
+            session = quiz.session
+            if session.current is None:
+                return _error(HTTPStatus.CONFLICT, "No question is waiting for an answer")
+            expired = quiz.deadline is not None and self.clock() > quiz.deadline
+            try:
+                result = session.submit_answer(None if expired else answer)
+            except ValueError:
+                return _error(HTTPStatus.BAD_REQUEST,
+                              f"Please enter a number between 1 and {len(session.current.options)}.")
+            quiz.deadline = None
+            latency = self.clock() - quiz.asked_at
+        # A null answer is the client's own timer running out; a late one is ours
+        if result.is_timeout:
+            _TIMER_EXPIRATIONS.inc()
+        _ANSWERS[metrics.answer_outcome(result)].inc()
+        if quiz.events is not None:
+            quiz.events.record_answer(quiz.session_id, result, latency)
+        return HTTPStatus.OK, {}, _json(protocol.result_payload(result))
+
+    def _get(self, quiz_id):
+        """Find a quiz and mark it used, or None if unknown or expired"""
+        now = self.clock()
+        with self._lock:
+            quiz = self._quizzes.get(quiz_id)
+            if quiz is None:
+                return None
+            if now - quiz.last_used > self.idle_seconds:
+                self._drop(quiz_id)
+                return None
+            quiz.last_used = now
+            self._quizzes.move_to_end(quiz_id)
+        return quiz
+
+    def _expire(self, now):
+        """Drop idle quizzes and make room for one more (lock held)"""
+        quizzes = self._quizzes
+        # Oldest first, so stop at the first one still in use
+        while quizzes:
+            quiz_id, quiz = next(iter(quizzes.items()))
+            if now - quiz.last_used <= self.idle_seconds and len(quizzes) < self.max_quizzes:
+                break
+            self._drop(quiz_id)
+
+    def _drop(self, quiz_id):
+        """Forget a quiz (lock held), counting it as abandoned if it never reached its summary"""
+        quiz = self._quizzes.pop(quiz_id, None)
+        if quiz is not None and not quiz.completed:
+            metrics.QUIZZES_ABANDONED.labels("http", quiz.spec.difficulty).inc()
+
+class ApiRequestHandler(SimpleHTTPRequestHandler):
+    """HTTP/1.1 request handler routing /api/ to a QuizApi and the rest to the web app"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = f"MushroomQuiz/{__version__}"
+    timeout = KEEPALIVE_SECONDS
+    # Headers and body are separate writes; with Nagle's algorithm a kept-alive
+    # connection stalls on the client's delayed ACK after every response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._dispatch(super().do_GET)
+
+    def do_HEAD(self):
+        self._dispatch(super().do_HEAD)
+
+    def do_POST(self):
+        self._dispatch()
+
+    def do_DELETE(self):
+        self._dispatch()
+
+    def _dispatch(self, static=None):
+        if self.path.split('?', 1)[0] == '/metrics' and self.command in ('GET', 'HEAD'):
+            body = metrics.get_registry().exposition().encode('utf-8')
+            self._respond(HTTPStatus.OK, {"Content-Type": metrics.CONTENT_TYPE}, body)
+            return
+        if not self.path.startswith('/api/'):
+            if static is not None and self.server.web_dir is not None:
+                static()
+            else:
+                self._respond(*_error(HTTPStatus.NOT_FOUND, "Not found"))
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY_BYTES:
+            # The unread body would corrupt the next request on this connection
+            self.close_connection = True
+            self._respond(*_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large or unreadable"))
+            return
+        body = self.rfile.read(length) if length else b''
+        self._respond(*self.server.api.handle(self.command, self.path, body, self.headers))
+
+    def _respond(self, status, headers, body):
+        self.send_response(status)
+        if body:
+            headers.setdefault("Content-Type", JSON_TYPE)
+        if status not in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+            self.send_header("Content-Length", str(len(body)))
+        headers.setdefault("Cache-Control", "no-store")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # One line per request would drown a busy server's console
+        pass
+
+class _ApiServer(ThreadingHTTPServer):
+    request_queue_size = LISTEN_BACKLOG
+
+def make_api_server(api, host=DEFAULT_HOST, port=DEFAULT_PORT, web_dir=None):
+    """
+    Build a threaded HTTP server for a QuizApi.
+
+    Args:
+        api (QuizApi): Endpoint logic to serve
+        host (str): Interface to listen on
+        port (int): TCP port to listen on (0 picks a free port)
+        web_dir (str): Directory of the web app to serve at /, or None
+
+    Returns:
+        ThreadingHTTPServer: Bound server; call serve_forever() to run it
+    """
+    handler = functools.partial(ApiRequestHandler, directory=web_dir)
+    server = _ApiServer((host, port), handler)
+    server.api = api
+    server.web_dir = web_dir
+    return server
+
+def run_api(host=DEFAULT_HOST, port=DEFAULT_PORT, web_dir=None):
+    """
+    Serve the quiz API until interrupted.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): TCP port to listen on
+        web_dir (str): Directory of the web app to serve at /, or None
+    """
+    server = make_api_server(QuizApi(), host, port, web_dir)
+    port = server.server_address[1]
+    print(f"{Colors.GREEN}🍄 Quiz API listening on http://{host}:{port}/api/{Colors.ENDC}")
+    if web_dir is not None:
+        print(f"{Colors.CYAN}   Web app at http://{host}:{port}/{Colors.ENDC}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}Quiz API stopped. 🍄{Colors.ENDC}")
+    finally:
+        server.server_close()
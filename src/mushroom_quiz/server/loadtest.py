@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏋️ Load Test Module
+
+Simulated players for sizing the networked quiz servers.
+
+File: loadtest.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module plays full quizzes against a running quiz server with many
+    asyncio client bots, for either the line-based TCP server
+    (`mushroom-quiz serve`) or the HTTP JSON API (`mushroom-quiz api`).
+    Each bot keeps one connection open and plays quizzes back to back,
+    pausing for a think time drawn from a configurable distribution before
+    each answer and answering correctly with its own accuracy, itself drawn
+    once per bot from a distribution. Bots know the answers by looking the
+    questions up in the local bank; a question the bank lacks is answered
+    at random.
+
+    Quizzes are drawn from scenarios built from the interactive menu
+    presets (difficulty, question count and timer mode), named like
+    "beginner-standard-timed". Think times are capped at a timed
+    question's limit: a bot that runs out of time lets the TCP server's
+    timer fire, and sends no answer to the HTTP API.
+
+    Every request is timed from send to reply. The report gives
+    throughput, the p50/p95/p99 latency of each protocol step and its
+    error rate. A failed step (an error reply, a bad HTTP status, a lost
+    connection or no reply in time) abandons the bot's quiz; the bot
+    reconnects for its next one.
+
+Distributions:
+    A plain number is a constant; otherwise "kind:param:param":
+        uniform:LOW:HIGH, exponential:MEAN, normal:MEAN:SD,
+        lognormal:MEDIAN:SIGMA, beta:ALPHA:BETA
+    Samples below zero are clamped to zero, and accuracies to 0..1.
+
+Classes:
+    Distribution: Parsed random distribution (kind, params)
+    Scenario: Quiz settings played by bots (name, difficulty,
+        num_questions, timer_seconds)
+    StepReport: Latency percentiles and errors of one protocol step
+    LoadReport: Outcome of a load test
+    LoadStats: Collects latencies and errors while bots run
+
+Functions:
+    parse_distribution(): Parse a distribution from text
+    preset_scenarios(): Every scenario built from the menu presets
+    select_scenarios(): Scenarios matching names or wildcard patterns
+    load_test(): Run bots against a server (coroutine)
+    format_report(): Text table of a LoadReport
+    report_payload(): Serialisable form of a LoadReport
+    run_loadtest(): Run a load test and print its report (used by
+        `mushroom-quiz loadtest`)
+
+Usage:
+    mushroom-quiz serve &
+    mushroom-quiz loadtest --bots 2000 --ramp 10 --scenario 'mixed-*-timed'
+    mushroom-quiz loadtest --mode http --bots 200 --think 0 --duration 30
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import asyncio
+import fnmatch
+import json
+import random
+import time
+from collections import Counter, defaultdict, namedtuple
+
+from ..core.adaptive import ADAPTIVE
+from ..data.question_loader import get_question_bank
+from ..ui.terminal_ui import (Colors, DIFFICULTY_PRESETS, QUESTION_COUNT_PRESETS,
+                              TIMER_MODE_PRESETS)
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+MODES = ("tcp", "http")
+DEFAULT_PORTS = {"tcp": 7777, "http": 8080}
+DEFAULT_THINK = "lognormal:4:0.5"
+DEFAULT_ACCURACY = "beta:7:3"
+# Seconds a bot waits for any one reply before counting the step as failed
+DEFAULT_TIMEOUT = 10.0
+# Extra wait for a TCP question's own timer to fire
+TIMER_SLACK_SECONDS = 5.0
+PERCENTILES = (50, 95, 99)
+
+_DISTRIBUTION_PARAMS = {
+    "constant": 1, "uniform": 2, "exponential": 1, "normal": 2, "lognormal": 2, "beta": 2,
+}
+
+class Distribution(namedtuple('Distribution', ['kind', 'params'])):
+    """Random distribution of think times or accuracies"""
+
+    __slots__ = ()
+
+    def sample(self, rng):
+        """
+        Draw one value.
+
+        Args:
+            rng (random.Random): Source of randomness
+
+        Returns:
+            float: A sample, never below zero
+        """
+        kind, params = self.kind, self.params
+        if kind == "constant":
+            value = params[0]
+        elif kind == "uniform":
+            value = rng.uniform(*params)
+        elif kind == "exponential":
+            value = rng.expovariate(1.0 / params[0]) if params[0] > 0 else 0.0
+        elif kind == "normal":
+            value = rng.gauss(*params)
+        elif kind == "lognormal":
+            value = params[0] * rng.lognormvariate(0.0, params[1])
+        else:
+            value = rng.betavariate(*params)
+        return max(0.0, value)
+
+def parse_distribution(text):
+    """
+    Parse a distribution such as "2.5", "uniform:1:3" or "beta:7:3".
+
+    Args:
+        text (str): Constant or "kind:param[:param]"
+
+    Returns:
+        Distribution: The parsed distribution
+
+    Raises:
+        ValueError: If the kind or its parameters are invalid
+    """
+    kind, *params = str(text).strip().lower().split(":")
+    try:
+        if not params:
+            kind, params = "constant", (float(kind),)
+        else:
+            params = tuple(float(param) for param in params)
+    except ValueError:
+        raise ValueError(f"Invalid distribution '{text}'") from None
+    if _DISTRIBUTION_PARAMS.get(kind) != len(params):
+        raise ValueError(f"Invalid distribution '{text}'; use a number or one of "
+                         "uniform:LOW:HIGH, exponential:MEAN, normal:MEAN:SD, "
+                         "lognormal:MEDIAN:SIGMA, beta:ALPHA:BETA")
+    if kind == "beta" and min(params) <= 0:
+        raise ValueError(f"Beta parameters must be positive in '{text}'")
+    if kind != "normal" and min(params) < 0:
+        raise ValueError(f"Parameters must not be negative in '{text}'")
+    return Distribution(kind, params)
+
+Scenario = namedtuple('Scenario', ['name', 'difficulty', 'num_questions', 'timer_seconds'])
+
+def preset_scenarios():
+    """
+    Build every scenario the interactive menus can produce.
+
+    Returns:
+        list: Scenario for each difficulty (and the adaptive mode), question
+            count preset and timer mode preset
+    """
+    return [
+        Scenario(f"{difficulty}-{length}-{mode}", difficulty, count, seconds)
+        for difficulty in DIFFICULTY_PRESETS + (ADAPTIVE,)
+        for length, count in QUESTION_COUNT_PRESETS
+        for mode, seconds in TIMER_MODE_PRESETS
+    ]
+
+def select_scenarios(patterns):
+    """
+    Select preset scenarios by name; shell wildcards are allowed.
+
+    Args:
+        patterns (list): Names or patterns such as "beginner-*-relaxed";
+            "all" selects every scenario
+
+    Returns:
+        list: Matching scenarios, each once, in preset order
+
+    Raises:
+        ValueError: If a pattern matches no scenario
+    """
+    scenarios = preset_scenarios()
+    chosen = set()
+    for pattern in patterns:
+        pattern = "*" if pattern == "all" else pattern.lower()
+        matched = {scenario.name for scenario in scenarios if fnmatch.fnmatchcase(scenario.name, pattern)}
+        if not matched:
+            raise ValueError(f"No scenario matches '{pattern}'")
+        chosen |= matched
+    return [scenario for scenario in scenarios if scenario.name in chosen]
+
+StepReport = namedtuple('StepReport', ['step', 'count', 'errors', 'p50', 'p95', 'p99', 'max'])
+
+LoadReport = namedtuple('LoadReport', [
+    'mode', 'bots', 'elapsed', 'quizzes', 'requests', 'errors',
+    'correct', 'wrong', 'timeouts', 'steps', 'error_reasons',
+])
+
+def _percentile(ordered, percent):
+    """Nearest-rank percentile of sorted values"""
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[min(len(ordered), rank) - 1]
+
+class LoadStats:
+    """Collects latencies, outcomes and errors while bots run"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+        self.reasons = Counter()
+        self.answers = Counter()
+        self.quizzes = 0
+
+    def record(self, step, seconds):
+        """Record one completed request of a protocol step"""
+        self.latencies[step].append(seconds)
+
+    def error(self, step, reason):
+        """Record a failed request of a protocol step"""
+        self.errors[step] += 1
+        self.reasons[reason] += 1
+
+    def report(self, mode, bots, elapsed):
+        """
+        Summarise the run.
+
+        Args:
+            mode (str): "tcp" or "http"
+            bots (int): Number of bots that ran
+            elapsed (float): Wall-clock seconds of the run
+
+        Returns:
+            LoadReport: Totals and per-step percentiles (in seconds)
+        """
+        steps = []
+        for step in sorted(set(self.latencies) | set(self.errors)):
+            ordered = sorted(self.latencies[step])
+            points = [_percentile(ordered, p) for p in PERCENTILES] if ordered else [None] * len(PERCENTILES)
+            steps.append(StepReport(step, len(ordered), self.errors[step], *points,
+                                    ordered[-1] if ordered else None))
+        requests = sum(step.count + step.errors for step in steps)
+        return LoadReport(mode, bots, elapsed, self.quizzes, requests, sum(self.errors.values()),
+                          self.answers["correct"], self.answers["wrong"], self.answers["timeout"],
+                          steps, dict(self.reasons.most_common()))
+
+class _StepFailed(Exception):
+    """A request failed; the bot abandons its quiz"""
+
+    def __init__(self, step, reason):
+        super().__init__(f"{step}: {reason}")
+        self.step = step
+        self.reason = reason
+
+class _Bot:
+    """One simulated player, with its own connection, skill and randomness"""
+
+    def __init__(self, number, mode, host, port, scenarios, think, accuracy, answers, stats,
+                 seed, timeout):
+        self.number = number
+        self.mode = mode
+        self.host = host
+        self.port = port
+        self.scenarios = scenarios
+        self.think = think
+        self.answers = answers
+        self.stats = stats
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.accuracy = min(1.0, accuracy.sample(self.rng))
+        self.reader = None
+        self.writer = None
+
+    async def run(self, quizzes, stop_at):
+        """Play quizzes until enough are done or the stop time passes"""
+        played = 0
+        try:
+            while (quizzes is None or played < quizzes) and (stop_at is None or time.monotonic() < stop_at):
+                played += 1
+                try:
+                    if self.writer is None:
+                        await self.connect()
+                    await self.play(self.rng.choice(self.scenarios))
+                    self.stats.quizzes += 1
+                except _StepFailed as e:
+                    self.stats.error(e.step, e.reason)
+                    self.close()
+            if self.writer is not None and self.mode == "tcp":
+                await self.tcp_quit()
+        except _StepFailed:
+            pass
+        finally:
+            self.close()
+
+    async def connect(self):
+        """Open the bot's connection (and, for TCP, read the welcome)"""
+        started = time.perf_counter()
+        try:
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+        except asyncio.TimeoutError:
+            raise _StepFailed("connect", "timeout") from None
+        except OSError as e:
+            raise _StepFailed("connect", type(e).__name__) from None
+        if self.mode == "tcp":
+            await self.tcp_read("connect", "welcome", started=started)
+        else:
+            self.stats.record("connect", time.perf_counter() - started)
+            # As the web app does when it loads
+            await self.http("bank", "GET", "/api/bank")
+
+    def close(self):
+        """Drop the connection, if open"""
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    def choose(self, message):
+        """Pick an option number for a question message, right with the bot's accuracy"""
+        options = message["options"]
+        answer = self.answers.get(message["question"])
+        if answer in options:
+            if self.rng.random() < self.accuracy:
+                return options.index(answer) + 1
+            wrong = [number for number, option in enumerate(options, 1) if option != answer]
+            if wrong:
+                return self.rng.choice(wrong)
+        return self.rng.randint(1, len(options))
+
+    def think_time(self, time_limit):
+        """Seconds to wait before answering, or None to let a timed question expire"""
+        seconds = self.think.sample(self.rng)
+        if time_limit and seconds >= time_limit:
+            return None
+        return seconds
+
+    def count(self, result):
+        """Tally a result message"""
+        self.stats.answers["timeout" if result["timeout"] else "correct" if result["correct"] else "wrong"] += 1
+
+    async def play(self, scenario):
+        """Play one quiz of a scenario to its summary"""
+        if self.mode == "tcp":
+            await self.play_tcp(scenario)
+        else:
+            await self.play_http(scenario)
+
+    # TCP line protocol
+
+    async def tcp_read(self, step, expect, wait=None, started=None):
+        """Read one message; fail the step on anything but the expected types"""
+        try:
+            line = await asyncio.wait_for(self.reader.readline(), wait or self.timeout)
+        except asyncio.TimeoutError:
+            raise _StepFailed(step, "timeout") from None
+        except OSError as e:
+            raise _StepFailed(step, type(e).__name__) from None
+        if not line:
+            raise _StepFailed(step, "connection closed")
+        try:
+            message = json.loads(line)
+        except ValueError:
+            raise _StepFailed(step, "invalid reply") from None
+        if message.get("type") not in (expect if isinstance(expect, tuple) else (expect,)):
+            raise _StepFailed(step, "error reply" if message.get("type") == "error" else "unexpected reply")
+        if started is not None:
+            self.stats.record(step, time.perf_counter() - started)
+        return message
+
+    async def tcp_send(self, step, line, expect):
+        """Send one command and read its reply, timing the round trip"""
+        started = time.perf_counter()
+        try:
+            self.writer.write(line.encode('utf-8') + b"\n")
+            await self.writer.drain()
+        except OSError as e:
+            raise _StepFailed(step, type(e).__name__) from None
+        return await self.tcp_read(step, expect, started=started)
+
+    async def play_tcp(self, scenario):
+        message = await self.tcp_send(
+            "start", f"START {scenario.difficulty} {scenario.num_questions} {scenario.timer_seconds or 0}",
+            "question",
+        )
+        while message["type"] == "question":
+            seconds = self.think_time(message["time_limit"])
+            if seconds is None:
+                # Let the server's timer answer for us
+                self.count(await self.tcp_read("timeout", "result",
+                                               wait=message["time_limit"] + TIMER_SLACK_SECONDS))
+            else:
+                await asyncio.sleep(seconds)
+                result = await self.tcp_send("answer", f"ANSWER {self.choose(message)}", "result")
+                self.count(result)
+                if result["timeout"]:
+                    # The timer fired as we answered; the server rejects the late answer
+                    await self.tcp_read("answer", "error")
+            message = await self.tcp_send("next", "NEXT", ("question", "summary"))
+
+    async def tcp_quit(self):
+        await self.tcp_send("quit", "QUIT", "bye")
+
+    # HTTP JSON API
+
+    async def http(self, step, method, path, payload=None):
+        """Send one HTTP/1.1 request on the kept-alive connection; return the decoded body"""
+        body = b"" if payload is None else json.dumps(payload).encode('utf-8')
+        request = (f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n"
+                   f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+        started = time.perf_counter()
+        try:
+            self.writer.write(request.encode('ascii') + body)
+            await self.writer.drain()
+            status, headers, content = await asyncio.wait_for(self.http_response(), self.timeout)
+        except asyncio.TimeoutError:
+            raise _StepFailed(step, "timeout") from None
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            raise _StepFailed(step, type(e).__name__) from None
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        if status >= 400:
+            raise _StepFailed(step, f"HTTP {status}")
+        self.stats.record(step, time.perf_counter() - started)
+        return json.loads(content) if content else None
+
+    async def http_response(self):
+        """Read a response's status, headers and body"""
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed")
+        status = int(status_line.split(None, 2)[1])
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        content = await self.reader.readexactly(length) if length else b""
+        return status, headers, content
+
+    async def play_http(self, scenario):
+        quiz = await self.http("create", "POST", "/api/quizzes", {
+            "difficulty": scenario.difficulty,
+            "num_questions": scenario.num_questions,
+            "timer_seconds": scenario.timer_seconds,
+        })
+        path = f"/api/quizzes/{quiz['id']}"
+        while True:
+            message = await self.http("question", "GET", path + "/question")
+            if message["type"] == "summary":
+                return
+            seconds = self.think_time(message["time_limit"])
+            await asyncio.sleep(message["time_limit"] if seconds is None else seconds)
+            answer = None if seconds is None else self.choose(message)
+            self.count(await self.http("answer", "POST", path + "/answer", {"answer": answer}))
+
+def _raise_open_file_limit(wanted):
+    """Raise the soft limit on open files towards wanted, where the platform allows"""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != resource.RLIM_INFINITY and soft < wanted:
+        target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            pass
+
+async def load_test(mode="tcp", host="127.0.0.1", port=None, bots=100, quizzes=None, duration=None,
+                    ramp=0.0, scenarios=None, think=DEFAULT_THINK, accuracy=DEFAULT_ACCURACY,
+                    seed=None, timeout=DEFAULT_TIMEOUT, bank=None):
+    """
+    Run bots against a quiz server and report what they measured.
+
+    Args:
+        mode (str): "tcp" for `mushroom-quiz serve`, "http" for `mushroom-quiz api`
+        host (str): Server address
+        port (int): Server port (default: the mode's default port)
+        bots (int): Concurrent simulated players
+        quizzes (int): Quizzes each bot plays (default: 1, or no limit
+            when a duration is given)
+        duration (float): If given, bots start no new quiz after this many
+            seconds
+        ramp (float): Seconds over which bot start times are spread
+        scenarios (list): Scenarios bots draw quizzes from (default: every preset)
+        think (Distribution or str): Seconds of thought before each answer
+        accuracy (Distribution or str): Chance each bot answers correctly
+        seed (int): Seed for the bots' choices, for repeatable runs
+        timeout (float): Seconds to wait for any one reply
+        bank (QuestionBank): Bank the bots look answers up in (default: the standard bank)
+
+    Returns:
+        LoadReport: Throughput, outcomes and per-step latencies
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}'")
+    think = think if isinstance(think, Distribution) else parse_distribution(think)
+    accuracy = accuracy if isinstance(accuracy, Distribution) else parse_distribution(accuracy)
+    scenarios = scenarios or preset_scenarios()
+    bank = bank if bank is not None else get_question_bank()
+    answers = {question['question']: question['answer'] for question in bank}
+    port = port or DEFAULT_PORTS[mode]
+    if quizzes is None and not duration:
+        quizzes = 1
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    _raise_open_file_limit(bots + 64)
+
+    stats = LoadStats()
+    started = time.monotonic()
+    stop_at = started + duration if duration else None
+
+    async def start_bot(number):
+        await asyncio.sleep(ramp * number / bots)
+        bot = _Bot(number, mode, host, port, scenarios, think, accuracy, answers, stats,
+                   seed + number, timeout)
+        await bot.run(quizzes, stop_at)
+
+    await asyncio.gather(*(start_bot(number) for number in range(bots)))
+    return stats.report(mode, bots, time.monotonic() - started)
+
+def _ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+def format_report(report):
+    """
+    Format a load test report as a text table.
+
+    Args:
+        report (LoadReport): Result of load_test()
+
+    Returns:
+        str: Multi-line report
+    """
+    elapsed = report.elapsed or 1e-9
+    answered = report.correct + report.wrong + report.timeouts
+    lines = [
+        f"{Colors.BOLD}{Colors.CYAN}🏋️ Load test: {report.bots} bots, {report.mode} mode, "
+        f"{report.elapsed:.1f}s{Colors.ENDC}",
+        f"Quizzes completed: {report.quizzes} ({report.quizzes / elapsed:.1f}/s)",
+        f"Requests:          {report.requests} ({report.requests / elapsed:.1f}/s)",
+        f"Errors:            {report.errors} ({report.errors / max(1, report.requests):.2%})",
+    ]
+    if answered:
+        lines.append(f"Answers:           {report.correct} correct, {report.wrong} wrong, "
+                     f"{report.timeouts} timed out ({report.correct / answered:.1%} correct)")
+    lines.append(f"\n{Colors.BOLD}{'step':<10} {'count':>8} {'errors':>8} {'p50 ms':>9} "
+                 f"{'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}{Colors.ENDC}")
+    for step in report.steps:
+        color = Colors.RED if step.errors else ""
+        lines.append(f"{color}{step.step:<10} {step.count:>8} {step.errors:>8} {_ms(step.p50):>9} "
+                     f"{_ms(step.p95):>9} {_ms(step.p99):>9} {_ms(step.max):>9}"
+                     f"{Colors.ENDC if color else ''}")
+    for reason, count in report.error_reasons.items():
+        lines.append(f"{Colors.YELLOW}{count:>8} × {reason}{Colors.ENDC}")
+    return "\n".join(lines)
+
+def report_payload(report):
+    """
+    Build the serialisable form of a load test report.
+
+    Args:
+        report (LoadReport): Result of load_test()
+
+    Returns:
+        dict: Report with each step as a dictionary
+    """
+    payload = report._asdict()
+    payload["steps"] = [step._asdict() for step in report.steps]
+    return payload
+
+def run_loadtest(**options):
+    """
+    Run a load test and print its report.
+
+    Args:
+        **options: Keyword arguments of load_test(), plus json (bool) to
+            print the report as JSON
+
+    Returns:
+        LoadReport: The report printed
+    """
+    as_json = options.pop("json", False)
+    report = asyncio.run(load_test(**options))
+    print(json.dumps(report_payload(report), indent=2) if as_json else format_report(report))
+    return report
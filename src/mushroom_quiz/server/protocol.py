@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📨 Quiz Protocol Module
+
+Message payloads shared by the networked quiz front ends.
+
+File: protocol.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module turns QuizSession records into plain dictionaries that can
+    be sent over the network as JSON, and parses the text commands clients
+    send to the line-based quiz server. Payloads never include the correct
+    answer of a question that is still open.
+
+Protocol:
+    Clients send one command per line; the server answers with one JSON
+    object per line.
+
+    START <difficulty> <num_questions> [timer_seconds] [seed]
+        Start a quiz; replies with the first "question" message. Use a
+        timer of 0 for an untimed quiz with a seed. A difficulty of
+        "adaptive" picks each question from the answers so far. A quiz
+        still in progress is abandoned
+    ANSWER <option_number>
+        Answer the open question; replies with a "result" message
+    NEXT
+        Replies with the next "question", or a "summary" when finished;
+        the summary's "quiz" spec (bank version, settings and seed) is
+        enough to regenerate the same quiz; adaptive quizzes also report
+        the player's "ability" estimate and its "standard_error"
+    QUIT
+        Replies with "bye" and closes the connection
+
+    When a timed question expires the server sends its "result" message
+    (with "timeout": true) without waiting for the client.
+
+Functions:
+    - validate_settings(): Check and normalise quiz settings from a client
+    - validate_seed(): Check a quiz seed from a client
+    - spec_payload(): Serialisable form of a QuizSpec
+    - question_payload(): Payload for an asked question
+    - result_payload(): Payload for an answer result
+    - summary_payload(): Payload for a finished quiz
+    - error_payload(): Payload for a rejected command
+    - encode(): Serialise a payload as one protocol line
+    - parse_command(): Split a protocol line into command and arguments
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import json
+
+from ..core.quiz_spec import SEED_BITS
+from ..core.adaptive import ADAPTIVE
+from ..data.question_loader import get_difficulty_levels
+
+COMMANDS = ("START", "ANSWER", "NEXT", "QUIT")
+MAX_QUESTIONS = 100
+
+def validate_settings(difficulty, num_questions, timer_seconds=None):
+    """
+    Check and normalise quiz settings sent by a client.
+
+    Args:
+        difficulty (str): Difficulty level name
+        num_questions (int or str): Number of questions wanted
+        timer_seconds (int, str or None): Seconds per question; None or 0 for untimed
+
+    Returns:
+        tuple: (difficulty, num_questions, timer_seconds or None)
+
+    Raises:
+        ValueError: If any setting is invalid
+    """
+    difficulty = str(difficulty).lower()
+    if difficulty not in get_difficulty_levels() and difficulty != ADAPTIVE:
+        raise ValueError(f"Unknown difficulty '{difficulty}'")
+    num_questions = int(num_questions)
+    if not 1 <= num_questions <= MAX_QUESTIONS:
+        raise ValueError(f"Number of questions must be between 1 and {MAX_QUESTIONS}")
+    timer_seconds = int(timer_seconds) if timer_seconds else None
+    if timer_seconds is not None and timer_seconds < 0:
+        raise ValueError("Timer must not be negative")
+    return difficulty, num_questions, timer_seconds or None
+
+def validate_seed(seed):
+    """
+    Check a quiz seed sent by a client.
+
+    Args:
+        seed (int or str): Requested seed
+
+    Returns:
+        int: The seed
+
+    Raises:
+        ValueError: If the seed is outside the range of quiz seeds
+    """
+    seed = int(seed)
+    if not 0 <= seed < 2 ** SEED_BITS:
+        raise ValueError(f"Seed must be between 0 and 2**{SEED_BITS} - 1")
+    return seed
+
+def spec_payload(spec):
+    """
+    Build the serialisable form of a quiz spec.
+
+    Args:
+        spec (QuizSpec): Spec from QuizGame.spec
+
+    Returns:
+        dict: Bank version, settings and seed
+    """
+    return spec._asdict()
+
+def question_payload(asked, time_limit=None):
+    """
+    Build the payload for a question being asked.
+
+    Args:
+        asked (AskedQuestion): Question from QuizSession.next_question()
+        time_limit (int or None): Seconds allowed to answer, if timed
+
+    Returns:
+        dict: Question message
+    """
+    return {
+        "type": "question",
+        "number": asked.number,
+        "total": asked.total,
+        "difficulty": asked.question['difficulty'],
+        "question": asked.question['question'],
+        "options": asked.options,
+        "time_limit": time_limit,
+    }
+
+def result_payload(result):
+    """
+    Build the payload for a scored answer.
+
+    Args:
+        result (AnswerResult): Result from QuizSession.submit_answer()
+
+    Returns:
+        dict: Result message
+    """
+    return {
+        "type": "result",
+        "correct": result.is_correct,
+        "timeout": result.is_timeout,
+        "your_answer": result.user_answer,
+        "correct_answer": result.correct_answer,
+        "explanation": result.explanation,
+    }
+
+def summary_payload(summary, spec=None, ability=None):
+    """
+    Build the payload for a finished quiz.
+
+    Args:
+        summary (QuizSummary): Summary from QuizSession.summary()
+        spec (QuizSpec): Spec of the finished quiz, if known
+        ability (tuple): (estimate, standard error) of an adaptive quiz
+
+    Returns:
+        dict: Summary message
+    """
+    payload = {
+        "type": "summary",
+        "score": summary.score,
+        "total": summary.total,
+        "wrong_topics": sorted(set(summary.wrong_topics)),
+    }
+    if spec is not None:
+        payload["quiz"] = spec_payload(spec)
+    if ability is not None:
+        payload["ability"] = round(ability[0], 3)
+        payload["standard_error"] = round(ability[1], 3)
+    return payload
+
+def error_payload(message):
+    """
+    Build the payload for a rejected command.
+
+    Args:
+        message (str): Human readable reason
+
+    Returns:
+        dict: Error message
+    """
+    return {"type": "error", "message": message}
+
+def encode(payload):
+    """
+    Serialise a payload as a single protocol line.
+
+    Args:
+        payload (dict): Message to send
+
+    Returns:
+        bytes: UTF-8 JSON terminated by a newline
+    """
+    return (json.dumps(payload, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+def parse_command(line):
+    """
+    Split a protocol line into an upper-cased command and its arguments.
+
+    Args:
+        line (bytes or str): Raw line received from a client
+
+    Returns:
+        tuple: (command, list of argument strings); command is '' for blank lines
+    """
+    if isinstance(line, bytes):
+        line = line.decode('utf-8', errors='replace')
+    parts = line.split()
+    if not parts:
+        return '', []
+    return parts[0].upper(), parts[1:]
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🖧 Quiz Server Module
+
+Single-process asyncio server hosting many concurrent quiz sessions.
+
+File: quiz_server.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module serves the quiz over a line-based TCP protocol (see
+    protocol.py). Each connection gets its own QuizSession, and per-question
+    timers are scheduled on the event loop with call_later() rather than in
+    threads, so an idle session costs only its stream buffers and session
+    state.
+
+    Scored answers are counted in the live metrics and, when an answer
+    event log is open, appended to it with the time since the question
+    was sent.
+
+Classes:
+    QuizConnection: Protocol handler for one connected player
+        - Parses commands and drives the player's QuizSession
+        - Schedules and cancels the per-question timeout
+    QuizServer: Listening server that owns all active connections
+
+Functions:
+    run_server(): Run a QuizServer until interrupted (used by `mushroom-quiz serve`)
+
+Dependencies:
+    - asyncio: Event loop, streams and timers
+    - ..core.quiz_engine: Question selection and headless sessions
+    - .protocol: Message payloads and command parsing
+    - ..stats.metrics: Live counters and latency histograms
+    - ..stats.event_log: Optional append-only answer event log
+
+Usage:
+    mushroom-quiz serve --host 0.0.0.0 --port 7777
+    # then, from another terminal
+    nc localhost 7777
+    START beginner 5 30
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import asyncio
+import time
+
+from .. import __version__
+from ..core.quiz_engine import QuizGame
+from ..core.adaptive import AdaptiveSession
+from ..stats import metrics
+from ..stats.event_log import new_session_id
+from ..ui.terminal_ui import Colors
+from . import protocol
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7777
+
+# Longest command line accepted from a client
+MAX_LINE_BYTES = 1024
+
+_SELECTION_SECONDS = metrics.SELECTION_SECONDS.labels("tcp")
+_RENDER_SECONDS = metrics.RENDER_SECONDS.labels("tcp")
+_TIMER_EXPIRATIONS = metrics.TIMER_EXPIRATIONS.labels("tcp")
+_ANSWERS = {outcome: metrics.ANSWERS.labels("tcp", outcome)
+            for outcome in ("correct", "incorrect", "timeout")}
+
+class QuizConnection:
+    """Protocol handler for one connected player"""
+
+    def __init__(self, server, reader, writer):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.session = None
+        self.spec = None
+        self.timer_seconds = None
+        self.timeout_handle = None
+        # Answer event log of the current quiz, its session id and when
+        # the open question was sent
+        self.events = None
+        self.session_id = None
+        self.asked_at = None
+
+    def send(self, payload):
+        """Queue one protocol message for the client"""
+        if not self.writer.is_closing():
+            self.writer.write(protocol.encode(payload))
+
+    async def run(self):
+        """Serve commands until the client quits or disconnects"""
+        self.send({"type": "welcome", "version": __version__, "commands": list(protocol.COMMANDS)})
+        try:
+            while True:
+                try:
+                    line = await self.reader.readline()
+                except ValueError:
+                    # Line longer than the stream limit
+                    self.send(protocol.error_payload("Line too long"))
+                    break
+                if not line:
+                    break
+                if not self.handle_line(line):
+                    break
+                await self.writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.cancel_timeout()
+            self.abandon()
+            self.writer.close()
+
+    def handle_line(self, line):
+        """
+        Handle one command line.
+
+        Returns:
+            bool: False when the connection should be closed
+        """
+        command, args = protocol.parse_command(line)
+        if command == "START":
+            self.start(args)
+        elif command == "ANSWER":
+            self.answer(args)
+        elif command == "NEXT":
+            self.next_question()
+        elif command == "QUIT":
+            self.send({"type": "bye"})
+            return False
+        elif command:
+            self.send(protocol.error_payload(f"Unknown command '{command}'"))
+        return True
+
+    def start(self, args):
+        """Handle START <difficulty> <num_questions> [timer_seconds] [seed]"""
+        if not 2 <= len(args) <= 4:
+            self.send(protocol.error_payload(
+                "Usage: START <difficulty> <num_questions> [timer_seconds] [seed]"
+            ))
+            return
+        try:
+            difficulty, num_questions, timer_seconds = protocol.validate_settings(*args[:3])
+            seed = protocol.validate_seed(args[3]) if len(args) == 4 else None
+        except ValueError as e:
+            self.send(protocol.error_payload(str(e)))
+            return
+
+        self.cancel_timeout()
+        # A START during a quiz replaces it
+        self.abandon()
+        self.timer_seconds = timer_seconds
+        # The game itself is dropped; the session holds the selected questions
+        # and the spec names the quiz in the summary, until the quiz ends
+        game = QuizGame(difficulty, num_questions, timer_seconds, seed=seed)
+        self.spec = game.spec
+        self.session = game.new_session()
+        self.events = game.events
+        if self.events is not None:
+            self.session_id = new_session_id()
+        metrics.QUIZZES_STARTED.labels("tcp", difficulty).inc()
+        self.ask()
+
+    def answer(self, args):
+        """Handle ANSWER <option_number>"""
+        if self.session is None or self.session.current is None:
+            self.send(protocol.error_payload("No question is waiting for an answer"))
+            return
+        try:
+            answer_num = int(args[0]) if len(args) == 1 else None
+            if answer_num is None:
+                raise ValueError
+            result = self.session.submit_answer(answer_num)
+        except ValueError:
+            options_count = len(self.session.current.options)
+            self.send(protocol.error_payload(f"Please enter a number between 1 and {options_count}."))
+            return
+        self.cancel_timeout()
+        self.scored(result)
+        self.send(protocol.result_payload(result))
+
+    def next_question(self):
+        """Handle NEXT"""
+        if self.session is None:
+            self.send(protocol.error_payload("No quiz in progress; use START"))
+        elif self.session.current is not None:
+            self.send(protocol.error_payload("Answer the current question first"))
+        elif self.session.finished:
+            ability = None
+            if isinstance(self.session, AdaptiveSession):
+                ability = (self.session.ability, self.session.standard_error)
+            self.send(protocol.summary_payload(self.session.summary(), self.spec, ability))
+            metrics.QUIZZES_COMPLETED.labels("tcp", self.spec.difficulty).inc()
+            self.session = None
+            self.spec = None
+        else:
+            self.ask()
+
+    def ask(self):
+        """Send the next question and arm its timer"""
+        selecting_at = time.perf_counter()
+        asked = self.session.next_question()
+        encoding_at = time.perf_counter()
+        line = protocol.encode(protocol.question_payload(asked, self.timer_seconds))
+        _SELECTION_SECONDS.observe(encoding_at - selecting_at)
+        _RENDER_SECONDS.observe(time.perf_counter() - encoding_at)
+        if not self.writer.is_closing():
+            self.writer.write(line)
+        self.asked_at = time.monotonic()
+        if self.timer_seconds:
+            loop = asyncio.get_running_loop()
+            self.timeout_handle = loop.call_later(self.timer_seconds, self.expire)
+
+    def expire(self):
+        """Timer callback: score the open question as a timeout"""
+        self.timeout_handle = None
+        if self.session is not None and self.session.current is not None:
+            _TIMER_EXPIRATIONS.inc()
+            result = self.session.submit_answer(None)
+            self.scored(result)
+            self.send(protocol.result_payload(result))
+
+    def scored(self, result):
+        """Count a scored answer and log it, if the quiz has an event log"""
+        _ANSWERS[metrics.answer_outcome(result)].inc()
+        if self.events is not None:
+            self.events.record_answer(self.session_id, result, time.monotonic() - self.asked_at)
+
+    def abandon(self):
+        """Count the quiz in progress, if any, as abandoned and drop it"""
+        if self.session is not None:
+            metrics.QUIZZES_ABANDONED.labels("tcp", self.spec.difficulty).inc()
+            self.session = None
+            self.spec = None
+
+    def cancel_timeout(self):
+        """Cancel the pending question timer, if any"""
+        if self.timeout_handle is not None:
+            self.timeout_handle.cancel()
+            self.timeout_handle = None
+
+class QuizServer:
+    """Line-based TCP server hosting concurrent quiz sessions"""
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.connections = set()
+        self._server = None
+
+    async def start(self):
+        """Start listening; resolves the real port when port 0 is requested"""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port, limit=MAX_LINE_BYTES
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        metrics.ACTIVE_SESSIONS.labels("tcp").set_function(lambda: self.active_sessions)
+
+    async def _handle_client(self, reader, writer):
+        connection = QuizConnection(self, reader, writer)
+        self.connections.add(connection)
+        try:
+            await connection.run()
+        finally:
+            self.connections.discard(connection)
+
+    @property
+    def active_sessions(self):
+        """int: Number of connected players"""
+        return len(self.connections)
+
+    async def serve_forever(self):
+        """Start (if needed) and serve until cancelled"""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop listening and wait for the listener to shut down"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+def run_server(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """
+    Run a quiz server until interrupted.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): TCP port to listen on
+    """
+    server = QuizServer(host, port)
+
+    async def main():
+        await server.start()
+        print(f"{Colors.GREEN}🍄 Quiz server listening on {server.host}:{server.port}{Colors.ENDC}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}Quiz server stopped. 🍄{Colors.ENDC}")
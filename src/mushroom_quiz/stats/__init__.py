@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📈 Stats Module 📈
+
+Performance tracking across quiz sessions.
+
+File: stats/__init__.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module stores quiz sessions and individual answers in a local
+    SQLite database, so players can see how their accuracy develops per
+    topic over many sessions. It also keeps live metrics of running
+    quizzes for Prometheus scrapes, and an append-only binary log of
+    every scored answer for analytics.
+    
+Exports:
+    - StatsStore: Buffered writer and query interface for the statistics database
+    - default_stats_path: Default location of the statistics database
+    - MetricsRegistry: Named counters, gauges and histograms in the Prometheus text format
+    - get_registry: The default registry the quiz front ends record into
+    - start_metrics_server: Serve /metrics from a background thread
+    - EventLog: Batched, rotating writer of binary answer records
+    - read_events: Iterate the records of an answer event log
+    
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+from .event_log import EventLog, read_events
+from .metrics import MetricsRegistry, get_registry, start_metrics_server
+from .store import StatsStore, default_stats_path
+
+__all__ = ["StatsStore", "default_stats_path", "MetricsRegistry", "get_registry",
+           "start_metrics_server", "EventLog", "read_events"]
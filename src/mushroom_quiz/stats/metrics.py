@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📟 Metrics Module
+
+Live counters, gauges and histograms in the Prometheus text format.
+
+File: metrics.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module keeps process-wide metrics of running quizzes and serves
+    them in the Prometheus text exposition format (version 0.0.4), for
+    kiosk and server deployments that are scraped by a monitoring system.
+
+    Each labelled series has its own small lock taken only by writers, so
+    quiz threads never contend with each other on unrelated series, and
+    scrapes read the values without taking any lock: a scrape can never
+    block the quiz loop, at the cost of a histogram's sum occasionally
+    missing an observation its buckets already count. Gauges can also be
+    computed at scrape time from a callback, which must be cheap and must
+    not block.
+
+    The terminal quiz, the TCP server and the HTTP API all record into the
+    default registry, each under its own "frontend" label. The HTTP API
+    serves it at /metrics; `mushroom-quiz --metrics [HOST:]PORT` and
+    `mushroom-quiz serve --metrics [HOST:]PORT` serve it from a background
+    thread.
+
+Metrics:
+    mushroom_quiz_active_sessions{frontend}                Quiz sessions in progress
+    mushroom_quiz_quizzes_started_total{frontend,difficulty}
+    mushroom_quiz_quizzes_completed_total{frontend,difficulty}
+    mushroom_quiz_quizzes_abandoned_total{frontend,difficulty}
+                                                           Restarted, disconnected or expired
+    mushroom_quiz_answers_total{frontend,outcome}          outcome: correct, incorrect, timeout
+    mushroom_quiz_timer_expirations_total{frontend}        Question timers that ran out
+    mushroom_quiz_selection_seconds{frontend}              Time to select each question
+    mushroom_quiz_render_seconds{frontend}                 Time to draw or encode each question
+
+Classes:
+    Counter: Monotonically increasing count
+    Gauge: Value that goes up and down, or is computed when scraped
+    Histogram: Observations counted in fixed cumulative buckets
+    MetricsRegistry: Named metrics and their text exposition
+
+Functions:
+    get_registry(): The default registry the quiz front ends record into
+    answer_outcome(): Outcome label of an AnswerResult
+    parse_address(): Split "[HOST:]PORT" into a host and port
+    make_metrics_server(): Build an HTTP server for /metrics
+    start_metrics_server(): Serve /metrics from a background thread
+
+Usage:
+    from mushroom_quiz.stats.metrics import get_registry
+    print(get_registry().exposition())
+
+    mushroom-quiz --metrics 9100    # then: curl localhost:9100/metrics
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import bisect
+import math
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Seconds; suits work measured in microseconds to a few seconds
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_METRICS_HOST = "127.0.0.1"
+
+def _escape(value, quote=True):
+    value = str(value).replace('\\', '\\\\').replace('\n', '\\n')
+    return value.replace('"', '\\"') if quote else value
+
+def _number(value):
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+class _Metric:
+    """Named metric with optional labels; labels() with no values gets an unlabelled series"""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values, **kwargs):
+        """
+        Get the series for a set of label values.
+
+        Args:
+            *values: Label values in labelnames order
+            **kwargs: Label values by name (instead of positional values)
+
+        Returns:
+            The series, created on first use; keep it to skip the lookup
+        """
+        if kwargs:
+            values = tuple(kwargs[name] for name in self.labelnames)
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _label_text(self, key, extra=()):
+        pairs = list(zip(self.labelnames, key)) + list(extra)
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def samples(self):
+        """Yield exposition lines of every series (without HELP and TYPE)"""
+        # A list copy, so series created during a scrape cannot break iteration
+        for key, child in list(self._children.items()):
+            yield f"{self.name}{self._label_text(key)} {_number(child.value)}"
+
+class _CounterChild:
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        """Add amount (not negative) to the count"""
+        if amount < 0:
+            raise ValueError("Counters only go up")
+        with self._lock:
+            self.value += amount
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+class _GaugeChild:
+    __slots__ = ('_value', '_lock', '_function')
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+        self._function = None
+
+    def inc(self, amount=1):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount=1):
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value):
+        self._value = float(value)
+
+    def set_function(self, function):
+        """Compute the value when scraped (function must be cheap and never block)"""
+        self._function = function
+
+    @property
+    def value(self):
+        function = self._function
+        return float(function()) if function is not None else self._value
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is computed when scraped"""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+class _HistogramChild:
+    __slots__ = ('bounds', 'counts', 'sum', '_lock')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        # One count per bound plus +Inf, not cumulative until exposition
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        """Count one observation"""
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+class Histogram(_Metric):
+    """Observations counted in fixed cumulative buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def samples(self):
+        for key, child in list(self._children.items()):
+            counts = list(child.counts)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket{self._label_text(key, [('le', _number(bound))])} {cumulative}"
+            labels = self._label_text(key)
+            yield f"{self.name}_sum{labels} {_number(child.sum)}"
+            # The +Inf bucket and the count must agree, so both come from the copy
+            yield f"{self.name}_count{labels} {cumulative}"
+
+class MetricsRegistry:
+    """Named metrics and their text exposition"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        """Register and return a Counter"""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        """Register and return a Gauge"""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Register and return a Histogram"""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name):
+        """Get a registered metric by name, or None"""
+        return self._metrics.get(name)
+
+    def exposition(self):
+        """
+        Render every metric in the Prometheus text format.
+
+        Returns:
+            str: Exposition text, ending in a newline
+        """
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation, quote=False)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+_REGISTRY = MetricsRegistry()
+
+ACTIVE_SESSIONS = _REGISTRY.gauge(
+    "mushroom_quiz_active_sessions", "Quiz sessions in progress.", ["frontend"])
+QUIZZES_STARTED = _REGISTRY.counter(
+    "mushroom_quiz_quizzes_started_total", "Quizzes started.", ["frontend", "difficulty"])
+QUIZZES_COMPLETED = _REGISTRY.counter(
+    "mushroom_quiz_quizzes_completed_total", "Quizzes played to their summary.", ["frontend", "difficulty"])
+QUIZZES_ABANDONED = _REGISTRY.counter(
+    "mushroom_quiz_quizzes_abandoned_total",
+    "Quizzes dropped before their summary: restarted, disconnected, deleted or expired.",
+    ["frontend", "difficulty"])
+ANSWERS = _REGISTRY.counter(
+    "mushroom_quiz_answers_total", "Answers scored, by outcome.", ["frontend", "outcome"])
+TIMER_EXPIRATIONS = _REGISTRY.counter(
+    "mushroom_quiz_timer_expirations_total", "Question timers that ran out before an answer.", ["frontend"])
+SELECTION_SECONDS = _REGISTRY.histogram(
+    "mushroom_quiz_selection_seconds", "Time to select each question.", ["frontend"])
+RENDER_SECONDS = _REGISTRY.histogram(
+    "mushroom_quiz_render_seconds", "Time to draw (terminal) or encode (network) each question.", ["frontend"])
+
+def get_registry():
+    """Get the default registry the quiz front ends record into"""
+    return _REGISTRY
+
+def answer_outcome(result):
+    """
+    Get the outcome label of a scored answer.
+
+    Args:
+        result (AnswerResult): Result from QuizSession.submit_answer()
+
+    Returns:
+        str: "timeout", "correct" or "incorrect"
+    """
+    if result.is_timeout:
+        return "timeout"
+    return "correct" if result.is_correct else "incorrect"
+
+def parse_address(text, default_host=DEFAULT_METRICS_HOST):
+    """
+    Split a "[HOST:]PORT" address.
+
+    Args:
+        text (str): Port, or host and port
+        default_host (str): Host used when only a port is given
+
+    Returns:
+        tuple: (host, port)
+
+    Raises:
+        ValueError: If the port is not a number from 0 to 65535
+    """
+    host, _, port = str(text).rpartition(":")
+    if not port.isdigit() or not 0 <= int(port) <= 65535:
+        raise ValueError(f"Invalid port {port!r}")
+    port = int(port)
+    return host.strip("[]") or default_host, port
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves GET /metrics and nothing else"""
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != '/metrics':
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        body = self.server.registry.exposition().encode('utf-8')
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # The terminal quiz owns the screen
+        pass
+
+def make_metrics_server(host=DEFAULT_METRICS_HOST, port=9100, registry=None):
+    """
+    Build an HTTP server for /metrics.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): TCP port to listen on (0 picks a free port)
+        registry (MetricsRegistry): Metrics to serve (default: the default registry)
+
+    Returns:
+        ThreadingHTTPServer: Bound server; call serve_forever() to run it
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.registry = registry if registry is not None else _REGISTRY
+    return server
+
+def start_metrics_server(host=DEFAULT_METRICS_HOST, port=9100, registry=None):
+    """
+    Serve /metrics from a daemon thread, so scrapes run beside the quiz.
+
+    Args:
+        host (str): Interface to listen on
+        port (int): TCP port to listen on (0 picks a free port)
+        registry (MetricsRegistry): Metrics to serve (default: the default registry)
+
+    Returns:
+        ThreadingHTTPServer: The running server; shutdown() stops it
+    """
+    server = make_metrics_server(host, port, registry)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
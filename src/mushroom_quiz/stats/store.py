@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📈 Stats Store Module
+
+Persistent cross-session statistics on SQLite, with batched writes.
+
+File: store.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module records quiz sessions and every answer given in them in an
+    SQLite database opened in WAL mode. Writes are buffered in memory and
+    written by flush() in a single transaction, one executemany() per
+    table, so the per-answer cost is one row in a prepared statement
+    rather than one commit. A flush happens automatically once batch_size
+    rows are waiting, and on close().
+
+    Session ids are random 63-bit integers chosen by the writer, so
+    answers can reference their session before anything has been written
+    and several processes can share one database. Question ids come from
+    question_id(), so no lookup is needed to record an answer either.
+
+    The answers table carries a covering (user, topic, is_correct) index,
+    so "accuracy by topic for this user" is answered from the index alone
+    without touching the table. Spaced-repetition schedules (see
+    core/review.py) are kept in review_items, one row per player and
+    question, and written in the same batches. Databases written by an
+    older schema version are upgraded in place when opened.
+
+Classes:
+    StatsStore: Buffered writer and query interface for the statistics database
+    TopicAccuracy: (topic, answered, correct, accuracy) row
+    SessionRecord: (session_id, started_at, difficulty, score, total) row
+
+Functions:
+    default_stats_path(): Default location of the statistics database
+
+Environment:
+    - MUSHROOM_QUIZ_DATA_DIR: Override the directory holding stats.db
+      (defaults to $XDG_DATA_HOME/mushroom_quiz or ~/.local/share/mushroom_quiz)
+
+Usage:
+    from mushroom_quiz.stats import StatsStore
+    with StatsStore() as stats:
+        session_id = stats.start_session("alice", game.spec)
+        stats.record_answer(session_id, "alice", result, elapsed=4.2)
+        stats.finish_session(session_id, session.summary())
+    StatsStore().accuracy_by_topic("alice")
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import os
+import random
+import sqlite3
+import time
+from collections import namedtuple
+
+from ..core.quiz_spec import SEED_BITS
+from ..data.question_bank import question_id
+
+# Bump when the schema changes; _MIGRATIONS upgrades older databases
+SCHEMA_VERSION = 2
+
+# Rows buffered before an automatic flush
+DEFAULT_BATCH_SIZE = 1000
+
+TopicAccuracy = namedtuple('TopicAccuracy', ['topic', 'answered', 'correct', 'accuracy'])
+SessionRecord = namedtuple('SessionRecord', ['session_id', 'started_at', 'difficulty', 'score', 'total'])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id            INTEGER PRIMARY KEY,
+    user          TEXT    NOT NULL,
+    started_at    REAL    NOT NULL,
+    finished_at   REAL,
+    bank_version  TEXT,
+    difficulty    TEXT    NOT NULL,
+    num_questions INTEGER NOT NULL,
+    timer_seconds INTEGER,
+    seed          INTEGER,
+    score         INTEGER,
+    total         INTEGER
+);
+CREATE INDEX IF NOT EXISTS sessions_user_started ON sessions (user, started_at);
+
+CREATE TABLE IF NOT EXISTS questions (
+    id         INTEGER PRIMARY KEY,
+    topic      TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    text       TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS answers (
+    session_id  INTEGER NOT NULL,
+    user        TEXT    NOT NULL,
+    question_id INTEGER NOT NULL,
+    topic       TEXT    NOT NULL,
+    is_correct  INTEGER NOT NULL,
+    is_timeout  INTEGER NOT NULL,
+    answered_at REAL    NOT NULL,
+    elapsed     REAL
+);
+CREATE INDEX IF NOT EXISTS answers_user_topic ON answers (user, topic, is_correct);
+CREATE INDEX IF NOT EXISTS answers_session ON answers (session_id);
+
+CREATE TABLE IF NOT EXISTS review_items (
+    user        TEXT    NOT NULL,
+    question_id INTEGER NOT NULL,
+    due         REAL    NOT NULL,
+    interval    REAL    NOT NULL,
+    ease        REAL    NOT NULL,
+    repetitions INTEGER NOT NULL,
+    difficulty  TEXT,
+    PRIMARY KEY (user, question_id)
+) WITHOUT ROWID;
+"""
+
+# Statements taking a database from the keyed version to the next one
+_MIGRATIONS = {
+    1: "ALTER TABLE review_items ADD COLUMN difficulty TEXT",
+}
+
+_INSERT_SESSION = """
+INSERT INTO sessions (id, user, started_at, bank_version, difficulty, num_questions, timer_seconds, seed)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_FINISH_SESSION = "UPDATE sessions SET finished_at = ?, score = ?, total = ? WHERE id = ?"
+_INSERT_QUESTION = "INSERT OR IGNORE INTO questions (id, topic, difficulty, text) VALUES (?, ?, ?, ?)"
+_INSERT_ANSWER = """
+INSERT INTO answers (session_id, user, question_id, topic, is_correct, is_timeout, answered_at, elapsed)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SAVE_REVIEW = """
+INSERT OR REPLACE INTO review_items (user, question_id, due, interval, ease, repetitions, difficulty)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_LOAD_REVIEWS = """
+SELECT question_id, due, interval, ease, repetitions, difficulty FROM review_items WHERE user = ?
+"""
+
+_ACCURACY_BY_TOPIC = """
+SELECT topic, COUNT(*), SUM(is_correct) FROM answers
+WHERE user = ? GROUP BY topic ORDER BY topic
+"""
+_RECENT_SESSIONS = """
+SELECT id, started_at, difficulty, score, total FROM sessions
+WHERE user = ? AND finished_at IS NOT NULL ORDER BY started_at DESC LIMIT ?
+"""
+
+def default_stats_path():
+    """
+    Get the default location of the statistics database.
+
+    Returns:
+        str: Path to stats.db
+    """
+    directory = os.environ.get('MUSHROOM_QUIZ_DATA_DIR')
+    if not directory:
+        base = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+        directory = os.path.join(base, 'mushroom_quiz')
+    return os.path.join(directory, 'stats.db')
+
+class StatsStore:
+    """Buffered writer and query interface for the statistics database"""
+
+    def __init__(self, path=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Open (and if needed create) a statistics database.
+
+        Args:
+            path (str): Database file, or ':memory:' (defaults to default_stats_path())
+            batch_size (int): Buffered rows that trigger an automatic flush
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+            OSError: If its directory cannot be created
+        """
+        self.path = path or default_stats_path()
+        self.batch_size = batch_size
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly in flush()
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the database consistent with NORMAL; only the last
+        # transactions can be lost on power failure
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._create_schema()
+        self._rng = random.SystemRandom()
+        self._sessions = []
+        self._questions = {}
+        # Ids of question rows already written, so each is sent once
+        self._written_questions = set()
+        self._answers = []
+        self._finished = []
+        self._reviews = []
+
+    def _create_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise sqlite3.DatabaseError(
+                f"Statistics database {self.path} has schema {version}, expected {SCHEMA_VERSION}"
+            )
+        if 0 < version < SCHEMA_VERSION:
+            self._migrate()
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def _migrate(self):
+        """Upgrade an older database in one transaction, unless another process just did"""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for step in range(version, SCHEMA_VERSION):
+                conn.execute(_MIGRATIONS[step])
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def pending(self):
+        """int: Buffered rows not yet written"""
+        return len(self._sessions) + len(self._answers) + len(self._finished) + len(self._reviews)
+
+    def start_session(self, user, spec, started_at=None):
+        """
+        Record the start of a quiz session.
+
+        Args:
+            user (str): Player name
+            spec (QuizSpec): Spec of the quiz being played
+            started_at (float): Unix time (defaults to now)
+
+        Returns:
+            int: Session id to pass to record_answer() and finish_session()
+        """
+        session_id = self._rng.getrandbits(SEED_BITS)
+        self._sessions.append((
+            session_id, user, time.time() if started_at is None else started_at,
+            spec.bank_version, spec.difficulty, spec.num_questions, spec.timer_seconds, spec.seed
+        ))
+        self._maybe_flush()
+        return session_id
+
+    def record_answer(self, session_id, user, result, elapsed=None, answered_at=None):
+        """
+        Record one answer.
+
+        Args:
+            session_id (int): Id from start_session()
+            user (str): Player name
+            result (AnswerResult): Result from QuizSession.submit_answer()
+            elapsed (float): Seconds taken to answer, if measured
+            answered_at (float): Unix time (defaults to now)
+        """
+        question = result.question
+        qid = question_id(question)
+        if qid not in self._written_questions and qid not in self._questions:
+            self._questions[qid] = (qid, question['topic'], question['difficulty'], question['question'])
+        self._answers.append((
+            session_id, user, qid, question['topic'], int(result.is_correct), int(result.is_timeout),
+            time.time() if answered_at is None else answered_at, elapsed
+        ))
+        self._maybe_flush()
+
+    def finish_session(self, session_id, summary, finished_at=None):
+        """
+        Record the final score of a session.
+
+        Args:
+            session_id (int): Id from start_session()
+            summary (QuizSummary): Summary from QuizSession.summary()
+            finished_at (float): Unix time (defaults to now)
+        """
+        self._finished.append((
+            time.time() if finished_at is None else finished_at, summary.score, summary.total, session_id
+        ))
+        self._maybe_flush()
+
+    def save_review_items(self, user, rows):
+        """
+        Queue a player's changed review schedules for writing.
+
+        Args:
+            user (str): Player name
+            rows (list): (question_id, due, interval, ease, repetitions, difficulty) tuples
+        """
+        self._reviews.extend((user,) + tuple(row) for row in rows)
+        self._maybe_flush()
+
+    def load_review_items(self, user):
+        """
+        Load a player's review schedules (buffered rows are flushed first).
+
+        Args:
+            user (str): Player name
+
+        Returns:
+            list: (question_id, due, interval, ease, repetitions, difficulty) tuples
+        """
+        self.flush()
+        return self._conn.execute(_LOAD_REVIEWS, (user,)).fetchall()
+
+    def _maybe_flush(self):
+        if self.pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write every buffered row in one transaction"""
+        if not self.pending:
+            return
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(_INSERT_SESSION, self._sessions)
+            conn.executemany(_INSERT_QUESTION, self._questions.values())
+            conn.executemany(_INSERT_ANSWER, self._answers)
+            conn.executemany(_FINISH_SESSION, self._finished)
+            conn.executemany(_SAVE_REVIEW, self._reviews)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self._written_questions.update(self._questions)
+        self._sessions.clear()
+        self._questions.clear()
+        self._answers.clear()
+        self._finished.clear()
+        self._reviews.clear()
+
+    def close(self):
+        """Flush buffered rows and close the database"""
+        if self._conn is not None:
+            try:
+                self.flush()
+            finally:
+                self._conn.close()
+                self._conn = None
+
+    def accuracy_by_topic(self, user):
+        """
+        Get a player's accuracy per topic (buffered rows are flushed first).
+
+        Args:
+            user (str): Player name
+
+        Returns:
+            list: TopicAccuracy rows ordered by topic
+        """
+        self.flush()
+        return [
+            TopicAccuracy(topic, answered, correct, correct / answered)
+            for topic, answered, correct in self._conn.execute(_ACCURACY_BY_TOPIC, (user,))
+        ]
+
+    def recent_sessions(self, user, limit=10):
+        """
+        Get a player's most recent finished sessions.
+
+        Args:
+            user (str): Player name
+            limit (int): Maximum number of sessions
+
+        Returns:
+            list: SessionRecord rows, newest first
+        """
+        self.flush()
+        return [SessionRecord(*row) for row in self._conn.execute(_RECENT_SESSIONS, (user, limit))]
@@ -10,7 +10,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-23
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 License: MIT
 
 Description:
@@ -21,23 +21,28 @@ Description:
 Exports:
     - clear_screen: Clear terminal screen
     - print_header: Display application header
+    - show_screen: Draw the header and a body as one frame
     - display_main_menu: Show main menu options
     - display_about: Show about information
     - get_difficulty_level: Get user's difficulty preference
     - get_number_of_questions: Get desired number of questions
     - get_timer_mode: Get timer mode preference
     - Colors: Color constants for terminal styling
+    - ScreenRenderer: Buffered single-write terminal renderer
+    - get_renderer: Get the shared renderer for standard output
     
 Repository:
     https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
 """
 
 from .terminal_ui import (
-    clear_screen, print_header, display_main_menu, display_about,
+    clear_screen, print_header, show_screen, display_main_menu, display_about,
     get_difficulty_level, get_number_of_questions, get_timer_mode, Colors
 )
+from .renderer import ScreenRenderer, get_renderer
 
 __all__ = [
-    "clear_screen", "print_header", "display_main_menu", "display_about",
-    "get_difficulty_level", "get_number_of_questions", "get_timer_mode", "Colors"
+    "clear_screen", "print_header", "show_screen", "display_main_menu", "display_about",
+    "get_difficulty_level", "get_number_of_questions", "get_timer_mode", "Colors",
+    "ScreenRenderer", "get_renderer"
 ]
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🖥️ Screen Renderer Module
+
+Buffered, single-write terminal output for quiz screens.
+
+File: renderer.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+
+Description:
+    This module provides the ScreenRenderer used by the terminal UI. Each
+    screen (header, question, options, result) is built as a string in
+    memory and sent with one write and one flush, and the screen is
+    cleared with ANSI escape sequences instead of spawning a `clear`/`cls`
+    subprocess. Single-line updates such as the countdown repaint only the
+    current line.
+
+Classes:
+    ScreenRenderer: Writes whole frames or single lines to a stream
+
+Functions:
+    get_renderer(): Get the shared renderer for standard output
+
+Constants:
+    CLEAR_SCREEN: ANSI sequence that clears the screen and homes the cursor
+    CLEAR_LINE: ANSI sequence that erases the current line
+
+Usage:
+    from mushroom_quiz.ui.renderer import get_renderer
+    renderer = get_renderer()
+    renderer.draw(header_text, question_text)   # clear + one write
+    renderer.update_line("⏰ Time remaining: 12 seconds")
+
+License:
+    MIT License - See LICENSE file for details
+"""
+
+import os
+import sys
+
+CLEAR_SCREEN = "\033[2J\033[H"
+CLEAR_LINE = "\033[2K"
+
+class ScreenRenderer:
+    """Writes whole frames or single lines with one buffered write each"""
+
+    def __init__(self, stream=None):
+        """
+        Create a renderer.
+
+        Args:
+            stream: Text stream to write to; defaults to whatever
+                sys.stdout is at write time (so redirection keeps working)
+        """
+        self._stream = stream
+        if os.name == 'nt':
+            # Calling the shell once switches the Windows console into
+            # VT mode, so the ANSI sequences below are understood
+            os.system('')
+
+    @property
+    def stream(self):
+        """Stream the renderer writes to"""
+        return self._stream if self._stream is not None else sys.stdout
+
+    def write(self, *parts):
+        """Join the parts and send them in a single write and flush"""
+        stream = self.stream
+        stream.write("".join(parts))
+        stream.flush()
+
+    def draw(self, *parts, clear=True):
+        """
+        Draw a full frame.
+
+        Args:
+            *parts (str): Frame sections, written in order
+            clear (bool): Clear the screen first (in the same write)
+        """
+        if clear:
+            self.write(CLEAR_SCREEN, *parts)
+        else:
+            self.write(*parts)
+
+    def update_line(self, text):
+        """Repaint only the line the cursor is on"""
+        self.write("\r", CLEAR_LINE, text)
+
+    def clear(self):
+        """Clear the screen and move the cursor to the top left"""
+        self.write(CLEAR_SCREEN)
+
+_RENDERER = None
+
+def get_renderer():
+    """
+    Get the shared renderer for standard output.
+
+    Returns:
+        ScreenRenderer: Shared renderer
+    """
+    global _RENDERER
+    if _RENDERER is None:
+        _RENDERER = ScreenRenderer()
+    return _RENDERER
@@ -11,7 +11,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-21
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 
 Description:
     This module provides all user interface functionality for the mushroom
@@ -19,16 +19,25 @@ Description:
     menu systems, and interactive elements. It uses ANSI color codes to
     create an engaging visual experience.
 
+    Screens are built in memory by render_* functions and sent to the
+    terminal by the shared ScreenRenderer in one buffered write, and the
+    screen is cleared with ANSI sequences rather than a shell subprocess.
+
 Classes:
     Colors: ANSI color code constants for terminal formatting
         - Standard colors (RED, GREEN, BLUE, YELLOW, etc.)
         - Style modifiers (BOLD, UNDERLINE)
         - Special formatting (HEADER, WARNING, FAIL, etc.)
 
+Presets:
+    DIFFICULTY_PRESETS, QUESTION_COUNT_PRESETS, TIMER_MODE_PRESETS: The
+    menu choices, also used as the load tester's scenarios
+
 Functions:
     Screen Management:
-        - clear_screen(): Cross-platform screen clearing
+        - clear_screen(): ANSI screen clearing (no subprocess)
         - print_header(): Displays ASCII art header
+        - show_screen(): Clear, header and body in a single write
     
     Menu Systems:
         - display_main_menu(): Shows main application menu
@@ -42,6 +51,12 @@ Functions:
         - display_result(): Answer result with explanation
         - display_final_score(): Comprehensive score report with rankings
         - display_study_recommendations(): Personalized learning suggestions
+        - display_ability_estimate(): Ability estimate after an adaptive quiz
+    
+    Rendering (return strings, no output):
+        - render_header(), render_question(), render_result(),
+          render_final_score(), render_study_recommendations(),
+          render_ability_estimate()
 
 Features:
     - Colorful ANSI terminal interface
@@ -57,6 +72,7 @@ Features:
       * <50%: 🔰 SPORE BEGINNER
     - Topic-specific study recommendations
     - Cross-platform compatibility (Windows/Unix)
+    - Flicker-free, single-write screen updates
 
 Color Scheme:
     - Cyan: Headers and titles
@@ -67,8 +83,7 @@ Color Scheme:
     - Blue: Questions and information
 
 Dependencies:
-    - os: For cross-platform screen clearing
-    - time: For display timing (imported but may be used by callers)
+    - .renderer: Buffered single-write screen output
 
 Usage:
     from quiz_ui import clear_screen, print_header, Colors
@@ -80,8 +95,13 @@ License:
     MIT License - See LICENSE file for details
 """
 
-import os
-import time
+from .renderer import get_renderer
+
+# Choices offered by the quiz menus, in menu order; load test scenarios
+# are built from the same presets
+DIFFICULTY_PRESETS = ("beginner", "intermediate", "advanced", "mixed")
+QUESTION_COUNT_PRESETS = (("quick", 5), ("standard", 10), ("challenge", 20))
+TIMER_MODE_PRESETS = (("relaxed", None), ("timed", 30), ("speed", 15))
 
 # ANSI color codes
 class Colors:
@@ -103,11 +123,11 @@ class Colors:
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    get_renderer().clear()
 
-def print_header():
-    """Print the game header with mushroom art"""
-    header = f"""
+def render_header():
+    """Build the game header with mushroom art"""
+    return f"""
 {Colors.CYAN}╔══════════════════════════════════════════════════════════════╗
 ║                🍄 MUSHROOM CULTIVATION QUIZ 🍄               ║
 ║                   Test Your Fungi Knowledge!                 ║
@@ -119,49 +139,56 @@ def print_header():
 ╱_______╲___╱_╲___╱_╲___╱_╲___╱_╲___╱_╲___╱_╲___╱_╲{Colors.ENDC}
 
 {Colors.YELLOW}Welcome to the ultimate mushroom cultivation challenge!{Colors.ENDC}
-    """
-    print(header)
-
-def get_difficulty_level():
-    """Let user choose difficulty level"""
-    print(f"\n{Colors.BOLD}Choose your difficulty level:{Colors.ENDC}")
-    print(f"{Colors.GREEN}1. 🟢 Beginner (Easy questions)") 
-    print(f"{Colors.YELLOW}2. 🟡 Intermediate (Moderate questions)")
-    print(f"{Colors.RED}3. 🔴 Advanced (Hard questions)")
-    print(f"{Colors.CYAN}4. 🌈 Mixed (All difficulty levels){Colors.ENDC}")
+    
+"""
+
+def print_header():
+    """Print the game header with mushroom art"""
+    get_renderer().write(render_header())
+
+def show_screen(body=""):
+    """Clear the screen and draw the header followed by body in one write"""
+    get_renderer().draw(render_header(), body)
+
+def get_difficulty_level(adaptive=False):
+    """Let user choose difficulty level (offering the adaptive mode if asked)"""
+    last = 5 if adaptive else 4
+    get_renderer().write(
+        f"\n{Colors.BOLD}Choose your difficulty level:{Colors.ENDC}\n"
+        f"{Colors.GREEN}1. 🟢 Beginner (Easy questions)\n"
+        f"{Colors.YELLOW}2. 🟡 Intermediate (Moderate questions)\n"
+        f"{Colors.RED}3. 🔴 Advanced (Hard questions)\n"
+        f"{Colors.CYAN}4. 🌈 Mixed (All difficulty levels){Colors.ENDC}\n"
+        + (f"{Colors.BLUE}5. 🧠 Adaptive (Questions follow your level){Colors.ENDC}\n" if adaptive else "")
+    )
     
     while True:
         try:
-            choice = int(input(f"\n{Colors.BOLD}Enter your choice (1-4): {Colors.ENDC}"))
-            if choice == 1:
-                return "beginner"
-            elif choice == 2:
-                return "intermediate"
-            elif choice == 3:
-                return "advanced"
-            elif choice == 4:
-                return "mixed"
+            choice = int(input(f"\n{Colors.BOLD}Enter your choice (1-{last}): {Colors.ENDC}"))
+            if 1 <= choice <= len(DIFFICULTY_PRESETS):
+                return DIFFICULTY_PRESETS[choice - 1]
+            elif choice == 5 and adaptive:
+                return "adaptive"
             else:
-                print(f"{Colors.FAIL}Please enter a number between 1 and 4.{Colors.ENDC}")
+                print(f"{Colors.FAIL}Please enter a number between 1 and {last}.{Colors.ENDC}")
         except ValueError:
             print(f"{Colors.FAIL}Please enter a valid number.{Colors.ENDC}")
 
 def get_number_of_questions():
     """Let user choose number of questions"""
-    print(f"\n{Colors.BOLD}How many questions would you like?{Colors.ENDC}")
-    print(f"{Colors.GREEN}1. ⚡ Quick Quiz (5 questions)")
-    print(f"{Colors.YELLOW}2. 🎯 Standard Quiz (10 questions)")
-    print(f"{Colors.RED}3. 🏆 Challenge Quiz (20 questions){Colors.ENDC}")
+    quick, standard, challenge = (count for _, count in QUESTION_COUNT_PRESETS)
+    get_renderer().write(
+        f"\n{Colors.BOLD}How many questions would you like?{Colors.ENDC}\n"
+        f"{Colors.GREEN}1. ⚡ Quick Quiz ({quick} questions)\n"
+        f"{Colors.YELLOW}2. 🎯 Standard Quiz ({standard} questions)\n"
+        f"{Colors.RED}3. 🏆 Challenge Quiz ({challenge} questions){Colors.ENDC}\n"
+    )
     
     while True:
         try:
             choice = int(input(f"\n{Colors.BOLD}Enter your choice (1-3): {Colors.ENDC}"))
-            if choice == 1:
-                return 5
-            elif choice == 2:
-                return 10
-            elif choice == 3:
-                return 20
+            if 1 <= choice <= len(QUESTION_COUNT_PRESETS):
+                return QUESTION_COUNT_PRESETS[choice - 1][1]
             else:
                 print(f"{Colors.FAIL}Please enter a number between 1 and 3.{Colors.ENDC}")
         except ValueError:
@@ -169,105 +196,140 @@ def get_number_of_questions():
 
 def get_timer_mode():
     """Let user choose if they want timed mode"""
-    print(f"\n{Colors.BOLD}Choose quiz mode:{Colors.ENDC}")
-    print(f"{Colors.GREEN}1. 🐌 Relaxed Mode (No time limit)")
-    print(f"{Colors.YELLOW}2. ⏰ Timed Mode (30 seconds per question)")
-    print(f"{Colors.RED}3. 🚀 Speed Mode (15 seconds per question){Colors.ENDC}")
+    timed, speed = (seconds for _, seconds in TIMER_MODE_PRESETS[1:])
+    get_renderer().write(
+        f"\n{Colors.BOLD}Choose quiz mode:{Colors.ENDC}\n"
+        f"{Colors.GREEN}1. 🐌 Relaxed Mode (No time limit)\n"
+        f"{Colors.YELLOW}2. ⏰ Timed Mode ({timed} seconds per question)\n"
+        f"{Colors.RED}3. 🚀 Speed Mode ({speed} seconds per question){Colors.ENDC}\n"
+    )
     
     while True:
         try:
             choice = int(input(f"\n{Colors.BOLD}Enter your choice (1-3): {Colors.ENDC}"))
-            if choice == 1:
-                return None  # No timer
-            elif choice == 2:
-                return 30  # 30 seconds
-            elif choice == 3:
-                return 15  # 15 seconds
+            if 1 <= choice <= len(TIMER_MODE_PRESETS):
+                return TIMER_MODE_PRESETS[choice - 1][1]  # None means no timer
             else:
                 print(f"{Colors.FAIL}Please enter a number between 1 and 3.{Colors.ENDC}")
         except ValueError:
             print(f"{Colors.FAIL}Please enter a valid number.{Colors.ENDC}")
 
+def render_question(question_num, total_questions, question_data, options):
+    """Build a formatted question with options"""
+    lines = [
+        f"{Colors.BOLD}Question {question_num}/{total_questions}:{Colors.ENDC}",
+        f"{Colors.BLUE}📚 Difficulty: {question_data['difficulty'].title()}{Colors.ENDC}",
+        f"\n{Colors.YELLOW}{question_data['question']}{Colors.ENDC}\n",
+    ]
+    for j, option in enumerate(options, 1):
+        lines.append(f"{Colors.CYAN}{j}. {option}{Colors.ENDC}")
+    return "\n".join(lines) + "\n"
+
 def display_question(question_num, total_questions, question_data, options):
     """Display a formatted question with options"""
-    print(f"{Colors.BOLD}Question {question_num}/{total_questions}:{Colors.ENDC}")
-    print(f"{Colors.BLUE}📚 Difficulty: {question_data['difficulty'].title()}{Colors.ENDC}")
-    print(f"\n{Colors.YELLOW}{question_data['question']}{Colors.ENDC}\n")
-    
-    for j, option in enumerate(options, 1):
-        print(f"{Colors.CYAN}{j}. {option}{Colors.ENDC}")
+    get_renderer().write(render_question(question_num, total_questions, question_data, options))
 
-def display_result(is_correct, user_answer, correct_answer, explanation, is_timeout=False):
-    """Display the result of an answer"""
+def render_result(is_correct, user_answer, correct_answer, explanation, is_timeout=False):
+    """Build the result of an answer"""
     if is_correct:
-        print(f"\n{Colors.GREEN}✅ Correct! Well done! 🎉{Colors.ENDC}")
+        verdict = f"\n{Colors.GREEN}✅ Correct! Well done! 🎉{Colors.ENDC}"
     elif is_timeout:
-        print(f"\n{Colors.YELLOW}⏰ No answer given. The correct answer was: {correct_answer}{Colors.ENDC}")
+        verdict = f"\n{Colors.YELLOW}⏰ No answer given. The correct answer was: {correct_answer}{Colors.ENDC}"
     else:
-        print(f"\n{Colors.RED}❌ Wrong! The correct answer is: {correct_answer}{Colors.ENDC}")
+        verdict = f"\n{Colors.RED}❌ Wrong! The correct answer is: {correct_answer}{Colors.ENDC}"
     
-    print(f"{Colors.PURPLE}💡 {explanation}{Colors.ENDC}")
+    return f"{verdict}\n{Colors.PURPLE}💡 {explanation}{Colors.ENDC}\n"
 
-def display_final_score(score, total_questions):
-    """Display final quiz results and ranking"""
+def display_result(is_correct, user_answer, correct_answer, explanation, is_timeout=False):
+    """Display the result of an answer"""
+    get_renderer().write(render_result(is_correct, user_answer, correct_answer, explanation, is_timeout))
+
+def render_final_score(score, total_questions):
+    """Build final quiz results and ranking"""
     percentage = (score / total_questions) * 100
     
-    print(f"\n{Colors.BOLD}{Colors.CYAN}🏆 QUIZ COMPLETE! 🏆{Colors.ENDC}\n")
-    print(f"{Colors.YELLOW}Final Score: {score}/{total_questions} ({percentage:.1f}%){Colors.ENDC}\n")
+    lines = [
+        f"\n{Colors.BOLD}{Colors.CYAN}🏆 QUIZ COMPLETE! 🏆{Colors.ENDC}\n",
+        f"{Colors.YELLOW}Final Score: {score}/{total_questions} ({percentage:.1f}%){Colors.ENDC}\n",
+    ]
     
     # Score evaluation
     if percentage >= 90:
-        print(f"{Colors.GREEN}🌟 MUSHROOM MASTER! 🌟")
-        print(f"Outstanding! You're ready to start your own mushroom farm! 🍄🚜{Colors.ENDC}")
+        lines.append(f"{Colors.GREEN}🌟 MUSHROOM MASTER! 🌟")
+        lines.append(f"Outstanding! You're ready to start your own mushroom farm! 🍄🚜{Colors.ENDC}")
     elif percentage >= 70:
-        print(f"{Colors.CYAN}🍄 FUNGI EXPERT! 🍄")
-        print(f"Great job! You have solid mushroom cultivation knowledge! 🎯{Colors.ENDC}")
+        lines.append(f"{Colors.CYAN}🍄 FUNGI EXPERT! 🍄")
+        lines.append(f"Great job! You have solid mushroom cultivation knowledge! 🎯{Colors.ENDC}")
     elif percentage >= 50:
-        print(f"{Colors.YELLOW}🌱 GROWING CULTIVATOR! 🌱")
-        print(f"Good start! Keep learning and you'll be a mushroom pro! 📚{Colors.ENDC}")
+        lines.append(f"{Colors.YELLOW}🌱 GROWING CULTIVATOR! 🌱")
+        lines.append(f"Good start! Keep learning and you'll be a mushroom pro! 📚{Colors.ENDC}")
     else:
-        print(f"{Colors.PURPLE}🔰 SPORE BEGINNER! 🔰")
-        print(f"Don't worry! Every expert started somewhere. Keep studying! 💪{Colors.ENDC}")
+        lines.append(f"{Colors.PURPLE}🔰 SPORE BEGINNER! 🔰")
+        lines.append(f"Don't worry! Every expert started somewhere. Keep studying! 💪{Colors.ENDC}")
+    return "\n".join(lines) + "\n"
 
-def display_study_recommendations(wrong_topics):
-    """Display personalized study recommendations"""
+def display_final_score(score, total_questions):
+    """Display final quiz results and ranking"""
+    get_renderer().write(render_final_score(score, total_questions))
+
+def render_ability_estimate(theta, standard_error, level):
+    """Build the ability estimate shown after an adaptive quiz"""
+    return (f"{Colors.BOLD}{Colors.BLUE}🧠 Estimated ability: {theta:+.2f} ± {standard_error:.2f} "
+            f"({level.capitalize()} level){Colors.ENDC}\n")
+
+def display_ability_estimate(theta, standard_error, level):
+    """Display the ability estimate of an adaptive quiz"""
+    get_renderer().write(render_ability_estimate(theta, standard_error, level))
+
+STUDY_TIPS = {
+    "growing_conditions": "Review optimal temperature and humidity ranges.",
+    "mushroom_varieties": "Learn about different types of mushrooms and their characteristics.",
+    "substrates": "Explore various substrates used in mushroom cultivation.",
+    "biology_basics": "Understand the structure and function of mycelium.",
+    "sterilization": "Look into sterilization techniques like pressure cooking.",
+    "medicinal_mushrooms": "Research the benefits and uses of medicinal mushrooms.",
+    "cultivation_process": "Familiarize yourself with the steps in mushroom cultivation.",
+    "beginner_varieties": "Identify beginner-friendly mushrooms to start growing.",
+    "growing_methods": "Discover different growing methods such as log cultivation.",
+    "timing": "Learn about the timelines for various mushroom cultivation stages."
+}
+
+def render_study_recommendations(wrong_topics):
+    """Build personalized study recommendations"""
     if wrong_topics:
         unique_topics = list(set(wrong_topics))
-        print(f"\n{Colors.BOLD}{Colors.CYAN}📚 Study Recommendations:{Colors.ENDC}")
-        
-        study_tips = {
-            "growing_conditions": "Review optimal temperature and humidity ranges.",
-            "mushroom_varieties": "Learn about different types of mushrooms and their characteristics.",
-            "substrates": "Explore various substrates used in mushroom cultivation.",
-            "biology_basics": "Understand the structure and function of mycelium.",
-            "sterilization": "Look into sterilization techniques like pressure cooking.",
-            "medicinal_mushrooms": "Research the benefits and uses of medicinal mushrooms.",
-            "cultivation_process": "Familiarize yourself with the steps in mushroom cultivation.",
-            "beginner_varieties": "Identify beginner-friendly mushrooms to start growing.",
-            "growing_methods": "Discover different growing methods such as log cultivation.",
-            "timing": "Learn about the timelines for various mushroom cultivation stages."
-        }
+        lines = [f"\n{Colors.BOLD}{Colors.CYAN}📚 Study Recommendations:{Colors.ENDC}"]
         
         for topic in unique_topics:
-            if topic in study_tips:
-                print(f"- {study_tips[topic]}")
+            if topic in STUDY_TIPS:
+                lines.append(f"- {STUDY_TIPS[topic]}")
+        return "\n".join(lines) + "\n"
     else:
-        print(f"{Colors.GREEN}🎉 You're well-rounded in your mushroom knowledge! 🎉{Colors.ENDC}")
+        return f"{Colors.GREEN}🎉 You're well-rounded in your mushroom knowledge! 🎉{Colors.ENDC}\n"
+
+def display_study_recommendations(wrong_topics):
+    """Display personalized study recommendations"""
+    get_renderer().write(render_study_recommendations(wrong_topics))
 
 def display_main_menu():
     """Display the main menu options"""
-    print(f"\n{Colors.BOLD}What would you like to do?{Colors.ENDC}")
-    print(f"{Colors.GREEN}1. 🎮 Start Quiz")
-    print(f"{Colors.BLUE}2. 📖 About This Quiz")
-    print(f"{Colors.RED}3. 🚪 Exit{Colors.ENDC}")
+    get_renderer().write(
+        f"\n{Colors.BOLD}What would you like to do?{Colors.ENDC}\n"
+        f"{Colors.GREEN}1. 🎮 Start Quiz\n"
+        f"{Colors.CYAN}2. 🔁 Review Due Questions (spaced repetition)\n"
+        f"{Colors.YELLOW}3. 🔎 Study by Keyword\n"
+        f"{Colors.BLUE}4. 📖 About This Quiz\n"
+        f"{Colors.RED}5. 🚪 Exit{Colors.ENDC}\n"
+    )
 
 def display_about():
     """Display information about the quiz"""
-    print(f"\n{Colors.CYAN}📖 About This Quiz:{Colors.ENDC}")
-    print(f"{Colors.YELLOW}This quiz tests your knowledge of mushroom cultivation including:")
-    print(f"• Basic growing techniques and conditions")
-    print(f"• Different mushroom varieties and their requirements")
-    print(f"• Substrate preparation and sterilization")
-    print(f"• Common cultivation terminology")
-    print(f"• Tips for successful mushroom farming{Colors.ENDC}\n")
-
+    get_renderer().write(
+        f"\n{Colors.CYAN}📖 About This Quiz:{Colors.ENDC}\n"
+        f"{Colors.YELLOW}This quiz tests your knowledge of mushroom cultivation including:\n"
+        f"• Basic growing techniques and conditions\n"
+        f"• Different mushroom varieties and their requirements\n"
+        f"• Substrate preparation and sterilization\n"
+        f"• Common cultivation terminology\n"
+        f"• Tips for successful mushroom farming{Colors.ENDC}\n\n"
+    )
@@ -10,7 +10,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-23
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 License: MIT
 
 Description:
@@ -20,6 +20,29 @@ Description:
     
 Test Modules:
     - test_question_loader: Tests for question loading and filtering
+    - test_question: Tests for compact Question records
+    - test_question_bank: Tests for the indexed question bank
+    - test_question_source: Tests for streamed, reservoir-sampled question sources
+    - test_binary_bank: Tests for memory-mapped binary question banks
+    - test_compiler: Tests for the bank compiler and its committed outputs
+    - test_dedup: Tests for near-duplicate question detection
+    - test_search: Tests for ranked keyword search and study quizzes
+    - test_quiz_session: Tests for the headless quiz state machine
+    - test_quiz_spec: Tests for seeded, reproducible quizzes
+    - test_papers: Tests for bulk paper generation and formats
+    - test_stats_store: Tests for the SQLite statistics store
+    - test_review: Tests for spaced-repetition review scheduling
+    - test_adaptive: Tests for the item response theory adaptive mode
+    - test_quiz_server: Tests for the multi-session quiz server
+    - test_http_api: Tests for the HTTP JSON quiz API
+    - test_loadtest: Tests for the simulated-player load tester
+    - test_scheduler: Tests for the deadline scheduler and timed input
+    - test_instrumentation: Tests for per-phase quiz timing
+    - test_metrics: Tests for Prometheus metrics and /metrics endpoints
+    - test_event_log: Tests for the binary answer event log
+    - test_stdin_reader: Tests for the shared, cancellable stdin reader
+    - test_renderer: Tests for the single-write screen renderer
+    - test_benchmarks: Tests for the benchmark harness and reports
     
 Usage:
     python -m pytest tests/
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Adaptive Quiz Module 🧪
+
+Tests for item parameters, ability estimation and adaptive sessions.
+
+File: test_adaptive.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the adaptive quiz mode: default and
+    calibrated 3PL item parameters, picking the most informative unused
+    item, the posterior ability estimate, AdaptiveSession following the
+    player's answers, and the 'adaptive' difficulty in QuizGame and the
+    server protocol.
+
+Test Classes:
+    - TestAdaptive: Main test class for adaptive mode functionality
+
+Usage:
+    python -m pytest tests/test_adaptive.py
+    python -m unittest tests.test_adaptive
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import random
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame
+from mushroom_quiz.core.adaptive import (AbilityEstimate, AdaptiveSession, ItemModel,
+                                         MAX_GUESSING, ability_level, get_item_model)
+from mushroom_quiz.data import get_question_bank
+from mushroom_quiz.server.protocol import validate_settings
+
+def make_question(text, difficulty, **params):
+    """Build a minimal question dictionary."""
+    question = {
+        'question': text, 'options': ['A', 'B', 'C', 'D'], 'answer': 'A',
+        'explanation': '', 'topic': 'timing', 'difficulty': difficulty,
+    }
+    question.update(params)
+    return question
+
+def answer(session, correct):
+    """Answer the open question of a session right or wrong."""
+    asked = session.current
+    options = asked.options
+    right = options.index(asked.question['answer']) + 1
+    return session.submit_answer(right if correct else (right % len(options)) + 1)
+
+class TestAdaptive(unittest.TestCase):
+    """Test cases for adaptive quiz functionality"""
+
+    def test_default_and_calibrated_parameters(self):
+        """Test item parameters come from difficulty labels or calibration keys"""
+        model = ItemModel([
+            make_question("q1", "beginner"),
+            make_question("q2", "advanced", irt_a=1.7, irt_b=2.2, irt_c=0.1),
+        ])
+        self.assertEqual(model.parameters(0), (1.0, -1.0, 0.25))
+        self.assertEqual(model.parameters(1), (1.7, 2.2, 0.1))
+
+    def test_single_option_items(self):
+        """Test a one-option item keeps its guessing floor below 1 and can be scored"""
+        model = ItemModel([
+            make_question("q1", "beginner", options=['A']),
+            make_question("q2", "beginner", irt_c=1.0),
+        ])
+        self.assertEqual(model.parameters(0), (1.0, -1.0, MAX_GUESSING))
+        self.assertEqual(model.parameters(1)[2], MAX_GUESSING)
+        self.assertTrue(all(value >= 0 for value in model.information(0.0)))
+        self.assertIn(model.pick(0.0, model.new_mask()), (0, 1))
+        estimate = AbilityEstimate()
+        estimate.update(*model.parameters(0), False)
+        estimate.update(*model.parameters(0), True)
+        self.assertLess(estimate.theta, 0.0)
+
+    def test_pick_most_informative_item(self):
+        """Test the item nearest the ability is picked and then masked out"""
+        model = ItemModel([make_question(f"q{b}", "mixed", irt_b=b, irt_c=0.0) for b in (-2, 0, 2)])
+        available = model.new_mask()
+        self.assertEqual(model.pick(1.9, available), 2)
+        self.assertEqual(model.pick(1.9, available), 1)
+        self.assertEqual(model.pick(1.9, available), 0)
+        self.assertIsNone(model.pick(1.9, available))
+
+    def test_ties_are_broken_at_random(self):
+        """Test equally informative items are not always picked in bank order"""
+        model = ItemModel([make_question(f"q{i}", "intermediate") for i in range(10)])
+        firsts = {model.pick(0.0, model.new_mask(), random.Random(seed)) for seed in range(50)}
+        self.assertGreater(len(firsts), 1)
+
+    def test_ability_estimate_follows_answers(self):
+        """Test correct answers raise the estimate and every answer narrows it"""
+        estimate = AbilityEstimate()
+        self.assertAlmostEqual(estimate.theta, 0.0, places=6)
+        prior_se = estimate.standard_error
+        estimate.update(1.0, 0.0, 0.25, True)
+        self.assertGreater(estimate.theta, 0.0)
+        self.assertLess(estimate.standard_error, prior_se)
+
+        estimate = AbilityEstimate()
+        estimate.update(1.0, 0.0, 0.25, False)
+        self.assertLess(estimate.theta, 0.0)
+
+    def test_ability_level(self):
+        """Test abilities map to difficulty labels"""
+        self.assertEqual(ability_level(-1.2), 'beginner')
+        self.assertEqual(ability_level(0.1), 'intermediate')
+        self.assertEqual(ability_level(0.9), 'advanced')
+
+    def test_session_moves_towards_players_level(self):
+        """Test strong players get harder questions and weak players easier ones"""
+        model = get_item_model(get_question_bank())
+        for correct, level in ((True, 'advanced'), (False, 'beginner')):
+            session = AdaptiveSession(model, 10, random.Random(1))
+            asked = []
+            while not session.finished:
+                asked.append(session.next_question().question)
+                answer(session, correct)
+            self.assertEqual(len(asked), 10)
+            self.assertEqual(len({q['question'] for q in asked}), 10)
+            self.assertEqual(asked[-1]['difficulty'], level)
+            self.assertEqual(ability_level(session.ability), level)
+            self.assertEqual(session.summary().score, 10 if correct else 0)
+
+    def test_session_stops_at_target_precision(self):
+        """Test a session ends early once the standard error is small enough"""
+        session = AdaptiveSession(get_item_model(get_question_bank()), 100, random.Random(2),
+                                  target_se=0.8)
+        while not session.finished:
+            session.next_question()
+            answer(session, True)
+        self.assertLess(session.total, 100)
+        self.assertEqual(session.answered, session.total)
+        self.assertLessEqual(session.standard_error, 0.8)
+
+    def test_session_stops_when_bank_is_exhausted(self):
+        """Test a session never asks for more questions than the bank holds"""
+        model = ItemModel([make_question(f"q{i}", "beginner") for i in range(3)])
+        session = AdaptiveSession(model, 10)
+        self.assertEqual(session.total, 3)
+
+    def test_quiz_game_adaptive_mode(self):
+        """Test QuizGame runs adaptive sessions reproducibly from the seed"""
+        def play(seed):
+            session = QuizGame("adaptive", 5, seed=seed).new_session()
+            self.assertIsInstance(session, AdaptiveSession)
+            asked = []
+            for correct in (True, True, False, True, False):
+                asked.append(session.next_question())
+                answer(session, correct)
+            return [(a.question['question'], a.options) for a in asked]
+
+        self.assertEqual(play(42), play(42))
+
+    def test_protocol_accepts_adaptive(self):
+        """Test the server protocol accepts the adaptive difficulty"""
+        self.assertEqual(validate_settings("Adaptive", "5")[0], "adaptive")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Benchmark Harness 🧪
+
+Tests for the benchmark harness and its JSON reports.
+
+File: test_benchmarks.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module checks the pieces of the benchmark suite that other
+    releases rely on: the keys of throughput, latency and memory results, the
+    synthetic banks, and comparing two reports. The benchmarks themselves
+    are not run here.
+
+Test Classes:
+    - TestBenchmarkHarness: Main test class for the benchmark harness
+
+Usage:
+    python -m pytest tests/test_benchmarks.py
+    python -m unittest tests.test_benchmarks
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import json
+import unittest
+import sys
+import os
+
+# Add the repository root to path so the benchmarks package is importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.harness import (BenchConfig, build_report, compare_reports,
+                                latency_result, make_bank, measure, memory_result)
+
+class TestBenchmarkHarness(unittest.TestCase):
+    """Test cases for the benchmark harness"""
+
+    def test_measure_result_keys(self):
+        """Test that throughput results carry the comparable keys"""
+        result = measure("noop", lambda: None, {"size": 1}, repeat=2, min_time=0.001)
+        self.assertEqual(result["kind"], "throughput")
+        self.assertEqual(result["params"], {"size": 1})
+        self.assertLessEqual(result["best"], result["median"])
+        self.assertGreater(result["ops_per_sec"], 0)
+
+    def test_latency_result(self):
+        """Test latency summary statistics"""
+        result = latency_result("wake", [0.003, 0.001, 0.002])
+        self.assertEqual(result["samples"], 3)
+        self.assertEqual(result["best"], 0.001)
+        self.assertEqual(result["median"], 0.002)
+        self.assertEqual(result["max"], 0.003)
+
+    def test_memory_result(self):
+        """Test memory results report bytes per item under the comparable keys"""
+        result = memory_result("bank_memory", 6000, 10, {"bank_size": 10})
+        self.assertEqual(result["kind"], "memory")
+        self.assertEqual(result["median"], 600.0)
+        self.assertEqual(result["total_bytes"], 6000)
+
+    def test_make_bank(self):
+        """Test that synthetic banks cover every difficulty evenly"""
+        bank = make_bank(300)
+        self.assertEqual(len(bank), 300)
+        for difficulty in ("beginner", "intermediate", "advanced"):
+            self.assertEqual(bank.count(difficulty), 100)
+
+    def test_report_round_trip_and_compare(self):
+        """Test that reports serialise to JSON and compare by name and params"""
+        config = BenchConfig(repeat=1, min_time=0.0, bank_sizes=[100], samples=1)
+        old = build_report([latency_result("wake", [0.002])], config)
+        new = build_report([latency_result("wake", [0.001]),
+                            latency_result("wake", [0.001], {"pending": 2})], config)
+        old = json.loads(json.dumps(old))
+        rows = compare_reports(old, new)
+        self.assertEqual(len(rows), 1)
+        self.assertAlmostEqual(rows[0][4], 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Binary Question Bank Module 🧪
+
+Tests for memory-mapped binary banks.
+
+File: test_binary_bank.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for write_binary_bank() and
+    MappedQuestionBank: round trips of every field, difficulty and topic
+    views, sampling and id lookups matching the in-memory bank, pickling
+    by path, rejecting files that are not binary banks, item models read
+    from the records without decoding questions, and opening binary banks
+    through the loader and the 'pack' command.
+
+Test Classes:
+    - TestBinaryBank: Main test class for binary question banks
+
+Usage:
+    python -m pytest tests/test_binary_bank.py
+    python -m unittest tests.test_binary_bank
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import io
+import os
+import pickle
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.app import main
+from mushroom_quiz.core.adaptive import ItemModel, get_item_model
+from mushroom_quiz.data import (MappedQuestionBank, QuestionBank, get_question_bank,
+                                open_question_source, question_id, write_binary_bank)
+
+class TestBinaryBank(unittest.TestCase):
+    """Test cases for binary question banks"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.bank = get_question_bank()
+        self.path = os.path.join(self.tmp, "bank.mqb")
+        write_binary_bank(self.bank, self.path, version=self.bank.version)
+        self.mapped = MappedQuestionBank(self.path)
+
+    def tearDown(self):
+        self.mapped.close()
+        shutil.rmtree(self.tmp)
+
+    def test_round_trip(self):
+        """Test every question reads back equal, in order, with the version kept"""
+        self.assertEqual(len(self.mapped), len(self.bank))
+        self.assertEqual(list(self.mapped), list(self.bank))
+        self.assertEqual(self.mapped[-1], self.bank[-1])
+        self.assertEqual(self.mapped[2:5], list(self.bank[2:5]))
+        self.assertEqual(self.mapped.version, self.bank.version)
+
+    def test_unicode_and_extra_keys(self):
+        """Test non-ASCII text and keys beyond the standard six survive"""
+        question = dict(self.bank[0], question="Qu'est-ce que le mycélium? 🍄",
+                        options=["Réseau", "Spore"], answer="Réseau", irt_a=1.25)
+        path = os.path.join(self.tmp, "extra.mqb")
+        self.assertEqual(write_binary_bank([question], path), 1)
+        bank = MappedQuestionBank(path)
+        self.assertEqual(bank[0], question)
+        self.assertEqual(bank[0].get('irt_a'), 1.25)
+        self.assertEqual(len(bank.version), 64)
+        bank.close()
+
+    def test_views_match_bank(self):
+        """Test difficulty and topic views, counts and lookups match the in-memory bank"""
+        for difficulty in self.bank.difficulties() + ["mixed"]:
+            self.assertEqual(list(self.mapped.by_difficulty(difficulty)), list(self.bank.by_difficulty(difficulty)))
+            self.assertEqual(self.mapped.count(difficulty), self.bank.count(difficulty))
+        for topic in self.bank.topics():
+            self.assertEqual(list(self.mapped.by_topic(topic)), list(self.bank.by_topic(topic)))
+        self.assertEqual(self.mapped.by_difficulty("expert"), ())
+        with self.assertRaises(IndexError):
+            self.mapped.by_difficulty("beginner")[self.bank.count("beginner")]
+
+    def test_sample_and_get(self):
+        """Test samples equal the in-memory bank's for a seed, and ids are found"""
+        for difficulty in ("beginner", "mixed", "expert"):
+            self.assertEqual(self.mapped.sample(difficulty, 5, random.Random(6)),
+                             self.bank.sample(difficulty, 5, random.Random(6)))
+        for question in self.bank:
+            self.assertEqual(self.mapped.get(question_id(question)), question)
+        self.assertIsNone(self.mapped.get(12345))
+
+    def test_item_model_reads_records_lazily(self):
+        """Test the adaptive item model of a mapped bank decodes no questions to build"""
+        questions = [dict(self.bank[0], irt_a=1.7, irt_b=0.4), dict(self.bank[1], options=["Yes"], answer="Yes"),
+                     self.bank[2]]
+        path = os.path.join(self.tmp, "calibrated.mqb")
+        write_binary_bank(questions, path)
+        bank = MappedQuestionBank(path)
+        self.addCleanup(bank.close)
+        with mock.patch.object(bank, '_decode', wraps=bank._decode) as decoded:
+            model = get_item_model(bank)
+        self.assertEqual(decoded.call_count, 0)
+        expected = ItemModel(questions)
+        self.assertEqual([model.parameters(i) for i in range(3)], [expected.parameters(i) for i in range(3)])
+        self.assertEqual(model.questions[1], questions[1])
+
+    def test_pickles_by_path(self):
+        """Test pickles hold the path, so worker processes map the same file"""
+        self.assertLess(len(pickle.dumps(self.mapped)), 200)
+        copy = pickle.loads(pickle.dumps(self.mapped))
+        self.assertEqual(copy[7], self.bank[7])
+        copy.close()
+
+    def test_rejects_other_files(self):
+        """Test files that are not binary banks raise ValueError"""
+        for name, content in (("empty.mqb", b""), ("json.mqb", b'[{"question": "x"}]' * 10)):
+            path = os.path.join(self.tmp, name)
+            with open(path, 'wb') as f:
+                f.write(content)
+            with self.assertRaises(ValueError):
+                MappedQuestionBank(path)
+
+    def test_loader_and_pack_command(self):
+        """Test 'pack' writes a bank the loader opens, filtered by topic if asked"""
+        path = os.path.join(self.tmp, "packed.mqb")
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["pack", path]), 0)
+            self.assertEqual(main(["pack", os.path.join(self.tmp, "packed.bin")]), 2)
+        source = open_question_source(path)
+        self.assertIsInstance(source, MappedQuestionBank)
+        self.assertEqual(source.version, self.bank.version)
+        topical = open_question_source(path, topic="sterilization")
+        self.assertIsInstance(topical, QuestionBank)
+        self.assertEqual(list(topical), list(self.bank.by_topic("sterilization")))
+        source.close()
+
+if __name__ == '__main__':
+    unittest.main()
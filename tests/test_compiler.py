@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Question Bank Compiler Module 🧪
+
+Tests for building the web shards and legacy module from questions.json.
+
+File: test_compiler.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the bank compiler: per-difficulty shards
+    named by content hash with identical gzip copies, the generated loader
+    naming every shard, the legacy Python module reproducing the bank,
+    deterministic output, check mode, removal of stale shards, and the
+    repository's own compiled outputs being up to date.
+
+Test Classes:
+    - TestCompiler: Main test class for the bank compiler
+
+Usage:
+    python -m pytest tests/test_compiler.py
+    python -m unittest tests.test_compiler
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.app import main
+from mushroom_quiz.data.compiler import compile_bank
+from mushroom_quiz.data.question_loader import QUESTIONS_FILE
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+class TestCompiler(unittest.TestCase):
+    """Test cases for the bank compiler"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.web = os.path.join(self.tmp, "web")
+        self.python = os.path.join(self.tmp, "quiz_questions.py")
+        with open(QUESTIONS_FILE, encoding='utf-8') as f:
+            self.questions = json.load(f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def compile(self, **kwargs):
+        return compile_bank(QUESTIONS_FILE, self.web, self.python, **kwargs)
+
+    def shard_names(self):
+        return sorted(os.listdir(os.path.join(self.web, "data")))
+
+    def test_shards_by_difficulty(self):
+        """Test each difficulty gets a content-hashed shard and a matching gzip copy"""
+        self.compile()
+        for difficulty in ("beginner", "intermediate", "advanced"):
+            names = [name for name in self.shard_names()
+                     if name.startswith(f"questions-{difficulty}.") and name.endswith(".json")]
+            self.assertEqual(len(names), 1)
+            path = os.path.join(self.web, "data", names[0])
+            with open(path, 'rb') as f:
+                content = f.read()
+            self.assertIn(hashlib.sha256(content).hexdigest()[:12], names[0])
+            self.assertEqual(json.loads(content), [q for q in self.questions if q['difficulty'] == difficulty])
+            with gzip.open(path + ".gz", 'rb') as f:
+                self.assertEqual(f.read(), content)
+
+    def test_loader_names_current_shards(self):
+        """Test the generated questions.js points at the shards on disk"""
+        self.compile()
+        with open(os.path.join(self.web, "questions.js"), encoding='utf-8') as f:
+            loader = f.read()
+        for name in self.shard_names():
+            if name.endswith(".json"):
+                self.assertIn(f'"data/{name}"', loader)
+        self.assertIn("function loadQuestions(difficulty)", loader)
+        self.assertNotIn("What is mycelium?", loader)
+
+    def test_python_module_reproduces_bank(self):
+        """Test the legacy module holds the same questions and statistics"""
+        self.compile()
+        module = runpy.run_path(self.python)
+        self.assertEqual(module['QUESTIONS'], self.questions)
+        self.assertEqual(module['get_difficulty_distribution'](),
+                         {"beginner": 38, "intermediate": 46, "advanced": 27})
+        self.assertIn("Total Questions: 111", module['__doc__'])
+
+    def test_recompile_and_check(self):
+        """Test an unchanged bank rewrites nothing and check mode spots edits"""
+        first = self.compile()
+        self.assertIn(self.python, first.written)
+        again = self.compile()
+        self.assertEqual((again.written, again.removed), ([], []))
+
+        with open(self.python, 'a', encoding='utf-8') as f:
+            f.write("# hand edit\n")
+        checked = self.compile(check=True)
+        self.assertEqual(checked.written, [self.python])
+        with open(self.python, encoding='utf-8') as f:
+            self.assertIn("# hand edit", f.read())
+
+    def test_stale_shards_removed(self):
+        """Test shards of an older bank are removed, keeping copies of current ones"""
+        self.compile()
+        data = os.path.join(self.web, "data")
+        current = next(name for name in self.shard_names() if name.endswith(".json"))
+        for name in ("questions-beginner.000000000000.json", "questions-beginner.000000000000.json.gz",
+                     current + ".br", "notes.txt"):
+            with open(os.path.join(data, name), 'wb') as f:
+                f.write(b"old")
+        result = self.compile()
+        self.assertEqual([os.path.basename(path) for path in result.removed],
+                         ["questions-beginner.000000000000.json", "questions-beginner.000000000000.json.gz"])
+        self.assertIn(current + ".br", self.shard_names())
+        self.assertIn("notes.txt", self.shard_names())
+
+    def test_compile_command(self):
+        """Test the command writes outputs, then reports them up to date"""
+        os.makedirs(self.web)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(["compile", "--web-dir", self.web, "--python", self.python]), 0)
+            self.assertEqual(main(["compile", "--check", "--web-dir", self.web, "--python", self.python]), 0)
+            self.assertEqual(main(["compile", "--web-dir", os.path.join(self.tmp, "missing")]), 2)
+
+    def test_repository_outputs_up_to_date(self):
+        """Test the committed web shards and quiz_questions.py match questions.json"""
+        result = compile_bank(QUESTIONS_FILE, os.path.join(ROOT, "web"),
+                              os.path.join(ROOT, "quiz_questions.py"), check=True)
+        # Brotli copies are only produced where the optional package is installed
+        written = [path for path in result.written if not path.endswith(".br")]
+        self.assertEqual((written, result.removed), ([], []),
+                         "run 'mushroom-quiz compile' from the repository root")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Near-Duplicate Detection Module 🧪
+
+Tests for MinHash signatures, the LSH index and duplicate clustering.
+
+File: test_dedup.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for near-duplicate detection: shingling that
+    ignores case, punctuation and option order, densified signatures,
+    catching lightly edited questions, leaving distinct questions alone,
+    clustering, and the 'duplicates' command.
+
+Test Classes:
+    - TestDuplicateIndex: Main test class for near-duplicate detection
+
+Usage:
+    python -m pytest tests/test_dedup.py
+    python -m unittest tests.test_dedup
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.app import main
+from mushroom_quiz.data import DuplicateIndex, get_question_bank
+from mushroom_quiz.data.dedup import (find_duplicate_clusters, minhash_signature, optimal_bands,
+                                      question_shingles)
+
+def edited(question, old, new):
+    """Copy a question with one phrase of its text replaced and options reversed."""
+    copy = dict(question)
+    copy['question'] = question['question'].replace(old, new)
+    copy['options'] = list(reversed(question['options']))
+    return copy
+
+class TestDuplicateIndex(unittest.TestCase):
+    """Test cases for near-duplicate detection"""
+
+    def setUp(self):
+        self.bank = get_question_bank()
+
+    def test_shingles_ignore_case_punctuation_and_option_order(self):
+        """Test cosmetic differences do not change the shingles"""
+        question = self.bank[0]
+        variant = dict(question, question=question['question'].upper().replace('?', ' ?!'),
+                       options=list(reversed(question['options'])))
+        self.assertEqual(question_shingles(question), question_shingles(variant))
+
+    def test_signature_fills_every_bin(self):
+        """Test short texts still get a full, comparable signature"""
+        signature = minhash_signature(question_shingles({'question': 'Spore print?'}))
+        self.assertEqual(len(signature), 128)
+        self.assertNotIn((1 << 64) - 1, signature)
+
+    def test_flags_edited_question(self):
+        """Test a lightly reworded question is matched to its original"""
+        index = DuplicateIndex(self.bank)
+        for i in (0, 10, 50, 100):
+            question = self.bank[i]
+            last_word = question['question'].split()[-1]
+            matches = index.query(edited(question, last_word, last_word + "s"))
+            self.assertIn(i, [m.index for m in matches])
+
+    def test_distinct_questions_not_flagged(self):
+        """Test the bundled bank has no near-duplicates at the default threshold"""
+        self.assertEqual(find_duplicate_clusters(self.bank), [])
+
+    def test_add_reports_earlier_duplicates(self):
+        """Test add() reports matches before indexing the new question"""
+        index = DuplicateIndex()
+        question = self.bank[3]
+        self.assertEqual(index.add(question), [])
+        matches = index.add(dict(question))
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].index, 0)
+        self.assertEqual(matches[0].similarity, 1.0)
+        self.assertEqual(len(index), 2)
+
+    def test_clusters_link_duplicates(self):
+        """Test clustering groups copies of the same question together"""
+        a, b = self.bank[5], self.bank[20]
+        questions = [a, b, dict(a), self.bank[30], dict(b), dict(a)]
+        self.assertEqual(find_duplicate_clusters(questions), [[0, 2, 5], [1, 4]])
+
+    def test_invalid_settings(self):
+        """Test inconsistent signature settings are rejected"""
+        with self.assertRaises(ValueError):
+            DuplicateIndex(num_perm=100)
+        with self.assertRaises(ValueError):
+            DuplicateIndex(num_perm=64, bands=12)
+        for threshold in (0, 1.5):
+            with self.assertRaises(ValueError):
+                DuplicateIndex(threshold=threshold)
+
+    def test_banding_follows_threshold(self):
+        """Test pairs at any threshold usually become candidates, and far less similar ones rarely"""
+        self.assertEqual(optimal_bands(0.8), (16, 8))
+        for threshold in (0.3, 0.5, 0.7, 0.9):
+            index = DuplicateIndex(threshold=threshold)
+            self.assertLessEqual(index.bands * index.rows, index.num_perm)
+
+            def collide(s):
+                return 1 - (1 - s ** index.rows) ** index.bands
+
+            self.assertGreater(collide(threshold), 0.9)
+            self.assertLess(collide(threshold - 0.3), 0.2)
+        self.assertEqual((DuplicateIndex(bands=32).bands, DuplicateIndex(bands=32).rows), (32, 4))
+
+    def test_low_threshold_finds_loose_duplicates(self):
+        """Test a heavily reworded question is found at a low threshold"""
+        question = self.bank[18]
+        reworded = dict(question, options=[option + " grown outdoors on hardwood logs"
+                                           for option in question['options']])
+        index = DuplicateIndex(self.bank, threshold=0.5)
+        matches = {m.index: m.similarity for m in index.query(reworded)}
+        self.assertIn(18, matches)
+        self.assertLess(matches[18], 0.6)
+        # The banding for 0.8 would rarely even compare the pair
+        self.assertNotIn(18, [m.index for m in DuplicateIndex(self.bank, threshold=0.5, bands=16)
+                              .query(reworded)])
+
+    def test_duplicates_command_checks_submissions(self):
+        """Test 'duplicates --check' flags submissions and sets the exit status"""
+        question = self.bank[7]
+        last_word = question['question'].split()[-1]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'new.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump([edited(question, last_word, last_word + "s")], f)
+            out = io.StringIO()
+            with redirect_stdout(out):
+                status = main(["duplicates", "--check", path])
+        self.assertEqual(status, 1)
+        self.assertIn(question['question'], out.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Answer Event Log Module 🧪
+
+Tests for the append-only binary answer event log.
+
+File: test_event_log.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for EventLog and read_events: records
+    reading back exactly, group commit by count and by interval,
+    size-based rotation and pruning, torn trailing records, failed and
+    partial writes, segment numbers taken by another writer, appends from
+    many threads, and the terminal quiz and HTTP API logging their answers.
+
+Test Classes:
+    - TestEventLog: Main test class for the answer event log
+
+Usage:
+    python -m pytest tests/test_event_log.py
+    python -m unittest tests.test_event_log
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import errno
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.app import build_parser
+from mushroom_quiz.core import QuizGame, quiz_engine
+from mushroom_quiz.data.question_bank import question_id
+from mushroom_quiz.server import QuizApi
+from mushroom_quiz.stats import EventLog, read_events
+from mushroom_quiz.stats import event_log
+from mushroom_quiz.stats.event_log import AnswerEvent, RECORD_SIZE
+
+HEADER_SIZE = 16
+
+class TestEventLog(unittest.TestCase):
+    """Test cases for the answer event log"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_records_read_back(self):
+        """Test every field survives the round trip, including unknown latency"""
+        with EventLog(self.directory, flush_interval=None) as log:
+            log.append(2 ** 62, -5, 3, True, False, 1.25, answered_at=1700000000.5)
+            log.append(7, 8, -1, False, True, None, answered_at=1700000001.0)
+            log.append(7, 9, 0, False, False, 1e9, answered_at=1700000002.0)
+        events = list(read_events(self.directory))
+        self.assertEqual(events[0], AnswerEvent(2 ** 62, -5, 3, True, False, 1.25, 1700000000.5))
+        self.assertEqual(events[1], AnswerEvent(7, 8, -1, False, True, None, 1700000001.0))
+        self.assertAlmostEqual(events[2].latency, 4294.967294)
+        self.assertEqual(RECORD_SIZE, 32)
+
+    def test_group_commit_by_count(self):
+        """Test nothing is written until a batch fills, then the batch at once"""
+        log = EventLog(self.directory, batch_size=4, flush_interval=None)
+        for number in range(3):
+            log.append(1, number, 0, True, False, 0.5)
+        self.assertEqual(os.path.getsize(log.path), HEADER_SIZE)
+        self.assertEqual(log.pending, 3)
+        log.append(1, 3, 0, True, False, 0.5)
+        self.assertEqual(os.path.getsize(log.path), HEADER_SIZE + 4 * RECORD_SIZE)
+        self.assertEqual((log.pending, log.written), (0, 4))
+        log.append(1, 4, 0, True, False, 0.5)
+        log.close()
+        self.assertEqual([event.question_id for event in read_events(self.directory)], list(range(5)))
+        with self.assertRaises(ValueError):
+            log.append(1, 5, 0, True, False, 0.5)
+
+    def test_group_commit_by_interval(self):
+        """Test a partial batch is written by the flusher within its interval"""
+        with EventLog(self.directory, flush_interval=0.01) as log:
+            log.append(1, 2, 0, True, False, 0.5)
+            deadline = time.monotonic() + 2
+            while log.pending and time.monotonic() < deadline:
+                time.sleep(0.005)
+            self.assertEqual(len(list(read_events(self.directory))), 1)
+
+    def test_rotation_and_pruning(self):
+        """Test segments rotate at max_bytes, old ones are pruned, and reopening starts a new one"""
+        max_bytes = HEADER_SIZE + 4 * RECORD_SIZE
+        with EventLog(self.directory, batch_size=2, flush_interval=None, max_bytes=max_bytes) as log:
+            for number in range(10):
+                log.append(1, number, 0, False, False, 0.1)
+        names = sorted(os.listdir(self.directory))
+        self.assertEqual(names, ["answers-000001.evl", "answers-000002.evl", "answers-000003.evl"])
+        self.assertTrue(all(os.path.getsize(os.path.join(self.directory, name)) <= max_bytes
+                            for name in names))
+        self.assertEqual([event.question_id for event in read_events(self.directory)], list(range(10)))
+
+        with EventLog(self.directory, batch_size=2, flush_interval=None, max_bytes=max_bytes,
+                      max_segments=2) as log:
+            self.assertTrue(log.path.endswith("answers-000004.evl"))
+            log.append(1, 10, 0, False, False, 0.1)
+        self.assertEqual(sorted(os.listdir(self.directory)), ["answers-000003.evl", "answers-000004.evl"])
+        self.assertEqual([event.question_id for event in read_events(self.directory)], [8, 9, 10])
+        with self.assertRaises(ValueError):
+            EventLog(self.directory, batch_size=8, max_bytes=100)
+
+    def test_torn_record_and_foreign_file(self):
+        """Test a partial last record is ignored and a foreign segment is rejected"""
+        with EventLog(self.directory, flush_interval=None) as log:
+            log.append(1, 2, 0, True, False, 0.5)
+            path = log.path
+        with open(path, 'ab') as f:
+            f.write(b"\x01" * (RECORD_SIZE // 2))
+        self.assertEqual(len(list(read_events(self.directory))), 1)
+        with open(os.path.join(self.directory, "answers-000009.evl"), 'wb') as f:
+            f.write(b"NOTALOG!" + bytes(40))
+        with self.assertRaises(ValueError):
+            list(read_events(self.directory))
+
+    def test_failed_writes_are_retried(self):
+        """Test a full disk raises OSError on every commit and loses nothing once it clears"""
+        log = EventLog(self.directory, batch_size=2, flush_interval=None)
+        real_write = os.write
+        calls = []
+
+        def full_disk(fd, data):
+            # First call writes a record and a half, then the disk is full
+            calls.append(len(data))
+            if len(calls) == 1:
+                return real_write(fd, bytes(data[:RECORD_SIZE + RECORD_SIZE // 2]))
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        log.append(1, 0, 0, True, False, 0.5)
+        with mock.patch.object(event_log.os, 'write', full_disk):
+            with self.assertRaises(OSError):
+                log.append(1, 1, 0, True, False, 0.5)
+            # Half a record is still buffered, so one more fits before the next commit
+            log.append(1, 2, 0, True, False, 0.5)
+            for _ in range(2):
+                with self.assertRaises(OSError):
+                    log.append(1, 3, 0, True, False, 0.5)
+        self.assertEqual((log.written, log.pending), (1, 2))
+        for number in (3, 4):
+            log.append(1, number, 0, True, False, 0.5)
+        log.close()
+        self.assertEqual([event.question_id for event in read_events(self.directory)], [0, 1, 2, 3, 4])
+
+    def test_segment_number_taken_by_another_writer(self):
+        """Test a log skips segment numbers another process created first"""
+        first = EventLog(self.directory, flush_interval=None)
+        # As if both processes listed the directory before either created a segment
+        with mock.patch.object(event_log, '_segments', return_value=[]):
+            second = EventLog(self.directory, flush_interval=None)
+        self.assertTrue(second.path.endswith("answers-000002.evl"))
+        first.append(1, 1, 0, True, False, 0.5)
+        second.append(2, 2, 0, True, False, 0.5)
+        first.close()
+        second.close()
+        self.assertEqual([event.session_id for event in read_events(self.directory)], [1, 2])
+
+    def test_threaded_appends(self):
+        """Test records appended from many threads are all written whole"""
+        log = EventLog(self.directory, batch_size=100, flush_interval=0.001)
+
+        def work(session):
+            for number in range(2000):
+                log.append(session, number, 1, True, False, 0.2)
+
+        threads = [threading.Thread(target=work, args=(session,)) for session in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        log.close()
+        events = list(read_events(self.directory))
+        self.assertEqual(len(events), 16000)
+        self.assertEqual({event.session_id for event in events}, set(range(8)))
+        self.assertTrue(all(event.option == 1 and event.latency == 0.2 for event in events))
+
+    def test_events_option_before_or_after_command(self):
+        """Test --events is kept whether given before or after serve and api"""
+        parser = build_parser()
+        for command in ("serve", "api"):
+            self.assertEqual(parser.parse_args(["--events", "logs", command]).events, "logs")
+            self.assertEqual(parser.parse_args([command, "--events", "more"]).events, "more")
+            self.assertIsNone(parser.parse_args([command]).events)
+
+    def test_quiz_logs_answers(self):
+        """Test run_quiz() logs each answer under one session id with its option index"""
+        answers = iter([1, None, 2])
+        asked = []
+        game = QuizGame("beginner", 3, seed=9, events=EventLog(self.directory, flush_interval=None))
+        with mock.patch.multiple(quiz_engine, show_screen=mock.DEFAULT, display_result=mock.DEFAULT,
+                                 display_final_score=mock.DEFAULT, display_study_recommendations=mock.DEFAULT,
+                                 render_question=lambda number, total, question, options:
+                                     asked.append((question, options)),
+                                 get_user_input=lambda *args: next(answers)), \
+                mock.patch.object(quiz_engine.time, 'sleep'), \
+                mock.patch('builtins.input'):
+            game.run_quiz()
+        game.events.close()
+
+        events = list(read_events(self.directory))
+        self.assertEqual(len(events), 3)
+        self.assertEqual({event.session_id for event in events}, {game.session_id})
+        self.assertEqual([event.question_id for event in events],
+                         [question_id(question) for question, _ in asked])
+        for event, (question, options), number in zip(events, asked, (1, None, 2)):
+            if number is None:
+                self.assertEqual((event.option, event.is_timeout), (-1, True))
+            else:
+                chosen = options[number - 1]
+                self.assertEqual(event.option, list(question['options']).index(chosen))
+                self.assertEqual(event.is_correct, chosen == question['answer'])
+            self.assertIsNotNone(event.latency)
+
+    def test_http_api_logs_answers(self):
+        """Test the HTTP API logs answers to the process's event log"""
+        log = EventLog(self.directory, flush_interval=None)
+        with mock.patch.object(event_log, '_EVENT_LOG', log):
+            api = QuizApi()
+            status, _, body = api.handle("POST", "/api/quizzes", b'{"num_questions": 2}')
+            path = f"/api/quizzes/{json.loads(body)['id']}"
+            for _ in range(2):
+                api.handle("GET", path + "/question")
+                api.handle("POST", path + "/answer", b'{"answer": 2}')
+        log.close()
+        events = list(read_events(self.directory))
+        self.assertEqual(len(events), 2)
+        self.assertEqual(len({event.session_id for event in events}), 1)
+        self.assertTrue(all(0 <= event.option < 4 and not event.is_timeout for event in events))
+
+if __name__ == '__main__':
+    unittest.main()
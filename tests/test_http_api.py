@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for HTTP Quiz API Module 🧪
+
+Tests for the HTTP JSON quiz API.
+
+File: test_http_api.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for QuizApi and its HTTP server: playing
+    complete quizzes over one kept-alive connection, ETag revalidation of
+    the bank metadata, seeded quizzes matching QuizGame, payloads never
+    revealing answers early, timers enforced at answer time, the payload
+    cache, quiz expiry, request validation and serving the web app.
+
+Test Classes:
+    - TestHttpApi: Main test class for the HTTP quiz API
+
+Usage:
+    python -m pytest tests/test_http_api.py
+    python -m unittest tests.test_http_api
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import http.client
+import json
+import os
+import sys
+import threading
+import unittest
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame
+from mushroom_quiz.server import QuizApi, make_api_server
+from mushroom_quiz.server import protocol
+
+WEB_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web')
+
+class FakeClock:
+    """Monotonic clock the tests move by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestHttpApi(unittest.TestCase):
+    """Test cases for the HTTP quiz API"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.api = QuizApi(clock=self.clock)
+        self.server = make_api_server(self.api, "127.0.0.1", 0, web_dir=WEB_DIR)
+        self.thread = threading.Thread(target=self.server.serve_forever, args=(0.01,), daemon=True)
+        self.thread.start()
+        self.connection = http.client.HTTPConnection("127.0.0.1", self.server.server_address[1], timeout=5)
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, method, path, body=None, headers=None):
+        """Send one request on the shared connection; return (status, headers, decoded body)."""
+        data = json.dumps(body) if body is not None else None
+        self.connection.request(method, path, body=data, headers=headers or {})
+        response = self.connection.getresponse()
+        raw = response.read()
+        payload = json.loads(raw) if raw and response.getheader("Content-Type", "").startswith("application/json") else raw
+        return response.status, response, payload
+
+    def start(self, **settings):
+        status, response, quiz = self.request("POST", "/api/quizzes", settings)
+        self.assertEqual(status, 201, quiz)
+        self.assertEqual(response.getheader("Location"), f"/api/quizzes/{quiz['id']}")
+        return quiz
+
+    def test_full_quiz_on_one_connection(self):
+        """Test a whole quiz is played over a single kept-alive connection"""
+        quiz = self.start(difficulty="beginner", num_questions=4)
+        path = f"/api/quizzes/{quiz['id']}"
+        sock = self.connection.sock
+        numbers = []
+        while True:
+            status, _, message = self.request("GET", path + "/question")
+            self.assertEqual(status, 200)
+            if message["type"] == "summary":
+                break
+            numbers.append(message["number"])
+            self.assertNotIn("answer", message)
+            status, _, result = self.request("POST", path + "/answer", {"answer": 1})
+            self.assertEqual(result["type"], "result")
+        self.assertEqual(numbers, [1, 2, 3, 4])
+        self.assertEqual(message["total"], 4)
+        self.assertEqual(message["quiz"]["difficulty"], "beginner")
+        self.assertIs(self.connection.sock, sock)
+
+        self.assertEqual(self.request("DELETE", path)[0], 204)
+        self.assertEqual(self.request("GET", path + "/question")[0], 404)
+
+    def test_bank_metadata_etag(self):
+        """Test bank metadata is revalidated with a bodiless 304"""
+        status, response, bank = self.request("GET", "/api/bank")
+        self.assertEqual(status, 200)
+        self.assertEqual(bank["questions"], 111)
+        self.assertEqual(bank["difficulties"]["beginner"], 38)
+        self.assertIn("adaptive", bank["levels"])
+        etag = response.getheader("ETag")
+        self.assertEqual(etag, f'"{bank["version"]}"')
+        status, _, body = self.request("GET", "/api/bank", headers={"If-None-Match": etag})
+        self.assertEqual((status, body), (304, b""))
+
+    def test_seeded_quiz_matches_quiz_game(self):
+        """Test a seeded quiz asks the questions QuizGame selects for that seed"""
+        quiz = self.start(difficulty="intermediate", num_questions=3, seed=42)
+        expected = QuizGame("intermediate", 3, seed=42).new_session()
+        for _ in range(3):
+            asked = expected.next_question()
+            _, _, message = self.request("GET", f"/api/quizzes/{quiz['id']}/question")
+            self.assertEqual(message, protocol.question_payload(asked))
+            self.request("POST", f"/api/quizzes/{quiz['id']}/answer", {"answer": 2})
+            expected.submit_answer(2)
+
+    def test_question_repeats_until_answered(self):
+        """Test asking again returns the open question, from the payload cache"""
+        quiz = self.start(difficulty="advanced", num_questions=2)
+        path = f"/api/quizzes/{quiz['id']}/question"
+        first = self.request("GET", path)[2]
+        self.assertEqual(self.request("GET", path)[2], first)
+        self.assertEqual((self.api.cache.misses, self.api.cache.hits), (1, 1))
+
+    def test_timer_enforced_at_answer(self):
+        """Test an answer after the deadline (plus grace) is scored as a timeout"""
+        quiz = self.start(difficulty="beginner", num_questions=2, timer_seconds=10)
+        path = f"/api/quizzes/{quiz['id']}"
+        self.assertEqual(self.request("GET", path + "/question")[2]["time_limit"], 10)
+        self.clock.now += 11
+        self.assertFalse(self.request("POST", path + "/answer", {"answer": 1})[2]["timeout"])
+        self.request("GET", path + "/question")
+        self.clock.now += 13
+        result = self.request("POST", path + "/answer", {"answer": 1})[2]
+        self.assertTrue(result["timeout"])
+        self.assertIsNone(result["your_answer"])
+
+    def test_rejects_bad_requests(self):
+        """Test invalid settings, answers and routes get error payloads"""
+        status, _, error = self.request("POST", "/api/quizzes", {"difficulty": "expert"})
+        self.assertEqual((status, error["type"]), (400, "error"))
+        self.assertEqual(self.request("POST", "/api/quizzes", {"num_questions": 0})[0], 400)
+        quiz = self.start(num_questions=1)
+        path = f"/api/quizzes/{quiz['id']}"
+        self.assertEqual(self.request("POST", path + "/answer", {"answer": 1})[0], 409)
+        self.request("GET", path + "/question")
+        self.assertEqual(self.request("POST", path + "/answer", {"answer": 9})[0], 400)
+        self.assertEqual(self.request("POST", path + "/answer", {"answer": "1"})[0], 400)
+        self.assertEqual(self.request("GET", "/api/quizzes")[0], 405)
+        self.assertEqual(self.request("GET", "/api/nothing")[0], 404)
+        self.assertEqual(self.request("POST", "/api/quizzes", {"pad": "x" * 5000})[0], 413)
+
+    def test_idle_and_excess_quizzes_expire(self):
+        """Test quizzes expire when idle, and the least recently used goes first"""
+        api = QuizApi(max_quizzes=2, idle_seconds=60, clock=self.clock)
+        ids = []
+        for _ in range(3):
+            status, _, body = api.handle("POST", "/api/quizzes", b'{"num_questions": 1}')
+            ids.append(json.loads(body)["id"])
+        self.assertEqual(api.active_quizzes, 2)
+        self.assertEqual(api.handle("GET", f"/api/quizzes/{ids[0]}/question")[0], 404)
+        self.clock.now += 61
+        self.assertEqual(api.handle("GET", f"/api/quizzes/{ids[2]}/question")[0], 404)
+
+    def test_serves_web_app(self):
+        """Test the static web app is served from the same origin"""
+        status, response, body = self.request("GET", "/questions.js")
+        self.assertEqual(status, 200)
+        self.assertIn(b"loadQuestions", body)
+        self.assertEqual(self.request("GET", "/api/bank")[0], 200)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Phase Timing Module 🧪
+
+Tests for per-phase timing of terminal quizzes.
+
+File: test_instrumentation.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for Histogram and PhaseTimer: bucket bounds
+    and percentile accuracy, a fixed size whatever the number of samples,
+    marks measuring the time since the previous mark, QuizGame marking
+    every phase of a quiz, timing being off by default, and the text and
+    JSON reports.
+
+Test Classes:
+    - TestInstrumentation: Main test class for phase timing
+
+Usage:
+    python -m pytest tests/test_instrumentation.py
+    python -m unittest tests.test_instrumentation
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame, quiz_engine
+from mushroom_quiz.core.instrumentation import (Histogram, PhaseTimer, SUB_BUCKETS,
+                                                get_phase_timer)
+
+class FakeClock:
+    """Clock the tests move by hand."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for phase timing"""
+
+    def test_bucket_bounds(self):
+        """Test every duration falls at or below its bucket's upper bound"""
+        for seconds in (1e-9, 3e-7, 0.0015, 0.25, 1.0, 42.0):
+            index = Histogram.bucket(seconds)
+            self.assertLessEqual(seconds, Histogram.upper_bound(index))
+            self.assertGreater(seconds * (1 + 1.0 / SUB_BUCKETS), Histogram.upper_bound(index) * 0.999)
+        self.assertEqual(Histogram.bucket(0.0), 0)
+        self.assertEqual(Histogram.bucket(1e9), len(Histogram().counts) - 1)
+
+    def test_percentiles_within_bucket_error(self):
+        """Test percentiles are within one bucket of the exact values, with exact extremes"""
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(-5, 1.5) for _ in range(20000)]
+        histogram = Histogram()
+        for sample in samples:
+            histogram.add(sample)
+        ordered = sorted(samples)
+        for percent in (50, 90, 99):
+            exact = ordered[int(len(ordered) * percent / 100) - 1]
+            self.assertAlmostEqual(histogram.percentile(percent) / exact, 1, delta=1.0 / SUB_BUCKETS)
+        self.assertEqual((histogram.count, histogram.min, histogram.max), (20000, ordered[0], ordered[-1]))
+        self.assertAlmostEqual(histogram.mean, sum(samples) / len(samples))
+        self.assertEqual(len(histogram.counts), len(Histogram().counts))
+        self.assertIsNone(Histogram().percentile(50))
+
+    def test_marks_time_since_previous(self):
+        """Test each mark counts the time since the previous mark against its phase"""
+        clock = FakeClock()
+        timer = PhaseTimer(clock)
+        timer.start()
+        clock.now += 0.5
+        timer.mark("render")
+        clock.now += 2.0
+        timer.mark("input")
+        clock.now += 1.5
+        timer.mark("input")
+        self.assertEqual(timer.histograms["render"].total, 0.5)
+        self.assertEqual(timer.histograms["input"].count, 2)
+        self.assertEqual(timer.histograms["input"].max, 2.0)
+        snapshot = timer.snapshot()
+        self.assertEqual((snapshot["application"], snapshot["learner"]), (0.5, 3.5))
+        self.assertNotIn("select", snapshot["phases"])
+
+    def test_quiz_marks_every_phase(self):
+        """Test run_quiz() times each phase, keeping learner waits apart"""
+        clock = FakeClock()
+        timer = PhaseTimer(clock)
+        game = QuizGame("beginner", 3, seed=11, timing=timer)
+
+        def answer(*args):
+            clock.now += 4.0
+            return 1
+
+        def press_enter(prompt):
+            clock.now += 1.0
+
+        def draw(*args):
+            clock.now += 0.01
+
+        with mock.patch.multiple(quiz_engine, show_screen=draw, get_user_input=answer,
+                                 display_result=draw, display_final_score=draw,
+                                 display_study_recommendations=draw), \
+                mock.patch.object(quiz_engine.time, 'sleep'), \
+                mock.patch('builtins.input', press_enter):
+            game.run_quiz()
+
+        counts = {phase: row["count"] for phase, row in timer.snapshot()["phases"].items()}
+        self.assertEqual(counts, {"prepare": 1, "select": 3, "render": 3, "input": 3,
+                                  "evaluate": 3, "result": 3, "record": 3, "continue": 2})
+        snapshot = timer.snapshot()
+        self.assertAlmostEqual(snapshot["learner"], 3 * 4.0 + 2 * 1.0)
+        self.assertAlmostEqual(timer.histograms["render"].total, 0.03)
+        self.assertEqual(timer.questions, 3)
+
+    def test_disabled_by_default(self):
+        """Test games hold no timer unless timing is enabled"""
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('MUSHROOM_QUIZ_TIMING', None)
+            self.assertIsNone(get_phase_timer())
+            self.assertIsNone(QuizGame("beginner", 2).timing)
+
+    def test_reports(self):
+        """Test the text and JSON reports"""
+        clock = FakeClock()
+        timer = PhaseTimer(clock)
+        for seconds in (0.002, 0.004):
+            clock.now += seconds
+            timer.mark("evaluate")
+        clock.now += 6
+        timer.mark("input")
+        text = timer.format()
+        self.assertIn("evaluate", text)
+        self.assertIn("learner 6.000s", text)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "timings.json")
+            timer.dump(path)
+            with open(path, encoding='utf-8') as f:
+                report = json.load(f)
+        self.assertEqual(report["questions"], 2)
+        self.assertAlmostEqual(report["phases"]["evaluate"]["max"], 0.004)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Load Test Module 🧪
+
+Tests for the simulated-player load tester.
+
+File: test_loadtest.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the load tester: parsing think-time and
+    accuracy distributions, scenarios built from the menu presets, bots
+    playing full quizzes against the TCP server and the HTTP API with the
+    accuracy they were given, timed questions left to expire, percentile
+    reports, and connection errors being counted.
+
+Test Classes:
+    - TestLoadTest: Main test class for the load tester
+
+Usage:
+    python -m pytest tests/test_loadtest.py
+    python -m unittest tests.test_loadtest
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import asyncio
+import io
+import os
+import random
+import socket
+import sys
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.app import main
+from mushroom_quiz.server import QuizApi, QuizServer, make_api_server
+from mushroom_quiz.server.loadtest import (LoadStats, Scenario, format_report, load_test,
+                                           parse_distribution, preset_scenarios, select_scenarios)
+from mushroom_quiz.ui.terminal_ui import QUESTION_COUNT_PRESETS, TIMER_MODE_PRESETS
+
+def run_tcp(**options):
+    """Run a load test against a fresh TCP server on a free port."""
+    async def runner():
+        server = QuizServer("127.0.0.1", 0)
+        await server.start()
+        try:
+            return await load_test("tcp", server.host, server.port, **options)
+        finally:
+            await server.close()
+    return asyncio.run(runner())
+
+class TestLoadTest(unittest.TestCase):
+    """Test cases for the load tester"""
+
+    def test_parse_distribution(self):
+        """Test constants and each distribution kind parse, and bad ones are rejected"""
+        rng = random.Random(1)
+        self.assertEqual(parse_distribution("2.5").sample(rng), 2.5)
+        self.assertEqual(parse_distribution("uniform:1:3").params, (1.0, 3.0))
+        for text in ("exponential:2", "lognormal:4:0.5", "normal:1:5"):
+            self.assertTrue(all(parse_distribution(text).sample(rng) >= 0 for _ in range(100)))
+        self.assertTrue(all(0 <= parse_distribution("beta:7:3").sample(rng) <= 1 for _ in range(100)))
+        for text in ("fast", "uniform:1", "beta:0:1", "gamma:1:2", "-1"):
+            with self.assertRaises(ValueError):
+                parse_distribution(text)
+
+    def test_scenarios_from_presets(self):
+        """Test every menu combination is a scenario, selectable by wildcard"""
+        scenarios = preset_scenarios()
+        self.assertEqual(len(scenarios), 5 * len(QUESTION_COUNT_PRESETS) * len(TIMER_MODE_PRESETS))
+        by_name = {scenario.name: scenario for scenario in scenarios}
+        self.assertEqual(by_name["beginner-standard-timed"], Scenario("beginner-standard-timed", "beginner", 10, 30))
+        self.assertEqual(by_name["adaptive-quick-relaxed"].timer_seconds, None)
+        self.assertEqual([s.name for s in select_scenarios(["mixed-*-speed", "mixed-quick-speed"])],
+                         ["mixed-quick-speed", "mixed-standard-speed", "mixed-challenge-speed"])
+        self.assertEqual(len(select_scenarios(["all"])), len(scenarios))
+        with self.assertRaises(ValueError):
+            select_scenarios(["expert-*"])
+
+    def test_tcp_bots_play_full_quizzes(self):
+        """Test bots finish every quiz on the TCP server, always right at accuracy 1"""
+        scenarios = select_scenarios(["beginner-quick-relaxed", "adaptive-quick-relaxed"])
+        report = run_tcp(bots=20, quizzes=2, scenarios=scenarios, think="0", accuracy="1", seed=3)
+        self.assertEqual((report.quizzes, report.errors), (40, 0))
+        self.assertEqual((report.correct, report.wrong, report.timeouts), (200, 0, 0))
+        steps = {step.step: step for step in report.steps}
+        self.assertEqual(steps["connect"].count, 20)
+        self.assertEqual(steps["start"].count, 40)
+        self.assertEqual(steps["answer"].count, 200)
+        self.assertEqual(steps["quit"].count, 20)
+        self.assertLessEqual(steps["answer"].p50, steps["answer"].p99)
+        self.assertLessEqual(steps["answer"].p99, steps["answer"].max)
+
+    def test_timed_questions_expire(self):
+        """Test bots thinking past the time limit let the server's timer answer"""
+        scenario = Scenario("short", "beginner", 2, 1)
+        report = run_tcp(bots=3, scenarios=[scenario], think="5", accuracy="1", seed=4)
+        self.assertEqual((report.quizzes, report.errors), (3, 0))
+        self.assertEqual((report.correct, report.timeouts), (0, 6))
+
+    def test_http_bots(self):
+        """Test bots play through the HTTP API, always wrong at accuracy 0"""
+        server = make_api_server(QuizApi(), "127.0.0.1", 0)
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        try:
+            report = asyncio.run(load_test("http", "127.0.0.1", server.server_address[1], bots=10,
+                                           quizzes=2, scenarios=select_scenarios(["mixed-quick-*"]),
+                                           think="0", accuracy="0", seed=5))
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual((report.quizzes, report.errors), (20, 0))
+        self.assertEqual((report.correct, report.wrong), (0, 100))
+        steps = {step.step: step.count for step in report.steps}
+        self.assertEqual((steps["bank"], steps["create"], steps["question"]), (10, 20, 120))
+
+    def test_connection_errors_counted(self):
+        """Test a server that is not running shows up as connect errors"""
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        report = asyncio.run(load_test("tcp", "127.0.0.1", port, bots=4, quizzes=2, timeout=1))
+        self.assertEqual((report.quizzes, report.errors), (0, 8))
+        self.assertEqual(report.steps[0].step, "connect")
+        self.assertIsNone(report.steps[0].p50)
+        self.assertIn("connect", format_report(report))
+
+    def test_percentiles(self):
+        """Test nearest-rank percentiles of recorded latencies"""
+        stats = LoadStats()
+        for ms in range(1, 101):
+            stats.record("answer", ms / 1000)
+        stats.error("answer", "timeout")
+        step = stats.report("tcp", 1, 1.0).steps[0]
+        self.assertEqual((step.count, step.errors), (100, 1))
+        self.assertEqual((step.p50, step.p95, step.p99, step.max), (0.05, 0.095, 0.099, 0.1))
+
+    def test_loadtest_command(self):
+        """Test the command lists scenarios and rejects bad options"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main(["loadtest", "--list"]), 0)
+        self.assertIn("beginner-challenge-speed", out.getvalue())
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["loadtest", "--think", "soon"]), 2)
+            self.assertEqual(main(["loadtest", "--scenario", "expert-*"]), 2)
+            self.assertEqual(main(["loadtest", "--bots", "0"]), 2)
+
+if __name__ == '__main__':
+    unittest.main()
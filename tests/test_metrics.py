@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Metrics Module 🧪
+
+Tests for the Prometheus metrics registry and /metrics endpoints.
+
+File: test_metrics.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the metrics registry: the exact text
+    exposition and label escaping, exact counts from many threads, scrapes
+    never waiting on a writer's lock, the standalone /metrics server, and
+    the terminal quiz and HTTP API recording into the default registry
+    under their frontend labels, and restarted, disconnected or deleted
+    quizzes counted as abandoned.
+
+Test Classes:
+    - TestMetrics: Main test class for quiz metrics
+
+Usage:
+    python -m pytest tests/test_metrics.py
+    python -m unittest tests.test_metrics
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import sys
+import threading
+import unittest
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.app import build_parser
+from mushroom_quiz.core import QuizGame, quiz_engine
+from mushroom_quiz.server import QuizApi, QuizServer, make_api_server
+from mushroom_quiz.stats import MetricsRegistry, get_registry, start_metrics_server
+from mushroom_quiz.stats import metrics
+from mushroom_quiz.stats.metrics import CONTENT_TYPE, parse_address
+
+def value(metric, *labels):
+    """Current value of one series of a default-registry metric."""
+    return metric.labels(*labels).value
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for quiz metrics"""
+
+    def test_exposition_format(self):
+        """Test counters, gauges and histograms render in the Prometheus text format"""
+        registry = MetricsRegistry()
+        answers = registry.counter("answers_total", "Answers scored.", ["outcome"])
+        active = registry.gauge("active", "Sessions in progress.")
+        latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+        answers.labels("correct").inc(3)
+        answers.labels(outcome='say "hi"\n').inc()
+        active.labels().set(2)
+        for seconds in (0.05, 0.5, 5):
+            latency.labels().observe(seconds)
+        self.assertEqual(registry.exposition(), "\n".join([
+            "# HELP answers_total Answers scored.",
+            "# TYPE answers_total counter",
+            'answers_total{outcome="correct"} 3',
+            'answers_total{outcome="say \\"hi\\"\\n"} 1',
+            "# HELP active Sessions in progress.",
+            "# TYPE active gauge",
+            "active 2",
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 2',
+            'latency_seconds_bucket{le="+Inf"} 3',
+            "latency_seconds_sum 5.55",
+            "latency_seconds_count 3",
+        ]) + "\n")
+        with self.assertRaises(ValueError):
+            registry.counter("active", "Again.")
+        with self.assertRaises(ValueError):
+            answers.labels("correct", "extra")
+        with self.assertRaises(ValueError):
+            answers.labels("correct").inc(-1)
+
+    def test_threaded_counts_exact(self):
+        """Test increments from many threads are never lost"""
+        registry = MetricsRegistry()
+        counter = registry.counter("hits_total", "Hits.", ["thread"])
+        histogram = registry.histogram("seconds", "Seconds.")
+
+        def work():
+            series = counter.labels("all")
+            for _ in range(5000):
+                series.inc()
+                histogram.labels().observe(0.001)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter.labels("all").value, 40000)
+        self.assertIn("seconds_count 40000", registry.exposition())
+
+    def test_scrape_never_waits_for_writers(self):
+        """Test a scrape completes while a writer holds a series lock"""
+        registry = MetricsRegistry()
+        series = registry.counter("busy_total", "Busy.").labels()
+        series.inc()
+        with series._lock:
+            scraped = []
+            scraper = threading.Thread(target=lambda: scraped.append(registry.exposition()))
+            scraper.start()
+            scraper.join(2)
+            self.assertFalse(scraper.is_alive())
+        self.assertIn("busy_total 1", scraped[0])
+
+    def test_metrics_server(self):
+        """Test the standalone server answers /metrics and nothing else"""
+        registry = MetricsRegistry()
+        registry.gauge("up", "Up.").labels().set_function(lambda: 1)
+        server = start_metrics_server("127.0.0.1", 0, registry)
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+            connection.request("GET", "/metrics")
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.getheader("Content-Type"), CONTENT_TYPE)
+            self.assertIn(b"up 1\n", response.read())
+            connection.request("GET", "/")
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 404)
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_parse_address(self):
+        """Test ports, hosts and bad addresses"""
+        self.assertEqual(parse_address("9100"), ("127.0.0.1", 9100))
+        self.assertEqual(parse_address("0.0.0.0:9200"), ("0.0.0.0", 9200))
+        self.assertEqual(parse_address("[::1]:9100"), ("::1", 9100))
+        for text in ("http", "host:", "70000"):
+            with self.assertRaises(ValueError):
+                parse_address(text)
+
+    def test_metrics_option_before_or_after_serve(self):
+        """Test --metrics is kept whether given before or after the serve command"""
+        parser = build_parser()
+        self.assertEqual(parser.parse_args(["--metrics", "9100", "serve"]).metrics, "9100")
+        self.assertEqual(parser.parse_args(["serve", "--metrics", "9200"]).metrics, "9200")
+        self.assertIsNone(parser.parse_args(["serve"]).metrics)
+
+    def test_terminal_quiz_recorded(self):
+        """Test a terminal quiz counts its start, answers, timeouts and completion"""
+        before = (value(metrics.QUIZZES_STARTED, "terminal", "beginner"),
+                  value(metrics.QUIZZES_COMPLETED, "terminal", "beginner"),
+                  value(metrics.ANSWERS, "terminal", "timeout"),
+                  value(metrics.TIMER_EXPIRATIONS, "terminal"),
+                  sum(metrics.SELECTION_SECONDS.labels("terminal").counts))
+        game = QuizGame("beginner", 3, seed=5)
+        with mock.patch.multiple(quiz_engine, show_screen=mock.DEFAULT, get_user_input=lambda *args: None,
+                                 display_result=mock.DEFAULT, display_final_score=mock.DEFAULT,
+                                 display_study_recommendations=mock.DEFAULT), \
+                mock.patch.object(quiz_engine.time, 'sleep'), \
+                mock.patch('builtins.input'):
+            game.run_quiz()
+        after = (value(metrics.QUIZZES_STARTED, "terminal", "beginner"),
+                 value(metrics.QUIZZES_COMPLETED, "terminal", "beginner"),
+                 value(metrics.ANSWERS, "terminal", "timeout"),
+                 value(metrics.TIMER_EXPIRATIONS, "terminal"),
+                 sum(metrics.SELECTION_SECONDS.labels("terminal").counts))
+        self.assertEqual([b - a for a, b in zip(before, after)], [1, 1, 3, 3, 3])
+        self.assertEqual(value(metrics.ACTIVE_SESSIONS, "terminal"), 0)
+
+    def test_http_api_recorded_and_served(self):
+        """Test the HTTP API counts its quizzes, answers and timeouts and serves /metrics"""
+        api = QuizApi()
+        before = (value(metrics.QUIZZES_STARTED, "http", "advanced"),
+                  value(metrics.QUIZZES_COMPLETED, "http", "advanced"),
+                  value(metrics.ANSWERS, "http", "correct") + value(metrics.ANSWERS, "http", "incorrect"),
+                  value(metrics.ANSWERS, "http", "timeout"),
+                  value(metrics.TIMER_EXPIRATIONS, "http"))
+        status, _, body = api.handle("POST", "/api/quizzes", b'{"difficulty": "advanced", "num_questions": 2}')
+        path = f"/api/quizzes/{json.loads(body)['id']}"
+        self.assertEqual(value(metrics.ACTIVE_SESSIONS, "http"), 1)
+        # The second answer is the client's timer running out
+        for answer in (b'{"answer": 1}', b'{"answer": null}'):
+            api.handle("GET", path + "/question")
+            api.handle("POST", path + "/answer", answer)
+        for _ in range(2):
+            self.assertEqual(json.loads(api.handle("GET", path + "/question")[2])["type"], "summary")
+        after = (value(metrics.QUIZZES_STARTED, "http", "advanced"),
+                 value(metrics.QUIZZES_COMPLETED, "http", "advanced"),
+                 value(metrics.ANSWERS, "http", "correct") + value(metrics.ANSWERS, "http", "incorrect"),
+                 value(metrics.ANSWERS, "http", "timeout"),
+                 value(metrics.TIMER_EXPIRATIONS, "http"))
+        self.assertEqual([b - a for a, b in zip(before, after)], [1, 1, 1, 1, 1])
+
+        server = make_api_server(api, "127.0.0.1", 0)
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+        thread.start()
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+            connection.request("GET", "/metrics")
+            response = connection.getresponse()
+            exposition = response.read().decode('utf-8')
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(response.getheader("Content-Type"), CONTENT_TYPE)
+        self.assertIn('mushroom_quiz_active_sessions{frontend="http"} 1', exposition)
+        self.assertIn('mushroom_quiz_render_seconds_count{frontend="http"}', exposition)
+        self.assertEqual(exposition, get_registry().exposition())
+
+    def test_abandoned_quizzes_counted(self):
+        """Test quizzes replaced by START, left by a disconnect or deleted unfinished are abandoned"""
+        def abandoned(frontend):
+            return value(metrics.QUIZZES_ABANDONED, frontend, "beginner")
+
+        async def play(server):
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            await reader.readline()
+            for _ in range(2):
+                writer.write(b"START beginner 3\n")
+                await writer.drain()
+                await reader.readline()
+            writer.close()
+            await writer.wait_closed()
+            # Give the server's handler time to see the disconnect
+            for _ in range(100):
+                if not server.connections:
+                    break
+                await asyncio.sleep(0.01)
+
+        async def serve():
+            server = QuizServer("127.0.0.1", 0)
+            await server.start()
+            try:
+                await play(server)
+            finally:
+                await server.close()
+
+        before = abandoned("tcp")
+        asyncio.run(serve())
+        self.assertEqual(abandoned("tcp") - before, 2)
+
+        api = QuizApi()
+        before = abandoned("http")
+        for num_questions in (1, 2):
+            status, _, body = api.handle("POST", "/api/quizzes",
+                                         b'{"difficulty": "beginner", "num_questions": %d}' % num_questions)
+            path = f"/api/quizzes/{json.loads(body)['id']}"
+            api.handle("GET", path + "/question")
+            api.handle("POST", path + "/answer", b'{"answer": 1}')
+            api.handle("GET", path + "/question")
+            api.handle("DELETE", path)
+        # Only the two-question quiz was left before its summary
+        self.assertEqual(abandoned("http") - before, 1)
+
+if __name__ == '__main__':
+    unittest.main()
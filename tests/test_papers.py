@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Papers Module 🧪
+
+Tests for bulk quiz paper generation.
+
+File: test_papers.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the paper generator and its output
+    formats: answer keys point at the correct options, runs are
+    reproducible from their base seed, the output does not depend on the
+    number of worker processes, and every format produces well-formed
+    documents.
+
+Test Classes:
+    - TestPaperGenerator: Main test class for paper generation
+
+Usage:
+    python -m pytest tests/test_papers.py
+    python -m unittest tests.test_papers
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import io
+import json
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame
+from mushroom_quiz.papers import generate_papers, generator, write_papers
+from mushroom_quiz.papers.formats import get_format
+
+def run(format_name="jsonl", count=6, workers=1, chunk_size=4, seed=99):
+    """Write a run of papers to memory, returning (papers, keys)."""
+    out = io.StringIO()
+    keys = io.StringIO()
+    write_papers(out, "mixed", 5, count, format_name, seed, keys, workers, chunk_size)
+    return out.getvalue(), keys.getvalue()
+
+class TestPaperGenerator(unittest.TestCase):
+    """Test cases for the paper generator"""
+
+    def test_answer_key_matches_options(self):
+        """Test that every answer key entry points at the correct option"""
+        for paper in generate_papers("beginner", 5, 3, base_seed=1):
+            self.assertEqual(len(paper.questions), 5)
+            for (question, options), answer in zip(paper.questions, paper.answer_key):
+                self.assertEqual(options[answer - 1], question['answer'])
+
+    def test_papers_are_distinct_and_regenerable(self):
+        """Test that papers differ and each regenerates from its spec"""
+        papers = list(generate_papers("mixed", 5, 3, base_seed=7))
+        self.assertEqual(len({tuple(q['question'] for q, _ in p.questions) for p in papers}), 3)
+        session = QuizGame.from_spec(papers[1].spec).new_session()
+        self.assertEqual(session.next_question().options, papers[1].questions[0][1])
+
+    def test_output_independent_of_workers(self):
+        """Test that a process pool writes exactly what one process writes"""
+        self.assertEqual(run(workers=1), run(workers=2))
+
+    def test_jsonl_records(self):
+        """Test that JSON Lines output has one record per paper"""
+        papers, keys = run("jsonl")
+        records = [json.loads(line) for line in papers.splitlines()]
+        self.assertEqual([r["paper"] for r in records], list(range(1, 7)))
+        self.assertEqual(records[0]["quiz"]["seed"], 100)
+        self.assertEqual(len(keys.splitlines()), 6)
+        # Papers can be handed out: the answers are only in the key file
+        self.assertTrue(all("answer_key" not in record for record in records))
+        self.assertEqual([len(json.loads(line)["answer_key"]) for line in keys.splitlines()], [5] * 6)
+
+    def test_many_options_are_numbered(self):
+        """Test questions with more options than letters are numbered on the paper and the key"""
+        paper = next(generate_papers("beginner", 2, 1, base_seed=3))
+        (first, options), second = paper.questions
+        many = [f"Option {n}" for n in range(1, 31)]
+        paper = paper._replace(questions=[(first, many), second], answer_key=[12, paper.answer_key[1]])
+        text = get_format("txt").paper(paper)
+        self.assertIn("   30) Option 30", text)
+        self.assertIn("   A) ", text)
+        key = get_format("txt").answer_key(paper)
+        self.assertIn(" 1(12) 2", key)
+        self.assertIn("1&nbsp;(12)", get_format("html").answer_key(paper))
+        self.assertIn('<ol class="numbered">', get_format("html").paper(paper))
+
+    def test_single_shard_runs_in_process(self):
+        """Test that a run of one shard starts no process pool"""
+        with mock.patch.object(generator, 'ProcessPoolExecutor') as pool:
+            papers, _ = run(count=3, workers=8)
+        pool.assert_not_called()
+        self.assertEqual(papers, run(count=3)[0])
+
+    def test_html_document(self):
+        """Test that HTML output is one escaped document"""
+        papers, keys = run("html", count=3)
+        self.assertTrue(papers.startswith("<!DOCTYPE html>"))
+        self.assertTrue(papers.rstrip().endswith("</html>"))
+        self.assertEqual(papers.count("<section>"), 3)
+        self.assertNotIn("'", papers.split("<body>")[1])
+        self.assertEqual(keys.count("<strong>Paper"), 3)
+
+    def test_unknown_format(self):
+        """Test that unknown formats are rejected"""
+        with self.assertRaises(ValueError):
+            get_format("pdf")
+
+if __name__ == '__main__':
+    unittest.main()
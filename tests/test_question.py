@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Compact Question Module 🧪
+
+Tests for slotted Question records and their dict-compatible view.
+
+File: test_question.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for Question: building from dictionaries,
+    the answer kept as an option index, interned difficulty and topic,
+    extra keys, reading and comparing like a dict, pickling, and banks
+    and quiz screens working with Question records.
+
+Test Classes:
+    - TestQuestion: Main test class for compact questions
+
+Usage:
+    python -m pytest tests/test_question.py
+    python -m unittest tests.test_question
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import io
+import pickle
+import sys
+import os
+import unittest
+from contextlib import redirect_stdout
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.data import QuestionBank, get_question_bank
+from mushroom_quiz.data.question import Question
+from mushroom_quiz.ui.terminal_ui import display_question, display_result
+
+def make_data(**extra):
+    """Build a question dictionary as it is read from JSON."""
+    data = {
+        "question": "Which gas builds up in a sealed grow tent?",
+        "options": ["Oxygen", "CO2", "Nitrogen", "Helium"],
+        "answer": "CO2",
+        "difficulty": "beginner",
+        "explanation": "Mycelium and mushrooms breathe out CO2.",
+        "topic": "growing_conditions",
+    }
+    data.update(extra)
+    return data
+
+class TestQuestion(unittest.TestCase):
+    """Test cases for compact questions"""
+
+    def test_fields_from_dict(self):
+        """Test the record holds tuple options and the answer as an index"""
+        question = Question.from_dict(make_data())
+        self.assertEqual(question.text, "Which gas builds up in a sealed grow tent?")
+        self.assertEqual(question.options, ("Oxygen", "CO2", "Nitrogen", "Helium"))
+        self.assertEqual(question.answer_index, 1)
+        self.assertEqual(question.answer, "CO2")
+        self.assertFalse(hasattr(question, '__dict__'))
+
+    def test_difficulty_and_topic_are_shared(self):
+        """Test equal difficulty and topic strings become one object"""
+        first = Question.from_dict(make_data(difficulty="".join(["begin", "ner"])))
+        second = Question.from_dict(make_data(topic="".join(["growing_", "conditions"])))
+        self.assertIs(first.difficulty, second.difficulty)
+        self.assertIs(first.topic, second.topic)
+
+    def test_reads_like_the_dict(self):
+        """Test item access, get(), keys and dict() match the source dict"""
+        data = make_data(irt_a=1.4)
+        question = Question.from_dict(data)
+        self.assertEqual(question['answer'], "CO2")
+        self.assertEqual(question['question'], data['question'])
+        self.assertEqual(question.get('irt_a'), 1.4)
+        self.assertIsNone(question.get('irt_b'))
+        self.assertIn('explanation', question)
+        self.assertNotIn('irt_b', question)
+        self.assertEqual(set(question), set(data))
+        self.assertEqual(dict(question), dict(data, options=tuple(data['options'])))
+        with self.assertRaises(KeyError):
+            question['missing']
+
+    def test_equality_with_dicts(self):
+        """Test a Question equals its source dict, and differs from a changed one"""
+        data = make_data()
+        self.assertEqual(Question.from_dict(data), data)
+        self.assertEqual(data, Question.from_dict(data))
+        self.assertNotEqual(Question.from_dict(data), dict(data, answer="Oxygen"))
+        self.assertNotEqual(Question.from_dict(data), make_data(irt_a=1.0))
+
+    def test_null_or_missing_topic_and_difficulty(self):
+        """Test null or missing topics and difficulties load as empty strings"""
+        data = make_data(topic=None, difficulty=None)
+        question = Question.from_dict(data)
+        self.assertEqual((question['topic'], question['difficulty']), ("", ""))
+        del data['topic'], data['difficulty']
+        bank = QuestionBank([data, make_data(question="Another?")])
+        self.assertEqual(bank.by_topic("")[0]['difficulty'], "")
+        self.assertEqual(len(bank.by_difficulty("")), 1)
+
+    def test_answer_must_be_an_option(self):
+        """Test questions whose answer is not an option are rejected"""
+        with self.assertRaises(ValueError):
+            Question.from_dict(make_data(answer="Argon"))
+
+    def test_pickle_round_trip(self):
+        """Test questions survive pickling (used by paper worker processes)"""
+        question = Question.from_dict(make_data(irt_b=0.5))
+        copy = pickle.loads(pickle.dumps(question))
+        self.assertEqual(copy, question)
+        self.assertEqual(copy.answer_index, 1)
+
+    def test_bank_stores_questions(self):
+        """Test banks convert dictionaries and keep existing Question records"""
+        question = Question.from_dict(make_data())
+        bank = QuestionBank([make_data(), question])
+        self.assertTrue(all(isinstance(q, Question) for q in bank))
+        self.assertIs(bank[1], question)
+        self.assertIsInstance(get_question_bank()[0], Question)
+
+    def test_screens_accept_questions(self):
+        """Test the question and result screens render a Question"""
+        question = Question.from_dict(make_data())
+        out = io.StringIO()
+        with redirect_stdout(out):
+            display_question(1, 5, question, list(question.options))
+            display_result(True, "CO2", question['answer'], question['explanation'])
+        self.assertIn("sealed grow tent", out.getvalue())
+        self.assertIn("breathe out CO2", out.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Question Bank Module 🧪
+
+Tests for the indexed QuestionBank.
+
+File: test_question_bank.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains unit tests for the QuestionBank class, testing
+    difficulty and topic indexes, counting, and random sampling with
+    fallback to the whole bank.
+
+Test Classes:
+    - TestQuestionBank: Main test class for QuestionBank functionality
+
+Usage:
+    python -m pytest tests/test_question_bank.py
+    python -m unittest tests.test_question_bank
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import random
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.data import QuestionBank, get_question_bank, get_all_questions
+
+def make_question(index, difficulty, topic):
+    """Build a minimal question dictionary for tests."""
+    return {
+        "question": f"Question {index}?",
+        "options": ["A", "B", "C", "D"],
+        "answer": "A",
+        "difficulty": difficulty,
+        "explanation": "Because.",
+        "topic": topic,
+    }
+
+class TestQuestionBank(unittest.TestCase):
+    """Test cases for QuestionBank functionality."""
+
+    def setUp(self):
+        self.questions = (
+            [make_question(i, "beginner", "substrates") for i in range(5)] +
+            [make_question(i, "advanced", "sterilization") for i in range(5, 7)]
+        )
+        self.bank = QuestionBank(self.questions)
+
+    def test_indexes_by_difficulty(self):
+        """Test that difficulty indexes hold the matching questions."""
+        self.assertEqual(len(self.bank.by_difficulty("beginner")), 5)
+        self.assertEqual(len(self.bank.by_difficulty("advanced")), 2)
+        self.assertEqual(self.bank.by_difficulty("mixed"), tuple(self.questions))
+        self.assertEqual(self.bank.by_difficulty("invalid"), ())
+
+    def test_indexes_by_topic(self):
+        """Test that topic indexes hold the matching questions."""
+        self.assertEqual(len(self.bank.by_topic("substrates")), 5)
+        self.assertEqual(self.bank.topics(), ["substrates", "sterilization"])
+        self.assertEqual(self.bank.by_topic("timing"), ())
+
+    def test_lookup_returns_prebuilt_index(self):
+        """Test that repeated lookups return the same index object."""
+        self.assertIs(self.bank.by_difficulty("beginner"), self.bank.by_difficulty("beginner"))
+
+    def test_sample_within_difficulty(self):
+        """Test sampling from a difficulty with enough questions."""
+        selected = self.bank.sample("beginner", 3, random.Random(1))
+        self.assertEqual(len(selected), 3)
+        self.assertTrue(all(q["difficulty"] == "beginner" for q in selected))
+        self.assertEqual(len(set(q["question"] for q in selected)), 3)
+
+    def test_sample_falls_back_to_all_questions(self):
+        """Test that small difficulties fall back to the whole bank."""
+        selected = self.bank.sample("advanced", 4, random.Random(1))
+        self.assertEqual(len(selected), 4)
+
+    def test_sample_caps_at_bank_size(self):
+        """Test that sampling never asks for more questions than exist."""
+        self.assertEqual(len(self.bank.sample("mixed", 50)), len(self.questions))
+
+    def test_default_bank_matches_database(self):
+        """Test that the default bank indexes the bundled questions."""
+        bank = get_question_bank()
+        self.assertEqual(len(bank), len(get_all_questions()))
+        self.assertEqual(
+            sum(bank.count(level) for level in bank.difficulties()),
+            len(bank)
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,7 @@ Author: Aaron J
 Email: git@aaronemail.xyz
 Version: 2.0.1
 Created: 2025-06-23
-Last Modified: 2025-06-23
+Last Modified: 2026-10-18
 License: MIT
 
 Description:
@@ -19,6 +19,7 @@ Description:
     
 Test Classes:
     - TestQuestionLoader: Main test class for question loader functionality
+    - TestQuestionCache: Tests for the JSON parse cache
     
 Usage:
     python -m pytest tests/test_question_loader.py
@@ -28,16 +29,20 @@ Repository:
     https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
 """
 
+import json
 import unittest
 import sys
 import os
+import tempfile
+from unittest import mock
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from mushroom_quiz.data import question_loader
 from mushroom_quiz.data.question_loader import (
     get_questions_by_difficulty, get_all_questions, 
-    get_question_count_by_difficulty, get_difficulty_levels
+    get_question_count_by_difficulty, get_difficulty_levels, load_questions
 )
 
 class TestQuestionLoader(unittest.TestCase):
@@ -91,5 +96,54 @@ class TestQuestionLoader(unittest.TestCase):
         self.assertIsInstance(beginner_count, int)
         self.assertGreater(beginner_count, 0)
 
+class TestQuestionCache(unittest.TestCase):
+    """Test cases for the parsed question cache."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        env = mock.patch.dict(os.environ, {'MUSHROOM_QUIZ_CACHE_DIR': os.path.join(self.tmp.name, 'cache')})
+        env.start()
+        self.addCleanup(env.stop)
+        self.path = os.path.join(self.tmp.name, 'questions.json')
+        self.write_questions([{"question": "One?", "difficulty": "beginner", "topic": "timing"}])
+    
+    def write_questions(self, questions):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(questions, f)
+    
+    def test_bundled_questions_load(self):
+        """Test that the bundled JSON database loads with a content hash."""
+        questions, digest = load_questions(use_cache=False)
+        self.assertGreater(len(questions), 100)
+        self.assertEqual(len(digest), 64)
+    
+    def test_second_load_skips_parsing(self):
+        """Test that an unchanged file is served from the cache."""
+        first, digest = load_questions(self.path)
+        with mock.patch.object(question_loader.json, 'loads', side_effect=AssertionError):
+            second, cached_digest = load_questions(self.path)
+        self.assertEqual(first, second)
+        self.assertEqual(digest, cached_digest)
+    
+    def test_touched_file_reuses_cache_by_hash(self):
+        """Test that a new mtime with identical content avoids reparsing."""
+        load_questions(self.path)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with mock.patch.object(question_loader.json, 'loads', side_effect=AssertionError):
+            questions, _ = load_questions(self.path)
+        self.assertEqual(questions[0]["question"], "One?")
+    
+    def test_changed_file_is_reparsed(self):
+        """Test that edited content invalidates the cache."""
+        _, old_digest = load_questions(self.path)
+        self.write_questions([{"question": "Two?", "difficulty": "advanced", "topic": "timing"}])
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        questions, digest = load_questions(self.path)
+        self.assertEqual(questions[0]["question"], "Two?")
+        self.assertNotEqual(digest, old_digest)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Streaming Question Source Module 🧪
+
+Tests for reservoir sampling quizzes from JSON Lines files.
+
+File: test_question_source.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for JsonlQuestionSource: uniform reservoir
+    samples, difficulty, topic and predicate filters applied while
+    streaming, the fallback to the whole bank, fields the raw-byte check
+    cannot read, gzip files, reproducible quizzes in QuizGame, and
+    open_question_source() choosing between loading and streaming.
+
+Test Classes:
+    - TestQuestionSource: Main test class for streamed question sources
+
+Usage:
+    python -m pytest tests/test_question_source.py
+    python -m unittest tests.test_question_source
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import gzip
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from collections import Counter
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame
+from mushroom_quiz.data import (JsonlQuestionSource, QuestionBank, get_question_bank,
+                                open_question_source)
+
+class TestQuestionSource(unittest.TestCase):
+    """Test cases for streamed question sources"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.bank = get_question_bank()
+        self.path = self.write("bank.jsonl", self.bank)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def write(self, name, questions, opener=open):
+        """Write questions as JSON Lines, with a blank line in between"""
+        path = os.path.join(self.tmp, name)
+        with opener(path, 'wt', encoding='utf-8') as f:
+            for i, question in enumerate(questions):
+                f.write(json.dumps(dict(question)) + "\n")
+                if i == 3:
+                    f.write("\n")
+        return path
+
+    def test_sample_is_uniform(self):
+        """Test every question is equally likely to be chosen"""
+        questions = [dict(self.bank[0], question=f"q{i}") for i in range(10)]
+        source = JsonlQuestionSource(self.write("ten.jsonl", questions))
+        rng = random.Random(7)
+        counts = Counter()
+        for _ in range(2000):
+            counts.update(q['question'] for q in source.sample("mixed", 3, rng))
+        self.assertEqual(len(counts), 10)
+        # Expected 600 each; allow about four standard deviations
+        for count in counts.values():
+            self.assertLess(abs(count - 600), 90)
+
+    def test_sample_applies_difficulty(self):
+        """Test samples hold k distinct questions of the difficulty"""
+        source = JsonlQuestionSource(self.path)
+        chosen = source.sample("advanced", 10, random.Random(1))
+        self.assertEqual(len(chosen), 10)
+        self.assertEqual({q['difficulty'] for q in chosen}, {"advanced"})
+        self.assertEqual(len({q['question'] for q in chosen}), 10)
+
+    def test_topic_and_predicate_filters(self):
+        """Test the source's own filters are applied while streaming"""
+        source = JsonlQuestionSource(self.path, topic="sterilization",
+                                     predicate=lambda q: len(q['options']) == 4)
+        expected = [q for q in self.bank if q['topic'] == "sterilization" and len(q['options']) == 4]
+        self.assertEqual(list(source), expected)
+        chosen = source.sample("mixed", 3, random.Random(2))
+        self.assertTrue(all(q in expected for q in chosen))
+
+    def test_fallback_to_whole_bank(self):
+        """Test a difficulty with too few questions falls back to every question"""
+        source = JsonlQuestionSource(self.path)
+        chosen = source.sample("expert", 5, random.Random(3))
+        self.assertEqual(len(chosen), 5)
+        self.assertEqual(len(source.sample("mixed", 1000, random.Random(3))), len(self.bank))
+
+    def test_escaped_and_nested_fields(self):
+        """Test fields the raw-byte check cannot read are parsed instead"""
+        escaped = json.dumps(dict(self.bank[0], question="escaped", difficulty="beginner"))
+        escaped = escaped.replace('"beginner"', '"\\u0062eginner"')
+        nested = dict(self.bank[1], question="nested", difficulty="advanced",
+                      meta={"difficulty": "beginner"})
+        path = os.path.join(self.tmp, "odd.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(escaped + "\n" + json.dumps(nested) + "\n")
+        source = JsonlQuestionSource(path)
+        self.assertEqual([q['question'] for q in source.sample("beginner", 1, random.Random(0))], ["escaped"])
+        self.assertEqual([q['question'] for q in source.sample("advanced", 1, random.Random(0))], ["nested"])
+
+    def test_gzip_file(self):
+        """Test gzip-compressed banks are streamed too"""
+        path = self.write("bank.jsonl.gz", self.bank, opener=gzip.open)
+        chosen = JsonlQuestionSource(path).sample("beginner", 4, random.Random(4))
+        self.assertEqual([q['difficulty'] for q in chosen], ["beginner"] * 4)
+
+    def test_invalid_line_reports_position(self):
+        """Test a malformed line is reported with its line number"""
+        path = os.path.join(self.tmp, "bad.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(dict(self.bank[0])) + "\n{not json\n")
+        with self.assertRaisesRegex(ValueError, r"bad\.jsonl:2"):
+            JsonlQuestionSource(path).sample("mixed", 5, random.Random(0))
+
+    def test_quiz_game_draws_from_source(self):
+        """Test QuizGame quizzes from a source are reproducible from the seed"""
+        source = JsonlQuestionSource(self.path)
+        first = QuizGame("intermediate", 5, bank=source, seed=9).prepare_questions()
+        again = QuizGame("intermediate", 5, bank=JsonlQuestionSource(self.path), seed=9).prepare_questions()
+        self.assertEqual(first, again)
+        self.assertEqual(QuizGame(bank=source).spec.bank_version, source.version)
+        with self.assertRaises(ValueError):
+            QuizGame("adaptive", 5, bank=source).new_session()
+
+    def test_open_question_source(self):
+        """Test JSON files are loaded and JSON Lines files are streamed"""
+        json_path = os.path.join(self.tmp, "bank.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump([dict(question) for question in self.bank], f)
+        loaded = open_question_source(json_path, topic="sterilization")
+        self.assertIsInstance(loaded, QuestionBank)
+        self.assertEqual({q['topic'] for q in loaded}, {"sterilization"})
+        self.assertIsInstance(open_question_source(self.path), JsonlQuestionSource)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Quiz Server Module 🧪
+
+Tests for the asyncio multi-session quiz server.
+
+File: test_quiz_server.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the line-based TCP quiz server, playing
+    complete quizzes over real sockets, checking timer expiry on the event
+    loop and hosting several sessions at once.
+
+Test Classes:
+    - TestQuizServer: Main test class for QuizServer functionality
+
+Usage:
+    python -m pytest tests/test_quiz_server.py
+    python -m unittest tests.test_quiz_server
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import asyncio
+import json
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.server import QuizServer
+
+async def open_client(server):
+    """Connect to the server and consume its welcome message."""
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    welcome = json.loads(await reader.readline())
+    assert welcome["type"] == "welcome"
+    return reader, writer
+
+async def request(reader, writer, line):
+    """Send one command and read one reply."""
+    writer.write((line + "\n").encode())
+    await writer.drain()
+    return json.loads(await reader.readline())
+
+async def play_quiz(server, num_questions, seed=None):
+    """Play a full untimed quiz, always answering option 1."""
+    reader, writer = await open_client(server)
+    start = f"START beginner {num_questions}"
+    if seed is not None:
+        start += f" 0 {seed}"
+    message = await request(reader, writer, start)
+    while message["type"] == "question":
+        result = await request(reader, writer, "ANSWER 1")
+        assert result["type"] == "result"
+        message = await request(reader, writer, "NEXT")
+    await request(reader, writer, "QUIT")
+    writer.close()
+    return message
+
+def run_with_server(test):
+    """Run a coroutine test against a fresh server on a free port."""
+    async def runner():
+        server = QuizServer("127.0.0.1", 0)
+        await server.start()
+        try:
+            return await test(server)
+        finally:
+            await server.close()
+    return asyncio.run(runner())
+
+class TestQuizServer(unittest.TestCase):
+    """Test cases for QuizServer functionality."""
+
+    def test_full_quiz_over_tcp(self):
+        """Test that a complete quiz ends with a summary."""
+        summary = run_with_server(lambda server: play_quiz(server, 3))
+        self.assertEqual(summary["type"], "summary")
+        self.assertEqual(summary["total"], 3)
+
+    def test_seeded_quiz_is_reproducible(self):
+        """Test that a START seed is reported back in the summary's quiz spec."""
+        async def test(server):
+            return await asyncio.gather(play_quiz(server, 4, 1234), play_quiz(server, 4, 1234))
+        first, second = run_with_server(test)
+        self.assertEqual(first["quiz"]["seed"], 1234)
+        self.assertEqual(first["quiz"]["difficulty"], "beginner")
+        self.assertEqual(first["quiz"], second["quiz"])
+        self.assertEqual(first["score"], second["score"])
+
+    def test_concurrent_sessions(self):
+        """Test that many sessions run independently on one loop."""
+        async def test(server):
+            return await asyncio.gather(*(play_quiz(server, 2) for _ in range(25)))
+        summaries = run_with_server(test)
+        self.assertEqual(len(summaries), 25)
+        self.assertTrue(all(s["total"] == 2 for s in summaries))
+
+    def test_timer_expires_on_event_loop(self):
+        """Test that a timed question expires without client input."""
+        async def test(server):
+            reader, writer = await open_client(server)
+            # Patch the timer down to keep the test fast
+            question = await request(reader, writer, "START beginner 1 1")
+            connection = next(iter(server.connections))
+            connection.timeout_handle.cancel()
+            connection.timeout_handle = asyncio.get_running_loop().call_later(0.05, connection.expire)
+            result = json.loads(await asyncio.wait_for(reader.readline(), 2))
+            late = await request(reader, writer, "ANSWER 1")
+            writer.close()
+            return question, result, late
+        question, result, late = run_with_server(test)
+        self.assertEqual(question["time_limit"], 1)
+        self.assertTrue(result["timeout"])
+        self.assertEqual(late["type"], "error")
+
+    def test_invalid_commands(self):
+        """Test that bad commands produce error messages."""
+        async def test(server):
+            reader, writer = await open_client(server)
+            replies = [
+                await request(reader, writer, "START impossible 5"),
+                await request(reader, writer, "ANSWER 1"),
+                await request(reader, writer, "DANCE"),
+            ]
+            writer.close()
+            return replies
+        replies = run_with_server(test)
+        self.assertTrue(all(reply["type"] == "error" for reply in replies))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Quiz Session Module 🧪
+
+Tests for the headless QuizSession state machine.
+
+File: test_quiz_session.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains unit tests for the QuizSession class, testing
+    question flow, answer scoring, timeout handling, wrong-topic tracking
+    and state validation, all without a terminal.
+
+Test Classes:
+    - TestQuizSession: Main test class for QuizSession functionality
+
+Usage:
+    python -m pytest tests/test_quiz_session.py
+    python -m unittest tests.test_quiz_session
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame, QuizSession
+
+QUESTIONS = [
+    {"question": "Q1?", "options": ["a", "b", "c", "d"], "answer": "a",
+     "difficulty": "beginner", "explanation": "E1", "topic": "substrates"},
+    {"question": "Q2?", "options": ["a", "b", "c", "d"], "answer": "b",
+     "difficulty": "beginner", "explanation": "E2", "topic": "timing"},
+    {"question": "Q3?", "options": ["a", "b", "c", "d"], "answer": "c",
+     "difficulty": "beginner", "explanation": "E3", "topic": "sterilization"},
+]
+
+class TestQuizSession(unittest.TestCase):
+    """Test cases for QuizSession functionality."""
+
+    def answer_for(self, asked, correct=True):
+        """Get the option number that is (or is not) the right answer."""
+        answer = asked.question["answer"]
+        for number, option in enumerate(asked.options, 1):
+            if (option == answer) == correct:
+                return number
+
+    def test_full_quiz_flow(self):
+        """Test a correct, a wrong and a timed-out answer."""
+        session = QuizSession(QUESTIONS)
+
+        asked = session.next_question()
+        self.assertEqual((asked.number, asked.total), (1, 3))
+        self.assertEqual(sorted(asked.options), ["a", "b", "c", "d"])
+        self.assertTrue(session.submit_answer(self.answer_for(asked)).is_correct)
+
+        asked = session.next_question()
+        result = session.submit_answer(self.answer_for(asked, correct=False))
+        self.assertFalse(result.is_correct)
+        self.assertEqual(result.correct_answer, "b")
+
+        session.next_question()
+        result = session.submit_answer(None)
+        self.assertTrue(result.is_timeout)
+
+        self.assertTrue(session.finished)
+        self.assertIsNone(session.next_question())
+        self.assertEqual(tuple(session.summary()), (1, 3, ["timing"]))
+
+    def test_options_are_not_mutated(self):
+        """Test that shuffling leaves the source question untouched."""
+        session = QuizSession(QUESTIONS)
+        for _ in QUESTIONS:
+            session.next_question()
+            session.submit_answer(1)
+        self.assertEqual(QUESTIONS[0]["options"], ["a", "b", "c", "d"])
+
+    def test_state_is_enforced(self):
+        """Test that out-of-order calls and bad answers are rejected."""
+        session = QuizSession(QUESTIONS)
+        with self.assertRaises(RuntimeError):
+            session.submit_answer(1)
+        session.next_question()
+        with self.assertRaises(RuntimeError):
+            session.next_question()
+        with self.assertRaises(ValueError):
+            session.submit_answer(5)
+
+    def test_quiz_game_new_session(self):
+        """Test that QuizGame selects questions into a headless session."""
+        game = QuizGame("beginner", 5)
+        session = game.new_session()
+        self.assertEqual(session.total, 5)
+        self.assertIs(game.session, session)
+        self.assertEqual(game.score, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Quiz Spec Module 🧪
+
+Tests for seeded, reproducible quiz generation.
+
+File: test_quiz_spec.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module checks that a quiz is fully determined by its QuizSpec:
+    the same spec always gives the same questions in the same order with
+    the same option order, each quiz leaves the global random module
+    alone, and a spec is refused by a bank of a different version.
+
+Test Classes:
+    - TestQuizSpec: Main test class for seeded quiz generation
+
+Usage:
+    python -m pytest tests/test_quiz_spec.py
+    python -m unittest tests.test_quiz_spec
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import random
+import unittest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame, QuizSpec
+from mushroom_quiz.data import QuestionBank, get_all_questions
+
+def play_order(session):
+    """Ask every question, returning (question text, option order) pairs."""
+    asked = []
+    while not session.finished:
+        question = session.next_question()
+        asked.append((question.question['question'], tuple(question.options)))
+        session.submit_answer(1)
+    return asked
+
+class TestQuizSpec(unittest.TestCase):
+    """Test cases for seeded quiz generation"""
+
+    def test_same_seed_same_quiz(self):
+        """Test that one seed always produces the same questions and options"""
+        first = play_order(QuizGame("mixed", 10, seed=42).new_session())
+        second = play_order(QuizGame("mixed", 10, seed=42).new_session())
+        self.assertEqual(first, second)
+        self.assertEqual(len(first), 10)
+
+    def test_different_seeds_differ(self):
+        """Test that different seeds give different quizzes"""
+        first = play_order(QuizGame("mixed", 10, seed=1).new_session())
+        second = play_order(QuizGame("mixed", 10, seed=2).new_session())
+        self.assertNotEqual(first, second)
+
+    def test_regenerate_from_spec(self):
+        """Test that a spec regenerates the quiz it was taken from"""
+        game = QuizGame("beginner", 5, 30)
+        original = play_order(game.new_session())
+        spec = game.spec
+        self.assertIsInstance(spec, QuizSpec)
+        self.assertEqual(spec.timer_seconds, 30)
+        regenerated = QuizGame.from_spec(QuizSpec(**spec._asdict()))
+        self.assertEqual(play_order(regenerated.new_session()), original)
+
+    def test_global_random_untouched(self):
+        """Test that quizzes neither use nor disturb the global generator"""
+        state = random.getstate()
+        play_order(QuizGame("mixed", 10, seed=7).new_session())
+        self.assertEqual(random.getstate(), state)
+
+    def test_bank_version_mismatch(self):
+        """Test that a spec is refused by a different bank version"""
+        spec = QuizGame("mixed", 5, seed=3).spec
+        other = QuestionBank(get_all_questions(), version="other")
+        with self.assertRaises(ValueError):
+            QuizGame.from_spec(spec, bank=other)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Screen Renderer Module 🧪
+
+Tests for the buffered, single-write screen renderer.
+
+File: test_renderer.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the ScreenRenderer and the render_*
+    functions of the terminal UI. It checks that a whole frame reaches the
+    stream in one write, that clearing uses ANSI sequences instead of a
+    subprocess, and that countdown updates repaint a single line.
+
+Test Classes:
+    - TestScreenRenderer: Main test class for ScreenRenderer functionality
+
+Usage:
+    python -m pytest tests/test_renderer.py
+    python -m unittest tests.test_renderer
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.ui import renderer
+from mushroom_quiz.ui.renderer import ScreenRenderer, CLEAR_SCREEN, CLEAR_LINE
+from mushroom_quiz.ui.terminal_ui import render_header, render_question, show_screen
+
+class RecordingStream:
+    """Text stream that records each write and flush separately"""
+
+    def __init__(self):
+        self.writes = []
+        self.flushes = 0
+
+    def write(self, text):
+        self.writes.append(text)
+
+    def flush(self):
+        self.flushes += 1
+
+class TestScreenRenderer(unittest.TestCase):
+    """Test cases for ScreenRenderer"""
+
+    def setUp(self):
+        """Set up a renderer over a recording stream"""
+        self.stream = RecordingStream()
+        self.renderer = ScreenRenderer(self.stream)
+        self.question = {'question': 'What is mycelium?', 'difficulty': 'beginner'}
+
+    def test_draw_is_one_write(self):
+        """Test that a cleared frame is sent in one write and one flush"""
+        self.renderer.draw("header\n", "body\n")
+        self.assertEqual(self.stream.writes, [CLEAR_SCREEN + "header\nbody\n"])
+        self.assertEqual(self.stream.flushes, 1)
+
+    def test_clear_does_not_spawn_process(self):
+        """Test that clearing the screen never shells out"""
+        with mock.patch('os.system') as system:
+            self.renderer.clear()
+        system.assert_not_called()
+        self.assertEqual(self.stream.writes, [CLEAR_SCREEN])
+
+    def test_update_line(self):
+        """Test that line updates only repaint the current line"""
+        self.renderer.update_line("12 seconds")
+        self.assertEqual(self.stream.writes, ["\r" + CLEAR_LINE + "12 seconds"])
+        self.assertNotIn(CLEAR_SCREEN, self.stream.writes[0])
+
+    def test_render_question(self):
+        """Test that a question renders with numbered options"""
+        text = render_question(2, 5, self.question, ["Roots", "Fungal threads"])
+        self.assertIn("Question 2/5", text)
+        self.assertIn("Beginner", text)
+        self.assertIn("1. Roots", text)
+        self.assertIn("2. Fungal threads", text)
+
+    def test_show_screen_single_frame(self):
+        """Test that the header and a question go out as a single frame"""
+        body = render_question(1, 1, self.question, ["Roots"])
+        with mock.patch.object(renderer, '_RENDERER', self.renderer):
+            show_screen(body)
+        self.assertEqual(self.stream.writes, [CLEAR_SCREEN + render_header() + body])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Spaced Repetition Review Module 🧪
+
+Tests for SM-2 scheduling and the ReviewDeck question selector.
+
+File: test_review.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the spaced-repetition review mode: SM-2
+    intervals and ease, due-first selection through the deck's heap,
+    filling with unseen questions, plugging into QuizGame as a selector,
+    and keeping schedules in the statistics database between runs.
+
+Test Classes:
+    - TestReviewDeck: Main test class for ReviewDeck functionality
+
+Usage:
+    python -m pytest tests/test_review.py
+    python -m unittest tests.test_review
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import random
+import unittest
+from unittest import mock
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame
+from mushroom_quiz.core.quiz_session import AnswerResult
+from mushroom_quiz.core import review
+from mushroom_quiz.core.review import DAY, UNSEEN_DRAWS_PER_QUESTION, ReviewDeck, ReviewItem
+from mushroom_quiz.data import get_question_bank, question_id
+from mushroom_quiz.stats import StatsStore
+
+class FakeClock:
+    """Settable clock standing in for time.time()."""
+
+    def __init__(self, now=1000000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def answer(question, correct, timeout=False):
+    """Build an AnswerResult for a question."""
+    return AnswerResult(question, None, question['answer'], question['explanation'],
+                        correct, timeout)
+
+class TestReviewDeck(unittest.TestCase):
+    """Test cases for ReviewDeck functionality"""
+
+    def setUp(self):
+        self.bank = get_question_bank()
+        self.clock = FakeClock()
+        self.deck = ReviewDeck("alice", clock=self.clock)
+
+    def test_sm2_intervals(self):
+        """Test that correct answers grow the interval and wrong ones reset it"""
+        item = ReviewItem(1, 0)
+        item.review(4, 0)
+        self.assertEqual(item.interval, 1 * DAY)
+        item.review(4, 0)
+        self.assertEqual(item.interval, 6 * DAY)
+        ease = item.ease
+        item.review(5, 0)
+        self.assertAlmostEqual(item.interval, 6 * DAY * ease)
+        ease = item.ease
+        item.review(1, 0)
+        self.assertEqual((item.repetitions, item.interval), (0, 1 * DAY))
+        self.assertLess(item.ease, ease)
+
+    def test_due_questions_come_first(self):
+        """Test that due questions are selected earliest-due first"""
+        questions = self.bank.by_difficulty("beginner")[:3]
+        for i, question in enumerate(questions):
+            self.deck.record_answer(answer(question, False))
+            self.clock.now += 60
+        self.clock.now += 2 * DAY
+        chosen = self.deck.select(self.bank, "beginner", 3, random.Random(0))
+        self.assertEqual(chosen, list(questions))
+
+    def test_fills_with_unseen_questions(self):
+        """Test that places left after due questions go to unseen questions"""
+        seen = self.bank.by_difficulty("advanced")[0]
+        self.deck.record_answer(answer(seen, True))
+        chosen = self.deck.select(self.bank, "advanced", 5, random.Random(0))
+        self.assertEqual(len(chosen), 5)
+        self.assertNotIn(seen, chosen)
+        self.assertTrue(all(q['difficulty'] == "advanced" for q in chosen))
+
+    def test_unseen_questions_hash_about_k_ids(self):
+        """Test that filling with unseen questions does not compute every question's id"""
+        for question in self.bank.by_difficulty("mixed")[:10]:
+            self.deck.record_answer(answer(question, True))
+        with mock.patch.object(review, 'question_id', wraps=question_id) as hashed:
+            chosen = self.deck.select(self.bank, "mixed", 5, random.Random(3))
+        self.assertEqual(len(set(map(question_id, chosen))), 5)
+        self.assertFalse(any(question_id(q) in self.deck.items for q in chosen))
+        self.assertLessEqual(hashed.call_count, UNSEEN_DRAWS_PER_QUESTION * 5)
+
+    def test_unseen_falls_back_when_nearly_all_seen(self):
+        """Test that the last unseen questions of a difficulty are still found"""
+        pool = self.bank.by_difficulty("advanced")
+        for question in pool[1:]:
+            self.deck.record_answer(answer(question, True))
+        chosen = self.deck.select(self.bank, "advanced", 3, random.Random(0))
+        self.assertEqual(chosen[0], pool[0])
+        self.assertEqual(len(chosen), 3)
+
+    def test_difficulty_quiz_skips_other_difficulties(self):
+        """Test that a difficulty's due items are taken from its own heap"""
+        for question in self.bank.by_difficulty("advanced"):
+            self.deck.record_answer(answer(question, False))
+        beginner = self.bank.by_difficulty("beginner")[0]
+        self.clock.now += 60
+        self.deck.record_answer(answer(beginner, False))
+        self.clock.now += 2 * DAY
+        deck = ReviewDeck("alice", [item.as_row() for item in self.deck.items.values()], clock=self.clock)
+        with mock.patch.object(self.bank, 'get', wraps=self.bank.get) as looked_up:
+            self.assertEqual(deck.select(self.bank, "beginner", 1, random.Random(0)), [beginner])
+        # Only the chosen question is looked up; the heap comes from the items
+        self.assertEqual(looked_up.call_count, 2)
+
+    def test_items_saved_without_difficulty_are_placed(self):
+        """Test that schedules saved before difficulties were kept still reach difficulty quizzes"""
+        question = self.bank.by_difficulty("advanced")[2]
+        deck = ReviewDeck("alice", [(question_id(question), self.clock.now - 1, DAY, 2.5, 1)],
+                          clock=self.clock)
+        self.assertEqual(deck.select(self.bank, "advanced", 1, random.Random(0)), [question])
+        self.assertEqual(deck.items[question_id(question)].difficulty, "advanced")
+        self.assertEqual(deck.select(self.bank, "beginner", 1, random.Random(0))[0]['difficulty'], "beginner")
+
+    def test_stale_entries_are_compacted(self):
+        """Test that rescheduling one question many times keeps its heaps small"""
+        questions = self.bank.by_difficulty("beginner")[:3]
+        for _ in range(200):
+            for question in questions:
+                self.clock.now += 1
+                self.deck.record_answer(answer(question, False))
+        for difficulty in ("mixed", "beginner"):
+            self.assertLessEqual(len(self.deck._heaps[difficulty]), 2 * len(questions) + 1)
+        self.clock.now += 2 * DAY
+        self.assertEqual(self.deck.take(10, difficulty="beginner"), [question_id(q) for q in questions])
+
+    def test_unseen_questions_are_distinct(self):
+        """Test that questions sharing an id are picked once"""
+        first, second = self.bank.by_difficulty("beginner")[:2]
+        pool = [first, dict(first), dict(first), second]
+        for seed in range(20):
+            chosen = self.deck._unseen(pool, 4, random.Random(seed))
+            self.assertEqual(sorted(chosen), sorted({question_id(first), question_id(second)}))
+
+    def test_rescheduled_entries_are_not_returned_twice(self):
+        """Test that stale heap entries are skipped after a reschedule"""
+        question = self.bank[0]
+        for _ in range(3):
+            self.deck.record_answer(answer(question, True))
+        self.clock.now += 365 * DAY
+        self.assertEqual(self.deck.take(5), [question_id(question)])
+
+    def test_plugs_into_quiz_game(self):
+        """Test that QuizGame selects through the deck and reports answers to it"""
+        due = self.bank.by_difficulty("intermediate")[4]
+        self.deck.record_answer(answer(due, False))
+        self.clock.now += 2 * DAY
+        game = QuizGame("intermediate", 4, selector=self.deck, seed=1)
+        session = game.new_session()
+        self.assertIs(session.next_question().question, due)
+        result = session.submit_answer(1)
+        self.deck.record_answer(result)
+        self.assertEqual(self.deck.due_count(), 0)
+
+    def test_schedule_persists(self):
+        """Test that schedules survive a round trip through the stats store"""
+        store = StatsStore(":memory:")
+        self.addCleanup(store.close)
+        self.deck.record_answer(answer(self.bank[3], True))
+        self.deck.save(store)
+        loaded = ReviewDeck.load(store, "alice")
+        self.assertEqual(loaded.items[question_id(self.bank[3])].as_row(),
+                         self.deck.items[question_id(self.bank[3])].as_row())
+        self.assertEqual(len(ReviewDeck.load(store, "bob")), 0)
+
+if __name__ == '__main__':
+    unittest.main()
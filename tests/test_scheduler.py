@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Deadline Scheduler Module 🧪
+
+Tests for the shared deadline scheduler and scheduler-driven timed input.
+
+File: test_scheduler.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains unit tests for the DeadlineScheduler, testing
+    deadline ordering, cancellation, heap compaction and the single worker
+    thread, plus TimedInput's use of the scheduler for timeouts, answer
+    wake-up latency and start-anchored countdown ticks.
+
+Test Classes:
+    - TestDeadlineScheduler: Tests for DeadlineScheduler functionality
+    - TestTimedInputScheduling: Tests for scheduler-driven TimedInput
+
+Usage:
+    python -m pytest tests/test_scheduler.py
+    python -m unittest tests.test_scheduler
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import io
+import threading
+import time
+import unittest
+import sys
+import os
+from contextlib import redirect_stdout
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core.scheduler import DeadlineScheduler
+from mushroom_quiz.core.stdin_reader import StdinReader
+from mushroom_quiz.core.timer import TimedInput
+
+class TestDeadlineScheduler(unittest.TestCase):
+    """Test cases for DeadlineScheduler functionality."""
+
+    def setUp(self):
+        self.scheduler = DeadlineScheduler()
+        self.addCleanup(self.scheduler.stop)
+
+    def test_callbacks_fire_in_deadline_order(self):
+        """Test that callbacks run earliest deadline first."""
+        fired = []
+        done = threading.Event()
+        self.scheduler.call_later(0.03, fired.append, 3)
+        self.scheduler.call_later(0.01, fired.append, 1)
+        self.scheduler.call_later(0.02, fired.append, 2)
+        self.scheduler.call_later(0.04, done.set)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(fired, [1, 2, 3])
+
+    def test_cancelled_callbacks_do_not_fire(self):
+        """Test that cancel() prevents a callback from running."""
+        fired = []
+        done = threading.Event()
+        handle = self.scheduler.call_later(0.01, fired.append, "cancelled")
+        handle.cancel()
+        self.scheduler.call_later(0.02, done.set)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(fired, [])
+
+    def test_many_deadlines_share_one_thread(self):
+        """Test that thousands of deadlines add a single worker thread."""
+        before = threading.active_count()
+        done = threading.Event()
+        counter = []
+        for _ in range(2000):
+            self.scheduler.call_later(0.01, counter.append, 1)
+        self.scheduler.call_later(0.05, done.set)
+        self.assertEqual(threading.active_count(), before + 1)
+        self.assertTrue(done.wait(2))
+        self.assertEqual(len(counter), 2000)
+
+    def test_cancelled_entries_are_compacted(self):
+        """Test that mass cancellation does not grow the heap forever."""
+        handles = [self.scheduler.call_later(60, lambda: None) for _ in range(500)]
+        for handle in handles:
+            handle.cancel()
+        self.assertEqual(self.scheduler.pending(), 0)
+        self.assertLess(len(self.scheduler._heap), 500)
+
+class TestTimedInputScheduling(unittest.TestCase):
+    """Test cases for scheduler-driven TimedInput."""
+
+    def setUp(self):
+        self.scheduler = DeadlineScheduler()
+        self.addCleanup(self.scheduler.stop)
+        read_fd, self.write_fd = os.pipe()
+        self.stream = os.fdopen(read_fd, 'rb', buffering=0)
+        self.reader = StdinReader(self.stream)
+        self.addCleanup(self.stream.close)
+        self.addCleanup(os.close, self.write_fd)
+        self.addCleanup(self.reader.close)
+
+    def test_timeout_returns_none(self):
+        """Test that an unanswered question times out via the scheduler."""
+        timer = TimedInput(0.05, self.scheduler, self.reader)
+        with redirect_stdout(io.StringIO()):
+            answer = timer.get_timed_input("Answer: ", 4)
+        self.assertIsNone(answer)
+        self.assertTrue(timer.timed_out)
+        self.assertEqual(self.scheduler.pending(), 0)
+
+    def test_answer_before_deadline(self):
+        """Test that an answer cancels the pending deadline."""
+        os.write(self.write_fd, b"2\n")
+        timer = TimedInput(5, self.scheduler, self.reader)
+        with redirect_stdout(io.StringIO()):
+            answer = timer.get_timed_input("Answer: ", 4)
+        self.assertEqual(answer, 2)
+        self.assertFalse(timer.timed_out)
+        self.assertEqual(self.scheduler.pending(), 0)
+
+    def test_answer_wakes_waiter_immediately(self):
+        """Test that an answer is acknowledged without waiting for a tick."""
+        timer = TimedInput(5, self.scheduler, self.reader)
+        sent_at = []
+
+        def answer_later():
+            time.sleep(0.05)
+            sent_at.append(time.monotonic())
+            os.write(self.write_fd, b"1\n")
+
+        threading.Thread(target=answer_later).start()
+        with redirect_stdout(io.StringIO()):
+            answer = timer.get_timed_input("Answer: ", 4)
+        latency = time.monotonic() - sent_at[0]
+        self.assertEqual(answer, 1)
+        self.assertLess(latency, 0.2)
+        self.assertLess(timer.elapsed, 0.5)
+
+    def test_sub_second_ticks_are_anchored(self):
+        """Test that sub-second ticks fire on start-anchored boundaries."""
+        timer = TimedInput(0.3, self.scheduler, self.reader, tick_interval=0.05)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertIsNone(timer.get_timed_input("Answer: ", 4))
+        redraws = output.getvalue().count("Time remaining")
+        self.assertGreaterEqual(redraws, 4)
+        self.assertLessEqual(redraws, 6)
+        self.assertIn(" 0.3 seconds", output.getvalue())
+
+    def test_questions_after_end_of_input(self):
+        """Test timed questions asked after stdin closed return None at once."""
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        stream = os.fdopen(read_fd, 'rb', buffering=0)
+        self.addCleanup(stream.close)
+        reader = StdinReader(stream)
+        self.addCleanup(reader.close)
+        for _ in range(2):
+            timer = TimedInput(5, self.scheduler, reader)
+            started = time.monotonic()
+            with redirect_stdout(io.StringIO()):
+                self.assertIsNone(timer.get_timed_input("Answer: ", 4))
+            self.assertLess(time.monotonic() - started, 1)
+            self.assertFalse(timer.timed_out)
+            self.assertIsNotNone(timer.elapsed)
+        self.assertEqual(self.scheduler.pending(), 0)
+
+    def test_invalid_tick_interval(self):
+        """Test that a non-positive tick interval is rejected."""
+        with self.assertRaises(ValueError):
+            TimedInput(5, self.scheduler, self.reader, tick_interval=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Question Search Module 🧪
+
+Tests for tokenising, query parsing, ranked search and keyword study quizzes.
+
+File: test_search.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the full-text search index: tokens and
+    query clauses, top-k results agreeing with scoring every question,
+    phrase and OR queries, the cached index form, the SearchSelector used
+    by keyword study quizzes, and the 'search' command.
+
+Test Classes:
+    - TestSearch: Main test class for search functionality
+
+Usage:
+    python -m pytest tests/test_search.py
+    python -m unittest tests.test_search
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import io
+import random
+import sys
+import os
+import unittest
+from contextlib import redirect_stdout
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.app import main
+from mushroom_quiz.core import QuizGame
+from mushroom_quiz.data import SearchIndex, get_question_bank, get_search_index
+from mushroom_quiz.data.search import SearchSelector, parse_query, tokenize
+
+def make_question(text, options=('Yes', 'No'), explanation=''):
+    """Build a minimal question dictionary."""
+    return {
+        'question': text, 'options': list(options), 'answer': options[0],
+        'explanation': explanation, 'topic': 'timing', 'difficulty': 'beginner',
+    }
+
+class TestSearch(unittest.TestCase):
+    """Test cases for search functionality"""
+
+    def setUp(self):
+        self.bank = get_question_bank()
+        self.index = get_search_index(self.bank, use_cache=False)
+
+    def test_tokenize(self):
+        """Test tokens are lowercased words with plural 's' removed"""
+        self.assertEqual(tokenize("Spores, Mushrooms & grass!"), ['spore', 'mushroom', 'grass'])
+        self.assertEqual(tokenize("gas is CO2"), ['gas', 'is', 'co2'])
+
+    def test_parse_query(self):
+        """Test quoted phrases, ignored OR and dropped stopwords"""
+        self.assertEqual(parse_query('"Pressure cookers" OR agar'), [('pressure', 'cooker'), ('agar',)])
+        self.assertEqual(parse_query('what is the substrate'), [('substrate',)])
+        self.assertEqual(parse_query('what is'), [('what',), ('is',)])
+        self.assertEqual(parse_query('PF-Tek'), [('pf',), ('tek',)])
+
+    def test_ranking_matches_full_scoring(self):
+        """Test top-k search returns the best of all scored matches"""
+        rng = random.Random(3)
+        words = sorted(self.index.terms)
+        for _ in range(100):
+            query = " ".join(rng.sample(words, rng.randint(1, 3)))
+            everything = self.index.search(query, limit=None)
+            top = self.index.search(query, limit=5)
+            self.assertEqual(len(top), min(5, len(everything)))
+            for got, expected in zip(top, everything):
+                self.assertAlmostEqual(got.score, expected.score, places=9)
+
+    def test_phrase_requires_adjacent_words(self):
+        """Test phrases match only when their words are next to each other"""
+        index = SearchIndex([
+            make_question("Grow in a pressure cooker?"),
+            make_question("Is cooker pressure safe?"),
+            make_question("Pressure?", options=('Cooker', 'Oven')),
+        ])
+        self.assertEqual([hit.index for hit in index.search('"pressure cooker"')], [0])
+        self.assertEqual(sorted(hit.index for hit in index.search('pressure cooker', limit=None)),
+                         [0, 1, 2])
+
+    def test_or_query_matches_either_clause(self):
+        """Test a document matching either clause is found"""
+        index = SearchIndex([make_question("Agar plates?"), make_question("Grain spawn?"),
+                             make_question("Casing layer?")])
+        self.assertEqual(sorted(hit.index for hit in index.search('agar OR spawn')), [0, 1])
+        self.assertEqual(index.search('"spawn agar"'), [])
+        self.assertEqual(index.search('unknownword'), [])
+
+    def test_explanations_are_searched(self):
+        """Test words in the explanation match too"""
+        index = SearchIndex([make_question("Which?", explanation="Lime raises the pH.")])
+        self.assertEqual(len(index.search('lime')), 1)
+
+    def test_state_round_trip(self):
+        """Test an index rebuilt from its cached form answers identically"""
+        copy = SearchIndex._from_state(self.index._state())
+        for query in ('sterilization', 'spawn substrate', '"fruiting bodies"'):
+            self.assertEqual(copy.search(query), self.index.search(query))
+
+    def test_selector_draws_from_matches(self):
+        """Test keyword quizzes only ask questions matching the query"""
+        selector = SearchSelector('sterilization')
+        matches = {q['question'] for q in selector.matches(self.bank)}
+        self.assertTrue(matches)
+        session = QuizGame("mixed", 3, seed=5, selector=selector).new_session()
+        asked = []
+        while not session.finished:
+            asked.append(session.next_question().question['question'])
+            session.submit_answer(1)
+        self.assertEqual(len(asked), min(3, len(matches)))
+        self.assertTrue(set(asked) <= matches)
+        self.assertEqual(SearchSelector('zzqx').select(self.bank, 'mixed', 3, random.Random(1)), [])
+
+    def test_search_command(self):
+        """Test 'search' prints ranked matches and reports when nothing matches"""
+        out = io.StringIO()
+        with redirect_stdout(out):
+            self.assertEqual(main(["search", "pressure", "cooker", "--limit", "2"]), 0)
+            self.assertEqual(main(["search", "zzqx"]), 1)
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines[0].lstrip().startswith("1."))
+        self.assertIn("pressure cooker", lines[0])
+        self.assertIn("No questions match", lines[-1])
+
+if __name__ == '__main__':
+    unittest.main()
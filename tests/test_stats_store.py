@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Stats Store Module 🧪
+
+Tests for the SQLite cross-session statistics store.
+
+File: test_stats_store.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the StatsStore class: WAL mode, batched
+    writes, persistence across reopening, per-topic accuracy, and that the
+    accuracy query is answered from the covering index.
+
+Test Classes:
+    - TestStatsStore: Main test class for StatsStore functionality
+
+Usage:
+    python -m pytest tests/test_stats_store.py
+    python -m unittest tests.test_stats_store
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import sys
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core import QuizGame
+from mushroom_quiz.stats import StatsStore
+from mushroom_quiz.stats.store import _ACCURACY_BY_TOPIC, SCHEMA_VERSION
+
+class TestStatsStore(unittest.TestCase):
+    """Test cases for StatsStore functionality"""
+
+    def setUp(self):
+        """Create a store in a temporary directory"""
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "stats.db")
+        self.store = StatsStore(self.path, batch_size=1000)
+        self.addCleanup(self.store.close)
+
+    def play(self, user, answer=1, seed=5):
+        """Play and record one 5-question quiz, always giving the same answer"""
+        game = QuizGame("beginner", 5, seed=seed)
+        session = game.new_session()
+        session_id = self.store.start_session(user, game.spec)
+        while not session.finished:
+            session.next_question()
+            self.store.record_answer(session_id, user, session.submit_answer(answer), 1.5)
+        self.store.finish_session(session_id, session.summary())
+        return session.summary()
+
+    def count(self, table):
+        """Count committed rows, as seen by a separate connection"""
+        other = StatsStore(self.path)
+        try:
+            return other._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        finally:
+            other.close()
+
+    def test_wal_mode(self):
+        """Test that the database uses write-ahead logging"""
+        mode = self.store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_writes_are_batched(self):
+        """Test that answers are buffered until flush"""
+        self.play("alice")
+        self.assertEqual(self.store.pending, 7)
+        self.assertEqual(self.count("answers"), 0)
+        self.store.flush()
+        self.assertEqual(self.store.pending, 0)
+        self.assertEqual(self.count("answers"), 5)
+
+    def test_question_rows_written_once(self):
+        """Test that a question's row is sent only by the first flush that needs it"""
+        statements = []
+        self.store._conn.set_trace_callback(statements.append)
+        self.play("alice")
+        self.store.flush()
+        self.play("bob")
+        self.store.flush()
+        inserts = [sql for sql in statements if sql.startswith("INSERT OR IGNORE INTO questions")]
+        self.assertEqual(len(inserts), 5)
+        self.assertEqual(self.count("questions"), 5)
+
+    def test_automatic_flush_at_batch_size(self):
+        """Test that a full buffer is flushed without being asked"""
+        self.store.batch_size = 10
+        self.play("alice")
+        self.play("alice")
+        self.assertGreater(self.count("answers"), 0)
+        self.assertLess(self.store.pending, 10)
+
+    def test_accuracy_by_topic(self):
+        """Test that per-topic accuracy matches the recorded sessions"""
+        first = self.play("alice", seed=1)
+        second = self.play("alice", seed=2)
+        self.play("bob", seed=3)
+        rows = self.store.accuracy_by_topic("alice")
+        self.assertEqual(sum(row.answered for row in rows), 10)
+        self.assertEqual(sum(row.correct for row in rows), first.score + second.score)
+        self.assertEqual([row.topic for row in rows], sorted(row.topic for row in rows))
+        sessions = self.store.recent_sessions("alice")
+        self.assertEqual(len(sessions), 2)
+        self.assertEqual(sessions[0].total, 5)
+
+    def test_accuracy_uses_covering_index(self):
+        """Test that the accuracy query never scans the answers table"""
+        plan = self.store._conn.execute("EXPLAIN QUERY PLAN " + _ACCURACY_BY_TOPIC, ("alice",)).fetchall()
+        detail = " ".join(row[-1] for row in plan)
+        self.assertIn("COVERING INDEX answers_user_topic", detail)
+
+    def test_persists_across_reopen(self):
+        """Test that close() flushes and statistics survive reopening"""
+        self.play("alice")
+        self.store.close()
+        reopened = StatsStore(self.path)
+        try:
+            self.assertEqual(sum(row.answered for row in reopened.accuracy_by_topic("alice")), 5)
+        finally:
+            reopened.close()
+
+    def test_upgrades_version_1_database(self):
+        """Test that a database without review difficulties is upgraded in place"""
+        path = os.path.join(self.directory, "old.db")
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE TABLE review_items (
+                user TEXT NOT NULL, question_id INTEGER NOT NULL, due REAL NOT NULL,
+                interval REAL NOT NULL, ease REAL NOT NULL, repetitions INTEGER NOT NULL,
+                PRIMARY KEY (user, question_id)
+            ) WITHOUT ROWID;
+            INSERT INTO review_items VALUES ('alice', 7, 100.0, 86400.0, 2.5, 1);
+            PRAGMA user_version=1;
+        """)
+        conn.close()
+        with StatsStore(path) as store:
+            self.assertEqual(store.load_review_items("alice"), [(7, 100.0, 86400.0, 2.5, 1, None)])
+            store.save_review_items("alice", [(7, 200.0, 86400.0, 2.5, 2, "beginner")])
+            self.assertEqual(store.load_review_items("alice"), [(7, 200.0, 86400.0, 2.5, 2, "beginner")])
+            self.assertEqual(store._conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Test Suite for Stdin Reader Module 🧪
+
+Tests for the shared, cancellable stdin reader.
+
+File: test_stdin_reader.py
+Author: Aaron J
+Email: git@aaronemail.xyz
+Version: 2.0.1
+Created: 2026-10-18
+Last Modified: 2026-10-18
+License: MIT
+
+Description:
+    This module contains tests for the StdinReader, using a pipe in place
+    of stdin. It checks line delivery, cancellation, end of input, and that
+    hundreds of timed-out questions leave the thread count and memory flat
+    and never swallow the next answer, and that input() prompts and timed
+    answers share piped stdin.
+
+Test Classes:
+    - TestStdinReader: Main test class for StdinReader functionality
+
+Usage:
+    python -m pytest tests/test_stdin_reader.py
+    python -m unittest tests.test_stdin_reader
+
+Repository:
+    https://github.com/aaronjacobs-chelt/mushroom-cultivation-quiz
+"""
+
+import io
+import threading
+import tracemalloc
+import unittest
+import sys
+import os
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mushroom_quiz.core.scheduler import DeadlineScheduler
+from mushroom_quiz.core.stdin_reader import StdinReader
+from mushroom_quiz.core.timer import TimedInput
+
+class TestStdinReader(unittest.TestCase):
+    """Test cases for StdinReader functionality."""
+
+    def setUp(self):
+        read_fd, self.write_fd = os.pipe()
+        self.stream = os.fdopen(read_fd, 'rb', buffering=0)
+        self.reader = StdinReader(self.stream)
+        self.scheduler = DeadlineScheduler()
+        self.addCleanup(self.stream.close)
+        self.addCleanup(self.reader.close)
+        self.addCleanup(self.scheduler.stop)
+
+    def close_writer(self):
+        os.close(self.write_fd)
+        self.write_fd = None
+
+    def tearDown(self):
+        if self.write_fd is not None:
+            os.close(self.write_fd)
+
+    def timed_question(self, timeout):
+        """Ask one timed question against the pipe."""
+        timer = TimedInput(timeout, self.scheduler, self.reader)
+        with redirect_stdout(io.StringIO()):
+            return timer.get_timed_input("Answer: ", 4)
+
+    def test_reader_is_selector_based(self):
+        """Test that pipes are served through the selector."""
+        self.assertTrue(self.reader.selectable)
+
+    def test_readline_returns_lines_in_order(self):
+        """Test that each request gets exactly one line."""
+        os.write(self.write_fd, b"1\r\ntwo\n")
+        self.assertEqual(self.reader.readline(1), "1")
+        self.assertEqual(self.reader.readline(1), "two")
+
+    def test_readline_timeout(self):
+        """Test that a read with no input times out and is cancelled."""
+        self.assertIsNone(self.reader.readline(0.02))
+
+    def test_end_of_input(self):
+        """Test that a closed stream completes reads with None."""
+        self.close_writer()
+        self.assertIsNone(self.reader.readline(1))
+        self.assertIsNone(self.reader.readline(1))
+
+    def test_reader_stops_reading_when_cancelled(self):
+        """Test that input typed after a cancel is left for the next reader."""
+        self.assertIsNone(self.reader.readline(0.02))
+        os.write(self.write_fd, b"late\n")
+        # Nothing is pending, so the bytes stay in the pipe
+        self.assertEqual(os.read(self.stream.fileno(), 5), b"late\n")
+
+    def test_timeouts_do_not_leak_threads_or_memory(self):
+        """Test hundreds of timed-out questions keep threads and memory flat."""
+        # Warm up so the reader, scheduler and caches exist before measuring
+        self.assertIsNone(self.timed_question(0.002))
+        threads_before = threading.active_count()
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        memory_before = tracemalloc.get_traced_memory()[0]
+
+        for _ in range(300):
+            self.assertIsNone(self.timed_question(0.002))
+
+        self.assertEqual(threading.active_count(), threads_before)
+        self.assertLess(tracemalloc.get_traced_memory()[0] - memory_before, 64 * 1024)
+        self.assertEqual(self.scheduler.pending(), 0)
+
+        # The next answer goes to the next question, not a stale reader
+        os.write(self.write_fd, b"3\n")
+        self.assertEqual(self.timed_question(5), 3)
+
+    def test_piped_stdin_shared_with_input(self):
+        """Test input() prompts and timed answers each get their own line of piped stdin."""
+        read_fd, write_fd = os.pipe()
+        stdin = os.fdopen(read_fd, 'r')
+        self.addCleanup(stdin.close)
+        reader = StdinReader(stdin)
+        self.addCleanup(reader.close)
+        self.assertFalse(reader.selectable)
+        os.write(write_fd, b"1\nmenu\n2\n\n3\n")
+        os.close(write_fd)
+
+        def timed_question():
+            timer = TimedInput(2, self.scheduler, reader)
+            with redirect_stdout(io.StringIO()):
+                return timer.get_timed_input("Answer: ", 4)
+
+        with mock.patch.object(sys, 'stdin', stdin), redirect_stdout(io.StringIO()):
+            self.assertEqual(timed_question(), 1)
+            self.assertEqual(input("Choice: "), "menu")
+            self.assertEqual(timed_question(), 2)
+            self.assertEqual(input("Press Enter..."), "")
+            self.assertEqual(timed_question(), 3)
+            self.assertIsNone(timed_question())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,7 +8,11 @@ class MushroomQuiz {
             timerSeconds: null
         };
         
+        // Set once we know whether `mushroom-quiz api` serves this page
+        this.api = null;
+        
         this.gameState = {
+            quizId: null,
             currentQuestionIndex: 0,
             score: 0,
             questions: [],
@@ -23,10 +27,42 @@ class MushroomQuiz {
     }
     
     init() {
+        this.apiReady = this.detectApi();
         this.setupEventListeners();
         this.showScreen('welcome-screen');
     }
     
+    async detectApi() {
+        // Under `mushroom-quiz api` the server picks the questions and sends
+        // them one at a time, so answers never reach the browser
+        try {
+            const response = await fetch('api/bank');
+            this.api = response.ok;
+        } catch (error) {
+            this.api = false;
+        }
+    }
+    
+    async apiRequest(method, path, body) {
+        const options = {method};
+        if (body !== undefined) {
+            options.headers = {'Content-Type': 'application/json'};
+            options.body = JSON.stringify(body);
+        }
+        const response = await fetch(`api/${path}`, options);
+        const payload = await response.json();
+        if (!response.ok) {
+            throw new Error(payload.message || `HTTP ${response.status}`);
+        }
+        return payload;
+    }
+    
+    apiFailed(error) {
+        this.stopTimer();
+        alert(`Lost contact with the quiz server: ${error.message}`);
+        this.showScreen('welcome-screen');
+    }
+    
     setupEventListeners() {
         // Option button selection
         document.addEventListener('click', (e) => {
@@ -66,6 +102,10 @@ class MushroomQuiz {
         // Store the setting
         if (button.hasAttribute('data-difficulty')) {
             this.settings.difficulty = button.getAttribute('data-difficulty');
+            // Start fetching the shard now; errors surface when the quiz starts
+            if (!this.api) {
+                loadQuestions(this.settings.difficulty).catch(() => {});
+            }
         } else if (button.hasAttribute('data-questions')) {
             this.settings.numQuestions = parseInt(button.getAttribute('data-questions'));
         } else if (button.hasAttribute('data-timer')) {
@@ -94,12 +134,24 @@ class MushroomQuiz {
         document.getElementById(screenId).classList.add('active');
     }
     
-    prepareQuiz() {
-        // Get questions based on difficulty
-        const availableQuestions = getQuestionsByDifficulty(this.settings.difficulty);
-        
-        // Select random questions
-        this.gameState.questions = getRandomQuestions(availableQuestions, this.settings.numQuestions);
+    async prepareQuiz() {
+        await this.apiReady;
+        if (this.api) {
+            // The server selects the quiz; questions are filled in as they are asked
+            const created = await this.apiRequest('POST', 'quizzes', {
+                difficulty: this.settings.difficulty,
+                num_questions: this.settings.numQuestions,
+                timer_seconds: this.settings.timerSeconds
+            });
+            this.gameState.quizId = created.id;
+            this.gameState.questions = new Array(created.total).fill(null);
+        } else {
+            // Get questions based on difficulty (fetched once per shard)
+            const availableQuestions = await loadQuestions(this.settings.difficulty);
+            
+            // Select random questions
+            this.gameState.questions = getRandomQuestions(availableQuestions, this.settings.numQuestions);
+        }
         
         // Reset game state
         this.gameState.currentQuestionIndex = 0;
@@ -121,7 +173,11 @@ class MushroomQuiz {
         }
     }
     
-    displayQuestion() {
+    async displayQuestion() {
+        if (this.api) {
+            this.gameState.questions[this.gameState.currentQuestionIndex] =
+                await this.apiRequest('GET', `quizzes/${this.gameState.quizId}/question`);
+        }
         const question = this.gameState.questions[this.gameState.currentQuestionIndex];
         const questionNum = this.gameState.currentQuestionIndex + 1;
         
@@ -205,7 +261,7 @@ class MushroomQuiz {
         this.handleAnswerSelection(null, true);
     }
     
-    handleAnswerSelection(button, isTimeout = false) {
+    async handleAnswerSelection(button, isTimeout = false) {
         // Stop timer
         this.stopTimer();
         
@@ -216,6 +272,8 @@ class MushroomQuiz {
         const question = this.gameState.questions[this.gameState.currentQuestionIndex];
         let isCorrect = false;
         let selectedAnswer = null;
+        let correctAnswer = question.answer;
+        let explanation = question.explanation;
         
         if (!isTimeout && button) {
             selectedAnswer = button.getAttribute('data-answer');
@@ -223,20 +281,37 @@ class MushroomQuiz {
             button.classList.add('selected');
         }
         
+        if (this.api) {
+            // The server scores the answer (and enforces the timer)
+            const optionNumber = selectedAnswer === null ? null : question.options.indexOf(selectedAnswer) + 1;
+            let result;
+            try {
+                result = await this.apiRequest('POST', `quizzes/${this.gameState.quizId}/answer`,
+                                               {answer: optionNumber});
+            } catch (error) {
+                this.apiFailed(error);
+                return;
+            }
+            isCorrect = result.correct;
+            isTimeout = result.timeout;
+            correctAnswer = result.correct_answer;
+            explanation = result.explanation;
+        }
+        
         // Highlight correct answer
         answerBtns.forEach(btn => {
             const answer = btn.getAttribute('data-answer');
-            if (answer === question.answer) {
+            if (answer === correctAnswer) {
                 btn.classList.add('correct');
             } else if (btn === button && !isCorrect) {
                 btn.classList.add('incorrect');
             }
         });
         
-        // Update score
+        // Update score (in API mode the summary reports wrong topics)
         if (isCorrect) {
             this.gameState.score++;
-        } else if (!isTimeout) {
+        } else if (!isTimeout && !this.api) {
             this.gameState.wrongTopics.push(question.topic);
         }
         
@@ -245,7 +320,7 @@ class MushroomQuiz {
         document.getElementById('questions-answered').textContent = this.gameState.currentQuestionIndex + 1;
         
         // Show explanation
-        this.showExplanation(question.explanation, isCorrect, isTimeout);
+        this.showExplanation(explanation, isCorrect, isTimeout);
         
         // Auto-advance after delay
         setTimeout(() => {
@@ -297,14 +372,23 @@ class MushroomQuiz {
         }, 2800);
     }
     
-    nextQuestion() {
+    async nextQuestion() {
         this.gameState.currentQuestionIndex++;
         
-        if (this.gameState.currentQuestionIndex < this.gameState.questions.length) {
-            this.displayQuestion();
-        } else {
-            this.showResults();
+        try {
+            if (this.gameState.currentQuestionIndex < this.gameState.questions.length) {
+                await this.displayQuestion();
+                return;
+            }
+            if (this.api) {
+                const summary = await this.apiRequest('GET', `quizzes/${this.gameState.quizId}/question`);
+                this.gameState.wrongTopics = summary.wrong_topics;
+            }
+        } catch (error) {
+            this.apiFailed(error);
+            return;
         }
+        this.showResults();
     }
     
     showResults() {
@@ -416,10 +500,15 @@ function showAbout() {
     quiz.showScreen('about-screen');
 }
 
-function startQuiz() {
-    quiz.prepareQuiz();
+async function startQuiz() {
+    try {
+        await quiz.prepareQuiz();
+        await quiz.displayQuestion();
+    } catch (error) {
+        alert(`Could not load the questions: ${error.message}`);
+        return;
+    }
     quiz.showScreen('quiz-screen');
-    quiz.displayQuestion();
 }
 
 function quitQuiz() {